@@ -0,0 +1,49 @@
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._datainput.grid_fence import GridFenceSampler
+
+
+def _write_grid_and_property(tmp_path):
+    grid = xtgeo.create_box_grid((10, 12, 5), increment=(50.0, 50.0, 10.0))
+    prop = xtgeo.GridProperty(
+        grid,
+        name="PORO",
+        values=np.arange(grid.ntotal, dtype=np.float64).reshape(grid.dimensions),
+    )
+    grid_path = tmp_path / "grid.roff"
+    prop_path = tmp_path / "poro.roff"
+    grid.to_file(grid_path, fformat="roff")
+    prop.to_file(prop_path, fformat="roff")
+    return grid_path, prop_path
+
+
+def _fence():
+    poly = xtgeo.Polygons([(20.0, 30.0, 0.0, 1), (420.0, 550.0, 0.0, 1)])
+    return poly.get_fence(asnumpy=True)
+
+
+def test_sample_fence(tmp_path):
+    grid_path, prop_path = _write_grid_and_property(tmp_path)
+    sampler = GridFenceSampler.for_grid_file(grid_path)
+    assert GridFenceSampler.for_grid_file(grid_path) is sampler
+
+    fence = _fence()
+    sample = sampler.sample_fence(prop_path, fence, zincrement=1.0)
+
+    grid = xtgeo.grid_from_file(grid_path)
+    prop = xtgeo.gridproperty_from_file(prop_path, grid=grid)
+    hmin, hmax, vmin, vmax, values = grid.get_randomline(fence, prop, zincrement=1.0)
+    assert (sample.hmin, sample.hmax, sample.vmin, sample.vmax) == (
+        hmin,
+        hmax,
+        vmin,
+        vmax,
+    )
+    assert sample.values.dtype == np.float32
+    assert np.allclose(sample.values, values, equal_nan=True)
+    assert not np.all(np.isnan(sample.values))
+
+    # Same grid, property and fence is served from the cache
+    assert sampler.sample_fence(prop_path, fence.copy(), zincrement=1.0) is sample
+    assert sampler.sample_fence(prop_path, fence, zincrement=2.0) is not sample
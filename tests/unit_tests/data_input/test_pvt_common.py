@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from webviz_subsurface._datainput.eclipse_init_io.pvt_common import (
+    EclPropertyTableRawData,
+    PVDx,
+    PVTx,
+)
+from webviz_subsurface._datainput.eclipse_unit import ConvertUnits
+
+NO_CONVERSION = ConvertUnits(lambda x: x, [lambda x: x] * 4)
+
+
+def _raw_table(primary_keys: list, curves: list) -> EclPropertyTableRawData:
+    """Creates raw data for a single table, where curves holds one list of
+    (x, 1/B, 1/(B*mu)) rows per primary key"""
+    raw = EclPropertyTableRawData()
+    raw.num_primary = len(primary_keys)
+    raw.num_rows = max(len(curve) for curve in curves)
+    raw.num_cols = 3
+    raw.num_tables = 1
+    raw.primary_key = primary_keys
+
+    data = np.full((raw.num_cols, raw.num_primary, raw.num_rows), 2.0e20)
+    for index_primary, curve in enumerate(curves):
+        for index_row, row in enumerate(curve):
+            data[:, index_primary, index_row] = row
+    raw.data = data.flatten()
+    return raw
+
+
+def test_pvdx_vectorized():
+    raw = _raw_table([0.0], [[(100.0, 1 / 1.2, 1 / 0.6), (200.0, 1 / 1.1, 1 / 0.66)]])
+    pvdx = PVDx(0, raw, NO_CONVERSION)
+    pressure = np.array([100.0, 150.0, 200.0])
+
+    recip_fvf = np.array([1 / 1.2, (1 / 1.2 + 1 / 1.1) / 2, 1 / 1.1])
+    recip_fvf_visc = np.array([1 / 0.6, (1 / 0.6 + 1 / 0.66) / 2, 1 / 0.66])
+    assert np.allclose(pvdx.formation_volume_factor(pressure), 1 / recip_fvf)
+    assert np.allclose(pvdx.viscosity(pressure), recip_fvf / recip_fvf_visc)
+
+
+def test_pvtx_vectorized():
+    curves = [
+        [(100.0, 1 / 1.20, 1 / 0.60), (200.0, 1 / 1.18, 1 / 0.64)],
+        [(150.0, 1 / 1.40, 1 / 0.70), (250.0, 1 / 1.36, 1 / 0.74)],
+    ]
+    pvtx = PVTx(0, _raw_table([10.0, 50.0], curves), (lambda x: x, NO_CONVERSION))
+
+    # Table values are reproduced in the nodes
+    keys, pressures = pvtx.get_keys(), pvtx.get_independents()
+    assert np.allclose(
+        pvtx.formation_volume_factor(keys, pressures), [1.20, 1.18, 1.40, 1.36]
+    )
+    assert np.allclose(
+        pvtx.viscosity(keys, pressures),
+        [0.60 / 1.20, 0.64 / 1.18, 0.70 / 1.40, 0.74 / 1.36],
+    )
+
+    # Linear between the curves, constant outside the range of keys and pressures
+    fvf = pvtx.formation_volume_factor(
+        np.array([30.0, 0.0, 100.0]), np.array([150.0, 50.0, 300.0])
+    )
+    recip_mid = 0.5 * (1 / 1.20 + 1 / 1.18) / 2 + 0.5 * (1 / 1.40)
+    assert fvf == pytest.approx([1 / recip_mid, 1.20, 1.36])
+
+    with pytest.raises(ValueError):
+        pvtx.formation_volume_factor(np.array([10.0]), np.array([100.0, 200.0]))
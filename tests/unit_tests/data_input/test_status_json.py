@@ -0,0 +1,65 @@
+import json
+import os
+
+import numpy as np
+
+from webviz_subsurface._datainput.status_json import StatusFileIndex
+
+
+def _write_status(path, runtimes, status="Success", mtime=None):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        {
+            "name": f"job{idx}",
+            "status": status,
+            "start_time": 0.0,
+            "end_time": runtime,
+        }
+        for idx, runtime in enumerate(runtimes)
+    ]
+    path.write_text(
+        json.dumps({"jobs": jobs, "start_time": 0.0, "end_time": sum(runtimes)})
+    )
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+def test_status_file_index(tmp_path):
+    ens_path = str(tmp_path / "realization-*" / "iter-0")
+
+    def status_file(real):
+        return tmp_path / f"realization-{real}" / "iter-0" / "status.json"
+
+    _write_status(status_file(0), [10.0, 20.0], mtime=1000)
+    _write_status(status_file(2), [40.0, 5.0], status="Failure", mtime=1000)
+
+    index = StatusFileIndex({"iter-0": ens_path}, "status.json", max_workers=2)
+    assert index.version("iter-0") == 0
+    assert index.refresh() == ["iter-0"]
+    assert index.version("iter-0") == 1
+
+    job_df = index.job_status_df("iter-0")
+    # Missing realization 1 is added for whitespace in the matrix
+    assert list(job_df["REAL"]) == [0, 0, 2, 2, 1, 1]
+    assert list(job_df["JOB_MAX_RUNTIME"]) == [40.0, 20.0] * 3
+    assert np.allclose(job_df["JOB_SCALED_RUNTIME"][:4], [0.25, 1.0, 1.0, 0.25])
+    assert np.allclose(job_df["ENS_SCALED_RUNTIME"][:4], [0.25, 0.5, 1.0, 0.125])
+    assert job_df["RUNTIME"][4:].isna().all()
+
+    real_df = index.real_status_df()
+    assert list(real_df["STATUS"]) == ["Success", "Failure"]
+    assert list(real_df["RUNTIME"][:1]) == [30.0]
+
+    # Nothing has changed
+    assert index.refresh() == []
+    assert index.version("iter-0") == 1
+
+    # Only the modified file is read again
+    _write_status(status_file(1), [80.0, 20.0], mtime=2000)
+    status_file(0).write_text("not valid json")
+    os.utime(status_file(0), (1000, 1000))
+    assert index.refresh() == ["iter-0"]
+    assert index.version("iter-0") == 2
+    job_df = index.job_status_df("iter-0")
+    assert list(job_df["REAL"]) == [0, 0, 1, 1, 2, 2]
+    assert list(job_df["JOB_MAX_RUNTIME"]) == [80.0, 20.0] * 3
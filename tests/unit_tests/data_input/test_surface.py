@@ -0,0 +1,49 @@
+import io
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xtgeo
+
+from webviz_subsurface._datainput.surface import (
+    surfaces_from_binary,
+    surfaces_to_binary_stream,
+)
+
+
+def _surface(values: np.ndarray, **kwargs: float) -> xtgeo.RegularSurface:
+    return xtgeo.RegularSurface(
+        ncol=values.shape[0],
+        nrow=values.shape[1],
+        xinc=25.0,
+        yinc=50.0,
+        values=np.ma.masked_invalid(values),
+        **kwargs,
+    )
+
+
+def test_surfaces_binary_roundtrip(tmp_path: Path) -> None:
+    mean_values = np.arange(12, dtype=float).reshape(3, 4) + 0.5
+    mean_values[1, 2] = np.nan
+    surfaces = {
+        "mean": _surface(mean_values, xori=100.0, yori=200.0, rotation=30.0),
+        "stddev": _surface(np.full((2, 5), 1.25)),
+    }
+
+    stream = surfaces_to_binary_stream(surfaces)
+    file_name = tmp_path / "surfaces.bin"
+    file_name.write_bytes(stream.getvalue())
+
+    for source in [stream, stream.getvalue(), file_name]:
+        loaded = surfaces_from_binary(source)
+        assert list(loaded) == ["mean", "stddev"]
+        for name, surface in surfaces.items():
+            for attr in ["ncol", "nrow", "xori", "yori", "xinc", "yinc", "rotation"]:
+                assert getattr(loaded[name], attr) == getattr(surface, attr)
+            assert np.array_equal(loaded[name].values.mask, surface.values.mask)
+            assert np.allclose(loaded[name].values, surface.values)
+
+
+def test_surfaces_from_binary_invalid_stream() -> None:
+    with pytest.raises(ValueError):
+        surfaces_from_binary(io.BytesIO(b'{"mean": {}}'))
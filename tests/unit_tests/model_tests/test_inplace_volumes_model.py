@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from webviz_subsurface._models.inplace_volumes_model import InplaceVolumesModel
+
+DATA_FOLDER = Path(__file__).resolve().parents[2] / "data"
+
+
+@pytest.fixture(name="volumes_model")
+def fixture_volumes_model() -> InplaceVolumesModel:
+    volumes_table = pd.read_csv(DATA_FOLDER / "volumes.csv", index_col=0)
+    parameter_table = pd.read_csv(DATA_FOLDER / "parameters.csv")
+    parameter_table["ENSEMBLE"] = "iter-0"
+    return InplaceVolumesModel(volumes_table, parameter_table)
+
+
+@pytest.mark.parametrize(
+    "filters, groups",
+    [
+        ({}, ["ZONE"]),
+        ({"REGION": [1, 2]}, ["ZONE"]),
+        ({"ZONE": ["UpperReek"], "FLUID_ZONE": ["oil"]}, ["REGION", "REAL"]),
+        ({"REAL": [0, 1, 2]}, ["ENSEMBLE", "ZONE", "REGION"]),
+        ({"ZONE": ["UpperReek", "MidReek"]}, ["FLUID_ZONE"]),
+        ({"ZONE": ["NotAZone"]}, ["REGION"]),
+    ],
+)
+def test_get_df_grouped(volumes_model, filters, groups):
+    # pylint: disable=protected-access
+    parameters = volumes_model.parameters[:2]
+    expected = volumes_model.compute_property_columns(
+        volumes_model._get_df_from_dataframe(filters, groups, parameters)
+    )
+    result = volumes_model.get_df(filters=filters, groups=groups, parameters=parameters)
+
+    if expected.empty:
+        assert result.empty
+        return
+    columns = [x for x in expected if x not in ["BO", "BG"]]
+    pd.testing.assert_frame_equal(result[columns], expected[columns], check_dtype=False)
+
+
+def test_get_df_ungrouped(volumes_model):
+    # pylint: disable=protected-access
+    filters = {"REGION": [2], "ZONE": ["LowerReek", "UpperReek"]}
+    expected = volumes_model._get_df_from_dataframe(filters, [], [])
+    result = volumes_model.get_df(filters=filters)
+    pd.testing.assert_frame_equal(
+        result[volumes_model.volume_columns].reset_index(drop=True),
+        expected[volumes_model.volume_columns].reset_index(drop=True),
+    )
+
+
+def test_get_df_returns_independent_copies(volumes_model):
+    dframe = volumes_model.get_df(filters={"REGION": [1]}, groups=["ZONE"])
+    dframe.rename(columns={"STOIIP": "VALUE"}, inplace=True)
+    dframe.loc[:, "BULK"] = 0
+    again = volumes_model.get_df(filters={"REGION": [1]}, groups=["ZONE"])
+    assert "STOIIP" in again
+    assert (again["BULK"] > 0).any()
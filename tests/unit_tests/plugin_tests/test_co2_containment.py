@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface.plugins._co2_leakage._utilities.co2volume import (
+    ContainmentData,
+    generate_co2_time_containment_figure,
+    generate_co2_volume_figure,
+    get_containment_data,
+)
+
+
+class _TableProvider:
+    def __init__(self) -> None:
+        self.num_reads = 0
+        self._df = pd.DataFrame(
+            [
+                (0, 20200101, 1.0, 0.0),
+                (0, 20300101, 3.0, 1.0),
+                (2, 20200101, 2.0, 0.5),
+                (2, 20250101, 4.0, 2.0),
+                (2, 20300101, 5.0, 3.0),
+                (5, 20250101, 6.0, 0.25),
+            ],
+            columns=["REAL", "date", "co2_inside", "co2_outside"],
+        )
+
+    def get_column_data(self, column_names, realizations=None):
+        self.num_reads += 1
+        df = self._df
+        if realizations is not None:
+            df = df[df["REAL"].isin(realizations)]
+        return df[["REAL"] + column_names]
+
+    @staticmethod
+    def realizations():
+        return [0, 2, 5]
+
+
+def test_containment_data():
+    data = ContainmentData.from_table_provider(_TableProvider())
+    assert list(data.realizations) == [0, 2, 5]
+    assert list(data.dates) == [20200101, 20250101, 20300101]
+    assert data.volumes.shape == (3, 3, 3)
+    assert np.isnan(data.volumes[0, 1]).all()
+    assert list(data.category_volumes("total")[1]) == [2.5, 6.0, 8.0]
+    assert list(data.terminal_date_idx) == [2, 2, 1]
+    assert np.allclose(data.mean[:, data.categories.index("inside")], [1.5, 5.0, 4.0])
+    assert np.allclose(data.maximum[:, data.categories.index("total")], [2.5, 6.25, 8])
+    assert list(data.realization_indices([5, 3, 0])) == [2, 0]
+
+
+def test_figures_slice_cached_data():
+    provider = _TableProvider()
+    assert get_containment_data(provider) is get_containment_data(provider)
+
+    fig = generate_co2_volume_figure(provider, [0, 5])
+    volumes = {
+        (trace.name, real): vol
+        for trace in fig.data
+        for real, vol in zip(trace.y, trace.x)
+    }
+    assert volumes == {
+        ("inside", "0"): 3.0,
+        ("outside", "0"): 1.0,
+        ("inside", "5"): 6.0,
+        ("outside", "5"): 0.25,
+    }
+
+    fig = generate_co2_time_containment_figure(provider, [2, 0])
+    # Two legend entries, then outside and total per realization
+    assert len(fig.data) == 6
+    assert list(fig.data[2].x) == ["2020-01-01", "2025-01-01", "2030-01-01"]
+    assert list(fig.data[3].y) == [2.5, 6.0, 8.0]
+    assert list(fig.data[5].x) == ["2020-01-01", "2030-01-01"]
+    assert fig.layout.yaxis.range == (0, 1.05 * 8.0)
+    assert provider.num_reads == 1
@@ -0,0 +1,45 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from webviz_config import WebvizPluginABC
+
+import webviz_subsurface.plugins
+
+SETUP_PY = Path(__file__).resolve().parents[3] / "setup.py"
+
+
+def test_plugins_are_imported_lazily():
+    """Importing the plugins package should not import the plugin modules,
+    nor their heavy dependencies"""
+    code = (
+        "import sys\n"
+        "import webviz_subsurface.plugins\n"
+        "print(sorted(m for m in ['xtgeo', 'vtk', 'vtkmodules', 'ecl2df', 'opm', "
+        "'webviz_subsurface.plugins._map_viewer_fmu'] if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=SETUP_PY.parent,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_all_plugins_resolve():
+    entry_points = re.findall(
+        r'"(\w+) = webviz_subsurface\.plugins:(\w+)"', SETUP_PY.read_text()
+    )
+    assert entry_points
+    for name, attribute in entry_points:
+        assert name == attribute
+        assert name in webviz_subsurface.plugins.__all__
+
+    for name in webviz_subsurface.plugins.__all__:
+        plugin = getattr(webviz_subsurface.plugins, name)
+        assert issubclass(plugin, WebvizPluginABC)
+        assert plugin.__name__ == name
+        assert name in dir(webviz_subsurface.plugins)
@@ -0,0 +1,140 @@
+import threading
+
+import numpy as np
+import pytest
+import xtgeo
+
+from webviz_subsurface.plugins._co2_leakage._utilities.plume_extent import (
+    MISSING_DEPENDENCIES,
+    PlumeExtentEngine,
+    plume_polygons,
+    truncate_surfaces,
+)
+
+DATES = ["20200101", "20300101", "20400101"]
+
+
+def _surface(realization, date_idx):
+    x_idx, y_idx = np.meshgrid(np.arange(40), np.arange(30), indexing="ij")
+    radius = 4.0 + 3.0 * date_idx + realization
+    values = np.ma.array(
+        np.hypot(x_idx - 20.0, y_idx - 15.0) < radius, dtype=np.float64
+    ) * (1.0 + 0.1 * realization)
+    values[0, 0] = np.ma.masked
+    return xtgeo.RegularSurface(ncol=40, nrow=30, xinc=10.0, yinc=10.0, values=values)
+
+
+class _Provider:
+    def __init__(self, missing=()):
+        self.num_requests = 0
+        self._missing = missing
+
+    @staticmethod
+    def surface_dates_for_attribute(_attribute):
+        return DATES
+
+    def get_surface(self, address):
+        self.num_requests += 1
+        if (address.realization, address.datestr) in self._missing:
+            return None
+        return _surface(address.realization, DATES.index(address.datestr))
+
+
+def test_plume_count_matches_truncate_surfaces():
+    engine = PlumeExtentEngine(_Provider(missing={(2, "20300101")}))
+    for date_idx, datestr in enumerate(DATES):
+        reals = [r for r in range(4) if not (r == 2 and datestr == "20300101")]
+        count, num_surfaces, _ = engine.plume_count(
+            "top", "max_sgas", [0, 1, 2, 3], datestr, threshold=0.5, smoothing=2.0
+        )
+        expected = truncate_surfaces(
+            [_surface(r, date_idx) for r in reals], threshold=0.5, smoothing=2.0
+        )
+        assert num_surfaces == len(reals)
+        assert np.allclose(count, expected)
+
+
+def test_surfaces_are_read_once():
+    provider = _Provider()
+    engine = PlumeExtentEngine(provider)
+    for datestr in DATES:
+        for threshold in [0.5, 1.05]:
+            engine.plume_count(
+                "top", "max_sgas", [0, 1, 2], datestr, threshold, smoothing=2.0
+            )
+    # All dates are read on the first request, and not read again
+    assert provider.num_requests == 3 * len(DATES)
+    assert (
+        engine.plume_count("top", "max_sgas", [0, 1, 2], "20500101", 0.5, 2.0) is None
+    )
+
+
+@pytest.mark.skipif(MISSING_DEPENDENCIES, reason="Requires matplotlib and shapely")
+def test_plume_polygons_are_cached():
+    engine = PlumeExtentEngine(_Provider())
+    polygons = engine.plume_polygons(
+        "top", "max_sgas", [0, 1, 2], DATES[1], threshold=0.5, smoothing=2.0
+    )
+    expected = plume_polygons(
+        [_surface(r, 1) for r in range(3)], threshold=0.5, smoothing=2.0
+    )
+    assert polygons == expected
+    assert len(polygons["features"]) > 0
+    assert (
+        engine.plume_polygons(
+            "top", "max_sgas", [0, 1, 2], DATES[1], threshold=0.5, smoothing=2.0
+        )
+        is polygons
+    )
+
+
+def test_loading_does_not_block_cached_requests():
+    release = threading.Event()
+    loading = threading.Event()
+
+    class _BlockingProvider(_Provider):
+        def get_surface(self, address):
+            if address.attribute == "blocked":
+                loading.set()
+                release.wait(20)
+            return super().get_surface(address)
+
+    provider = _BlockingProvider()
+    engine = PlumeExtentEngine(provider)
+    expected = engine.plume_count("top", "max_sgas", [0, 1], DATES[0], 0.5, 2.0)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                engine.plume_count("top", "blocked", [0, 1], DATES[0], 0.5, 2.0)
+            ),
+            daemon=True,
+        )
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    assert loading.wait(5)
+
+    # Served from the cache while the other attribute is loading
+    cached = []
+    thread = threading.Thread(
+        target=lambda: cached.append(
+            engine.plume_count("top", "max_sgas", [0, 1], DATES[0], 0.5, 2.0)
+        ),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(5)
+    assert not release.is_set()
+    assert len(cached) == 1
+    assert np.shares_memory(cached[0][0], expected[0])
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    # Both requests for the loading attribute share one load
+    assert len(results) == 2
+    assert np.shares_memory(results[0][0], results[1][0])
+    assert provider.num_requests == 2 * 2 * len(DATES)
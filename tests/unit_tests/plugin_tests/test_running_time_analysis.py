@@ -0,0 +1,118 @@
+import json
+import os
+from unittest import mock
+
+import dash
+import pandas as pd
+from webviz_config import WebvizSettings
+from webviz_config.common_cache import CACHE
+from webviz_config.themes import default_theme
+from webviz_config.webviz_instance_info import WebvizInstanceInfo, WebvizRunMode
+
+import webviz_subsurface.plugins._running_time_analysis_fmu as running_time
+from webviz_subsurface.plugins._running_time_analysis_fmu import (
+    RunningTimeAnalysisFMU,
+)
+
+
+def _write_status(path, runtimes, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    jobs = [
+        {"name": f"job{idx}", "status": "Success", "start_time": 0.0, "end_time": rt}
+        for idx, rt in enumerate(runtimes)
+    ]
+    path.write_text(
+        json.dumps({"jobs": jobs, "start_time": 0.0, "end_time": sum(runtimes)})
+    )
+    os.utime(path, (mtime, mtime))
+
+
+def _update_fig(client, plugin, n_intervals, shown_version):
+    controls = [
+        ("ensemble", "iter-0"),
+        ("mode", "running_time_matrix"),
+        ("relative_runtime", RunningTimeAnalysisFMU.COLOR_MATRIX_BY_LABELS[0]),
+        ("relative_real", RunningTimeAnalysisFMU.COLOR_PARCOORD_BY_LABELS[0]),
+        ("parameters", []),
+        ("filter_short", []),
+    ]
+    inputs = [
+        {"id": plugin.uuid(name), "property": "value", "value": value}
+        for name, value in controls
+    ] + [
+        {
+            "id": plugin.uuid("refresh"),
+            "property": "n_intervals",
+            "value": n_intervals,
+        }
+    ]
+    response = client.post(
+        "/_dash-update-component",
+        json={
+            "output": f"..{plugin.uuid('fig')}.figure...{plugin.uuid('shown_version')}.data..",
+            "outputs": [
+                {"id": plugin.uuid("fig"), "property": "figure"},
+                {"id": plugin.uuid("shown_version"), "property": "data"},
+            ],
+            "inputs": inputs,
+            "state": [
+                {
+                    "id": plugin.uuid("shown_version"),
+                    "property": "data",
+                    "value": shown_version,
+                }
+            ],
+            "changedPropIds": [f"{plugin.uuid('refresh')}.n_intervals"],
+        },
+    )
+    if response.status_code == 204:
+        return None
+    return response.get_json()["response"][plugin.uuid("shown_version")]["data"]
+
+
+def test_refresh_updates_all_sessions(tmp_path, monkeypatch):
+    def status_file(real):
+        return tmp_path / f"realization-{real}" / "iter-0" / "status.json"
+
+    _write_status(status_file(0), [10.0, 20.0], mtime=1000)
+
+    app = dash.Dash(__name__)
+    CACHE.init_app(app.server)
+    monkeypatch.setattr(
+        running_time,
+        "load_parameters",
+        lambda **_: pd.DataFrame({"ENSEMBLE": ["iter-0"], "REAL": [0], "P": [1.0]}),
+    )
+    with mock.patch.object(
+        WebvizInstanceInfo,
+        "run_mode",
+        new_callable=mock.PropertyMock,
+        return_value=WebvizRunMode.NON_PORTABLE,
+    ):
+        plugin = RunningTimeAnalysisFMU(
+            app,
+            WebvizSettings(
+                shared_settings={
+                    "scratch_ensembles": {
+                        "iter-0": str(tmp_path / "realization-*" / "iter-0")
+                    }
+                },
+                theme=default_theme,
+            ),
+            ensembles=["iter-0"],
+            refresh_interval=1,
+        )
+    app.layout = plugin.layout
+    client = app.server.test_client()
+
+    first = _update_fig(client, plugin, 1, None)
+    second = _update_fig(client, plugin, 1, None)
+    assert first == second == {"ensemble": "iter-0", "version": 1}
+    # Sessions already showing the current version are not updated
+    assert _update_fig(client, plugin, 2, first) is None
+
+    # A changed status file is shown in every session, not only the first one
+    _write_status(status_file(1), [30.0, 5.0], mtime=2000)
+    first = _update_fig(client, plugin, 3, first)
+    second = _update_fig(client, plugin, 3, second)
+    assert first == second == {"ensemble": "iter-0", "version": 2}
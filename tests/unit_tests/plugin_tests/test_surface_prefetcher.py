@@ -0,0 +1,111 @@
+import threading
+
+import xtgeo
+
+from webviz_subsurface._providers import (
+    ObservedSurfaceAddress,
+    QualifiedSurfaceAddress,
+    SimulatedSurfaceAddress,
+    StatisticalSurfaceAddress,
+)
+from webviz_subsurface._providers.ensemble_surface_provider.ensemble_surface_provider import (
+    SurfaceStatistic,
+)
+from webviz_subsurface.plugins._map_viewer_fmu._surface_prefetcher import (
+    SurfacePrefetcher,
+    neighbor_surface_addresses,
+)
+
+
+class _Provider:
+    def __init__(self, block: threading.Event = None) -> None:
+        self.requested = []
+        self.started = threading.Event()
+        self._block = block
+
+    @staticmethod
+    def provider_id():
+        return "provider"
+
+    @staticmethod
+    def realizations():
+        return [3, 0, 1, 2]
+
+    @staticmethod
+    def surface_dates_for_attribute(_attribute):
+        return ["20200101", "20190101", "20210101"]
+
+    def get_surface(self, address):
+        self.started.set()
+        if self._block is not None:
+            self._block.wait(5)
+        self.requested.append(address)
+        return xtgeo.RegularSurface(ncol=3, nrow=2, xinc=1.0, yinc=1.0)
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.published = {}
+
+    @staticmethod
+    def encode_partial_url(qualified_address):
+        return str(qualified_address)
+
+    def get_surface_metadata(self, qualified_address):
+        return self.published.get(str(qualified_address))
+
+    def publish_surface(self, qualified_address, surface):
+        self.published[str(qualified_address)] = surface
+
+
+def test_neighbor_surface_addresses():
+    provider = _Provider()
+    address = SimulatedSurfaceAddress("ds", "top", "20200101", realization=1)
+    assert neighbor_surface_addresses(provider, address) == [
+        SimulatedSurfaceAddress("ds", "top", "20200101", realization=2),
+        SimulatedSurfaceAddress("ds", "top", "20200101", realization=0),
+        SimulatedSurfaceAddress("ds", "top", "20210101", realization=1),
+        SimulatedSurfaceAddress("ds", "top", "20190101", realization=1),
+    ]
+
+    address = StatisticalSurfaceAddress(
+        "ds", "top", None, statistic="Mean", realizations=[0, 1]
+    )
+    assert neighbor_surface_addresses(provider, address) == [
+        StatisticalSurfaceAddress(
+            "ds", "top", None, statistic=SurfaceStatistic.STDDEV, realizations=[0, 1]
+        )
+    ]
+
+    address = ObservedSurfaceAddress("ds", "top", "20210101")
+    assert neighbor_surface_addresses(provider, address) == [
+        ObservedSurfaceAddress("ds", "top", "20200101")
+    ]
+
+
+def test_prefetch_publishes_and_cancels_queued():
+    server = _Server()
+    block = threading.Event()
+    provider = _Provider(block)
+    prefetcher = SurfacePrefetcher(server, max_workers=1, max_queued=2)
+    addresses = [
+        SimulatedSurfaceAddress("ds", "top", None, realization=real)
+        for real in range(4)
+    ]
+
+    # Only max_queued surfaces are queued, and the one not yet started is
+    # cancelled by the next prefetch
+    prefetcher.prefetch([(provider, address) for address in addresses[:3]])
+    assert provider.started.wait(5)
+    prefetcher.prefetch([(provider, addresses[3])])
+    block.set()
+    for address in addresses:
+        prefetcher.wait_for(QualifiedSurfaceAddress(provider.provider_id(), address))
+
+    assert provider.requested == [addresses[0], addresses[3]]
+    assert len(server.published) == 2
+
+    # Published surfaces are not fetched again
+    prefetcher.prefetch([(provider, addresses[0])])
+    prefetcher.wait_for(QualifiedSurfaceAddress(provider.provider_id(), addresses[0]))
+    assert provider.requested == [addresses[0], addresses[3]]
@@ -2,6 +2,7 @@
 import pandas as pd
 import pytest
 
+from webviz_subsurface._components.tornado._tornado_batch_data import TornadoBatchData
 from webviz_subsurface._components.tornado._tornado_data import TornadoData
 
 
@@ -119,3 +120,43 @@ def test_tornado_data_init():
             "high_reals": [6, 7],
         },
     ]
+
+
+@pytest.mark.parametrize("scale", ["Percentage", "Absolute"])
+@pytest.mark.parametrize("reference", ["A", "B"])
+def test_tornado_batch_data(scale, reference):
+    # fmt: off
+    input_data = [
+        ["REAL",  "SENSNAME",   "SENSCASE",  "SENSTYPE", "RESP1", "RESP2"],
+        [     0,         "A",    "p10_p90", "mc"       ,    10.0,    -1.0],
+        [     1,         "A",    "p10_p90", "mc"       ,    20.0,    -2.0],
+        [     2,         "B",       "deep", "scalar"   ,     5.0,    -3.0],
+        [     3,         "B",       "deep", "scalar"   ,     6.0,    -4.0],
+        [     4,         "C",    "shallow", "scalar"   ,    25.0,     0.0],
+        [     5,         "C",    "shallow", "scalar"   ,    26.0,     1.0],
+        [     6,         "C",       "deep", "scalar"   ,    24.0,     4.0],
+        [     7,         "D", "simulation", "mc"       ,     9.0,     5.0],
+        [     8,         "D", "simulation", "mc"       ,    11.0,     6.0],
+    ]
+    # fmt: on
+    input_df = pd.DataFrame(input_data[1:], columns=input_data[0])
+
+    batch = TornadoBatchData(
+        input_df, responses=["RESP1", "RESP2"], reference=reference
+    )
+    for response in ["RESP1", "RESP2"]:
+        for sensitivities in [None, ["C"]]:
+            expected_input = input_df.rename(columns={response: "VALUE"})
+            if sensitivities is not None:
+                expected_input = expected_input.loc[
+                    expected_input["SENSNAME"].isin(sensitivities + [reference])
+                ]
+            expected = TornadoData(
+                dframe=expected_input, reference=reference, scale=scale, cutbyref=True
+            )
+            result = batch.tornado_data(
+                response, scale=scale, cutbyref=True, sensitivities=sensitivities
+            )
+            assert result.reference_average == expected.reference_average
+            pd.testing.assert_frame_equal(result.tornadotable, expected.tornadotable)
+            pd.testing.assert_frame_equal(result.real_df, expected.real_df)
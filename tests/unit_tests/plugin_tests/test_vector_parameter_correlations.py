@@ -0,0 +1,152 @@
+import datetime
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_subsurface._utils.dataframe_utils import (
+    correlate_response_with_dataframe,
+    merge_dataframes_on_realization,
+)
+from webviz_subsurface.plugins._parameter_analysis.models import (
+    VectorParameterCorrelations,
+    vector_parameter_correlations,
+)
+
+DATES = [datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1)]
+
+
+def _data() -> tuple:
+    rng = np.random.default_rng(42)
+    reals = np.arange(20)
+    param_df = pd.DataFrame(
+        {
+            "ENSEMBLE": "iter-0",
+            "REAL": reals,
+            "P1": rng.normal(size=20),
+            "P2": rng.normal(size=20),
+            "CONST": 1.0,
+        }
+    )
+    vector_df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "DATE": date,
+                    "REAL": reals,
+                    "FOPT": param_df["P1"] * (idx + 1) + rng.normal(size=20),
+                    "FGPT": rng.normal(size=20),
+                    "FWPT": 0.0 if idx == 0 else rng.normal(size=20),
+                }
+            )
+            for idx, date in enumerate(DATES)
+        ]
+    )
+    return vector_df, param_df
+
+
+@pytest.mark.parametrize("date", DATES)
+def test_correlations_match_corrwith(date: datetime.datetime) -> None:
+    vector_df, param_df = _data()
+    vectors = ["FOPT", "FGPT", "FWPT"]
+    parameters = ["P1", "P2", "CONST"]
+    correlations = VectorParameterCorrelations()
+
+    merged_df = merge_dataframes_on_realization(
+        vector_df[vector_df["DATE"] == date], param_df.copy()
+    )
+    for vector in vectors:
+        expected = correlate_response_with_dataframe(merged_df, vector, parameters)
+        result = correlations.vector_correlations(
+            "iter-0", date, vector, parameters, vector_df, param_df
+        )
+        pd.testing.assert_series_equal(
+            result, expected, check_names=False, check_index_type=False
+        )
+
+    expected = correlate_response_with_dataframe(merged_df, "P1", vectors)
+    result = correlations.parameter_correlations(
+        "iter-0", date, "P1", vectors, parameters, vector_df, param_df
+    )
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+
+def test_correlations_are_cached_per_date() -> None:
+    vector_df, param_df = _data()
+    correlations = VectorParameterCorrelations(max_cached_dates=1)
+    corr = correlations.get_correlations(
+        "iter-0", DATES[0], ["FOPT", "FWPT"], ["P1", "P2"], vector_df, param_df
+    )
+    # FWPT is constant at the first date
+    assert corr.index.tolist() == ["FOPT"]
+
+    # Vectors are added to the cached correlations at the date
+    corr = correlations.get_correlations(
+        "iter-0", DATES[0], ["FGPT", "FOPT"], ["P1", "P2"], vector_df, param_df
+    )
+    expected = VectorParameterCorrelations().get_correlations(
+        "iter-0", DATES[0], ["FGPT", "FOPT"], ["P1", "P2"], vector_df, param_df
+    )
+    pd.testing.assert_frame_equal(corr, expected)
+
+    spearman = correlations.get_correlations(
+        "iter-0", DATES[1], ["FOPT"], ["P1"], vector_df, param_df, method="spearman"
+    )
+    merged = vector_df[vector_df["DATE"] == DATES[1]]
+    assert spearman.loc["FOPT", "P1"] == pytest.approx(
+        merged["FOPT"].corr(param_df["P1"], method="spearman")
+    )
+
+
+def test_correlations_cache_is_bounded_by_size() -> None:
+    vector_df, param_df = _data()
+    one_date = VectorParameterCorrelations()
+    one_date.get_correlations(
+        "iter-0", DATES[0], ["FOPT", "FGPT"], ["P1", "P2"], vector_df, param_df
+    )
+    # pylint: disable=protected-access
+    nbytes = one_date._cached_bytes
+    assert nbytes > 0
+
+    correlations = VectorParameterCorrelations(max_cached_bytes=nbytes)
+    for date in DATES:
+        correlations.get_correlations(
+            "iter-0", date, ["FOPT", "FGPT"], ["P1", "P2"], vector_df, param_df
+        )
+    assert [key[2] for key in correlations._cache] == [DATES[1]]
+    assert correlations._cached_bytes == nbytes
+
+
+def test_correlations_at_other_dates_are_not_blocked(monkeypatch) -> None:
+    vector_df, param_df = _data()
+    correlations = VectorParameterCorrelations()
+    started = threading.Event()
+    release = threading.Event()
+    correlate_at_date = vector_parameter_correlations._correlate_at_date
+
+    def _slow_correlate_at_date(date, *args):
+        if date == DATES[0]:
+            started.set()
+            release.wait(5)
+        return correlate_at_date(date, *args)
+
+    monkeypatch.setattr(
+        vector_parameter_correlations, "_correlate_at_date", _slow_correlate_at_date
+    )
+    thread = threading.Thread(
+        target=correlations.get_correlations,
+        args=("iter-0", DATES[0], ["FOPT"], ["P1"], vector_df, param_df),
+    )
+    thread.start()
+    assert started.wait(5)
+
+    corr = correlations.get_correlations(
+        "iter-0", DATES[1], ["FOPT"], ["P1"], vector_df, param_df
+    )
+    assert not release.is_set()
+    assert corr.index.tolist() == ["FOPT"]
+
+    release.set()
+    thread.join(5)
+    assert not thread.is_alive()
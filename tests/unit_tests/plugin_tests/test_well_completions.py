@@ -6,6 +6,8 @@ from pandas._testing import assert_frame_equal
 from webviz_subsurface._datainput.well_completions import remove_invalid_colors
 from webviz_subsurface.plugins._well_completions._business_logic import (
     extract_stratigraphy,
+    extract_wells,
+    get_completion_tensors,
     merge_compdat_and_connstatus,
 )
 
@@ -156,3 +158,65 @@ def test_merge_compdat_and_connstatus():
     assert_frame_equal(
         df_result, df_output, check_like=True
     )  # Ignore order of rows and columns
+
+
+def test_get_completion_tensors():
+    """Checks that completion events and kh are forward filled from the time steps
+    with data, and that a zone is open if minimum one of its compdats is open
+    """
+    df = pd.DataFrame(
+        data={
+            "WELL": ["A1", "A1", "A1", "A1", "A2"],
+            "ZONE": ["ZoneA", "ZoneA", "ZoneA", "ZoneB", "ZoneB"],
+            "REAL": [0, 0, 0, 1, 0],
+            "DATE": [
+                "2021-02-01",
+                "2021-02-01",
+                "2021-04-01",
+                "2021-01-01",
+                "2021-03-01",
+            ],
+            "OP/SH": ["OPEN", "SHUT", "SHUT", "OPEN", "OPEN"],
+            "KH": [100.0, 10.0, 100.0, 50.0, np.nan],
+        }
+    )
+    time_steps = ["2021-01-01", "2021-02-01", "2021-03-01", "2021-04-01"]
+    events, kh_values = get_completion_tensors(
+        df, ["A1", "A2"], ["ZoneA", "ZoneB"], time_steps, [0, 1]
+    )
+    assert events.shape == (2, 2, 2, 4)
+    assert events[0, 0, 0].tolist() == [0, 1, 1, -1]
+    assert kh_values[0, 0, 0].tolist() == [0, 100, 100, 0]
+    assert events[0, 1, 1].tolist() == [1, 1, 1, 1]
+    assert events[1, 1, 0].tolist() == [0, 0, 1, 1]
+    assert kh_values[1, 1, 0].tolist() == [0, 0, 0, 0]
+    assert not events[1, :, 1].any()
+
+    wells = extract_wells(
+        df, ["ZoneA", "ZoneB"], time_steps, [0, 1], {"A1": {"type": "producer"}}
+    )
+    assert wells[0] == {
+        "name": "A1",
+        "completions": {
+            "ZoneA": {
+                "t": [1, 3],
+                "open": [0.5, 0.0],
+                "shut": [0.0, 0.5],
+                "khMean": [50.0, 0.0],
+                "khMin": [0.0, 0.0],
+                "khMax": [100.0, 0.0],
+            },
+            "ZoneB": {
+                "t": [0],
+                "open": [0.5],
+                "shut": [0.0],
+                "khMean": [25.0],
+                "khMin": [0.0],
+                "khMax": [50.0],
+            },
+        },
+        "attributes": {"type": "producer"},
+    }
+    # Realization 1 does not have A2, and is not included in khMin/khMax
+    assert wells[1]["completions"]["ZoneB"]["t"] == [2]
+    assert wells[1]["attributes"] == {}
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import xtgeo
+
+from webviz_subsurface.plugins._well_log_viewer.utils.well_log_pyramid import (
+    WellLogPyramid,
+    template_curve_names,
+)
+
+
+def _well(num_samples: int) -> xtgeo.Well:
+    md = np.arange(num_samples, dtype=float)
+    gr = np.sin(md / 50)
+    gr[1234] = 10.0
+    gr[3000:3010] = np.nan
+    dframe = pd.DataFrame(
+        {
+            "X_UTME": 0.0,
+            "Y_UTMN": 0.0,
+            "Z_TVDSS": md,
+            "MDEPTH": md,
+            "GR": gr,
+            "PHIT": np.cos(md / 20),
+        }
+    )
+    return xtgeo.Well(
+        rkb=0.0,
+        xpos=0.0,
+        ypos=0.0,
+        wname="OP_1",
+        df=dframe,
+        mdlogname="MDEPTH",
+        wlogtypes={"GR": "CONT", "PHIT": "CONT", "MDEPTH": "CONT"},
+    )
+
+
+def test_well_log_pyramid() -> None:
+    pyramid = WellLogPyramid(_well(5000), max_points=500)
+    assert pyramid.curve_names == ["MD", "TVD", "MDEPTH", "GR", "PHIT"]
+    assert pyramid.md_range == (0.0, 4999.0)
+
+    welllog = pyramid.welllog(["gr"])
+    assert [curve["name"] for curve in welllog["curves"]] == ["MD", "TVD", "GR"]
+    data = np.array(welllog["data"], dtype=float)
+    assert len(data) <= 500
+    # The extremes are kept when decimating
+    assert np.nanmax(data[:, 2]) == 10.0
+    assert data[0, 0] == 0.0 and data[-1, 0] == 4999.0
+
+    # All samples are returned for a small enough window
+    welllog = pyramid.welllog(["GR", "PHIT"], md_window=(1000.0, 1200.0))
+    data = np.array(welllog["data"], dtype=float)
+    assert data[:, 0].tolist() == np.arange(1000.0, 1201.0).tolist()
+    assert data.shape[1] == 4
+
+
+def test_template_curve_names() -> None:
+    template = {
+        "tracks": [{"plots": [{"name": "PHIT"}, {"name": "GR"}]}, {"title": "Empty"}]
+    }
+    assert template_curve_names(template) == ["PHIT", "GR"]
+    differential = {
+        "tracks": [{"plots": [{"name": "PHIT", "name2": "GR", "type": "differential"}]}]
+    }
+    assert template_curve_names(differential) == ["PHIT", "GR"]
+    assert template_curve_names({"tracks": []}) is None
+    assert template_curve_names(None) is None
@@ -3,11 +3,13 @@ from pathlib import Path
 from typing import Dict
 
 import numpy as np
+import pandas as pd
 import pyarrow as pa
 import pyarrow.compute as pc
 import pytest
 
 from webviz_subsurface._providers.ensemble_summary_provider._provider_impl_arrow_lazy import (
+    PYRAMID_FREQUENCIES,
     Frequency,
     ProviderImplArrowLazy,
     _find_first_non_increasing_date_pair,
@@ -288,6 +290,60 @@ def test_get_vectors_with_daily_resampling(tmp_path: Path) -> None:
     assert tot_arr[5] == 6
 
 
+def test_get_vectors_from_pyramid_levels(tmp_path: Path) -> None:
+    # fmt:off
+    input_data = [
+        ["DATE",                            "REAL",  "TOT_t",  "RATE_r"],
+        [np.datetime64("2020-01-01", "ms"),  0,      10.0,     1.0],
+        [np.datetime64("2020-05-04", "ms"),  0,      40.0,     4.0],
+        [np.datetime64("2021-11-06", "ms"),  0,      60.0,     6.0],
+        [np.datetime64("2020-02-01", "ms"),  1,      20.0,     2.0],
+        [np.datetime64("2020-09-14", "ms"),  1,      50.0,     5.0],
+    ]
+    # fmt:on
+    provider = _create_provider_obj_with_data(input_data, tmp_path)
+    for frequency in PYRAMID_FREQUENCIES:
+        assert (tmp_path / f"dummy_key__{frequency.value}.arrow").is_file()
+    assert not (tmp_path / "dummy_key__daily.arrow").exists()
+
+    # A backing store without pyramid levels is resampled on demand
+    lazy_storage_dir = tmp_path / "lazy"
+    lazy_storage_dir.mkdir()
+    ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
+        lazy_storage_dir,
+        "dummy_key",
+        _split_into_per_realization_tables(
+            _add_mock_smry_meta_to_table(
+                pa.Table.from_pydict(dict(zip(input_data[0], zip(*input_data[1:]))))
+            )
+        ),
+        pyramid_frequencies=[],
+    )
+    lazy_provider = ProviderImplArrowLazy.from_backing_store(
+        lazy_storage_dir, "dummy_key"
+    )
+    assert lazy_provider is not None
+    assert list(lazy_storage_dir.glob("*.arrow")) == [
+        lazy_storage_dir / "dummy_key.arrow"
+    ]
+
+    for frequency in Frequency:
+        for realizations in [None, [1]]:
+            pd.testing.assert_frame_equal(
+                provider.get_vectors_df(["RATE_r", "TOT_t"], frequency, realizations),
+                lazy_provider.get_vectors_df(
+                    ["RATE_r", "TOT_t"], frequency, realizations
+                ),
+            )
+
+    vecdf = provider.get_vectors_df(["TOT_t"], Frequency.YEARLY, [0])
+    assert vecdf["DATE"].tolist() == [
+        datetime(2020, 1, 1),
+        datetime(2021, 1, 1),
+        datetime(2022, 1, 1),
+    ]
+
+
 def test_get_vectors_for_date_without_resampling(tmp_path: Path) -> None:
     # fmt:off
     input_data = [
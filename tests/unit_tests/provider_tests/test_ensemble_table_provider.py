@@ -1,16 +1,23 @@
 from pathlib import Path
 from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from webviz_subsurface._providers import (
+    ColumnFilter,
     ColumnMetadata,
+    CompactStorageOptions,
     EnsembleTableProvider,
     EnsembleTableProviderFactory,
 )
 from webviz_subsurface._providers.ensemble_table_provider import (
     EnsembleTableProviderImplArrow,
 )
+from webviz_subsurface._providers.ensemble_table_provider._table_compaction import (
+    compact_table,
+)
 
 
 def _create_synthetic_table_provider(
@@ -191,3 +198,125 @@ def test_create_provider_set_from_aggregated_csv_file(tmp_path: Path) -> None:
         # No metadata in csv files
         meta: Optional[ColumnMetadata] = provider.column_metadata("ZONE")
         assert meta is None
+
+
+def test_create_provider_set_from_aggregated_csv_file_compact(tmp_path: Path) -> None:
+    factory = EnsembleTableProviderFactory(tmp_path, allow_storage_writes=True)
+    full_set = factory.create_provider_set_from_aggregated_csv_file(
+        "tests/data/volumes.csv"
+    )
+    compact_set = factory.create_provider_set_from_aggregated_csv_file(
+        "tests/data/volumes.csv", compact_storage=CompactStorageOptions()
+    )
+    assert set(compact_set.keys()) == set(full_set.keys())
+
+    full_df = full_set["iter-0"].get_column_data(["ZONE", "STOIIP_OIL"])
+    compact_df = compact_set["iter-0"].get_column_data(["ZONE", "STOIIP_OIL"])
+    assert compact_df["ZONE"].dtype == "category"
+    assert compact_df["STOIIP_OIL"].dtype == "float32"
+    assert compact_df["ZONE"].astype(str).tolist() == full_df["ZONE"].tolist()
+    assert np.allclose(compact_df["STOIIP_OIL"], full_df["STOIIP_OIL"], rtol=1e-6)
+    assert (
+        compact_df.memory_usage(deep=True).sum() < full_df.memory_usage(deep=True).sum()
+    )
+
+
+def test_compact_table() -> None:
+    table = pa.table(
+        {
+            "REAL": pa.array([0, 0, 1, 1], pa.int64()),
+            "EXACT": [1.0, 2.5, np.nan, 4.0],
+            "PRECISE": [1.0 + 1e-12, 2.0, 3.0, 4.0],
+            "HUGE": [1e300, 2.0, 3.0, 4.0],
+            "INT": [1, 2, 300, 4],
+            "ZONE": ["A", "A", "B", "B"],
+            "WELL": ["W1", "W2", "W3", "W4"],
+        }
+    )
+    compacted = compact_table(table, CompactStorageOptions())
+    assert compacted.schema.field("REAL").type == pa.int64()
+    assert compacted.schema.field("EXACT").type == pa.float32()
+    assert compacted.schema.field("PRECISE").type == pa.float32()
+    assert compacted.schema.field("HUGE").type == pa.float64()
+    assert compacted.schema.field("INT").type == pa.int16()
+    assert pa.types.is_dictionary(compacted.schema.field("ZONE").type)
+    assert compacted.schema.field("WELL").type == pa.string()
+
+    # A stricter tolerance keeps the float64 values that are not exact in float32
+    compacted = compact_table(table, CompactStorageOptions(float_rel_tolerance=0))
+    assert compacted.schema.field("EXACT").type == pa.float32()
+    assert compacted.schema.field("PRECISE").type == pa.float64()
+
+
+def test_get_column_data_with_column_filters(tmp_path: Path) -> None:
+    per_real_tables = {
+        real: pa.table(
+            {
+                "ZONE": ["Upper", "Lower", "Upper", "Lower"],
+                "REGION": ["A", "A", "B", "B"],
+                "STOIIP": [1.0 + real, 2.0 + real, 3.0 + real, 4.0 + real],
+            }
+        )
+        for real in [0, 1, 2]
+    }
+    EnsembleTableProviderImplArrow.write_backing_store_from_per_realization_tables(
+        tmp_path, "filtered", per_real_tables
+    )
+    provider = EnsembleTableProviderImplArrow.from_backing_store(tmp_path, "filtered")
+    assert provider is not None
+    assert provider.realizations() == [0, 1, 2]
+
+    df = provider.get_column_data(
+        ["STOIIP"], column_filters=[ColumnFilter("ZONE", values=["Upper"])]
+    )
+    assert df.columns.tolist() == ["REAL", "STOIIP"]
+    assert df["STOIIP"].tolist() == [1.0, 3.0, 2.0, 4.0, 3.0, 5.0]
+
+    df = provider.get_column_data(
+        ["ZONE", "STOIIP"],
+        realizations=[1, 2],
+        column_filters=[
+            ColumnFilter("REGION", values=["B"]),
+            ColumnFilter("STOIIP", min_value=4.5, max_value=6.0),
+        ],
+    )
+    assert df.to_dict("list") == {
+        "REAL": [1, 2, 2],
+        "ZONE": ["Lower", "Upper", "Lower"],
+        "STOIIP": [5.0, 5.0, 6.0],
+    }
+
+    # No matching rows
+    df = provider.get_column_data(
+        ["STOIIP"], column_filters=[ColumnFilter("REGION", values=[])]
+    )
+    assert df.shape == (0, 2)
+
+
+def test_create_from_per_realization_parameter_file_compact(tmp_path: Path) -> None:
+    ens_path = tmp_path / "ensemble"
+    for real in range(3):
+        real_dir = ens_path / f"realization-{real}" / "iter-0"
+        real_dir.mkdir(parents=True)
+        (real_dir / "OK").write_text("")
+        (real_dir / "parameters.txt").write_text(
+            f"FLOAT_PARAM {0.5 * (real + 1)}\nINT_PARAM {real + 1}\nZONE_NAME Upper\n"
+        )
+    ens_pattern = str(ens_path / "realization-*" / "iter-0")
+
+    factory = EnsembleTableProviderFactory(
+        tmp_path / "storage", allow_storage_writes=True
+    )
+    full = factory.create_from_per_realization_parameter_file(ens_pattern)
+    compact = factory.create_from_per_realization_parameter_file(
+        ens_pattern, compact_storage=CompactStorageOptions()
+    )
+
+    full_df = full.get_column_data(["FLOAT_PARAM", "INT_PARAM"])
+    compact_df = compact.get_column_data(["FLOAT_PARAM", "INT_PARAM"])
+    assert full_df["FLOAT_PARAM"].dtype == "float64"
+    assert full_df["INT_PARAM"].dtype == "int64"
+    assert compact_df["FLOAT_PARAM"].dtype == "float32"
+    assert compact_df["INT_PARAM"].dtype == "int8"
+    assert sorted(compact_df["FLOAT_PARAM"].tolist()) == [0.5, 1.0, 1.5]
+    assert sorted(compact_df["INT_PARAM"].tolist()) == [1, 2, 3]
@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+from webviz_subsurface._providers.benchmarks import (
+    SYNTHETIC_ENSEMBLE_SIZES,
+    compare_benchmark_results,
+    create_synthetic_ensemble,
+    run_benchmarks,
+)
+
+
+def test_run_benchmarks_on_synthetic_ensemble(tmp_path: Path) -> None:
+    spec = SYNTHETIC_ENSEMBLE_SIZES["tiny"]
+    ensemble = create_synthetic_ensemble(tmp_path / "ensemble", spec)
+    assert len(ensemble.vector_names) == spec.num_vectors
+    assert ensemble.runpath(2).exists()
+
+    results = run_benchmarks(ensemble, tmp_path / "benchmarks", repeat=1)
+    assert results["spec"]["num_realizations"] == spec.num_realizations
+    assert {
+        "summary.init_import",
+        "summary.get_vectors_df_monthly",
+        "summary.get_vectors_for_date_df",
+        "table.get_column_data",
+        "surface.statistical_surface",
+        "surface.png_encoding",
+        "grid.surface_extraction",
+        "grid.egrid_init_import",
+        "grid.egrid_surface_extraction_static",
+        "grid.egrid_surface_extraction_dynamic",
+    } <= set(results["benchmarks"])
+    # The results must be JSON serializable
+    assert json.loads(json.dumps(results)) == results
+
+
+def test_compare_benchmark_results() -> None:
+    baseline = {
+        "benchmarks": {
+            "a": {"median_ms": 10.0},
+            "b": {"median_ms": 10.0},
+            "removed": {"median_ms": 10.0},
+        }
+    }
+    current = {
+        "benchmarks": {
+            "a": {"median_ms": 12.0},
+            "b": {"median_ms": 20.0},
+            "new": {"median_ms": 1.0},
+        }
+    }
+    assert compare_benchmark_results(baseline, current) == [
+        "b: 10.0ms -> 20.0ms (2.00x)"
+    ]
+    assert len(compare_benchmark_results(baseline, current, tolerance=0.1)) == 2
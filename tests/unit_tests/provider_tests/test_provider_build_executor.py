@@ -0,0 +1,130 @@
+import functools
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from webviz_subsurface._providers import EnsembleTableProviderFactory
+from webviz_subsurface._providers.provider_build_executor import ProviderBuildExecutor
+
+
+def test_build_all_keeps_order_and_runs_concurrently() -> None:
+    executor = ProviderBuildExecutor(max_concurrent_imports=3)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def build(value: int) -> int:
+        # Will time out unless the three functions run concurrently
+        barrier.wait()
+        return value
+
+    results = executor.build_all(
+        {
+            name: functools.partial(build, v)
+            for name, v in [("c", 3), ("a", 1), ("b", 2)]
+        }
+    )
+    assert list(results.items()) == [("c", 3), ("a", 1), ("b", 2)]
+
+
+def test_build_all_reraises() -> None:
+    executor = ProviderBuildExecutor(max_concurrent_imports=2)
+
+    def fail() -> int:
+        raise ValueError("Failed to load")
+
+    with pytest.raises(ValueError, match="Failed to load"):
+        executor.build_all({"a": lambda: 1, "b": fail})
+
+
+def test_import_slot_serializes_same_key(tmp_path: Path) -> None:
+    executor = ProviderBuildExecutor(max_concurrent_imports=4)
+    active = {"key_a": 0}
+    max_active = {"key_a": 0}
+    counter_lock = threading.Lock()
+
+    def import_data() -> None:
+        with executor.import_slot(tmp_path, "key_a"):
+            with counter_lock:
+                active["key_a"] += 1
+                max_active["key_a"] = max(max_active["key_a"], active["key_a"])
+            time.sleep(0.02)
+            with counter_lock:
+                active["key_a"] -= 1
+
+    executor.build_all({str(idx): import_data for idx in range(4)})
+    assert max_active["key_a"] == 1
+    assert (tmp_path / "key_a.lock").exists()
+
+
+def test_import_slot_limits_concurrent_imports(tmp_path: Path) -> None:
+    executor = ProviderBuildExecutor(max_concurrent_imports=2)
+    active = [0]
+    max_active = [0]
+    counter_lock = threading.Lock()
+
+    def import_data(storage_key: str) -> None:
+        with executor.import_slot(tmp_path, storage_key):
+            with counter_lock:
+                active[0] += 1
+                max_active[0] = max(max_active[0], active[0])
+            time.sleep(0.02)
+            with counter_lock:
+                active[0] -= 1
+
+    threads = [
+        threading.Thread(target=import_data, args=(f"key_{idx}",)) for idx in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max_active[0] == 2
+
+
+def test_import_slot_returns_existing_backing_store(tmp_path: Path) -> None:
+    executor = ProviderBuildExecutor(max_concurrent_imports=4)
+    written = set()
+    num_imports = [0]
+
+    def from_backing_store(storage_dir: Path, storage_key: str):
+        assert storage_dir == tmp_path
+        return f"provider_{storage_key}" if storage_key in written else None
+
+    def create_provider() -> str:
+        with executor.import_slot(
+            tmp_path, "key_a", from_backing_store
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
+            time.sleep(0.02)
+            num_imports[0] += 1
+            written.add("key_a")
+            return "imported"
+
+    results = executor.build_all({str(idx): create_provider for idx in range(4)})
+    # Only the first one to get the lock imports, the others load its result
+    assert sorted(results.values()) == ["imported"] + ["provider_key_a"] * 3
+    assert num_imports[0] == 1
+
+
+def test_provider_set_from_aggregated_csv_file(tmp_path: Path) -> None:
+    csv_file = tmp_path / "aggregated.csv"
+    pd.DataFrame(
+        {
+            "ENSEMBLE": ["iter-0", "iter-0", "iter-1", "iter-2"],
+            "REAL": [0, 1, 0, 0],
+            "A": [1.0, 2.0, 3.0, 4.0],
+        }
+    ).to_csv(csv_file, index=False)
+
+    factory = EnsembleTableProviderFactory(tmp_path / "storage", True)
+    providers = factory.create_provider_set_from_aggregated_csv_file(csv_file)
+    assert list(providers) == ["iter-0", "iter-1", "iter-2"]
+    assert providers["iter-0"].get_column_data(["A"])["A"].tolist() == [1.0, 2.0]
+
+    # The second time the providers are loaded from the backing store
+    read_only_factory = EnsembleTableProviderFactory(tmp_path / "storage", False)
+    providers = read_only_factory.create_provider_set_from_aggregated_csv_file(csv_file)
+    assert providers["iter-2"].get_column_data(["A"])["A"].tolist() == [4.0]
@@ -0,0 +1,68 @@
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._providers.ensemble_surface_provider.surface_diff import (
+    SurfaceGeometry,
+    compute_diff_surface,
+    get_resampling_operator,
+)
+
+
+def _surfaces(rotation, yflip):
+    rng = np.random.default_rng(42)
+    surface_a = xtgeo.RegularSurface(
+        ncol=50, nrow=40, xinc=25.0, yinc=25.0, values=rng.random((50, 40))
+    )
+    values_b = np.ma.array(rng.random((70, 60)))
+    values_b[10:15, 20:30] = np.ma.masked
+    surface_b = xtgeo.RegularSurface(
+        ncol=70,
+        nrow=60,
+        xinc=20.0,
+        yinc=20.0,
+        xori=-13.0,
+        yori=-7.0 if yflip == 1 else 1100.0,
+        rotation=rotation,
+        yflip=yflip,
+        values=values_b,
+    )
+    return surface_a, surface_b
+
+
+def test_diff_surface_matches_xtgeo():
+    for rotation, yflip in [(0.0, 1), (10.0, 1), (33.0, -1)]:
+        surface_a, surface_b = _surfaces(rotation, yflip)
+        expected = surface_a - surface_b
+        diff = compute_diff_surface(surface_a, surface_b)
+
+        assert SurfaceGeometry.from_surface(diff) == SurfaceGeometry.from_surface(
+            surface_a
+        )
+        assert np.array_equal(
+            np.ma.getmaskarray(diff.values), np.ma.getmaskarray(expected.values)
+        )
+        assert np.ma.allclose(diff.values, expected.values)
+
+
+def test_resampling_operator_is_reused():
+    surface_a, surface_b = _surfaces(10.0, 1)
+    geometry_a = SurfaceGeometry.from_surface(surface_a)
+    geometry_b = SurfaceGeometry.from_surface(surface_b)
+    operator = get_resampling_operator(geometry_a, geometry_b)
+    assert get_resampling_operator(geometry_a, geometry_b) is operator
+
+    # Any values on the source geometry can be resampled with the operator
+    surface_b.values = surface_b.values * 2
+    expected = surface_a - surface_b
+    diff = compute_diff_surface(surface_a, surface_b)
+    assert np.ma.allclose(diff.values, expected.values)
+
+
+def test_diff_surface_same_geometry():
+    surface_a, _ = _surfaces(0.0, 1)
+    surface_b = surface_a.copy()
+    surface_b.values = surface_b.values + 1.5
+    diff = compute_diff_surface(surface_a, surface_b)
+    assert np.ma.allclose(diff.values, -1.5)
+    # The input surfaces are not modified
+    assert not np.ma.allclose(surface_a.values, -1.5)
@@ -0,0 +1,128 @@
+from unittest import mock
+
+import dash
+import numpy as np
+import xtgeo
+from dash import html
+from webviz_config.webviz_instance_info import WebvizInstanceInfo
+
+from webviz_subsurface._providers import (
+    QualifiedSurfaceAddress,
+    SimulatedSurfaceAddress,
+    SurfaceServer,
+)
+from webviz_subsurface._providers.ensemble_surface_provider._surface_to_tiles import (
+    SurfaceTile,
+    surface_to_tile_pyramid,
+)
+
+
+def _decode_tile(tile):
+    # pylint: disable=import-outside-toplevel
+    import io
+
+    from PIL import Image
+
+    rgba = np.asarray(Image.open(io.BytesIO(tile.png_bytes))).astype(np.int64)
+    scaled = rgba[:, :, 0] * 256 * 256 + rgba[:, :, 1] * 256 + rgba[:, :, 2]
+    values = tile.val_min + scaled * (tile.val_max - tile.val_min) / (256**3 - 1)
+    return np.ma.masked_where(rgba[:, :, 3] == 0, values)
+
+
+def test_surface_to_tile_pyramid():
+    ncol, nrow = 300, 130
+    values = np.ma.array(
+        np.arange(ncol * nrow, dtype=np.float64).reshape(ncol, nrow) / 7.0
+    )
+    values[:70, :] = np.ma.masked
+    surface = xtgeo.RegularSurface(
+        ncol=ncol, nrow=nrow, xinc=10.0, yinc=10.0, values=values
+    )
+
+    meta, tiles = surface_to_tile_pyramid(surface, tile_size=64)
+    assert (meta.width, meta.height) == (ncol, nrow)
+    assert meta.num_levels == 4
+    assert meta.level_num_tiles == [(1, 1), (2, 1), (3, 2), (5, 3)]
+    assert all(0 <= z < meta.num_levels for z, _x, _y in tiles)
+
+    # The full resolution level reproduces the surface, in image orientation
+    image_values = np.flip(surface.values.transpose(), axis=0)
+    full = np.ma.masked_all((3 * 64, 5 * 64))
+    for x_idx in range(5):
+        for y_idx in range(3):
+            tile = tiles.get((3, x_idx, y_idx))
+            if tile is not None:
+                full[
+                    y_idx * 64 : (y_idx + 1) * 64, x_idx * 64 : (x_idx + 1) * 64
+                ] = _decode_tile(tile)
+    full = full[:nrow, :ncol]
+    assert np.array_equal(np.ma.getmaskarray(full), np.ma.getmaskarray(image_values))
+    # Quantization within the value range of each tile
+    assert np.ma.max(np.abs(full - image_values)) < 1e-3
+
+    # Tiles without defined values are left out
+    assert all((3, 0, y_idx) not in tiles for y_idx in range(3))
+    assert (2, 0, 0) in tiles
+
+    # The coarsest level is the mean of the defined values
+    coarse = _decode_tile(tiles[(0, 0, 0)])
+    assert np.isclose(coarse.max(), image_values.max(), rtol=0.05)
+
+
+def test_publish_surface_with_tiles(tmp_path):
+    app = dash.Dash(__name__)
+    app.layout = html.Div()
+    with mock.patch.object(
+        WebvizInstanceInfo,
+        "storage_folder",
+        new_callable=mock.PropertyMock,
+        return_value=tmp_path,
+    ):
+        server = SurfaceServer(app)
+    client = app.server.test_client()
+
+    def _address(name):
+        return QualifiedSurfaceAddress(
+            "provider", SimulatedSurfaceAddress("ds", name, None, realization=0)
+        )
+
+    small_addresses = [_address(f"small_{idx}") for idx in range(6)]
+    for address in small_addresses:
+        server.publish_surface(
+            address, xtgeo.RegularSurface(ncol=3, nrow=2, xinc=1.0, yinc=1.0)
+        )
+
+    # Each pyramid has 341 tiles, more than the default threshold of the cache
+    ncol = nrow = 512
+    values = np.arange(ncol * nrow, dtype=np.float64).reshape(ncol, nrow)
+    tiled_addresses = [_address(f"tiled_{idx}") for idx in range(2)]
+    for address in tiled_addresses:
+        server.publish_surface(
+            address,
+            xtgeo.RegularSurface(
+                ncol=ncol, nrow=nrow, xinc=1.0, yinc=1.0, values=values
+            ),
+            tile_size=32,
+        )
+
+    # Tiles do not evict images or metadata
+    for address in small_addresses + tiled_addresses:
+        assert server.get_surface_metadata(address) is not None
+        assert client.get(server.encode_partial_url(address)).status_code == 200
+
+    meta = server.get_surface_metadata(tiled_addresses[0]).tile_pyramid
+    assert meta.num_levels == 5
+    assert meta.level_num_tiles[-1] == (16, 16)
+    tile_url = server.encode_partial_tile_url(tiled_addresses[0])
+    response = client.get(tile_url.format(z=4, x=0, y=15))
+    assert response.status_code == 200
+    tile = SurfaceTile(
+        png_bytes=response.data,
+        val_min=float(response.headers["X-Value-Min"]),
+        val_max=float(response.headers["X-Value-Max"]),
+    )
+    # Lower left tile, in image orientation
+    expected = np.flip(values[:32, :32].transpose(), axis=0)
+    assert np.max(np.abs(_decode_tile(tile) - expected)) < 1e-2
+
+    assert client.get(tile_url.format(z=4, x=16, y=0)).status_code == 404
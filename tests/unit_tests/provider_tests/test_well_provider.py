@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._providers.well_provider._provider_impl_file import (
+    WELL_PATHS_FILE_NAME,
+    ProviderImplFile,
+)
+
+
+def _write_rmswell(file_name: Path, well_name: str, num_points: int) -> None:
+    lines = [
+        "1.0",
+        "Unknown",
+        f"{well_name} 1000.0 2000.0",
+        "1",
+        "MDepth unk lin",
+    ]
+    for idx in range(num_points):
+        lines.append(
+            f"{1000.0 + idx} {2000.0 - 2 * idx} {1500.0 + 10 * idx} {10.0 * idx}"
+        )
+    file_name.write_text("\n".join(lines) + "\n")
+
+
+def _write_store(tmp_path: Path, storage_key: str) -> list:
+    well_file_names = []
+    for well_name, num_points in [("OP_1", 5), ("OP_2", 12), ("WI_1", 8)]:
+        file_name = tmp_path / f"{well_name}.w"
+        _write_rmswell(file_name, well_name, num_points)
+        well_file_names.append(str(file_name))
+    ProviderImplFile.write_backing_store(
+        tmp_path, storage_key, well_file_names, md_logname="MDepth"
+    )
+    return well_file_names
+
+
+def test_well_paths_from_columnar_store(tmp_path: Path) -> None:
+    well_file_names = _write_store(tmp_path, "wells")
+    assert (tmp_path / "wells" / WELL_PATHS_FILE_NAME).exists()
+
+    provider = ProviderImplFile.from_backing_store(tmp_path, "wells")
+    assert provider is not None
+    assert sorted(provider.well_names()) == ["OP_1", "OP_2", "WI_1"]
+
+    for file_name in well_file_names:
+        well = xtgeo.well_from_file(wfile=file_name, mdlogname="MDepth")
+        df = well.dataframe
+        well_path = provider.get_well_path(well.name)
+        np.testing.assert_array_equal(well_path.x_arr, df["X_UTME"])
+        np.testing.assert_array_equal(well_path.y_arr, df["Y_UTMN"])
+        np.testing.assert_array_equal(well_path.z_arr, df["Z_TVDSS"])
+        np.testing.assert_array_equal(well_path.md_arr, df["MDepth"])
+
+    well_paths = provider.get_well_paths(["WI_1", "OP_1"])
+    assert list(well_paths) == ["WI_1", "OP_1"]
+    np.testing.assert_array_equal(
+        well_paths["OP_1"].z_arr, provider.get_well_path("OP_1").z_arr
+    )
+
+
+def test_well_path_without_columnar_store(tmp_path: Path) -> None:
+    _write_store(tmp_path, "wells")
+    expected = ProviderImplFile.from_backing_store(tmp_path, "wells").get_well_path(
+        "OP_2"
+    )
+
+    # Backing stores written before the well paths file was added
+    (tmp_path / "wells" / WELL_PATHS_FILE_NAME).unlink()
+    provider = ProviderImplFile.from_backing_store(tmp_path, "wells")
+    well_path = provider.get_well_path("OP_2")
+    np.testing.assert_array_equal(well_path.x_arr, expected.x_arr)
+    np.testing.assert_array_equal(well_path.md_arr, expected.md_arr)
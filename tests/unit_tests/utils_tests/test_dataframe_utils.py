@@ -1,11 +1,13 @@
 import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas._testing import assert_frame_equal
 
 from webviz_subsurface._utils.dataframe_utils import (
     assert_date_column_is_datetime_object,
+    correlation_matrix,
     make_date_column_datetime_object,
 )
 
@@ -279,3 +281,29 @@ def test_make_date_column_datetime_object_input_date_year_2020_df() -> None:
     with pytest.raises(ValueError) as err:
         make_date_column_datetime_object(input_date_year_2020_df)
     assert str(err.value) == f'Column "DATE" of type {datetime.date} is not handled!'
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_correlation_matrix(method: str) -> None:
+    rng = np.random.default_rng(seed=0)
+    dframe1 = pd.DataFrame(rng.normal(size=(30, 3)) + 250, columns=["A", "B", "C"])
+    dframe1["CONST"] = 1.0
+    dframe2 = pd.DataFrame(rng.normal(size=(30, 2)), columns=["X", "Y"])
+    dframe2["Y"] += dframe1["A"]
+    if method == "pearson":
+        # Missing values are excluded pairwise
+        dframe1.loc[3, "B"] = np.nan
+        dframe2.loc[7, "X"] = np.nan
+
+    corrdf = correlation_matrix(dframe1, dframe2, method=method)
+
+    expected = pd.DataFrame(
+        {col: dframe1.corrwith(dframe2[col], method=method) for col in dframe2}
+    )
+    assert_frame_equal(corrdf, expected)
+    assert corrdf.loc["CONST"].isna().all()
+
+
+def test_correlation_matrix_unknown_method() -> None:
+    with pytest.raises(ValueError):
+        correlation_matrix(pd.DataFrame({"A": [1]}), pd.DataFrame({"B": [1]}), "foo")
@@ -0,0 +1,166 @@
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+import xtgeo
+
+from webviz_subsurface._utils.fingerprint_memoize import (
+    fingerprint,
+    fingerprint_memoize,
+    memoize_stats,
+)
+
+
+class _Model:
+    pass
+
+
+def test_fingerprint_dataframe() -> None:
+    df = pd.DataFrame({"A": np.arange(10000.0), "B": ["x"] * 10000})
+    assert fingerprint(df) == fingerprint(df.copy())
+
+    changed = df.copy()
+    changed.loc[0, "A"] = -1.0
+    assert fingerprint(df) != fingerprint(changed)
+    assert fingerprint(df) != fingerprint(df.rename(columns={"B": "C"}))
+    assert fingerprint(df) != fingerprint(df.astype({"A": np.float32}))
+
+    # Changes to any row are detected, not only to a sample of the rows
+    large = pd.DataFrame({"A": np.arange(6000.0), "B": np.arange(6000)})
+    changed = large.copy()
+    changed.loc[3, "B"] = -1
+    assert fingerprint(large) != fingerprint(changed)
+    assert fingerprint(large["B"]) != fingerprint(changed["B"])
+
+    # Unhashable values
+    lists = pd.DataFrame({"A": [[1, 2], [3]]})
+    assert fingerprint(lists) == fingerprint(lists.copy())
+
+
+def test_fingerprint_arrays_and_containers() -> None:
+    arr = np.arange(12.0).reshape(3, 4)
+    assert fingerprint(arr) == fingerprint(arr.copy())
+    assert fingerprint(arr) != fingerprint(arr.reshape(4, 3))
+
+    large = np.arange(6000.0)
+    changed = large.copy()
+    changed[3] = -1.0
+    assert fingerprint(large) != fingerprint(changed)
+
+    masked = np.ma.masked_array(arr, mask=arr > 5)
+    assert fingerprint(masked) != fingerprint(np.ma.masked_array(arr, mask=arr > 6))
+
+    assert fingerprint({"a": [1, arr]}) == fingerprint({"a": [1, arr.copy()]})
+    assert fingerprint([1, 2]) != fingerprint((1, 2))
+
+
+def test_fingerprint_identity_token() -> None:
+    model = _Model()
+    assert fingerprint(model) == fingerprint(model)
+    assert fingerprint(model) != fingerprint(_Model())
+
+
+def test_fingerprint_memoize() -> None:
+    calls = []
+
+    @fingerprint_memoize(maxsize=2)
+    def total(df: pd.DataFrame, column: str = "A") -> pd.DataFrame:
+        calls.append(column)
+        return df[[column]].sum().to_frame()
+
+    df = pd.DataFrame({"A": [1.0, 2.0], "B": [3.0, 4.0]})
+    first = total(df, "A")
+    # Returned objects are copies, and can be modified by the caller
+    first.iloc[0, 0] = 100.0
+    assert total(df.copy(), "A").iloc[0, 0] == 3.0
+    assert calls == ["A"]
+
+    total(df, "B")
+    total(df, "A")
+    assert calls == ["A", "B"]
+
+    # The least recently used result ("B") is discarded
+    total(df[["A"]].assign(B=0.0), "B")
+    total(df, "A")
+    total(df, "B")
+    assert calls == ["A", "B", "B", "B"]
+
+    stats = total.cache_info()  # type: ignore[attr-defined]
+    assert (stats.hits, stats.misses) == (3, 4)
+    assert stats.hit_rate == 3 / 7
+    assert memoize_stats()[f"{__name__}.{total.__qualname__}"] is stats
+
+    total.cache_clear()  # type: ignore[attr-defined]
+    total(df, "A")
+    assert len(calls) == 5
+
+
+def test_fingerprint_xtgeo_objects() -> None:
+    values = np.arange(12.0).reshape(4, 3)
+    surface = xtgeo.RegularSurface(ncol=4, nrow=3, xinc=1.0, yinc=1.0, values=values)
+    # Content based, not based on the identity of the surface
+    assert fingerprint(surface) == fingerprint(surface.copy())
+    changed = surface.copy()
+    changed.values = values + 1.0
+    assert fingerprint(surface) != fingerprint(changed)
+    shifted = surface.copy()
+    shifted.xori = 10.0
+    assert fingerprint(surface) != fingerprint(shifted)
+    assert not any(callable(part) for part in _flatten(fingerprint(surface)))
+
+    cube_values = np.arange(24, dtype=np.float32).reshape(2, 3, 4)
+    cube = xtgeo.Cube(
+        ncol=2, nrow=3, nlay=4, xinc=1.0, yinc=1.0, zinc=1.0, values=cube_values
+    )
+    same_cube = xtgeo.Cube(
+        ncol=2, nrow=3, nlay=4, xinc=1.0, yinc=1.0, zinc=1.0, values=cube_values.copy()
+    )
+    assert fingerprint(cube) == fingerprint(same_cube)
+    assert fingerprint(cube) != fingerprint(
+        xtgeo.Cube(
+            ncol=2, nrow=3, nlay=4, xinc=1.0, yinc=1.0, zinc=1.0, values=cube_values * 2
+        )
+    )
+
+    well_df = pd.DataFrame(
+        {"X_UTME": [1.0, 2.0], "Y_UTMN": [3.0, 4.0], "Z_TVDSS": [5.0, 6.0]}
+    )
+    well = xtgeo.Well(wname="OP_1", df=well_df)
+    assert fingerprint(well) == fingerprint(xtgeo.Well(wname="OP_1", df=well_df.copy()))
+    assert fingerprint(well) != fingerprint(
+        xtgeo.Well(wname="OP_1", df=well_df.assign(Z_TVDSS=[5.0, 7.0]))
+    )
+    assert fingerprint(well) != fingerprint(xtgeo.Well(wname="OP_2", df=well_df))
+
+
+def test_fingerprint_memoize_xtgeo_surface() -> None:
+    num_calls = []
+
+    @fingerprint_memoize(maxsize=8, copy_result=False)
+    def surface_max(surface: xtgeo.RegularSurface) -> float:
+        num_calls.append(1)
+        return float(surface.values.max())
+
+    surface_refs = []
+    for _ in range(5):
+        surface = xtgeo.RegularSurface(
+            ncol=4, nrow=3, xinc=1.0, yinc=1.0, values=np.arange(12.0).reshape(4, 3)
+        )
+        surface_refs.append(weakref.ref(surface))
+        assert surface_max(surface) == 11.0
+    del surface
+
+    # Surfaces with the same content hit the same entry, and the cache does not
+    # keep the surfaces alive
+    assert len(num_calls) == 1
+    gc.collect()
+    assert all(surface_ref() is None for surface_ref in surface_refs)
+
+
+def _flatten(obj):
+    if isinstance(obj, tuple):
+        for item in obj:
+            yield from _flatten(item)
+    else:
+        yield obj
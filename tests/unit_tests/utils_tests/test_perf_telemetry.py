@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+
+import pytest
+from dash import Dash, html
+
+from webviz_subsurface._utils.perf_telemetry import (
+    TELEMETRY_ENV_VAR,
+    TELEMETRY_URL_PATH,
+    PerfTelemetry,
+    add_span_tags,
+    record_phases,
+    register_telemetry_route,
+    telemetry_span,
+    traced,
+)
+
+
+@pytest.fixture(name="telemetry")
+def fixture_telemetry() -> PerfTelemetry:
+    telemetry = PerfTelemetry.instance()
+    telemetry.reset()
+    return telemetry
+
+
+@traced("test.load", tags=lambda name, size=1: {"name": name})
+def _load(name: str, size: int = 1) -> str:
+    record_phases(read=2.0, convert=1.0)
+    add_span_tags(bytes=size)
+    return name
+
+
+def test_traced_records_spans(telemetry: PerfTelemetry) -> None:
+    for size in range(100):
+        assert _load("a", size=size) == "a"
+
+    snapshot = telemetry.snapshot()
+    assert list(snapshot["operations"]) == [
+        "test.load",
+        "test.load.convert",
+        "test.load.read",
+    ]
+    assert snapshot["operations"]["test.load"]["count"] == 100
+    assert snapshot["operations"]["test.load.read"]["p99_ms"] == 2.0
+
+    span = snapshot["recent_spans"][-1]
+    assert span["operation"] == "test.load"
+    assert span["tags"] == {"name": "a", "bytes": 99}
+    assert span["phases_ms"] == {"read": 2.0, "convert": 1.0}
+
+
+def test_span_errors_and_nesting(telemetry: PerfTelemetry) -> None:
+    with pytest.raises(ValueError):
+        with telemetry_span("test.outer", provider="p") as outer:
+            _load("inner")
+            add_span_tags(num_vectors=3)
+            raise ValueError()
+
+    assert outer.tags == {"provider": "p", "num_vectors": 3, "error": True}
+    assert [span["operation"] for span in telemetry.snapshot()["recent_spans"]] == [
+        "test.load",
+        "test.outer",
+    ]
+
+    # Outside a span tags and phases are ignored
+    add_span_tags(bytes=1)
+    record_phases(read=1.0)
+
+
+def test_dump_json(telemetry: PerfTelemetry, tmp_path: Path) -> None:
+    _load("a")
+    telemetry.dump_json(tmp_path / "telemetry.json")
+    dumped = json.loads((tmp_path / "telemetry.json").read_text())
+    assert dumped["operations"]["test.load"]["count"] == 1
+
+
+def test_telemetry_route(
+    telemetry: PerfTelemetry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    app = Dash(__name__)
+    app.layout = html.Div()
+    register_telemetry_route(app)
+    assert TELEMETRY_URL_PATH not in [
+        rule.rule for rule in app.server.url_map.iter_rules()
+    ]
+
+    monkeypatch.setenv(TELEMETRY_ENV_VAR, "1")
+    register_telemetry_route(app)
+    register_telemetry_route(app)
+
+    _load("a")
+    response = app.server.test_client().get(TELEMETRY_URL_PATH)
+    assert response.json["operations"]["test.load"]["count"] == 1
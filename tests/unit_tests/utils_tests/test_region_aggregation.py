@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from webviz_subsurface._utils.region_aggregation import RegionAggregator, calc_recovery
+
+
+def _smry() -> pd.DataFrame:
+    smry = pd.DataFrame(
+        {
+            "ENSEMBLE": ["iter-0"] * 4 + ["iter-1"] * 2,
+            "REAL": [0, 0, 1, 1, 0, 0],
+            "DATE": pd.to_datetime(["2000-01-01", "2001-01-01"] * 3),
+        }
+    )
+    for node in [1, 2, 3, 4]:
+        smry[f"ROIP:{node}"] = [10.0 * node, 5.0 * node] * 3
+    smry["RGIP:1"] = 1.0
+    smry.loc[1, "ROIP:2"] = np.nan
+    return smry
+
+
+FIPDESC = pd.DataFrame(
+    [
+        ("FIPNUM", "ZONE", "Upper", 1),
+        ("FIPNUM", "ZONE", "Upper", 2),
+        ("FIPNUM", "ZONE", "Lower", 3),
+        ("FIPNUM", "ZONE", "Lower", 4),
+        ("FIPNUM", "REGION", "B", 2),
+        ("FIPNUM", "REGION", "B", 4),
+        ("FIPNUM", "REGION", "A", 1),
+        ("FIPNUM", "REGION", "A", 3),
+    ],
+    columns=["FIP", "GROUP", "SUBGROUP", "NODE"],
+)
+
+
+def test_aggregate_with_fipdesc() -> None:
+    smry = _smry()
+    aggregator = RegionAggregator(smry, list(smry.columns[3:]), "FIPNUM", FIPDESC)
+    filters = {"ZONE": ["Upper", "Lower"], "REGION": ["A", "B"]}
+
+    names, matrix = aggregator.aggregation_matrix("REGION", filters)
+    # Ordered by the first region in each group
+    assert names == ["A", "B"]
+    assert matrix.toarray().tolist() == [[1, 0], [0, 1], [1, 0], [0, 1]]
+
+    df, ref_vector = aggregator.aggregate(["iter-0"], "REGION", "ROIP", filters)
+    assert ref_vector == "ROIP:1"
+    assert list(df.columns) == [
+        "ENSEMBLE",
+        "REAL",
+        "DATE",
+        "AGG_ROIP_filtered_on_A",
+        "AGG_ROIP_filtered_on_B",
+    ]
+    assert df["AGG_ROIP_filtered_on_A"].tolist() == [40.0, 20.0] * 2
+    # Missing values are treated as zero
+    assert df["AGG_ROIP_filtered_on_B"].tolist() == [60.0, 20.0, 60.0, 30.0]
+
+    df, ref_vector = aggregator.aggregate(
+        ["iter-0", "iter-1"], "ENSEMBLE", "ROIP", {"ZONE": ["Lower"], "REGION": ["A"]}
+    )
+    assert ref_vector == "ROIP:3"
+    assert df["AGG_ROIP_filtered_on_ENSEMBLE"].tolist() == [30.0, 15.0] * 3
+
+    # No matching regions
+    df, ref_vector = aggregator.aggregate(
+        ["iter-0"], "ZONE", "ROIP", {"ZONE": [], "REGION": ["A", "B"]}
+    )
+    assert list(df.columns) == ["ENSEMBLE", "REAL", "DATE"]
+    assert ref_vector == ""
+
+    with pytest.raises(KeyError):
+        aggregator.aggregate(["iter-0"], "ZONE", "RGIP", filters)
+
+
+def test_aggregate_on_region_numbers() -> None:
+    smry = _smry()
+    aggregator = RegionAggregator(smry, list(smry.columns[3:]), "FIPNUM")
+
+    df, _ = aggregator.aggregate(["iter-1"], "regions", "ROIP", {"regions": [4, 1]})
+    assert list(df.columns[3:]) == ["AGG_ROIP_filtered_on_4", "AGG_ROIP_filtered_on_1"]
+    assert df.iloc[:, 3:].to_numpy().tolist() == [[40.0, 10.0], [20.0, 5.0]]
+
+    df, _ = aggregator.aggregate(["iter-1"], "ENSEMBLE", "ROIP", {"regions": [4, 1]})
+    assert df["AGG_ROIP_filtered_on_regions"].tolist() == [50.0, 25.0]
+
+
+def test_calc_recovery() -> None:
+    df = pd.DataFrame(
+        {
+            "ENSEMBLE": ["iter-0"] * 4,
+            "REAL": [0, 1, 0, 1],
+            "AGG": [10.0, 20.0, 5.0, 15.0],
+        }
+    )
+    assert calc_recovery(df, ["AGG"]).ravel().tolist() == [0.0, 0.0, 0.5, 0.25]
@@ -0,0 +1,267 @@
+import warnings
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ._tornado_data import TornadoData, validate_tornado_input
+
+
+@dataclass
+class _SensitivityCases:
+    """Case averages for one sensitivity, for all responses.
+    `values` has shape (n_cases, n_responses). For scalar sensitivities
+    `reals` holds the realizations of each case, while for monte carlo
+    sensitivities `rows` holds the row indices of the sensitivity, as the
+    low/high realizations depend on the response reference average."""
+
+    sensname: str
+    senstype: str
+    senscases: List[str]
+    values: np.ndarray
+    reals: List[List[int]]
+    rows: np.ndarray
+
+
+@dataclass
+class _LowHigh:
+    """Low and high case per sensitivity and response, for one scale"""
+
+    values_ref: Dict[str, np.ndarray]
+    low_idx: Dict[str, np.ndarray]
+    high_idx: Dict[str, np.ndarray]
+
+
+class TornadoBatchData:
+    """Tornado calculations for many responses in one pass.
+
+    Takes a dataframe with the sensitivity design columns and one column per
+    response (one row per realization), and computes reference averages and
+    low/high cases for all responses in vectorized form. Per-response
+    `TornadoData` instances are then assembled from the precomputed arrays.
+    """
+
+    DESIGN_COLUMNS = ["REAL", "SENSNAME", "SENSCASE", "SENSTYPE"]
+
+    def __init__(
+        self,
+        dframe: pd.DataFrame,
+        responses: List[str],
+        reference: str = "rms_seed",
+    ) -> None:
+        self._reference = reference
+        self._responses = list(responses)
+        validate_tornado_input(
+            dframe, self.DESIGN_COLUMNS + self._responses, self._reference
+        )
+        self._design = dframe[self.DESIGN_COLUMNS].reset_index(drop=True)
+        self._values = dframe[self._responses].to_numpy(dtype=np.float64)
+
+        ref_rows = (self._design["SENSNAME"] == self._reference).to_numpy()
+        self._reference_averages = _nanmean(self._values[ref_rows])
+        self._sensitivities = self._calculate_sensitivity_cases()
+        self._low_high: Dict[str, _LowHigh] = {}
+
+    @property
+    def responses(self) -> List[str]:
+        return self._responses
+
+    @property
+    def sensitivities(self) -> List[str]:
+        return [sens.sensname for sens in self._sensitivities]
+
+    @property
+    def reference_averages(self) -> pd.Series:
+        return pd.Series(self._reference_averages, index=self._responses)
+
+    def _calculate_sensitivity_cases(self) -> List[_SensitivityCases]:
+        sensitivities = []
+        reals = self._design["REAL"].to_numpy()
+        for sens_name, sens_name_df in self._design.groupby("SENSNAME"):
+            # Excluding cases if `ref` is used as `SENSNAME`, and only one realization
+            # is present for this `SENSNAME`
+            if sens_name == "ref" and sens_name_df["REAL"].nunique() == 1:
+                continue
+            rows = sens_name_df.index.to_numpy()
+
+            if (sens_name_df["SENSTYPE"] == "scalar").all():
+                senscases, values, case_reals = [], [], []
+                for sens_case, sens_case_df in sens_name_df.groupby("SENSCASE"):
+                    case_rows = sens_case_df.index.to_numpy()
+                    senscases.append(sens_case)
+                    values.append(_nanmean(self._values[case_rows]))
+                    case_reals.append(list(map(int, reals[case_rows])))
+                sensitivities.append(
+                    _SensitivityCases(
+                        sensname=sens_name,
+                        senstype="scalar",
+                        senscases=senscases,
+                        values=np.vstack(values),
+                        reals=case_reals,
+                        rows=rows,
+                    )
+                )
+            else:
+                # Monte carlo: p90 (low) and p10 (high)
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", category=RuntimeWarning)
+                    values = np.nanquantile(self._values[rows], [0.10, 0.90], axis=0)
+                sensitivities.append(
+                    _SensitivityCases(
+                        sensname=sens_name,
+                        senstype="mc",
+                        senscases=["P90", "P10"],
+                        values=values,
+                        reals=[],
+                        rows=rows,
+                    )
+                )
+        return sensitivities
+
+    def _scale_to_ref(self, values: np.ndarray, scale: str) -> np.ndarray:
+        """Vectorized version of `TornadoData._scale_to_ref` for all responses"""
+        values_ref = values - self._reference_averages
+        if scale == "Percentage":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(
+                    self._reference_averages != 0,
+                    100 * (values_ref / self._reference_averages),
+                    0,
+                )
+        return values_ref
+
+    def _get_low_high(self, scale: str) -> _LowHigh:
+        """Low and high case index per sensitivity and response.
+        Cached per scale, as the scale may change the ordering of the cases"""
+        if scale not in self._low_high:
+            low_high = _LowHigh(values_ref={}, low_idx={}, high_idx={})
+            for sens in self._sensitivities:
+                values_ref = self._scale_to_ref(sens.values, scale)
+                low_high.values_ref[sens.sensname] = values_ref
+                low_high.low_idx[sens.sensname] = np.argmin(
+                    np.where(np.isnan(values_ref), np.inf, values_ref), axis=0
+                )
+                low_high.high_idx[sens.sensname] = np.argmax(
+                    np.where(np.isnan(values_ref), -np.inf, values_ref), axis=0
+                )
+            self._low_high[scale] = low_high
+        return self._low_high[scale]
+
+    def _case_reals(
+        self, sens: _SensitivityCases, case_idx: int, response_idx: int
+    ) -> List[int]:
+        if sens.senstype == "scalar":
+            return sens.reals[case_idx]
+        values = self._values[sens.rows, response_idx]
+        ref_avg = self._reference_averages[response_idx]
+        mask = values <= ref_avg if case_idx == 0 else values > ref_avg
+        return list(map(int, self._design["REAL"].to_numpy()[sens.rows][mask]))
+
+    def tornado_table(
+        self,
+        response: str,
+        scale: str = "Percentage",
+        sensitivities: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Tornado table for one response, with the same content as
+        `TornadoData.tornadotable` before cutting and sorting"""
+        ridx = self._responses.index(response)
+        ref_avg = self._reference_averages[ridx]
+        low_high = self._get_low_high(scale)
+
+        rows: List[Dict[str, Union[str, list, float, None]]] = []
+        for sens in self._sensitivities:
+            if sensitivities is not None and sens.sensname not in sensitivities:
+                continue
+            values_ref = low_high.values_ref[sens.sensname][:, ridx]
+            low_idx = low_high.low_idx[sens.sensname][ridx]
+            high_idx = low_high.high_idx[sens.sensname][ridx]
+            low = {
+                "values_ref": values_ref[low_idx],
+                "values": sens.values[low_idx, ridx],
+                "senscase": sens.senscases[low_idx],
+                "reals": self._case_reals(sens, low_idx, ridx),
+            }
+            high = {
+                "values_ref": values_ref[high_idx],
+                "values": sens.values[high_idx, ridx],
+                "senscase": sens.senscases[high_idx],
+                "reals": self._case_reals(sens, high_idx, ridx),
+            }
+            if len(sens.senscases) == 1:
+                # Single case sens, the other bar is set to the reference
+                no_impact = {
+                    "values_ref": 0,
+                    "reals": [],
+                    "senscase": None,
+                    "values": ref_avg,
+                }
+                if low["values_ref"] < 0:
+                    high = no_impact
+                else:
+                    low = no_impact
+
+            rows.append(
+                {
+                    "low": TornadoData.calc_low_x(
+                        low["values_ref"], high["values_ref"]
+                    ),
+                    "low_base": TornadoData.calc_low_base(
+                        low["values_ref"], high["values_ref"]
+                    ),
+                    "low_label": low["senscase"],
+                    "low_tooltip": low["values_ref"],
+                    "true_low": low["values"],
+                    "low_reals": low["reals"],
+                    "sensname": sens.sensname,
+                    "high": TornadoData.calc_high_x(
+                        low["values_ref"], high["values_ref"]
+                    ),
+                    "high_base": TornadoData.calc_high_base(
+                        low["values_ref"], high["values_ref"]
+                    ),
+                    "high_label": high["senscase"],
+                    "high_tooltip": high["values_ref"],
+                    "true_high": high["values"],
+                    "high_reals": high["reals"],
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def tornado_data(
+        self,
+        response: str,
+        response_name: Optional[str] = None,
+        scale: str = "Percentage",
+        cutbyref: bool = False,
+        sensitivities: Optional[List[str]] = None,
+    ) -> TornadoData:
+        """Create a `TornadoData` instance for a response from the precomputed
+        results. If `sensitivities` is given, only these (and the reference)
+        are included."""
+        if sensitivities is not None and self._reference not in sensitivities:
+            sensitivities = sensitivities + [self._reference]
+
+        ridx = self._responses.index(response)
+        real_input_df = self._design.assign(VALUE=self._values[:, ridx])
+        if sensitivities is not None:
+            real_input_df = real_input_df.loc[
+                real_input_df["SENSNAME"].isin(sensitivities)
+            ]
+        return TornadoData(
+            dframe=real_input_df,
+            response_name=response_name if response_name is not None else response,
+            reference=self._reference,
+            scale=scale,
+            cutbyref=cutbyref,
+            reference_average=self._reference_averages[ridx],
+            tornadotable=self.tornado_table(response, scale, sensitivities),
+        )
+
+
+def _nanmean(values: np.ndarray) -> np.ndarray:
+    """Column mean skipping nan values, as pandas mean"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanmean(values, axis=0)
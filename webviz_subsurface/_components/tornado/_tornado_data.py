@@ -4,6 +4,23 @@ import numpy as np
 import pandas as pd
 
 
+def validate_tornado_input(
+    dframe: pd.DataFrame, required_columns: List[str], reference: str
+) -> None:
+    for col in required_columns:
+        if col not in dframe:
+            raise KeyError(f"Tornado input is missing {col}")
+
+    if list(dframe["SENSCASE"].unique()) == [None]:
+        raise KeyError("No sensitivities found in tornado input")
+
+    for sens_name, sens_name_df in dframe.groupby("SENSNAME"):
+        if not any((sens_name_df["SENSTYPE"] == st).all() for st in ["scalar", "mc"]):
+            raise ValueError(f"Sensitivity {sens_name} is not of type 'mc' or 'scalar")
+    if dframe.loc[dframe["SENSNAME"].isin([reference])].empty:
+        raise ValueError(f"Reference SENSNAME {reference} not in input data")
+
+
 class TornadoData:
     REQUIRED_COLUMNS = ["REAL", "SENSNAME", "SENSCASE", "SENSTYPE", "VALUE"]
 
@@ -14,35 +31,30 @@ class TornadoData:
         reference: str = "rms_seed",
         cutbyref: bool = False,
         scale: str = "Percentage",
+        reference_average: Optional[float] = None,
+        tornadotable: Optional[pd.DataFrame] = None,
     ) -> None:
+        """The reference average and the tornado table are calculated from the
+        input dataframe, unless given precomputed (e.g. from `TornadoBatchData`).
+        """
         self._reference = reference
         self.response_name = response_name
-        self._validate_input(dframe)
         self._scale = scale
-        self._reference_average = self._calculate_ref_average(dframe)
-        self._tornadotable = self._calculate_tornado_table(dframe)
+        if reference_average is None or tornadotable is None:
+            self._validate_input(dframe)
+            self._reference_average = self._calculate_ref_average(dframe)
+            self._tornadotable = self._calculate_tornado_table(dframe)
+        else:
+            self._reference_average = reference_average
+            self._tornadotable = tornadotable
         if cutbyref:
             self._cut_sensitivities_by_ref()
         self._sort_sensitivities_by_max()
-        self._real_df = self._create_real_df(dframe)
+        self._real_input_df = dframe[self.REQUIRED_COLUMNS]
+        self._real_df: Optional[pd.DataFrame] = None
 
     def _validate_input(self, dframe: pd.DataFrame) -> None:
-        for col in self.REQUIRED_COLUMNS:
-            if col not in dframe:
-                raise KeyError(f"Tornado input is missing {col}")
-
-        if list(dframe["SENSCASE"].unique()) == [None]:
-            raise KeyError("No sensitivities found in tornado input")
-
-        for sens_name, sens_name_df in dframe.groupby("SENSNAME"):
-            if not any(
-                (sens_name_df["SENSTYPE"] == st).all() for st in ["scalar", "mc"]
-            ):
-                raise ValueError(
-                    f"Sensitivity {sens_name} is not of type 'mc' or 'scalar"
-                )
-        if dframe.loc[dframe["SENSNAME"].isin([self._reference])].empty:
-            raise ValueError(f"Reference SENSNAME {self._reference} not in input data")
+        validate_tornado_input(dframe, self.REQUIRED_COLUMNS, self._reference)
 
     def _create_real_df(self, dframe: pd.DataFrame) -> pd.DataFrame:
         """Make dataframe with value and case info per realization"""
@@ -69,6 +81,8 @@ class TornadoData:
 
     @property
     def real_df(self) -> pd.DataFrame:
+        if self._real_df is None:
+            self._real_df = self._create_real_df(self._real_input_df)
         return self._real_df
 
     @property
@@ -23,7 +23,7 @@ from webviz_config.webviz_assets import WEBVIZ_ASSETS
 import webviz_subsurface
 
 from ._tornado_bar_chart import TornadoBarChart
-from ._tornado_data import TornadoData
+from ._tornado_batch_data import TornadoBatchData
 from ._tornado_table import TornadoTable
 
 
@@ -412,18 +412,14 @@ class TornadoWidget:
             ]
 
             design_and_responses = pd.merge(values, realizations, on="REAL")
-            if sens_filter is not None:
-                if reference not in sens_filter:
-                    sens_filter.append(reference)
-                design_and_responses = design_and_responses.loc[
-                    design_and_responses["SENSNAME"].isin(sens_filter)
-                ]
-            tornado_data = TornadoData(
-                dframe=design_and_responses,
+            tornado_data = TornadoBatchData(
+                dframe=design_and_responses, responses=["VALUE"], reference=reference
+            ).tornado_data(
+                response="VALUE",
                 response_name=data.get("response_name"),
-                reference=reference,
                 scale="Percentage" if scale == "Relative value (%)" else "Absolute",
                 cutbyref="Remove sensitivites with no impact" in plot_options,
+                sensitivities=sens_filter,
             )
 
             figure_height = (
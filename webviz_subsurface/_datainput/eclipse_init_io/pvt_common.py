@@ -37,9 +37,8 @@
 ########################################
 
 import abc
-import warnings
 from enum import Enum
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Callable, List, Optional, Tuple
 
 import numpy as np
 from scipy import interpolate
@@ -275,7 +274,7 @@ class PVDx(PVxx):
 
         """
         # 1 / (1 / B)
-        return self.__compute_quantity(pressure, lambda p: 1.0 / self.__fvf_recip(p))
+        return 1.0 / self.__compute_quantity(pressure)[0]
 
     def viscosity(self, pressure: np.ndarray) -> np.ndarray:
         """Computes all viscosity values for the given pressure values.
@@ -289,63 +288,27 @@ class PVDx(PVxx):
 
         """
         # (1 / B) / (1 / (B * mu)
-        return self.__compute_quantity(
-            pressure, lambda p: self.__fvf_recip(p) / self.__fvf_mu_recip(p)
-        )
-
-    @staticmethod
-    def __compute_quantity(
-        pressures: np.ndarray, evaluate: Callable[[Any], Any]
-    ) -> np.ndarray:
-        """Calls the given evaluate function with each of the
-        given pressure values and returns the results.
-
-        Args:
-            pressures: Pressure values
-            evaluate: Evaluation function
-
-        Returns:
-            Values resulting from evaluating the pressure values.
-
-        """
-        result = np.zeros(len(pressures))
-
-        for i, pressure in enumerate(pressures):
-            result[i] = float(evaluate(pressure))
+        recip = self.__compute_quantity(pressure)
+        return recip[0] / recip[1]
 
-        return result
-
-    def __fvf_recip(self, point: float) -> float:
-        """Computes (possibly inter-/extrapolates) the reciprocal of
-        the formation volume factor for the given point.
-
-        Args:
-            point:
-                The pressure point the formation volume factor
-                is requested for.
-
-        Returns:
-            The requested reciprocal formation volume factor.
-
-        """
-        return float(self.__interpolation(point)[0])
-
-    def __fvf_mu_recip(self, point: float) -> float:
+    def __compute_quantity(self, pressures: np.ndarray) -> np.ndarray:
         """Computes (possibly inter-/extrapolates) the reciprocal of
-        the product of the formation volume factor and viscosity
-        for the given point.
+        the formation volume factor and the reciprocal of the product
+        of the formation volume factor and viscosity for all the given
+        pressure values in one pass.
 
         Args:
-            point:
-                The pressure point the formation volume factor
-                is requested for.
+            pressures: Pressure values
 
         Returns:
-            The requested reciprocal product of the formation volume factor
-            and the viscosity.
+            A two-dimensional array, where the first row holds the reciprocal
+            formation volume factors and the second row the reciprocal products
+            of formation volume factor and viscosity.
 
         """
-        return float(self.__interpolation(point)[1])
+        return np.atleast_2d(
+            self.__interpolation(np.asarray(pressures, dtype=np.float64))
+        )
 
 
 class PVTx(PVxx):
@@ -366,7 +329,8 @@ class PVTx(PVxx):
         """Extracts all values of the table with the given index from raw, converts them according
         to the given convert object and stores them as numpy arrays, keys, x and y respectively.
 
-        Creates an interpolation and an extrapolation object utilising scipy's interp2d.
+        Groups the values into one curve per primary key, which are used for
+        vectorized inter- and extrapolation.
 
         Args:
             index_table: The index of the table which values are supposed to be extracted.
@@ -420,34 +384,37 @@ class PVTx(PVxx):
             else:
                 break
 
-        # NOTE: If there is only one primary key, interp2d cannot be used.
-        # As a fallback, use interp1d and make sure that the primary key asked for in
-        # any of the methods of this instance is the one stored in self.keys[0].
-        # Extrapolation is not possible.
+        # NOTE: If there is only one primary key, interpolation between curves is
+        # not possible. As a fallback, use interp1d and make sure that the primary
+        # key asked for in any of the methods of this instance is the one stored in
+        # self.keys[0]. Extrapolation is not possible.
 
         self.__single_key = np.amax(self.keys) == np.amin(self.keys)
 
         if len(self.x) < 2:
             raise ValueError("No interpolation interval of non-zero size.")
 
-        # Ignore warnings here for now since this seems to be a bug in scipy
-        # see: https://github.com/scipy/scipy/issues/4138
-        # TODO: check if the warning can be fixed.
-
-        warnings.filterwarnings("ignore")
-
-        self.__interpolants: List[Union[interpolate.interp2d, interpolate.interp1d]] = [
-            (
+        if self.__single_key:
+            self.__interpolants = [
                 interpolate.interp1d(self.x, self.y[index_column])
-                if self.__single_key
-                else interpolate.interp2d(
-                    x=self.keys, y=self.x, z=self.y[index_column], kind="linear"
+                for index_column in range(raw.num_cols - 1)
+            ]
+        else:
+            # One curve per unique primary key, sorted on the independents
+            self.__curve_keys = np.unique(self.keys)
+            self.__curves: List[Tuple[np.ndarray, List[np.ndarray]]] = []
+            for curve_key in self.__curve_keys:
+                indices = np.flatnonzero(self.keys == curve_key)
+                indices = indices[np.argsort(self.x[indices], kind="stable")]
+                self.__curves.append(
+                    (
+                        self.x[indices],
+                        [
+                            self.y[index_column][indices]
+                            for index_column in range(raw.num_cols - 1)
+                        ],
+                    )
                 )
-            )
-            for index_column in range(raw.num_cols - 1)
-        ]
-
-        warnings.filterwarnings("default")
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary keys."""
@@ -475,20 +442,11 @@ class PVTx(PVxx):
             Formation volume factor values corresponding
             to the given primary key and independent values.
 
-        Base implementation, raises a NotImplementedError.
-
         """
 
         self.key_valid(key)
 
-        return self.__compute_quantity(
-            key,
-            x,
-            lambda curve, point: self.__interpolants[0](point)
-            if self.__single_key
-            else self.__interpolants[0](curve, point),
-            lambda recip_fvf: 1.0 / recip_fvf,
-        )
+        return 1.0 / self.__compute_quantity(key, x, num_columns=1)[0]
 
     def viscosity(self, key: np.ndarray, x: np.ndarray) -> np.ndarray:
         """Computes viscosity values for the given ratio and pressure values.
@@ -501,63 +459,73 @@ class PVTx(PVxx):
             Viscosity values corresponding
             to the given primary key and independent values.
 
-        Base implementation, raises a NotImplementedError.
-
         """
 
         self.key_valid(key)
 
-        return self.__compute_quantity(
-            key,
-            x,
-            lambda curve, point: [
-                self.__interpolants[0](point),
-                self.__interpolants[1](point),
-            ]
-            if self.__single_key
-            else [
-                self.__interpolants[0](curve, point),
-                self.__interpolants[1](curve, point),
-            ],
-            lambda dense_vector: dense_vector[0] / dense_vector[1],
-        )
+        recip = self.__compute_quantity(key, x, num_columns=2)
+        return recip[0] / recip[1]
 
-    @staticmethod
     def __compute_quantity(
-        key: np.ndarray,
-        x: np.ndarray,
-        inner_function: Callable,
-        outer_function: Callable,
-    ) -> np.ndarray:
-        """Calls the evaluate method with each of the values
-        in the given primary keys and the given inner_function
-        and returns the results after the outer_function
-        has been applied on each them.
+        self, key: np.ndarray, x: np.ndarray, num_columns: int
+    ) -> List[np.ndarray]:
+        """Evaluates the first num_columns dependent columns for all the
+        given primary key and independent values in one pass.
+
+        Each curve (primary key) is interpolated linearly in the independent
+        variable, with constant extrapolation at the curve ends. The results
+        are then interpolated linearly between the two curves enclosing the
+        requested primary key, with constant extrapolation outside the
+        range of primary keys.
 
         Args:
-            key: Primary key values the viscosity values are requested for.
-            x: Independents the viscosity values are requested for.
-            inner_function: Callable for extracting a dense vector.
-            outer_function:
-                Callable that uses the dense vector to compute
-                the requested quantity.
+            key: Primary key values the values are requested for.
+            x: Independents the values are requested for.
+            num_columns: The number of dependent columns to evaluate.
 
         Returns:
-            Result values
+            A list with one array of values per evaluated column.
 
         """
-
-        num_vals = len(key)
-        results = np.zeros(num_vals)
-        if len(x) != num_vals:
+        key = np.asarray(key, dtype=np.float64)
+        x = np.asarray(x, dtype=np.float64)
+        if len(x) != len(key):
             raise ValueError(
                 "Number of inner sampling points does not match number of outer sampling points."
             )
 
-        for i in range(0, num_vals):
-            quantity = inner_function(key[i], x[i])
+        if self.__single_key:
+            return [self.__interpolants[column](x) for column in range(num_columns)]
+
+        curve_keys = self.__curve_keys
+        clipped_key = np.clip(key, curve_keys[0], curve_keys[-1])
+        upper = np.clip(
+            np.searchsorted(curve_keys, clipped_key, side="right"),
+            1,
+            len(curve_keys) - 1,
+        )
+        lower = upper - 1
+        weight = (clipped_key - curve_keys[lower]) / (
+            curve_keys[upper] - curve_keys[lower]
+        )
 
-            results[i] = float(outer_function(quantity))
+        results = []
+        for column in range(num_columns):
+            lower_values = np.empty(len(key))
+            upper_values = np.empty(len(key))
+            # Loop over curves rather than sampling points; each curve is
+            # evaluated for all points that depend on it in one call
+            for index_curve in np.union1d(lower, upper):
+                curve_x, curve_y = self.__curves[index_curve]
+                is_lower = lower == index_curve
+                is_upper = upper == index_curve
+                lower_values[is_lower] = np.interp(
+                    x[is_lower], curve_x, curve_y[column]
+                )
+                upper_values[is_upper] = np.interp(
+                    x[is_upper], curve_x, curve_y[column]
+                )
+            results.append((1.0 - weight) * lower_values + weight * upper_values)
 
         return results
 
@@ -141,16 +141,10 @@ class LiveOil(PvxOBase):
         """
         # rho_o = (rho_o,sc + Rs * rho_g,sc) / B_o
         fvf_oil = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                (
-                    self.__surface_mass_density_oil
-                    + ratio_sample * self.__surface_mass_density_gas
-                )
-                / fvf_oil_sample
-                for ratio_sample, fvf_oil_sample in zip(ratio, fvf_oil)
-            ]
-        )
+        return (
+            self.__surface_mass_density_oil
+            + np.asarray(ratio) * self.__surface_mass_density_gas
+        ) / fvf_oil
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary key values (Rs)"""
@@ -225,12 +219,7 @@ class DeadOil(PvxOBase):
         """
         # rho_o = rho_o,sc / B_o
         fvf_oil = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                self.__surface_mass_density_oil / fvf_oil_sample
-                for fvf_oil_sample in fvf_oil
-            ]
-        )
+        return self.__surface_mass_density_oil / fvf_oil
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary keys.
@@ -357,12 +346,7 @@ class DeadOilConstCompr(PvxOBase):
         """
         # rho_o = rho_o,sc / B_o
         fvf_oil = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                self.__surface_mass_density_oil / fvf_oil_sample
-                for fvf_oil_sample in fvf_oil
-            ]
-        )
+        return self.__surface_mass_density_oil / fvf_oil
 
     def __recip_fvf_visc(self, p_o: float) -> float:
         """Computes the reciprocal of the product of formation volume factor
@@ -403,17 +387,20 @@ class DeadOilConstCompr(PvxOBase):
     def __evaluate(
         pressures: np.ndarray, calculate: Callable[[Any], Any]
     ) -> np.ndarray:
-        """Calls the calculate method with each of pressure values and returns the results.
+        """Calls the calculate method with all the pressure values at once
+        and returns the results.
 
         Args:
             pressures: Pressure values
-            calculate: Method to be called with each of the pressure values
+            calculate: Method to be called with an array of the pressure values
 
         Returns:
             Result values
 
         """
-        return np.array([calculate(pressure) for pressure in pressures])
+        return np.asarray(
+            calculate(np.asarray(pressures, dtype=np.float64)), dtype=np.float64
+        )
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary keys.
@@ -149,18 +149,20 @@ class WaterImpl(PvxOBase):
     def __evaluate(
         pressures: np.ndarray, calculate: Callable[[Any], Any]
     ) -> np.ndarray:
-        """Calls the calculate method with each of the pressure values
+        """Calls the calculate method with all the pressure values at once
         and returns the results.
 
         Args:
             pressures: Pressure values
-            calculate: Method to be called with each of the pressure values
+            calculate: Method to be called with an array of the pressure values
 
         Returns:
             Result values
 
         """
-        return np.array([calculate(pressure) for pressure in pressures])
+        return np.asarray(
+            calculate(np.asarray(pressures, dtype=np.float64)), dtype=np.float64
+        )
 
     @staticmethod
     def __exp(x: float) -> float:
@@ -220,12 +222,7 @@ class WaterImpl(PvxOBase):
         """
         # rho_w = rho_w,sc / B_w
         fvf_water = self.formation_volume_factor(ratio, pressure)
-        return np.array(
-            [
-                self.__surface_mass_density_water / fvf_water_sample
-                for fvf_water_sample in fvf_water
-            ]
-        )
+        return self.__surface_mass_density_water / fvf_water
 
     def get_keys(self) -> np.ndarray:
         """Returns all primary keys.
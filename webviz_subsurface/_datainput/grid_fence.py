@@ -0,0 +1,127 @@
+import logging
+import threading
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FenceSample:
+    """Property values sampled along a fence, as a (depth x distance) array,
+    with undefined values as NaN"""
+
+    hmin: float
+    hmax: float
+    vmin: float
+    vmax: float
+    values: np.ndarray
+
+
+class GridFenceSampler:
+    """Samples grid properties along fences (polylines) through a grid.
+
+    The grid is loaded once per grid file and kept for the life-span of the
+    sampler, together with its column index: the map from map location to the
+    grid columns and their top and base depths. The index is built on the first
+    fence, after which each fence is sampled by only visiting the columns
+    intersected by the fence. Properties are loaded once, and the sampled fences
+    are kept in a LRU cache per grid, property and fence.
+    """
+
+    _instances: Dict[str, "GridFenceSampler"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, grid: xtgeo.Grid) -> None:
+        self._grid = grid
+        self._properties: Dict[str, xtgeo.GridProperty] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def for_grid_file(grid_path: Path) -> "GridFenceSampler":
+        """Returns the sampler of a grid file, loading the grid on first use"""
+        key = str(grid_path)
+        with GridFenceSampler._instances_lock:
+            sampler = GridFenceSampler._instances.get(key)
+            if sampler is None:
+                timer = PerfTimer()
+                grid = xtgeo.grid_from_file(grid_path)
+                _remove_invalid_subgrids(grid, key)
+                sampler = GridFenceSampler._instances[key] = GridFenceSampler(grid)
+                LOGGER.debug(
+                    f"Loaded grid {key} in {timer.elapsed_s():.2f}s "
+                    f"(dimensions={grid.dimensions})"
+                )
+            return sampler
+
+    @property
+    def grid(self) -> xtgeo.Grid:
+        return self._grid
+
+    def get_property(self, property_path: Path) -> xtgeo.GridProperty:
+        """Returns the grid property in the file, loading it on first use"""
+        key = str(property_path)
+        with self._lock:
+            prop = self._properties.get(key)
+            if prop is None:
+                prop = self._properties[key] = xtgeo.gridproperty_from_file(
+                    property_path, grid=self._grid
+                )
+            return prop
+
+    @fingerprint_memoize(maxsize=64, copy_result=False)
+    def sample_fence(
+        self,
+        property_path: Path,
+        fence: np.ndarray,
+        zincrement: float = 0.5,
+        zmin: Optional[float] = None,
+        zmax: Optional[float] = None,
+    ) -> FenceSample:
+        """Samples the property along the fence (a xtgeo fence specification)"""
+        prop = self.get_property(property_path)
+        timer = PerfTimer()
+        with self._lock:
+            # The column index of the grid is built and cached by xtgeo on the
+            # first fence, and is not safe to build concurrently
+            hmin, hmax, vmin, vmax, values = self._grid.get_randomline(
+                fence, prop, zmin=zmin, zmax=zmax, zincrement=zincrement
+            )
+        values = np.asarray(values, dtype=np.float32)
+        values.flags.writeable = False
+        LOGGER.debug(
+            f"Sampled fence with {len(fence)} points in {timer.elapsed_ms()}ms "
+            f"(shape={values.shape})"
+        )
+        return FenceSample(
+            hmin=float(hmin),
+            hmax=float(hmax),
+            vmin=float(vmin),
+            vmax=float(vmax),
+            values=values,
+        )
+
+
+def _remove_invalid_subgrids(grid: xtgeo.Grid, grid_name: str) -> None:
+    if (
+        grid.subgrids is not None
+        and sum(len(subgrid) for subgrid in grid.subgrids.values()) != grid.nlay
+    ):
+        warnings.warn(
+            (
+                f"Subgrid information in {grid_name} does not correspond "
+                "with number of grid layers. Subgrid information will be removed. "
+                "This is a bug in xtgeo==2.15.2 for grids exported from RMS using Xtgeo. "
+                "Export the grid with xtgeo>2.15.2 to remove this warning. "
+            ),
+            FutureWarning,
+        )
+        grid.subgrids = None
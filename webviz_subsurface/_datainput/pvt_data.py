@@ -4,9 +4,11 @@
 #
 ########################################
 
+import logging
 import sys
 import warnings
-from typing import Any, Dict, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -20,6 +22,7 @@ import pandas as pd
 #       on non-Linux OSes.
 try:
     import ecl2df
+    from fmu.ensemble import EnsembleSet
     from opm.io.ecl import EclFile
 except ImportError:
     pass
@@ -27,11 +30,16 @@ except ImportError:
 from webviz_config.common_cache import CACHE
 from webviz_config.webviz_store import webvizstore
 
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from .eclipse_init_io.pvt_common import FluidImplementation, PvxOBase
 from .eclipse_init_io.pvt_gas import Gas
 from .eclipse_init_io.pvt_oil import Oil
 from .eclipse_init_io.pvt_water import Water
 from .fmu_input import load_csv, load_ensemble_set
 
+LOGGER = logging.getLogger(__name__)
+
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
 @webvizstore
@@ -200,8 +208,6 @@ def load_pvt_dataframe(
     use_init_file: bool = False,
     drop_ensemble_duplicates: bool = False,
 ) -> pd.DataFrame:
-    # pylint: disable=too-many-statements
-
     def check_if_ecl2df_is_installed() -> None:
         # If ecl2df is not loaded, this machine is probably not
         # running Linux and the modules are not available.
@@ -218,189 +224,137 @@ def load_pvt_dataframe(
         check_if_ecl2df_is_installed()
         return ecl2df.pvt.df(kwargs["realization"].get_eclfiles())
 
-    def init_to_pvt_data_frame(kwargs: Any) -> pd.DataFrame:
-        # pylint: disable-msg=too-many-locals
-        # pylint: disable=too-many-branches
+    ensemble_set = load_ensemble_set(ensemble_paths, ensemble_set_name)
+    if use_init_file:
         check_if_ecl2df_is_installed()
-        ecl_init_file = EclFile(
-            kwargs["realization"].get_eclfiles().get_initfile().get_filename()
+        return filter_pvt_data_frame(
+            load_pvt_from_init_files(ensemble_set), drop_ensemble_duplicates
         )
+    return filter_pvt_data_frame(
+        ensemble_set.apply(ecl2df_pvt_data_frame), drop_ensemble_duplicates
+    )
 
-        # Keep the original unit system
-        oil = Oil.from_ecl_init_file(ecl_init_file, True)
-        gas = Gas.from_ecl_init_file(ecl_init_file, True)
-        water = Water.from_ecl_init_file(ecl_init_file, True)
-
-        column_pvtnum: List[int] = []
-        column_ratio: List[float] = []
-        column_volume_factor: List[float] = []
-        column_volume_factor_unit: List[str] = []
-        column_pressure: List[float] = []
-        column_pressure_unit: List[str] = []
-        column_viscosity: List[float] = []
-        column_viscosity_unit: List[str] = []
-        column_density: List[float] = []
-        column_density_unit: List[str] = []
-        column_ratio_unit: List[str] = []
-        column_keyword: List[str] = []
-
-        ratios: np.ndarray = np.zeros(21)
-        pressures: np.ndarray = np.zeros(21)
-
-        if oil and not oil.is_dead_oil_const_compr():
-            (pressure_min, pressure_max) = oil.range_independent(0)
-        elif gas:
-            (pressure_min, pressure_max) = gas.range_independent(0)
-        else:
-            raise NotImplementedError("Missing PVT data")
 
-        for pressure_step in range(0, 20 + 1):
-            pressures[pressure_step] = pressure_min + pressure_step / 20.0 * (
-                pressure_max - pressure_min
+def load_pvt_from_init_files(ensemble_set: "EnsembleSet") -> pd.DataFrame:
+    """Extracts PVT data from the INIT files of all realizations in the ensemble set.
+    The INIT files are read and evaluated in parallel processes, one per realization.
+    Returns a dataframe on the same format as `EnsembleSet.apply`.
+    """
+    timer = PerfTimer()
+    ens_reals: List[Tuple[str, int]] = []
+    init_files: List[str] = []
+    for ens_name in ensemble_set.ensemblenames:
+        for real, realization in ensemble_set[ens_name].realizations.items():
+            ens_reals.append((ens_name, real))
+            init_files.append(realization.get_eclfiles().get_initfile().get_filename())
+
+    with ProcessPoolExecutor() as executor:
+        real_data_frames = list(executor.map(init_to_pvt_data_frame, init_files))
+
+    for (ens_name, real), real_data_frame in zip(ens_reals, real_data_frames):
+        real_data_frame["REAL"] = real
+        real_data_frame["ENSEMBLE"] = ens_name
+
+    LOGGER.debug(
+        f"Extracted PVT data from {len(init_files)} INIT files "
+        f"in: {timer.elapsed_s():.2f}s"
+    )
+    return pd.concat(real_data_frames, sort=False, ignore_index=True)
+
+
+def init_to_pvt_data_frame(init_filename: str) -> pd.DataFrame:
+    """Extracts PVT data from an Eclipse INIT file, keeping the original unit system.
+    Each fluid and region is evaluated for all its sampling points in one pass.
+    """
+    ecl_init_file = EclFile(init_filename)
+
+    # Keep the original unit system
+    oil = Oil.from_ecl_init_file(ecl_init_file, True)
+    gas = Gas.from_ecl_init_file(ecl_init_file, True)
+    water = Water.from_ecl_init_file(ecl_init_file, True)
+
+    if oil and not oil.is_dead_oil_const_compr():
+        (pressure_min, pressure_max) = oil.range_independent(0)
+    elif gas:
+        (pressure_min, pressure_max) = gas.range_independent(0)
+    else:
+        raise NotImplementedError("Missing PVT data")
+
+    pressures = np.linspace(pressure_min, pressure_max, 21)
+    ratios = np.zeros(21)
+
+    region_data_frames: List[pd.DataFrame] = []
+
+    def add_region(
+        fluid: FluidImplementation,
+        region: PvxOBase,
+        region_index: int,
+        keyword: str,
+        ratio: np.ndarray,
+        pressure: np.ndarray,
+        ratio_unit: str,
+    ) -> None:
+        region_data_frames.append(
+            pd.DataFrame(
+                {
+                    "PVTNUM": region_index + 1,
+                    "KEYWORD": keyword,
+                    "R": ratio,
+                    "PRESSURE": pressure,
+                    "PRESSURE_UNIT": fluid.pressure_unit(),
+                    "VOLUMEFACTOR": region.formation_volume_factor(ratio, pressure),
+                    "VOLUMEFACTOR_UNIT": fluid.formation_volume_factor_unit(),
+                    "VISCOSITY": region.viscosity(ratio, pressure),
+                    "VISCOSITY_UNIT": fluid.viscosity_unit(),
+                    "DENSITY": region.density(ratio, pressure),
+                    "DENSITY_UNIT": fluid.density_unit(),
+                    "RATIO_UNIT": ratio_unit,
+                }
             )
-            ratios[pressure_step] = 0.0
-
-        if oil:
-            if oil.is_live_oil():
-                keyword = "PVTO"
-            elif oil.is_dead_oil():
-                keyword = "PVDO"
-            elif oil.is_dead_oil_const_compr():
-                keyword = "PVCDO"
+        )
+
+    if oil:
+        if oil.is_live_oil():
+            keyword = "PVTO"
+        elif oil.is_dead_oil():
+            keyword = "PVDO"
+        elif oil.is_dead_oil_const_compr():
+            keyword = "PVCDO"
+        else:
+            raise NotImplementedError(
+                "The PVT property type of oil is not implemented."
+            )
+
+        for region_index, region in enumerate(oil.regions()):
+            if oil.is_dead_oil_const_compr():
+                (ratio, pressure) = (ratios, pressures)
             else:
-                raise NotImplementedError(
-                    "The PVT property type of oil is not implemented."
-                )
+                (ratio, pressure) = (region.get_keys(), region.get_independents())
+            add_region(
+                oil, region, region_index, keyword, ratio, pressure, oil.ratio_unit()
+            )
 
-            for region_index, region in enumerate(oil.regions()):
-                if oil.is_dead_oil_const_compr():
-                    column_pvtnum.extend([region_index + 1 for _ in pressures])
-                    column_keyword.extend([keyword for _ in pressures])
-                    column_ratio.extend(ratios)
-                    column_pressure.extend(pressures)
-                    column_pressure_unit.extend(
-                        [oil.pressure_unit() for _ in pressures]
-                    )
-                    column_volume_factor.extend(
-                        region.formation_volume_factor(ratios, pressures)
-                    )
-                    column_volume_factor_unit.extend(
-                        [oil.formation_volume_factor_unit() for _ in pressures]
-                    )
-                    column_viscosity.extend(region.viscosity(ratios, pressures))
-                    column_viscosity_unit.extend(
-                        [oil.viscosity_unit() for _ in pressures]
-                    )
-                    column_density.extend(region.density(ratios, pressures))
-                    column_density_unit.extend([oil.density_unit() for _ in pressures])
-                    column_ratio_unit.extend([oil.ratio_unit() for _ in pressures])
-
-                else:
-                    (ratio, pressure) = (
-                        region.get_keys(),
-                        region.get_independents(),
-                    )
-                    column_pvtnum.extend([region_index + 1 for _ in pressure])
-                    column_keyword.extend([keyword for _ in pressure])
-                    column_ratio.extend(ratio)
-                    column_pressure.extend(pressure)
-                    column_pressure_unit.extend([oil.pressure_unit() for _ in pressure])
-                    column_volume_factor.extend(
-                        region.formation_volume_factor(ratio, pressure)
-                    )
-                    column_volume_factor_unit.extend(
-                        [oil.formation_volume_factor_unit() for _ in pressure]
-                    )
-                    column_viscosity.extend(region.viscosity(ratio, pressure))
-                    column_viscosity_unit.extend(
-                        [oil.viscosity_unit() for _ in pressure]
-                    )
-                    column_density.extend(region.density(ratio, pressure))
-                    column_density_unit.extend([oil.density_unit() for _ in pressure])
-                    column_ratio_unit.extend([oil.ratio_unit() for _ in pressure])
+    if gas:
+        if gas.is_wet_gas():
+            keyword = "PVTG"
+        elif gas.is_dry_gas():
+            keyword = "PVDG"
+        else:
+            raise NotImplementedError(
+                "The PVT property type of gas is not implemented."
+            )
 
-        if gas:
+        for region_index, region in enumerate(gas.regions()):
             if gas.is_wet_gas():
-                keyword = "PVTG"
-            elif gas.is_dry_gas():
-                keyword = "PVDG"
+                (pressure, ratio) = (region.get_keys(), region.get_independents())
             else:
-                raise NotImplementedError(
-                    "The PVT property type of gas is not implemented."
-                )
-
-            for region_index, region in enumerate(gas.regions()):
-                if gas.is_wet_gas():
-                    (pressure, ratio) = (
-                        region.get_keys(),
-                        region.get_independents(),
-                    )
-                else:
-                    (ratio, pressure) = (
-                        region.get_keys(),
-                        region.get_independents(),
-                    )
-                column_pvtnum.extend([region_index + 1 for _ in pressure])
-                column_keyword.extend([keyword for _ in pressure])
-                column_ratio.extend(ratio)
-                column_pressure.extend(pressure)
-                column_pressure_unit.extend([gas.pressure_unit() for _ in pressure])
-                column_volume_factor.extend(
-                    region.formation_volume_factor(ratio, pressure)
-                )
-                column_volume_factor_unit.extend(
-                    [gas.formation_volume_factor_unit() for _ in pressure]
-                )
-                column_viscosity.extend(region.viscosity(ratio, pressure))
-                column_viscosity_unit.extend([gas.viscosity_unit() for _ in pressure])
-
-                column_density.extend(region.density(ratio, pressure))
-                column_density_unit.extend([gas.density_unit() for _ in pressure])
-                column_ratio_unit.extend([gas.ratio_unit() for _ in pressure])
-
-        if water:
-            for region_index, region in enumerate(water.regions()):
-                column_pvtnum.extend([region_index + 1 for _ in pressures])
-                column_keyword.extend(["PVTW" for _ in pressures])
-                column_ratio.extend(ratios)
-                column_pressure.extend(pressures)
-                column_pressure_unit.extend([water.pressure_unit() for _ in pressures])
-                column_volume_factor.extend(
-                    region.formation_volume_factor(ratios, pressures)
-                )
-                column_volume_factor_unit.extend(
-                    [water.formation_volume_factor_unit() for _ in pressures]
-                )
-                column_viscosity.extend(region.viscosity(ratios, pressures))
-                column_viscosity_unit.extend(
-                    [water.viscosity_unit() for _ in pressures]
-                )
-                column_density.extend(region.density(ratio, pressures))
-                column_density_unit.extend([water.density_unit() for _ in pressures])
-                column_ratio_unit.extend(["" for _ in pressures])
-
-        data_frame = pd.DataFrame(
-            {
-                "PVTNUM": column_pvtnum,
-                "KEYWORD": column_keyword,
-                "R": column_ratio,
-                "PRESSURE": column_pressure,
-                "PRESSURE_UNIT": column_pressure_unit,
-                "VOLUMEFACTOR": column_volume_factor,
-                "VOLUMEFACTOR_UNIT": column_volume_factor_unit,
-                "VISCOSITY": column_viscosity,
-                "VISCOSITY_UNIT": column_viscosity_unit,
-                "DENSITY": column_density,
-                "DENSITY_UNIT": column_density_unit,
-                "RATIO_UNIT": column_ratio_unit,
-            }
-        )
+                (ratio, pressure) = (region.get_keys(), region.get_independents())
+            add_region(
+                gas, region, region_index, keyword, ratio, pressure, gas.ratio_unit()
+            )
 
-        return data_frame
+    if water:
+        for region_index, region in enumerate(water.regions()):
+            add_region(water, region, region_index, "PVTW", ratios, pressures, "")
 
-    return filter_pvt_data_frame(
-        load_ensemble_set(ensemble_paths, ensemble_set_name).apply(
-            init_to_pvt_data_frame if use_init_file else ecl2df_pvt_data_frame
-        ),
-        drop_ensemble_duplicates,
-    )
+    return pd.concat(region_data_frames, ignore_index=True)
@@ -0,0 +1,269 @@
+import glob
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+LOGGER = logging.getLogger(__name__)
+
+JOB_COLUMNS = [
+    "ENSEMBLE",
+    "REAL",
+    "RUNTIME",
+    "REAL_SCALED_RUNTIME",
+    "JOB",
+    "STATUS",
+    "JOB_ID",
+]
+
+
+@dataclass
+class StatusFileEntry:
+    """Parsed content of a single status file, together with the modification
+    time of the file when it was read"""
+
+    real: int
+    path: str
+    mtime: float
+    jobs: pd.DataFrame
+    status: dict
+
+
+def discover_status_files(ens_path: str, status_file: str) -> Dict[int, str]:
+    """Returns the status file path per realization, for all realizations
+    matching the ensemble path glob pattern"""
+    realidxregexp = re.compile(r"realization-(\d+)")
+    files: Dict[int, str] = {}
+    for path in glob.glob(os.path.join(ens_path, status_file)):
+        real = None
+        for path_comp in reversed(path.split(os.path.sep)):
+            realmatch = re.match(realidxregexp, path_comp)
+            if realmatch:
+                real = int(realmatch.group(1))
+                break
+        if real is None:
+            LOGGER.warning(f"Unable to determine realization number for file: {path}")
+            continue
+        files[real] = path
+    return dict(sorted(files.items()))
+
+
+def read_status_file(path: str, ensemble: str, real: int) -> Tuple[pd.DataFrame, dict]:
+    """Load a status file, and return a DataFrame with the runtime of each job
+    together with a record of the status of the realization"""
+    with open(path) as fjson:
+        status_dict = json.load(fjson)
+
+    jobs = pd.DataFrame(status_dict["jobs"])
+    runtime = pd.to_numeric(jobs["end_time"]) - pd.to_numeric(jobs["start_time"])
+    max_runtime = runtime.max()
+    real_df = pd.DataFrame(
+        {
+            "ENSEMBLE": ensemble,
+            "REAL": real,
+            "RUNTIME": runtime,
+            "REAL_SCALED_RUNTIME": runtime / max_runtime if max_runtime else np.nan,
+            "JOB": jobs["name"],
+            "STATUS": jobs["status"],
+            # Unique job ids to separate jobs in same realization with same name
+            "JOB_ID": range(len(jobs)),
+        }
+    )
+
+    # Status record to be used with parallel coordinates
+    if (real_df["STATUS"] == "Success").all():
+        status = {
+            "ENSEMBLE": ensemble,
+            "REAL": real,
+            "STATUS": "Success",
+            "STATUS_BOOL": 1,
+            "RUNTIME": status_dict["end_time"] - status_dict["start_time"],
+        }
+    else:
+        status = {
+            "ENSEMBLE": ensemble,
+            "REAL": real,
+            "STATUS": "Failure",
+            "STATUS_BOOL": 0,
+            "RUNTIME": None,
+        }
+    return real_df, status
+
+
+def ensemble_job_status(real_dfs: List[pd.DataFrame]) -> pd.DataFrame:
+    """Combine the job DataFrames of all realizations in an ensemble, and
+    calculate runtimes scaled by the slowest job in the ensemble.
+    *Missing realizations are added to get whitespace in the heatmap matrix.
+    *Creates hoverinfo column to be used in visualization.
+    """
+    reals = [real_df["REAL"].iloc[0] for real_df in real_dfs]
+    missing_reals = sorted(set(range(min(reals), max(reals) + 1)).difference(reals))
+    if missing_reals:
+        missing_df = real_dfs[0].assign(
+            STATUS="Realization not started",
+            RUNTIME=np.nan,
+            REAL_SCALED_RUNTIME=np.nan,
+        )
+        real_dfs = real_dfs + [missing_df.assign(REAL=real) for real in missing_reals]
+    job_df = pd.concat(real_dfs)
+
+    # Max running time of each job in ensemble, never less than 1 second
+    job_max_runtime = job_df.groupby("JOB_ID")["RUNTIME"].max().clip(lower=1).fillna(1)
+    job_df["JOB_MAX_RUNTIME"] = job_df["JOB_ID"].map(job_max_runtime).to_numpy()
+    job_df["JOB_SCALED_RUNTIME"] = job_df["RUNTIME"] / job_df["JOB_MAX_RUNTIME"]
+    job_df["ENS_SCALED_RUNTIME"] = job_df["RUNTIME"] / job_max_runtime.max()
+
+    job_df["HOVERINFO"] = (
+        "Real: "
+        + job_df["REAL"].astype(str)
+        + "<br>"
+        + "Job: #"
+        + job_df["JOB_ID"].astype(str)
+        + "<br>"
+        + job_df["JOB"].astype(str)
+        + "<br>"
+        + "Running time: "
+        + job_df["RUNTIME"].astype(str)
+        + " s"
+        + "<br>"
+        + "Status: "
+        + job_df["STATUS"]
+    )
+    return job_df
+
+
+class StatusFileIndex:
+    """Index of the status files of a set of ensembles.
+
+    The parsed content of each status file is kept together with its
+    modification time. On `refresh` only new and modified files are read
+    again, concurrently using a thread pool, and only the job status of
+    ensembles with changes are recalculated.
+
+    Each ensemble has a version, incremented on every change to the ensemble,
+    such that users of the index (e.g. sessions of a plugin) can tell whether
+    the ensemble has changed since they last read it. The index is thread safe.
+    """
+
+    def __init__(
+        self,
+        ens_paths: Dict[str, str],
+        status_file: str = "status.json",
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self._ens_paths = ens_paths
+        self._status_file = status_file
+        self._max_workers = max_workers
+        self._entries: Dict[str, Dict[int, StatusFileEntry]] = {
+            ens: {} for ens in ens_paths
+        }
+        self._job_status_dfs: Dict[str, pd.DataFrame] = {}
+        self._versions: Dict[str, int] = {ens: 0 for ens in ens_paths}
+        self._lock = threading.Lock()
+
+    @property
+    def ensembles(self) -> List[str]:
+        return list(self._ens_paths)
+
+    def version(self, ensemble: str) -> int:
+        """Number of times the ensemble has changed"""
+        with self._lock:
+            return self._versions[ensemble]
+
+    def refresh(self) -> List[str]:
+        """Read new and modified status files, and drop entries of removed
+        files. Returns the ensembles that have changed"""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> List[str]:
+        to_read: List[Tuple[str, int, str, float]] = []
+        changed = set()
+        for ens, ens_path in self._ens_paths.items():
+            files = discover_status_files(ens_path, self._status_file)
+            entries = self._entries[ens]
+            for real in set(entries).difference(files):
+                del entries[real]
+                changed.add(ens)
+            for real, path in files.items():
+                try:
+                    mtime = os.stat(path).st_mtime
+                except FileNotFoundError:
+                    continue
+                entry = entries.get(real)
+                if entry is None or entry.path != path or entry.mtime != mtime:
+                    to_read.append((ens, real, path, mtime))
+
+        if to_read:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                results = executor.map(
+                    lambda args: _try_read_status_file(args[2], args[0], args[1]),
+                    to_read,
+                )
+                for (ens, real, path, mtime), result in zip(to_read, results):
+                    if result is None:
+                        # Keep any previous entry, the file is retried on next refresh
+                        continue
+                    jobs, status = result
+                    self._entries[ens][real] = StatusFileEntry(
+                        real=real, path=path, mtime=mtime, jobs=jobs, status=status
+                    )
+                    changed.add(ens)
+
+        for ens in changed:
+            self._entries[ens] = dict(sorted(self._entries[ens].items()))
+            self._job_status_dfs.pop(ens, None)
+            self._versions[ens] += 1
+        return [ens for ens in self._ens_paths if ens in changed]
+
+    def job_status_df(self, ensemble: Optional[str] = None) -> pd.DataFrame:
+        """Job status of one ensemble, or all ensembles if not given"""
+        ensembles = [ensemble] if ensemble is not None else self.ensembles
+        dfs = []
+        with self._lock:
+            for ens in ensembles:
+                if ens not in self._job_status_dfs:
+                    real_dfs = [entry.jobs for entry in self._entries[ens].values()]
+                    self._job_status_dfs[ens] = (
+                        ensemble_job_status(real_dfs) if real_dfs else _empty_job_df()
+                    )
+                dfs.append(self._job_status_dfs[ens])
+        return pd.concat(dfs, sort=False)
+
+    def real_status_df(self, ensemble: Optional[str] = None) -> pd.DataFrame:
+        """Status and total running time of each realization"""
+        ensembles = [ensemble] if ensemble is not None else self.ensembles
+        with self._lock:
+            statuses = [
+                entry.status
+                for ens in ensembles
+                for entry in self._entries[ens].values()
+            ]
+        return pd.DataFrame(
+            statuses, columns=["ENSEMBLE", "REAL", "STATUS", "STATUS_BOOL", "RUNTIME"]
+        )
+
+
+def _try_read_status_file(
+    path: str, ensemble: str, real: int
+) -> Optional[Tuple[pd.DataFrame, dict]]:
+    try:
+        return read_status_file(path, ensemble, real)
+    except (OSError, ValueError, KeyError) as exc:
+        # The file may e.g. be partially written by a running realization
+        LOGGER.warning(f"Could not read status file {path}: {exc}")
+        return None
+
+
+def _empty_job_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        columns=JOB_COLUMNS
+        + ["JOB_MAX_RUNTIME", "JOB_SCALED_RUNTIME", "ENS_SCALED_RUNTIME", "HOVERINFO"]
+    )
@@ -1,13 +1,93 @@
+import io
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Union
+
 import numpy as np
 import xtgeo
 from webviz_config.common_cache import CACHE
 
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
+
+# Binary format for sets of surfaces, e.g. statistical surfaces:
+# magic, header length (uint32), JSON header with the geometry of each surface,
+# padding to 8 bytes and the float32 values of each surface (NaN if undefined)
+_SURFACES_MAGIC = b"WSSURF01"
+_SURFACE_GEOMETRY_ATTRS = ("ncol", "nrow", "xori", "yori", "xinc", "yinc", "rotation")
+
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
 def load_surface(surface_path: str) -> xtgeo.RegularSurface:
     return xtgeo.surface_from_file(surface_path)
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def get_surface_fence(fence: np.ndarray, surface: xtgeo.RegularSurface) -> np.ndarray:
     return surface.get_fence(fence)
+
+
+def surfaces_to_binary_stream(surfaces: Dict[str, xtgeo.RegularSurface]) -> io.BytesIO:
+    """Serializes named surfaces to a compact binary format, with the surface
+    values stored as float32. Read back with surfaces_from_binary()."""
+    header = json.dumps(
+        {
+            "surfaces": [
+                {
+                    "name": name,
+                    "yflip": surface.yflip,
+                    **{
+                        attr: getattr(surface, attr) for attr in _SURFACE_GEOMETRY_ATTRS
+                    },
+                }
+                for name, surface in surfaces.items()
+            ]
+        }
+    ).encode()
+    header += b" " * (-(len(_SURFACES_MAGIC) + 4 + len(header)) % 8)
+
+    stream = io.BytesIO()
+    stream.write(_SURFACES_MAGIC)
+    stream.write(struct.pack("<I", len(header)))
+    stream.write(header)
+    for surface in surfaces.values():
+        stream.write(surface.values.filled(np.nan).astype("<f4").tobytes())
+    stream.seek(0)
+    return stream
+
+
+def surfaces_from_binary(
+    source: Union[bytes, io.BytesIO, Path]
+) -> Dict[str, xtgeo.RegularSurface]:
+    """Deserializes surfaces written by surfaces_to_binary_stream(). The values
+    are read directly from the buffer, or from a memory mapped file if given
+    a path, without any parsing."""
+    buffer: Union[bytes, memoryview, mmap.mmap]
+    if isinstance(source, Path):
+        with open(source, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    elif isinstance(source, io.BytesIO):
+        buffer = source.getbuffer()
+    else:
+        buffer = source
+
+    if bytes(buffer[: len(_SURFACES_MAGIC)]) != _SURFACES_MAGIC:
+        raise ValueError("Not a binary surface stream")
+    offset = len(_SURFACES_MAGIC)
+    (header_length,) = struct.unpack_from("<I", buffer, offset)
+    offset += 4
+    header = json.loads(bytes(buffer[offset : offset + header_length]))
+    offset += header_length
+
+    surfaces = {}
+    for meta in header["surfaces"]:
+        count = meta["ncol"] * meta["nrow"]
+        values = np.frombuffer(buffer, dtype="<f4", count=count, offset=offset)
+        offset += 4 * count
+        surfaces[meta["name"]] = xtgeo.RegularSurface(
+            **{attr: meta[attr] for attr in _SURFACE_GEOMETRY_ATTRS},
+            yflip=meta["yflip"],
+            values=np.ma.masked_invalid(values.reshape(meta["ncol"], meta["nrow"])),
+        )
+    return surfaces
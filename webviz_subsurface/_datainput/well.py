@@ -5,6 +5,8 @@ import numpy as np
 import xtgeo
 from webviz_config.common_cache import CACHE
 
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
+
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
 def load_well(
@@ -27,7 +29,7 @@ def load_well(
     return well
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def make_well_layer(
     well: xtgeo.Well, name: str = "well", zmin: float = 0
 ) -> Dict[str, Any]:
@@ -184,7 +186,7 @@ def append_well_to_data(
             )
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def create_leaflet_well_marker_layer(
     wells: List[xtgeo.Well],
     surface: xtgeo.RegularSurface,
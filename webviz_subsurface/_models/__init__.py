@@ -1,11 +1,47 @@
-from .ensemble_model import EnsembleModel
-from .ensemble_set_model import EnsembleSetModel
-from .gruptree_model import GruptreeModel
-from .inplace_volumes_model import InplaceVolumesModel
-from .observation_model import ObservationModel
-from .parameter_model import ParametersModel
-from .stratigraphy_model import StratigraphyModel
-from .surface_leaflet_model import SurfaceLeafletModel
-from .surface_set_model import SurfaceSetModel
-from .well_attributes_model import WellAttributesModel
-from .well_set_model import WellSetModel
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# The models are imported on first access, through the module level
+# `__getattr__` below, such that e.g. xtgeo is only imported when a model
+# that depends on it is used.
+_MODEL_MODULES: Dict[str, str] = {
+    "EnsembleModel": ".ensemble_model",
+    "EnsembleSetModel": ".ensemble_set_model",
+    "GruptreeModel": ".gruptree_model",
+    "InplaceVolumesModel": ".inplace_volumes_model",
+    "ObservationModel": ".observation_model",
+    "ParametersModel": ".parameter_model",
+    "StratigraphyModel": ".stratigraphy_model",
+    "SurfaceLeafletModel": ".surface_leaflet_model",
+    "SurfaceSetModel": ".surface_set_model",
+    "WellAttributesModel": ".well_attributes_model",
+    "WellSetModel": ".well_set_model",
+}
+
+__all__ = list(_MODEL_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MODEL_MODULES:
+        attr = getattr(importlib.import_module(_MODEL_MODULES[name], __name__), name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .ensemble_model import EnsembleModel
+    from .ensemble_set_model import EnsembleSetModel
+    from .gruptree_model import GruptreeModel
+    from .inplace_volumes_model import InplaceVolumesModel
+    from .observation_model import ObservationModel
+    from .parameter_model import ParametersModel
+    from .stratigraphy_model import StratigraphyModel
+    from .surface_leaflet_model import SurfaceLeafletModel
+    from .surface_set_model import SurfaceSetModel
+    from .well_attributes_model import WellAttributesModel
+    from .well_set_model import WellSetModel
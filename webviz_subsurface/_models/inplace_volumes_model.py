@@ -8,6 +8,7 @@ from pandas.api.types import is_numeric_dtype
 
 from .ensemble_set_model import EnsembleSetModel
 from .parameter_model import ParametersModel
+from .volumes_aggregator import VolumesAggregator
 
 
 class InplaceVolumesModel:
@@ -109,6 +110,12 @@ class InplaceVolumesModel:
         self._set_initial_property_columns()
         self._dataframe = self.compute_property_columns(self._dataframe)
 
+        self._aggregator = VolumesAggregator(
+            self._dataframe,
+            selectors=self.selectors,
+            volume_columns=self.volume_columns,
+        )
+
     @property
     def dataframe(self) -> pd.DataFrame:
         return self._dataframe
@@ -286,17 +293,50 @@ class InplaceVolumesModel:
         Filters are supported on dictionary form with 'column_name': [list ov values to keep].
         The final dataframe can be grouped by giving in a list of columns to group on.
         """
-        dframe = self.dataframe.copy()
-
         groups = groups if groups is not None else []
         filters = filters if filters is not None else {}
         parameters = parameters if parameters is not None else []
 
+        prevent_sum_over = ["REAL", "ENSEMBLE", "SOURCE"]
+        sum_over_groups = groups + [x for x in prevent_sum_over if x not in groups]
+
+        if not self._aggregator.supports(filters, sum_over_groups if groups else None):
+            dframe = self._get_df_from_dataframe(filters, groups, parameters)
+
+        elif groups:
+            # Volume sums are served from the aggregator, parameters are constant
+            # per realization and can be merged in after the summation
+            dframe = self._aggregator.grouped_sum(filters, sum_over_groups)
+            if parameters and self.parameters:
+                dframe = self._merge_parameters(dframe, parameters)
+            dframe = dframe.groupby(groups).mean(numeric_only=True).reset_index()
+
+        else:
+            dframe = self.dataframe.loc[self._aggregator.mask(filters)]
+            if parameters and self.parameters:
+                dframe = self._merge_parameters(dframe, parameters)
+
+        dframe = self.compute_property_columns(dframe, properties)
+        if "FLUID_ZONE" not in groups:
+            if not filters.get("FLUID_ZONE") == ["oil"]:
+                dframe["BO"] = np.nan
+            if not filters.get("FLUID_ZONE") == ["gas"]:
+                dframe["BG"] = np.nan
+        return dframe
+
+    def _merge_parameters(self, dframe: pd.DataFrame, parameters: list) -> pd.DataFrame:
+        columns = parameters + ["REAL", "ENSEMBLE"]
+        return pd.merge(dframe, self.parameter_df[columns], on=["REAL", "ENSEMBLE"])
+
+    def _get_df_from_dataframe(
+        self, filters: Dict[str, list], groups: list, parameters: list
+    ) -> pd.DataFrame:
+        """Fallback for filters and groups on columns that are not selectors,
+        e.g. parameters. Operates directly on the full dataframe."""
+        dframe = self.dataframe.copy()
+
         if parameters and self.parameters:
-            columns = parameters + ["REAL", "ENSEMBLE"]
-            dframe = pd.merge(
-                dframe, self.parameter_df[columns], on=["REAL", "ENSEMBLE"]
-            )
+            dframe = self._merge_parameters(dframe, parameters)
         if filters:
             dframe = filter_df(dframe, filters)
 
@@ -310,13 +350,6 @@ class InplaceVolumesModel:
 
             dframe = dframe.groupby(sum_over_groups).agg(aggregations).reset_index()
             dframe = dframe.groupby(groups).mean(numeric_only=True).reset_index()
-
-        dframe = self.compute_property_columns(dframe, properties)
-        if "FLUID_ZONE" not in groups:
-            if not filters.get("FLUID_ZONE") == ["oil"]:
-                dframe["BO"] = np.nan
-            if not filters.get("FLUID_ZONE") == ["gas"]:
-                dframe["BG"] = np.nan
         return dframe
 
 
@@ -6,9 +6,14 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 import xtgeo
-from webviz_config.common_cache import CACHE
 from webviz_config.webviz_store import webvizstore
 
+from webviz_subsurface._datainput.surface import (
+    surfaces_from_binary,
+    surfaces_to_binary_stream,
+)
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
+
 
 class SurfaceSetModel:
     """Class to load and calculate statistical surfaces from an FMU Ensemble"""
@@ -115,7 +120,7 @@ class SurfaceSetModel:
                 df = df.loc[df[col] == filt]
         return df
 
-    @CACHE.memoize(timeout=CACHE.TIMEOUT)
+    @fingerprint_memoize()
     def calculate_statistical_surface(
         self,
         name: str,
@@ -139,7 +144,7 @@ class SurfaceSetModel:
                 sorted(list(df["path"])), calculation
             )
 
-        return xtgeo.surface_from_file(surface_stream, fformat="irap_binary")
+        return surfaces_from_binary(surface_stream)[str(calculation)]
 
     def webviz_store_statistical_calculation(
         self,
@@ -232,9 +237,7 @@ def save_statistical_surface_no_store(
         surface = xtgeo.RegularSurface(
             ncol=1, nrow=1, xinc=1, yinc=1
         )  # 1's as input is required
-    stream = io.BytesIO()
-    surface.to_file(stream, fformat="irap_binary")
-    return stream
+    return surfaces_to_binary_stream({str(calculation): surface})
 
 
 @webvizstore
@@ -256,9 +259,7 @@ def save_statistical_surface(fns: List[str], calculation: str) -> io.BytesIO:
         surface = xtgeo.RegularSurface(
             ncol=1, nrow=1, xinc=1, yinc=1
         )  # 1's as input is required
-    stream = io.BytesIO()
-    surface.to_file(stream, fformat="irap_binary")
-    return stream
+    return surfaces_to_binary_stream({str(calculation): surface})
 
 
 # pylint: disable=too-many-return-statements
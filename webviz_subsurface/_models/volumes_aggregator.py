@@ -0,0 +1,150 @@
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+FilterKey = Tuple[Tuple[str, FrozenSet[Hashable]], ...]
+
+
+class VolumesAggregator:
+    """Columnar aggregation engine for inplace volumes tables.
+
+    Selector columns are stored as integer codes into a sorted array of unique
+    values, and the volume columns as one contiguous float array. Filters are
+    evaluated as boolean masks directly on the codes, and the grouped sums are
+    memoized per (filter-set, group-by) key so that repeated selections are
+    served without touching the full table again.
+    """
+
+    def __init__(
+        self,
+        dframe: pd.DataFrame,
+        selectors: List[str],
+        volume_columns: List[str],
+        max_cached_results: int = 64,
+    ) -> None:
+        self._nrows = len(dframe)
+        self._volume_columns = list(volume_columns)
+        self._codes: Dict[str, np.ndarray] = {}
+        self._categories: Dict[str, np.ndarray] = {}
+        for selector in selectors:
+            try:
+                codes, uniques = pd.factorize(dframe[selector], sort=True)
+            except TypeError:
+                # Mixed types that can't be sorted, keep order of appearance
+                codes, uniques = pd.factorize(dframe[selector], sort=False)
+            self._codes[selector] = codes.astype(np.int64, copy=False)
+            self._categories[selector] = np.asarray(uniques, dtype=object)
+
+        # NaN volumes are treated as zero, consistent with pandas groupby sum
+        self._values = np.ascontiguousarray(
+            np.nan_to_num(dframe[self._volume_columns].to_numpy(dtype=np.float64))
+        )
+        self._dtypes = {col: dframe[col].dtype for col in selectors}
+
+        self._max_cached_results = max_cached_results
+        self._mask_cache: Dict[Tuple[str, FrozenSet[Hashable]], np.ndarray] = {}
+        self._result_cache: "OrderedDict[Tuple[FilterKey, Tuple[str, ...]], pd.DataFrame]" = (
+            OrderedDict()
+        )
+
+    @property
+    def selectors(self) -> List[str]:
+        return list(self._codes)
+
+    @property
+    def volume_columns(self) -> List[str]:
+        return self._volume_columns
+
+    def supports(
+        self, filters: Dict[str, list], groups: Optional[Sequence[str]] = None
+    ) -> bool:
+        """Check if all filter and group columns are encoded selectors"""
+        groups = groups if groups is not None else []
+        return all(col in self._codes for col in list(filters) + list(groups))
+
+    def mask(self, filters: Dict[str, list]) -> np.ndarray:
+        """Return a boolean row mask for the given filters. The mask for each
+        single column/values pair is cached, so changing one filter only
+        requires that column to be re-evaluated."""
+        mask = np.ones(self._nrows, dtype=bool)
+        for col, values in filters.items():
+            mask &= self._column_mask(col, values)
+        return mask
+
+    def grouped_sum(
+        self, filters: Dict[str, list], groups: Sequence[str]
+    ) -> pd.DataFrame:
+        """Return the sum of all volume columns for each unique combination
+        of the group columns, after filtering. Rows are ordered as from a
+        sorted pandas groupby. A new dataframe is returned for every call,
+        and can safely be modified by the caller."""
+        key = (self._filter_key(filters), tuple(groups))
+        if key in self._result_cache:
+            self._result_cache.move_to_end(key)
+            return self._result_cache[key].copy()
+
+        result = self._compute_grouped_sum(self.mask(filters), list(groups))
+
+        self._result_cache[key] = result
+        if len(self._result_cache) > self._max_cached_results:
+            self._result_cache.popitem(last=False)
+        return result.copy()
+
+    def _column_mask(self, col: str, values: list) -> np.ndarray:
+        key = (col, frozenset(values))
+        if key not in self._mask_cache:
+            categories = self._categories[col]
+            wanted = np.fromiter(
+                (cat in key[1] for cat in categories), dtype=bool, count=len(categories)
+            )
+            if len(self._mask_cache) >= self._max_cached_results:
+                self._mask_cache.clear()
+            # Append False to map missing values (code -1) to not selected
+            self._mask_cache[key] = np.append(wanted, False)[self._codes[col]]
+        return self._mask_cache[key]
+
+    def _compute_grouped_sum(self, mask: np.ndarray, groups: List[str]) -> pd.DataFrame:
+        codes = [self._codes[col][mask] for col in groups]
+        values = self._values[mask]
+
+        # Rows with missing values in any group column are dropped by pandas groupby
+        valid = np.ones(len(values), dtype=bool)
+        for col_codes in codes:
+            valid &= col_codes >= 0
+        if not valid.all():
+            codes = [col_codes[valid] for col_codes in codes]
+            values = values[valid]
+
+        if len(values) == 0:
+            columns = {col: pd.Series(dtype=self._dtypes[col]) for col in groups}
+            columns.update(
+                {col: pd.Series(dtype=float) for col in self._volume_columns}
+            )
+            return pd.DataFrame(columns)
+
+        # Combine the group codes into a single key. Since categories are sorted,
+        # the order of the combined keys equals the lexicographic group order.
+        dims = tuple(len(self._categories[col]) for col in groups)
+        keys = np.ravel_multi_index(codes, dims)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        sums = np.add.reduceat(values[order], starts, axis=0)
+
+        group_codes = np.unravel_index(sorted_keys[starts], dims)
+        columns = {
+            col: pd.Series(self._categories[col][col_codes]).astype(self._dtypes[col])
+            for col, col_codes in zip(groups, group_codes)
+        }
+        columns.update(
+            {col: sums[:, idx] for idx, col in enumerate(self._volume_columns)}
+        )
+        return pd.DataFrame(columns)
+
+    @staticmethod
+    def _filter_key(filters: Dict[str, list]) -> FilterKey:
+        return tuple(
+            sorted((col, frozenset(values)) for col, values in filters.items())
+        )
@@ -4,8 +4,8 @@ from typing import Dict, List, Optional, Union
 
 import numpy as np
 import xtgeo
-from webviz_config.common_cache import CACHE
 
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
 from webviz_subsurface._utils.webvizstore_functions import get_path
 
 
@@ -75,7 +75,7 @@ class WellSetModel:
         """Returns list of well names"""
         return list(self._wells.keys())
 
-    @CACHE.memoize(timeout=CACHE.TIMEOUT)
+    @fingerprint_memoize()
     def get_fence(
         self,
         well_name: str,
@@ -1,35 +1,99 @@
-from .ensemble_fault_polygons_provider import (
-    EnsembleFaultPolygonsProvider,
-    EnsembleFaultPolygonsProviderFactory,
-    FaultPolygonsAddress,
-    FaultPolygonsServer,
-    SimulatedFaultPolygonsAddress,
-)
-from .ensemble_summary_provider.ensemble_summary_provider import (
-    EnsembleSummaryProvider,
-    Frequency,
-    VectorMetadata,
-)
-from .ensemble_summary_provider.ensemble_summary_provider_factory import (
-    EnsembleSummaryProviderFactory,
-)
-from .ensemble_summary_provider.utils import get_matching_vector_names
-from .ensemble_surface_provider import (
-    EnsembleSurfaceProvider,
-    EnsembleSurfaceProviderFactory,
-    ObservedSurfaceAddress,
-    QualifiedDiffSurfaceAddress,
-    QualifiedSurfaceAddress,
-    SimulatedSurfaceAddress,
-    StatisticalSurfaceAddress,
-    SurfaceAddress,
-    SurfaceMeta,
-    SurfaceServer,
-)
-from .ensemble_table_provider import (
-    ColumnMetadata,
-    EnsembleTableProvider,
-    EnsembleTableProviderFactory,
-    EnsembleTableProviderImplArrow,
-)
-from .well_provider import WellProvider, WellProviderFactory, WellServer
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# The providers are imported on first access, through the module level
+# `__getattr__` below, such that e.g. xtgeo and shapely are only imported
+# when a provider that depends on them is used.
+_PROVIDER_MODULES: Dict[str, str] = {
+    "EnsembleFaultPolygonsProvider": ".ensemble_fault_polygons_provider",
+    "EnsembleFaultPolygonsProviderFactory": ".ensemble_fault_polygons_provider",
+    "FaultPolygonsAddress": ".ensemble_fault_polygons_provider",
+    "FaultPolygonsServer": ".ensemble_fault_polygons_provider",
+    "SimulatedFaultPolygonsAddress": ".ensemble_fault_polygons_provider",
+    "EnsembleSummaryProvider": ".ensemble_summary_provider.ensemble_summary_provider",
+    "Frequency": ".ensemble_summary_provider.ensemble_summary_provider",
+    "VectorMetadata": ".ensemble_summary_provider.ensemble_summary_provider",
+    "EnsembleSummaryProviderFactory": (
+        ".ensemble_summary_provider.ensemble_summary_provider_factory"
+    ),
+    "get_matching_vector_names": ".ensemble_summary_provider.utils",
+    "EnsembleSurfaceProvider": ".ensemble_surface_provider",
+    "EnsembleSurfaceProviderFactory": ".ensemble_surface_provider",
+    "ObservedSurfaceAddress": ".ensemble_surface_provider",
+    "QualifiedDiffSurfaceAddress": ".ensemble_surface_provider",
+    "QualifiedSurfaceAddress": ".ensemble_surface_provider",
+    "SimulatedSurfaceAddress": ".ensemble_surface_provider",
+    "StatisticalSurfaceAddress": ".ensemble_surface_provider",
+    "SurfaceAddress": ".ensemble_surface_provider",
+    "SurfaceMeta": ".ensemble_surface_provider",
+    "SurfaceServer": ".ensemble_surface_provider",
+    "TilePyramidMeta": ".ensemble_surface_provider",
+    "compute_diff_surface": ".ensemble_surface_provider",
+    "ColumnFilter": ".ensemble_table_provider",
+    "ColumnMetadata": ".ensemble_table_provider",
+    "CompactStorageOptions": ".ensemble_table_provider",
+    "EnsembleTableProvider": ".ensemble_table_provider",
+    "EnsembleTableProviderFactory": ".ensemble_table_provider",
+    "EnsembleTableProviderImplArrow": ".ensemble_table_provider",
+    "ProviderBuildExecutor": ".provider_build_executor",
+    "WellProvider": ".well_provider",
+    "WellProviderFactory": ".well_provider",
+    "WellServer": ".well_provider",
+}
+
+__all__ = list(_PROVIDER_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PROVIDER_MODULES:
+        attr = getattr(importlib.import_module(_PROVIDER_MODULES[name], __name__), name)
+        globals()[name] = attr
+        return attr
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .ensemble_fault_polygons_provider import (
+        EnsembleFaultPolygonsProvider,
+        EnsembleFaultPolygonsProviderFactory,
+        FaultPolygonsAddress,
+        FaultPolygonsServer,
+        SimulatedFaultPolygonsAddress,
+    )
+    from .ensemble_summary_provider.ensemble_summary_provider import (
+        EnsembleSummaryProvider,
+        Frequency,
+        VectorMetadata,
+    )
+    from .ensemble_summary_provider.ensemble_summary_provider_factory import (
+        EnsembleSummaryProviderFactory,
+    )
+    from .ensemble_summary_provider.utils import get_matching_vector_names
+    from .ensemble_surface_provider import (
+        EnsembleSurfaceProvider,
+        EnsembleSurfaceProviderFactory,
+        ObservedSurfaceAddress,
+        QualifiedDiffSurfaceAddress,
+        QualifiedSurfaceAddress,
+        SimulatedSurfaceAddress,
+        StatisticalSurfaceAddress,
+        SurfaceAddress,
+        SurfaceMeta,
+        SurfaceServer,
+        TilePyramidMeta,
+        compute_diff_surface,
+    )
+    from .ensemble_table_provider import (
+        ColumnFilter,
+        ColumnMetadata,
+        CompactStorageOptions,
+        EnsembleTableProvider,
+        EnsembleTableProviderFactory,
+        EnsembleTableProviderImplArrow,
+    )
+    from .provider_build_executor import ProviderBuildExecutor
+    from .well_provider import WellProvider, WellProviderFactory, WellServer
@@ -0,0 +1,7 @@
+from .run_benchmarks import compare_benchmark_results, run_benchmarks
+from .synthetic_ensembles import (
+    SYNTHETIC_ENSEMBLE_SIZES,
+    SyntheticEnsemble,
+    SyntheticEnsembleSpec,
+    create_synthetic_ensemble,
+)
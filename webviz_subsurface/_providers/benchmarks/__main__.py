@@ -0,0 +1,72 @@
+import argparse
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+from .run_benchmarks import compare_benchmark_results, run_benchmarks
+from .synthetic_ensembles import SYNTHETIC_ENSEMBLE_SIZES, create_synthetic_ensemble
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the providers on a synthetic FMU ensemble"
+    )
+    parser.add_argument(
+        "--size", choices=list(SYNTHETIC_ENSEMBLE_SIZES), default="small"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--output", type=Path, help="Write the results to this JSON file"
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="JSON file with baseline results. Exits with status 1 on regressions",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative increase of the median time when comparing",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="Folder for the ensemble and storage, a temporary folder by default",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s %(levelname)-3s [%(name)s]: %(message)s",
+    )
+    logging.getLogger(__package__).setLevel(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        work_dir = args.work_dir if args.work_dir else Path(tmp_dir)
+        ensemble = create_synthetic_ensemble(
+            work_dir / "ensemble", SYNTHETIC_ENSEMBLE_SIZES[args.size]
+        )
+        results = run_benchmarks(ensemble, work_dir / "benchmarks", args.repeat)
+
+    print(json.dumps(results["benchmarks"], indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare_benchmark_results(baseline, results, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+# Running:
+#   python -m webviz_subsurface._providers.benchmarks --size small --output results.json
+#   python -m webviz_subsurface._providers.benchmarks --compare results.json
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()
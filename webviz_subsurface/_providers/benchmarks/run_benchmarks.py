@@ -0,0 +1,322 @@
+import datetime
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from ..ensemble_grid_provider import (
+    CellFilter,
+    EnsembleGridProviderFactory,
+    GridVizService,
+    PropertySpec,
+)
+from ..ensemble_summary_provider.ensemble_summary_provider import Frequency
+from ..ensemble_summary_provider.ensemble_summary_provider_factory import (
+    EnsembleSummaryProviderFactory,
+)
+from ..ensemble_surface_provider import (
+    EnsembleSurfaceProviderFactory,
+    SimulatedSurfaceAddress,
+    StatisticalSurfaceAddress,
+)
+from ..ensemble_surface_provider._surface_to_image import (
+    surface_to_png_bytes_optimized,
+)
+from ..ensemble_surface_provider.ensemble_surface_provider import SurfaceStatistic
+from ..ensemble_table_provider import EnsembleTableProviderFactory
+from .synthetic_ensembles import (
+    ECLIPSE_CASE_NAME,
+    GRID_NAME,
+    REL_SURFACE_FOLDER,
+    REL_UNSMRY_FILE,
+    REL_VOLUMES_FILE,
+    RESTART_PROPERTIES,
+    SyntheticEnsemble,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Number of vectors fetched in the summary benchmarks
+NUM_BENCHMARK_VECTORS = 10
+
+
+class _BenchmarkRunner:
+    def __init__(self, ensemble: SyntheticEnsemble, work_dir: Path, repeat: int):
+        self._ensemble = ensemble
+        self._work_dir = Path(work_dir)
+        self._repeat = repeat
+        self._storage_counter = 0
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def new_storage_dir(self) -> Path:
+        self._storage_counter += 1
+        return self._work_dir / f"storage_{self._storage_counter}"
+
+    def time(
+        self,
+        name: str,
+        func: Callable[[Any], Any],
+        setup: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """Time `func` `repeat` times. The result of `setup`, which is not
+        timed, is passed to `func`"""
+        timings_ms: List[float] = []
+        for _ in range(self._repeat):
+            arg = setup() if setup else None
+            timer = PerfTimer()
+            func(arg)
+            timings_ms.append(1000 * timer.elapsed_s())
+
+        self.results[name] = {
+            "min_ms": min(timings_ms),
+            "median_ms": statistics.median(timings_ms),
+            "mean_ms": statistics.mean(timings_ms),
+            "repeat": self._repeat,
+        }
+        LOGGER.info(f"{name}: median={self.results[name]['median_ms']:.1f}ms")
+
+
+def run_benchmarks(
+    ensemble: SyntheticEnsemble,
+    work_dir: Optional[Path] = None,
+    repeat: int = 5,
+) -> Dict[str, Any]:
+    """Time provider initialization and data access on a synthetic ensemble.
+    Returns a JSON serializable dictionary with the timings per benchmark,
+    together with the ensemble spec and environment, to be compared between
+    commits with `compare_benchmark_results()`"""
+    if work_dir is None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            return run_benchmarks(ensemble, Path(tmp_dir), repeat)
+
+    runner = _BenchmarkRunner(ensemble, Path(work_dir), repeat)
+    _run_summary_benchmarks(runner, ensemble)
+    _run_table_benchmarks(runner, ensemble)
+    _run_surface_benchmarks(runner, ensemble)
+    _run_grid_benchmarks(runner, ensemble)
+
+    return {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        # Through JSON, such that the spec compares equal to loaded results
+        "spec": json.loads(json.dumps(asdict(ensemble.spec))),
+        "benchmarks": runner.results,
+    }
+
+
+def compare_benchmark_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.25
+) -> List[str]:
+    """Returns a description of each benchmark where the median time of the
+    current results exceeds the baseline by more than the relative tolerance"""
+    if baseline.get("spec") != current.get("spec"):
+        LOGGER.warning("Comparing benchmark results for different ensemble specs")
+
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        baseline_result = baseline["benchmarks"].get(name)
+        if baseline_result is None:
+            continue
+        ratio = result["median_ms"] / max(baseline_result["median_ms"], 1e-6)
+        if ratio > 1 + tolerance:
+            regressions.append(
+                f"{name}: {baseline_result['median_ms']:.1f}ms -> "
+                f"{result['median_ms']:.1f}ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def _run_summary_benchmarks(
+    runner: _BenchmarkRunner, ensemble: SyntheticEnsemble
+) -> None:
+    storage_dir = runner.new_storage_dir()
+
+    def create_provider(storage_dir: Path, allow_storage_writes: bool) -> Any:
+        factory = EnsembleSummaryProviderFactory(storage_dir, allow_storage_writes)
+        return factory.create_from_arrow_unsmry_lazy(ensemble.ens_path, REL_UNSMRY_FILE)
+
+    runner.time(
+        "summary.init_import",
+        lambda storage_dir: create_provider(storage_dir, True),
+        setup=runner.new_storage_dir,
+    )
+    create_provider(storage_dir, True)
+    runner.time(
+        "summary.init_from_backing_store",
+        lambda _: create_provider(storage_dir, False),
+    )
+
+    provider = create_provider(storage_dir, False)
+    vectors = ensemble.vector_names[:NUM_BENCHMARK_VECTORS]
+    runner.time(
+        "summary.get_vectors_df",
+        lambda _: provider.get_vectors_df(vectors, None),
+    )
+    runner.time(
+        "summary.get_vectors_df_monthly",
+        lambda _: provider.get_vectors_df(vectors, Frequency.MONTHLY),
+    )
+    runner.time(
+        "summary.get_vectors_df_yearly",
+        lambda _: provider.get_vectors_df(vectors, Frequency.YEARLY),
+    )
+    runner.time(
+        "summary.dates_monthly",
+        lambda _: provider.dates(Frequency.MONTHLY),
+    )
+    sample_date = ensemble.dates[len(ensemble.dates) // 2]
+    runner.time(
+        "summary.get_vectors_for_date_df",
+        lambda _: provider.get_vectors_for_date_df(sample_date, vectors),
+    )
+
+
+def _run_table_benchmarks(
+    runner: _BenchmarkRunner, ensemble: SyntheticEnsemble
+) -> None:
+    def create_provider(storage_dir: Path) -> Any:
+        factory = EnsembleTableProviderFactory(storage_dir, True)
+        return factory.create_from_per_realization_csv_file(
+            ensemble.ens_path, REL_VOLUMES_FILE
+        )
+
+    runner.time("table.init_import", create_provider, setup=runner.new_storage_dir)
+    provider = create_provider(runner.new_storage_dir())
+    columns = provider.column_names()
+    runner.time("table.get_column_data", lambda _: provider.get_column_data(columns))
+
+
+def _run_surface_benchmarks(
+    runner: _BenchmarkRunner, ensemble: SyntheticEnsemble
+) -> None:
+    spec = ensemble.spec
+    name = spec.surface_names[0].lower()
+
+    def create_provider(storage_dir: Path) -> Any:
+        factory = EnsembleSurfaceProviderFactory(storage_dir, True, True)
+        return factory.create_from_ensemble_surface_files(
+            ensemble.ens_path, REL_SURFACE_FOLDER
+        )
+
+    runner.time("surface.init_import", create_provider, setup=runner.new_storage_dir)
+
+    # The statistical surfaces are cached by the provider, use a new provider
+    # for each repetition
+    stat_address = StatisticalSurfaceAddress(
+        attribute="ds_extract_geogrid",
+        name=name,
+        datestr=None,
+        statistic=SurfaceStatistic.MEAN,
+        realizations=list(range(spec.num_realizations)),
+    )
+    runner.time(
+        "surface.statistical_surface",
+        lambda provider: provider.get_surface(stat_address),
+        setup=lambda: create_provider(runner.new_storage_dir()),
+    )
+
+    provider = create_provider(runner.new_storage_dir())
+    surface = provider.get_surface(
+        SimulatedSurfaceAddress(
+            attribute="ds_extract_geogrid", name=name, datestr=None, realization=0
+        )
+    )
+    runner.time(
+        "surface.png_encoding",
+        surface_to_png_bytes_optimized,
+        setup=surface.copy,
+    )
+
+
+def _run_grid_benchmarks(runner: _BenchmarkRunner, ensemble: SyntheticEnsemble) -> None:
+    factory = EnsembleGridProviderFactory(runner.new_storage_dir(), True, True)
+    provider = factory.create_from_roff_files(ensemble.ens_path, GRID_NAME)
+    _time_surface_extraction(
+        runner,
+        "grid.surface_extraction",
+        provider,
+        PropertySpec(prop_name=ensemble.spec.grid_properties[0], prop_date=None),
+        ensemble,
+    )
+
+    init_properties = [prop_name.upper() for prop_name in ensemble.spec.grid_properties]
+    restart_properties = list(RESTART_PROPERTIES)
+
+    def create_egrid_provider(storage_dir: Path) -> Any:
+        egrid_factory = EnsembleGridProviderFactory(storage_dir, True, True)
+        return egrid_factory.create_from_eclipse_files(
+            ensemble.ens_path, ECLIPSE_CASE_NAME, init_properties, restart_properties
+        )
+
+    runner.time(
+        "grid.egrid_init_import", create_egrid_provider, setup=runner.new_storage_dir
+    )
+    egrid_provider = create_egrid_provider(runner.new_storage_dir())
+    _time_surface_extraction(
+        runner,
+        "grid.egrid_surface_extraction_static",
+        egrid_provider,
+        PropertySpec(prop_name=init_properties[0], prop_date=None),
+        ensemble,
+    )
+    if ensemble.spec.restart_dates:
+        _time_surface_extraction(
+            runner,
+            "grid.egrid_surface_extraction_dynamic",
+            egrid_provider,
+            PropertySpec(
+                prop_name=restart_properties[0],
+                prop_date=ensemble.spec.restart_dates[-1],
+            ),
+            ensemble,
+        )
+
+
+def _time_surface_extraction(
+    runner: _BenchmarkRunner,
+    name: str,
+    provider: Any,
+    property_spec: PropertySpec,
+    ensemble: SyntheticEnsemble,
+) -> None:
+    ncol, nrow, nlay = ensemble.spec.grid_dimensions
+    cell_filter = CellFilter(
+        i_min=0, i_max=ncol - 1, j_min=0, j_max=nrow - 1, k_min=0, k_max=nlay - 1
+    )
+
+    def create_service() -> GridVizService:
+        # The grid workers are cached by the service, use a new service for
+        # each repetition
+        service = GridVizService()
+        service.register_provider(provider)
+        return service
+
+    runner.time(
+        name,
+        lambda service: service.get_surface(
+            provider.provider_id(), 0, property_spec, cell_filter
+        ),
+        setup=create_service,
+    )
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,304 @@
+import datetime
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import resfo
+import xtgeo
+
+REL_UNSMRY_FILE = "share/results/unsmry/SYNTHETIC.arrow"
+REL_SURFACE_FOLDER = "share/results/maps"
+REL_GRID_FOLDER = "share/results/grids"
+REL_ECLIPSE_FOLDER = "eclipse/model"
+REL_VOLUMES_FILE = "share/results/volumes/geogrid--vol.csv"
+
+GRID_NAME = "geogrid"
+ECLIPSE_CASE_NAME = "SYNTHETIC"
+RESTART_PROPERTIES = ("PRESSURE", "SWAT")
+
+
+@dataclass(frozen=True)
+class SyntheticEnsembleSpec:
+    """Sizes of a synthetic FMU ensemble"""
+
+    num_realizations: int = 10
+    num_vectors: int = 100
+    num_dates: int = 3 * 365
+    surface_shape: Tuple[int, int] = (250, 250)
+    surface_names: Tuple[str, ...] = ("TopVolantis", "BaseVolantis")
+    surface_dates: Tuple[str, ...] = ("20200101", "20220101")
+    grid_dimensions: Tuple[int, int, int] = (40, 40, 20)
+    grid_properties: Tuple[str, ...] = ("poro", "permx")
+    restart_dates: Tuple[str, ...] = ("20200101", "20220101")
+    num_volumetrics_rows: int = 200
+    seed: int = 42
+
+
+SYNTHETIC_ENSEMBLE_SIZES: Dict[str, SyntheticEnsembleSpec] = {
+    "tiny": SyntheticEnsembleSpec(
+        num_realizations=3,
+        num_vectors=10,
+        num_dates=100,
+        surface_shape=(30, 20),
+        surface_names=("TopVolantis",),
+        surface_dates=("20200101",),
+        grid_dimensions=(5, 4, 3),
+        grid_properties=("poro",),
+        restart_dates=("20200101",),
+        num_volumetrics_rows=10,
+    ),
+    "small": SyntheticEnsembleSpec(),
+    "medium": SyntheticEnsembleSpec(
+        num_realizations=50,
+        num_vectors=500,
+        num_dates=10 * 365,
+        surface_shape=(500, 500),
+        grid_dimensions=(100, 100, 50),
+        num_volumetrics_rows=2000,
+    ),
+    "large": SyntheticEnsembleSpec(
+        num_realizations=200,
+        num_vectors=2000,
+        num_dates=20 * 365,
+        surface_shape=(1000, 1000),
+        grid_dimensions=(200, 200, 100),
+        num_volumetrics_rows=10000,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class SyntheticEnsemble:
+    """Location and contents of a synthetic ensemble on disk"""
+
+    spec: SyntheticEnsembleSpec
+    root_path: Path
+    vector_names: List[str]
+    dates: List[datetime.datetime]
+
+    @property
+    def ens_path(self) -> str:
+        """Ensemble path pattern, as used by the provider factories"""
+        return str(self.root_path / "realization-*" / "iter-0")
+
+    def runpath(self, realization: int) -> Path:
+        return self.root_path / f"realization-{realization}" / "iter-0"
+
+
+def create_synthetic_ensemble(
+    root_path: Path, spec: SyntheticEnsembleSpec = SyntheticEnsembleSpec()
+) -> SyntheticEnsemble:
+    """Write a synthetic FMU ensemble with arrow UNSMRY files, irap binary
+    surfaces, ROFF grids with properties, Eclipse EGRID/INIT/UNRST files and
+    volumetrics CSV files for each realization, using the standard FMU file
+    layout"""
+    rng = np.random.default_rng(spec.seed)
+    root_path = Path(root_path)
+
+    vector_names = synthetic_vector_names(spec.num_vectors)
+    dates = [
+        datetime.datetime(2020, 1, 1) + datetime.timedelta(days=day)
+        for day in range(spec.num_dates)
+    ]
+    ensemble = SyntheticEnsemble(
+        spec=spec, root_path=root_path, vector_names=vector_names, dates=dates
+    )
+
+    grid = xtgeo.create_box_grid(spec.grid_dimensions)
+    for real in range(spec.num_realizations):
+        runpath = ensemble.runpath(real)
+        runpath.mkdir(parents=True, exist_ok=True)
+        # Marks the realization as successfully completed
+        (runpath / "OK").write_text("All jobs complete\n")
+        _write_arrow_unsmry(runpath / REL_UNSMRY_FILE, vector_names, dates, rng)
+        _write_surfaces(runpath / REL_SURFACE_FOLDER, spec, rng)
+        _write_grid(runpath / REL_GRID_FOLDER, grid, spec, rng)
+        _write_eclipse_case(runpath / REL_ECLIPSE_FOLDER, grid, spec, rng)
+        _write_volumetrics(runpath / REL_VOLUMES_FILE, spec, rng)
+
+    return ensemble
+
+
+def synthetic_vector_names(num_vectors: int) -> List[str]:
+    """Field and well vectors, alternating between rates and totals"""
+    field_vectors = ["FOPR", "FOPT", "FWPR", "FWPT", "FGPR", "FGPT"]
+    well_vectors = ["WOPR", "WOPT", "WWPR", "WWPT", "WGPR", "WGPT", "WBHP", "WTHP"]
+    names = field_vectors[:num_vectors]
+    well = 0
+    while len(names) < num_vectors:
+        well += 1
+        names.extend(
+            f"{vector}:OP_{well}" for vector in well_vectors[: num_vectors - len(names)]
+        )
+    return names
+
+
+def _write_arrow_unsmry(
+    file_name: Path,
+    vector_names: List[str],
+    dates: List[datetime.datetime],
+    rng: np.random.Generator,
+) -> None:
+    fields = [pa.field("DATE", pa.timestamp("ms"))]
+    columns = [pa.array(np.array(dates, dtype="datetime64[ms]"))]
+    for name in vector_names:
+        keyword = name.split(":")[0]
+        is_total = keyword.endswith("T") and keyword not in ("WBHP", "WTHP")
+        is_rate = keyword.endswith("R")
+        rates = rng.uniform(0, 1000, len(dates))
+        values = np.cumsum(rates) if is_total else rates
+        fields.append(
+            pa.field(
+                name,
+                pa.float32(),
+                metadata={
+                    b"unit": b"SM3" if is_total else b"SM3/DAY",
+                    b"is_total": b"True" if is_total else b"False",
+                    b"is_rate": b"True" if is_rate else b"False",
+                    b"is_historical": b"False",
+                    b"keyword": keyword.encode(),
+                    b"wgname": name.split(":")[1].encode() if ":" in name else b"",
+                    b"get_num": b"0",
+                },
+            )
+        )
+        columns.append(pa.array(values.astype(np.float32)))
+
+    file_name.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.table(columns, schema=pa.schema(fields))
+    with pa.OSFile(str(file_name), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _write_surfaces(
+    folder: Path, spec: SyntheticEnsembleSpec, rng: np.random.Generator
+) -> None:
+    folder.mkdir(parents=True, exist_ok=True)
+    ncol, nrow = spec.surface_shape
+    xx, yy = np.meshgrid(np.arange(nrow), np.arange(ncol))
+    for idx, name in enumerate(spec.surface_names):
+        depth = 1600 + 50 * idx + 20 * np.sin(xx / 25) * np.cos(yy / 25)
+        depth += rng.normal(0, 2, depth.shape)
+        _surface(spec, depth).to_file(
+            folder / f"{name.lower()}--ds_extract_geogrid.gri"
+        )
+        for date in spec.surface_dates:
+            values = rng.uniform(0, 1, depth.shape)
+            _surface(spec, values).to_file(
+                folder / f"{name.lower()}--amplitude_mean--{date}.gri"
+            )
+
+
+def _surface(spec: SyntheticEnsembleSpec, values: np.ndarray) -> xtgeo.RegularSurface:
+    ncol, nrow = spec.surface_shape
+    return xtgeo.RegularSurface(
+        ncol=ncol,
+        nrow=nrow,
+        xori=460000.0,
+        yori=5930000.0,
+        xinc=25.0,
+        yinc=25.0,
+        rotation=30.0,
+        values=values,
+    )
+
+
+def _write_grid(
+    folder: Path,
+    grid: xtgeo.Grid,
+    spec: SyntheticEnsembleSpec,
+    rng: np.random.Generator,
+) -> None:
+    folder.mkdir(parents=True, exist_ok=True)
+    grid.to_file(folder / f"{GRID_NAME}.roff", fformat="roff")
+    for prop_name in spec.grid_properties:
+        prop = xtgeo.GridProperty(
+            grid, name=prop_name, values=rng.uniform(0, 1, spec.grid_dimensions)
+        )
+        prop.to_file(
+            folder / f"{GRID_NAME}--{prop_name}.roff",
+            fformat="roff",
+            name=prop_name,
+        )
+
+
+def _write_eclipse_case(
+    folder: Path,
+    grid: xtgeo.Grid,
+    spec: SyntheticEnsembleSpec,
+    rng: np.random.Generator,
+) -> None:
+    """Write an EGRID file with the grid, an INIT file with the grid properties
+    and an UNRST file with the restart properties at each restart date. Only
+    the keywords read by xtgeo are written to the INIT and UNRST files."""
+    folder.mkdir(parents=True, exist_ok=True)
+    case_path = folder / ECLIPSE_CASE_NAME
+    grid.to_file(f"{case_path}.EGRID", fformat="egrid")
+    num_cells = int(np.prod(spec.grid_dimensions))
+    start_date = spec.restart_dates[0] if spec.restart_dates else "20200101"
+
+    resfo.write(
+        f"{case_path}.INIT",
+        _eclipse_headers(spec, start_date)
+        + [
+            (f"{prop_name.upper():<8}", _cell_values(rng, num_cells))
+            for prop_name in spec.grid_properties
+        ],
+    )
+    restart_keywords: List[Tuple[str, np.ndarray]] = []
+    for report_step, date in enumerate(spec.restart_dates):
+        restart_keywords.append(("SEQNUM  ", np.array([report_step], np.int32)))
+        restart_keywords.extend(_eclipse_headers(spec, date))
+        restart_keywords.extend(
+            (f"{prop_name:<8}", _cell_values(rng, num_cells))
+            for prop_name in RESTART_PROPERTIES
+        )
+    resfo.write(f"{case_path}.UNRST", restart_keywords)
+
+
+def _eclipse_headers(
+    spec: SyntheticEnsembleSpec, date: str
+) -> List[Tuple[str, np.ndarray]]:
+    intehead = np.zeros(411, np.int32)
+    intehead[8:11] = spec.grid_dimensions
+    intehead[11] = np.prod(spec.grid_dimensions)
+    # Metric units, Eclipse 100
+    intehead[14] = 1
+    intehead[94] = 100
+    # Day, month and year of the report step
+    intehead[64:67] = [int(date[6:8]), int(date[4:6]), int(date[:4])]
+    return [
+        ("INTEHEAD", intehead),
+        ("LOGIHEAD", np.zeros(121, bool)),
+        ("DOUBHEAD", np.zeros(229)),
+    ]
+
+
+def _cell_values(rng: np.random.Generator, num_cells: int) -> np.ndarray:
+    return rng.uniform(0, 1, num_cells).astype(np.float32)
+
+
+def _write_volumetrics(
+    file_name: Path, spec: SyntheticEnsembleSpec, rng: np.random.Generator
+) -> None:
+    num_rows = spec.num_volumetrics_rows
+    volumes = pd.DataFrame(
+        {
+            "ZONE": rng.choice(["Valysar", "Therys", "Volon"], num_rows),
+            "REGION": rng.integers(1, 8, num_rows).astype(str),
+            "FACIES": rng.choice(["Channel", "Crevasse", "Floodplain"], num_rows),
+            "LICENSE": rng.choice(["L1", "L2"], num_rows),
+        }
+    )
+    volumes["BULK_OIL"] = rng.uniform(1e6, 1e8, num_rows)
+    volumes["PORV_OIL"] = 0.25 * volumes["BULK_OIL"]
+    volumes["HCPV_OIL"] = 0.7 * volumes["PORV_OIL"]
+    volumes["STOIIP_OIL"] = volumes["HCPV_OIL"] / 1.3
+    volumes["ASSOCIATEDGAS_OIL"] = 100 * volumes["STOIIP_OIL"]
+
+    file_name.parent.mkdir(parents=True, exist_ok=True)
+    volumes.to_csv(file_name, index=False)
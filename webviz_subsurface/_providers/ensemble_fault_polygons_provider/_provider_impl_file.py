@@ -7,6 +7,7 @@ from typing import List, Optional
 import pandas as pd
 import xtgeo
 
+from webviz_subsurface._utils.perf_telemetry import provider_tags, traced
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._fault_polygons_discovery import FaultPolygonsFileInfo
@@ -152,6 +153,7 @@ class ProviderImplFile(EnsembleFaultPolygonsProvider):
         # Sort and strip out any entries with real == -1
         return sorted([r for r in unique_reals if r >= 0])
 
+    @traced("fault_polygons.get_fault_polygons", tags=provider_tags)
     def get_fault_polygons(
         self,
         address: FaultPolygonsAddress,
@@ -9,6 +9,7 @@ from webviz_config.webviz_instance_info import WebvizRunMode
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ..provider_build_executor import ProviderBuildExecutor
 from ._fault_polygons_discovery import discover_per_realization_fault_polygons_files
 from ._provider_impl_file import ProviderImplFile
 from .ensemble_fault_polygons_provider import EnsembleFaultPolygonsProvider
@@ -67,34 +68,42 @@ class EnsembleFaultPolygonsProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load fault polygons provider for {ens_path}")
 
-        LOGGER.info(f"Importing/copying fault polygons data for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir, storage_key, ProviderImplFile.from_backing_store
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
-        sim_fault_polygons_files = discover_per_realization_fault_polygons_files(
-            ens_path
-        )
+            LOGGER.info(f"Importing/copying fault polygons data for: {ens_path}")
 
-        et_discover_s = timer.lap_s()
+            timer.lap_s()
+            sim_fault_polygons_files = discover_per_realization_fault_polygons_files(
+                ens_path
+            )
 
-        ProviderImplFile.write_backing_store(
-            self._storage_dir,
-            storage_key,
-            sim_fault_polygons=sim_fault_polygons_files,
-        )
-        et_write_s = timer.lap_s()
+            et_discover_s = timer.lap_s()
 
-        provider = ProviderImplFile.from_backing_store(self._storage_dir, storage_key)
-        if not provider:
-            raise ValueError(
-                f"Failed to load/create fault polygons provider for {ens_path}"
+            ProviderImplFile.write_backing_store(
+                self._storage_dir,
+                storage_key,
+                sim_fault_polygons=sim_fault_polygons_files,
             )
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved fault polygons provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"discover={et_discover_s:.2f}s, write={et_write_s:.2f}s, ens_path={ens_path})"
-        )
+            provider = ProviderImplFile.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(
+                    f"Failed to load/create fault polygons provider for {ens_path}"
+                )
 
-        return provider
+            LOGGER.info(
+                f"Saved fault polygons provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"discover={et_discover_s:.2f}s, write={et_write_s:.2f}s, ens_path={ens_path})"
+            )
+
+            return provider
 
 
 def _make_hash_string(string_to_hash: str) -> str:
@@ -9,6 +9,11 @@ import geojson
 import xtgeo
 from dash import Dash
 
+from ..._utils.perf_telemetry import (
+    add_span_tags,
+    register_telemetry_route,
+    traced,
+)
 from .ensemble_fault_polygons_provider import (
     EnsembleFaultPolygonsProvider,
     FaultPolygonsAddress,
@@ -31,6 +36,7 @@ class FaultPolygonsServer:
     def __init__(self, app: Dash) -> None:
 
         self._setup_url_rule(app)
+        register_telemetry_route(app)
         self._id_to_provider_dict: Dict[str, EnsembleFaultPolygonsProvider] = {}
 
     @staticmethod
@@ -79,6 +85,7 @@ class FaultPolygonsServer:
 
     def _setup_url_rule(self, app: Dash) -> None:
         @app.server.route(_ROOT_URL_PATH + "/<provider_id>/<fault_polygons_address>")
+        @traced("fault_polygons_server.request")
         def _handle_fault_polygons_request(
             provider_id: str,
             fault_polygons_address: str,
@@ -112,9 +119,11 @@ class FaultPolygonsServer:
                 }
             )
 
-            return flask.Response(
+            response = flask.Response(
                 geojson.dumps(featurecoll), mimetype="application/geo+json"
             )
+            add_span_tags(provider=provider_id, bytes=response.content_length)
+            return response
 
 
 def _create_fault_polygons_geojson(polygons: xtgeo.Polygons) -> Dict:
@@ -10,6 +10,7 @@ from webviz_config.webviz_instance_info import WebvizRunMode
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ..provider_build_executor import ProviderBuildExecutor
 from ._egrid_file_discovery import discover_per_realization_eclipse_files
 from ._roff_file_discovery import discover_per_realization_roff_files
 from .ensemble_grid_provider import EnsembleGridProvider
@@ -83,34 +84,42 @@ class EnsembleGridProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load grid provider for {ens_path}")
 
-        LOGGER.info(f"Importing/copying grid data for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir, storage_key, ProviderImplRoff.from_backing_store
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
-        grid_info, grid_parameters_info = discover_per_realization_roff_files(
-            ens_path, grid_name, attribute_filter
-        )
+            LOGGER.info(f"Importing/copying grid data for: {ens_path}")
 
-        # As an optimization, avoid copying the grid data into the backing store,
-        # typically when  we're running in non-portable mode
-        ProviderImplRoff.write_backing_store(
-            self._storage_dir,
-            storage_key,
-            grid_geometries_info=grid_info,
-            grid_parameters_info=grid_parameters_info,
-            avoid_copying_grid_data=self._avoid_copying_grid_data,
-        )
-        et_write_s = timer.lap_s()
+            timer.lap_s()
+            grid_info, grid_parameters_info = discover_per_realization_roff_files(
+                ens_path, grid_name, attribute_filter
+            )
 
-        provider = ProviderImplRoff.from_backing_store(self._storage_dir, storage_key)
-        if not provider:
-            raise ValueError(f"Failed to load/create grid provider for {ens_path}")
+            # As an optimization, avoid copying the grid data into the backing store,
+            # typically when  we're running in non-portable mode
+            ProviderImplRoff.write_backing_store(
+                self._storage_dir,
+                storage_key,
+                grid_geometries_info=grid_info,
+                grid_parameters_info=grid_parameters_info,
+                avoid_copying_grid_data=self._avoid_copying_grid_data,
+            )
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved grid provider to backing store in {timer.elapsed_s():.2f}s ("
-            f" write={et_write_s:.2f}s, ens_path={ens_path})"
-        )
+            provider = ProviderImplRoff.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create grid provider for {ens_path}")
 
-        return provider
+            LOGGER.info(
+                f"Saved grid provider to backing store in {timer.elapsed_s():.2f}s ("
+                f" write={et_write_s:.2f}s, ens_path={ens_path})"
+            )
+
+            return provider
 
     def create_from_eclipse_files(
         self,
@@ -137,32 +146,44 @@ class EnsembleGridProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load grid provider for {ens_path}")
 
-        LOGGER.info(f"Importing/copying grid data for: {ens_path}")
-
-        timer.lap_s()
-        eclipse_case_paths = discover_per_realization_eclipse_files(ens_path, grid_name)
-
-        # As an optimization, avoid copying the grid data into the backing store,
-        # typically when  we're running in non-portable mode
-        ProviderImplEgrid.write_backing_store(
+        with ProviderBuildExecutor.instance().import_slot(
             self._storage_dir,
             storage_key,
-            eclipse_case_paths=eclipse_case_paths,
-            avoid_copying_grid_data=self._avoid_copying_grid_data,
-        )
-        et_write_s = timer.lap_s()
-        provider = ProviderImplEgrid.from_backing_store(
-            self._storage_dir, storage_key, init_properties, restart_properties
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create grid provider for {ens_path}")
+            lambda storage_dir, key: ProviderImplEgrid.from_backing_store(
+                storage_dir, key, init_properties, restart_properties
+            ),
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
+
+            LOGGER.info(f"Importing/copying grid data for: {ens_path}")
+
+            timer.lap_s()
+            eclipse_case_paths = discover_per_realization_eclipse_files(
+                ens_path, grid_name
+            )
 
-        LOGGER.info(
-            f"Saved grid provider to backing store in {timer.elapsed_s():.2f}s ("
-            f" write={et_write_s:.2f}s, ens_path={ens_path})"
-        )
+            # As an optimization, avoid copying the grid data into the backing store,
+            # typically when  we're running in non-portable mode
+            ProviderImplEgrid.write_backing_store(
+                self._storage_dir,
+                storage_key,
+                eclipse_case_paths=eclipse_case_paths,
+                avoid_copying_grid_data=self._avoid_copying_grid_data,
+            )
+            et_write_s = timer.lap_s()
+            provider = ProviderImplEgrid.from_backing_store(
+                self._storage_dir, storage_key, init_properties, restart_properties
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create grid provider for {ens_path}")
 
-        return provider
+            LOGGER.info(
+                f"Saved grid provider to backing store in {timer.elapsed_s():.2f}s ("
+                f" write={et_write_s:.2f}s, ens_path={ens_path})"
+            )
+
+            return provider
 
 
 def _make_hash_string(string_to_hash: str) -> str:
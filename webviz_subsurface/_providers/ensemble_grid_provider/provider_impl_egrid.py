@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 import xtgeo
 
+from webviz_subsurface._utils.perf_telemetry import provider_tags, traced
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._egrid_file_discovery import EclipseCaseFileInfo
@@ -156,6 +157,7 @@ class ProviderImplEgrid(EnsembleGridProvider):
         # Sort and strip out any entries with real == -1
         return sorted([r for r in unique_reals if r >= 0])
 
+    @traced("grid.get_3dgrid", tags=provider_tags)
     def get_3dgrid(self, realization: int) -> xtgeo.Grid:
 
         df = self._inventory_df.loc[self._inventory_df[Col.REAL] == realization]
@@ -164,6 +166,7 @@ class ProviderImplEgrid(EnsembleGridProvider):
 
         return grid
 
+    @traced("grid.get_static_property_values", tags=provider_tags)
     def get_static_property_values(
         self, property_name: str, realization: int
     ) -> Optional[np.ndarray]:
@@ -180,6 +183,7 @@ class ProviderImplEgrid(EnsembleGridProvider):
 
         return grid_property.get_npvalues1d(order="F", fill_value=fill_value).ravel()
 
+    @traced("grid.get_dynamic_property_values", tags=provider_tags)
     def get_dynamic_property_values(
         self, property_name: str, property_date: str, realization: int
     ) -> Optional[np.ndarray]:
@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 import xtgeo
 
+from webviz_subsurface._utils.perf_telemetry import provider_tags, traced
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._roff_file_discovery import GridFileInfo, GridParameterFileInfo
@@ -210,6 +211,7 @@ class ProviderImplRoff(EnsembleGridProvider):
         # Sort and strip out any entries with real == -1
         return sorted([r for r in unique_reals if r >= 0])
 
+    @traced("grid.get_3dgrid", tags=provider_tags)
     def get_3dgrid(self, realization: int) -> xtgeo.Grid:
         df = self._inventory_df.loc[self._inventory_df[Col.TYPE] == GridType.GEOMETRY]
         df = df.loc[df[Col.REAL] == realization]
@@ -233,6 +235,7 @@ class ProviderImplRoff(EnsembleGridProvider):
         grid = xtgeo.grid_from_file(fn_list[0])
         return grid
 
+    @traced("grid.get_static_property_values", tags=provider_tags)
     def get_static_property_values(
         self, property_name: str, realization: int
     ) -> Optional[np.ndarray]:
@@ -251,6 +254,7 @@ class ProviderImplRoff(EnsembleGridProvider):
         fill_value = np.nan if not grid_property.isdiscrete else -1
         return grid_property.get_npvalues1d(order="F", fill_value=fill_value).ravel()
 
+    @traced("grid.get_dynamic_property_values", tags=provider_tags)
     def get_dynamic_property_values(
         self, property_name: str, property_date: str, realization: int
     ) -> Optional[np.ndarray]:
@@ -9,6 +9,11 @@ import pandas as pd
 import pyarrow as pa
 import pyarrow.compute as pc
 
+from webviz_subsurface._utils.perf_telemetry import (
+    add_span_tags,
+    record_phases,
+    traced,
+)
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._field_metadata import create_vector_metadata_from_field_meta
@@ -34,6 +39,16 @@ from .ensemble_summary_provider import (
 
 LOGGER = logging.getLogger(__name__)
 
+# Frequencies that are resampled when writing the backing store, and stored as
+# "pyramid levels" next to the raw data. Requests for these frequencies are
+# served from the stored levels without any interpolation.
+PYRAMID_FREQUENCIES = [
+    Frequency.YEARLY,
+    Frequency.QUARTERLY,
+    Frequency.MONTHLY,
+    Frequency.WEEKLY,
+]
+
 
 def _sort_table_on_real_then_date(table: pa.Table) -> pa.Table:
     indices = pc.sort_indices(
@@ -62,12 +77,33 @@ def _find_first_non_increasing_date_pair(
     return (dates_np[offending_indices[0]], dates_np[offending_indices[0] + 1])
 
 
+def _pyramid_level_file_name(
+    storage_dir: Path, storage_key: str, frequency: Frequency
+) -> Path:
+    return storage_dir / f"{storage_key}__{frequency.value}.arrow"
+
+
+def _write_table(arrow_file_name: Path, table: pa.Table) -> None:
+    with pa.OSFile(str(arrow_file_name), "wb") as sink:
+        with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
 class ProviderImplArrowLazy(EnsembleSummaryProvider):
     """This class implements an EnsembleSummaryProvider with lazy (on-demand)
     resampling/interpolation.
+
+    The backing store may also contain presampled pyramid levels (by default
+    yearly, quarterly, monthly and weekly) next to the raw data. Requests for
+    these frequencies are served directly from the pyramid levels, while other
+    requests (e.g. daily) are resampled on demand from the raw data.
     """
 
-    def __init__(self, arrow_file_name: Path) -> None:
+    def __init__(
+        self,
+        arrow_file_name: Path,
+        pyramid_level_file_names: Optional[Dict[Frequency, Path]] = None,
+    ) -> None:
         self._arrow_file_name = str(arrow_file_name)
 
         LOGGER.debug(f"init with arrow file: {self._arrow_file_name}")
@@ -96,6 +132,13 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         # Done to try and stop blobfuse from throwing the file out of its cache.
         self._cached_reader = reader
 
+        self._pyramid_readers: Dict[Frequency, pa.ipc.RecordBatchFileReader] = {
+            frequency: pa.ipc.RecordBatchFileReader(
+                pa.memory_map(str(level_file_name), "r")
+            )
+            for frequency, level_file_name in (pyramid_level_file_names or {}).items()
+        }
+
         # For testing, uncomment code below and we will be more aggressive
         # and keep the "raw" table in memory
         self._cached_full_table = None
@@ -106,7 +149,8 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             f"(open={et_open_ms}ms, create_reader={et_create_reader_ms}ms, "
             f"find_vec_names={et_find_vec_names_ms}ms, find_real={et_find_real_ms}ms), "
             f"#vector_names={len(self._vector_names)}, "
-            f"#realization={len(self._realizations)}"
+            f"#realization={len(self._realizations)}, "
+            f"pyramid_levels={[freq.value for freq in self._pyramid_readers]}"
         )
 
         if not self._realizations:
@@ -116,7 +160,10 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
     @staticmethod
     def write_backing_store_from_per_realization_tables(
-        storage_dir: Path, storage_key: str, per_real_tables: Dict[int, pa.Table]
+        storage_dir: Path,
+        storage_key: str,
+        per_real_tables: Dict[int, pa.Table],
+        pyramid_frequencies: Sequence[Frequency] = tuple(PYRAMID_FREQUENCIES),
     ) -> None:
         # pylint: disable=too-many-locals
         @dataclass
@@ -125,6 +172,7 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             build_add_real_col_s: float = -1
             sorting_s: float = -1
             find_and_store_min_max_s: float = -1
+            write_pyramid_levels_s: float = -1
             write_s: float = -1
 
         elapsed = Elapsed()
@@ -184,10 +232,19 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         )
         elapsed.find_and_store_min_max_s = timer.lap_s()
 
+        # The pyramid levels are written before the raw data, since the existence
+        # of the raw data file marks a complete backing store
+        for frequency in pyramid_frequencies:
+            if frequency == Frequency.DAILY:
+                raise ValueError("Daily frequency is not supported as pyramid level")
+            _write_table(
+                _pyramid_level_file_name(storage_dir, storage_key, frequency),
+                resample_segmented_multi_real_table(full_table, frequency),
+            )
+        elapsed.write_pyramid_levels_s = timer.lap_s()
+
         # feather.write_feather(full_table, dest=arrow_file_name)
-        with pa.OSFile(str(arrow_file_name), "wb") as sink:
-            with pa.RecordBatchFileWriter(sink, full_table.schema) as writer:
-                writer.write_table(full_table)
+        _write_table(arrow_file_name, full_table)
         elapsed.write_s = timer.lap_s()
 
         LOGGER.debug(
@@ -196,6 +253,7 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             f"build_add_real_col={elapsed.build_add_real_col_s:.2f}s, "
             f"sorting={elapsed.sorting_s:.2f}s, "
             f"find_and_store_min_max={elapsed.find_and_store_min_max_s:.2f}s, "
+            f"write_pyramid_levels={elapsed.write_pyramid_levels_s:.2f}s, "
             f"write={elapsed.write_s:.2f}s)"
         )
 
@@ -206,7 +264,17 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         arrow_file_name = storage_dir / (storage_key + ".arrow")
         if arrow_file_name.is_file():
-            return ProviderImplArrowLazy(arrow_file_name)
+            # Backing stores written without pyramid levels are resampled lazily
+            level_file_names = {
+                frequency: _pyramid_level_file_name(storage_dir, storage_key, frequency)
+                for frequency in Frequency
+            }
+            pyramid_level_file_names = {
+                frequency: file_name
+                for frequency, file_name in level_file_names.items()
+                if file_name.is_file()
+            }
+            return ProviderImplArrowLazy(arrow_file_name, pyramid_level_file_names)
 
         return None
 
@@ -281,6 +349,7 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
     def supports_resampling(self) -> bool:
         return True
 
+    @traced("summary.dates")
     def dates(
         self,
         resampling_frequency: Optional[Frequency],
@@ -309,6 +378,15 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         et_find_unique_ms = timer.lap_ms()
 
+        record_phases(
+            read=et_read_ms, filter=et_filter_ms, find_unique=et_find_unique_ms
+        )
+        add_span_tags(
+            provider=Path(self._arrow_file_name).name,
+            resampling_frequency=str(resampling_frequency),
+            num_realizations=len(realizations) if realizations else "all",
+        )
+
         LOGGER.debug(
             f"dates({resampling_frequency}) took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
@@ -318,6 +396,7 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         return intersected_dates.astype(datetime.datetime).tolist()
 
+    @traced("summary.get_vectors_df")
     def get_vectors_df(
         self,
         vector_names: Sequence[str],
@@ -332,7 +411,15 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
 
         columns_to_get = ["DATE", "REAL"]
         columns_to_get.extend(vector_names)
-        table = self._get_or_read_table(columns_to_get)
+        pyramid_reader = (
+            self._pyramid_readers.get(resampling_frequency)
+            if resampling_frequency is not None
+            else None
+        )
+        if pyramid_reader is not None:
+            table = pyramid_reader.read_all().select(columns_to_get)
+        else:
+            table = self._get_or_read_table(columns_to_get)
         et_read_ms = timer.lap_ms()
 
         if realizations is not None:
@@ -340,13 +427,27 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             table = table.filter(mask)
         et_filter_ms = timer.lap_ms()
 
-        if resampling_frequency is not None:
+        if resampling_frequency is not None and pyramid_reader is None:
             table = resample_segmented_multi_real_table(table, resampling_frequency)
         et_resample_ms = timer.lap_ms()
 
         df = table.to_pandas(timestamp_as_object=True)
         et_to_pandas_ms = timer.lap_ms()
 
+        record_phases(
+            read=et_read_ms,
+            filter=et_filter_ms,
+            resample=et_resample_ms,
+            to_pandas=et_to_pandas_ms,
+        )
+        add_span_tags(
+            provider=Path(self._arrow_file_name).name,
+            num_vectors=len(vector_names),
+            num_realizations=len(realizations) if realizations is not None else "all",
+            bytes=int(df.memory_usage(index=False).sum()),
+            pyramid_level=pyramid_reader is not None,
+        )
+
         LOGGER.debug(
             f"get_vectors_df({resampling_frequency}) took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
@@ -355,11 +456,13 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
             f"to_pandas={et_to_pandas_ms}ms), "
             f"#vecs={len(vector_names)}, "
             f"#real={len(realizations) if realizations is not None else 'all'}, "
-            f"df.shape={df.shape}, file={Path(self._arrow_file_name).name}"
+            f"df.shape={df.shape}, pyramid_level={pyramid_reader is not None}, "
+            f"file={Path(self._arrow_file_name).name}"
         )
 
         return df
 
+    @traced("summary.get_vectors_for_date_df")
     def get_vectors_for_date_df(
         self,
         date: datetime.datetime,
@@ -391,6 +494,19 @@ class ProviderImplArrowLazy(EnsembleSummaryProvider):
         df = table.to_pandas()
         et_to_pandas_ms = timer.lap_ms()
 
+        record_phases(
+            read=et_read_ms,
+            filter=et_filter_ms,
+            resample=et_resample_ms,
+            to_pandas=et_to_pandas_ms,
+        )
+        add_span_tags(
+            provider=Path(self._arrow_file_name).name,
+            num_vectors=len(vector_names),
+            num_realizations=len(realizations) if realizations else "all",
+            bytes=int(df.memory_usage(index=False).sum()),
+        )
+
         LOGGER.debug(
             f"get_vectors_for_date_df() took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
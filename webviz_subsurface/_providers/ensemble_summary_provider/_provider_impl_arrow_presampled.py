@@ -10,6 +10,11 @@ import pyarrow as pa
 import pyarrow.compute as pc
 from pyarrow import feather
 
+from webviz_subsurface._utils.perf_telemetry import (
+    add_span_tags,
+    record_phases,
+    traced,
+)
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._dataframe_utils import make_date_column_datetime_object
@@ -348,6 +353,7 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
     def supports_resampling(self) -> bool:
         return False
 
+    @traced("summary.dates")
     def dates(
         self,
         resampling_frequency: Optional[Frequency],
@@ -370,6 +376,15 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         intersected_dates = find_intersected_dates_between_realizations(table)
         et_find_unique_ms = timer.lap_ms()
 
+        record_phases(
+            read=et_read_ms, filter=et_filter_ms, find_unique=et_find_unique_ms
+        )
+        add_span_tags(
+            provider=Path(self._arrow_file_name).name,
+            resampling_frequency=str(resampling_frequency),
+            num_realizations=len(realizations) if realizations else "all",
+        )
+
         LOGGER.debug(
             f"dates() took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
@@ -379,6 +394,7 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
 
         return intersected_dates.astype(datetime.datetime).tolist()
 
+    @traced("summary.get_vectors_df")
     def get_vectors_df(
         self,
         vector_names: Sequence[str],
@@ -406,6 +422,18 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         # del table  # not necessary, but a good practice
         et_to_pandas_ms = timer.lap_ms()
 
+        record_phases(
+            read=et_read_ms,
+            filter=et_filter_ms,
+            to_pandas=et_to_pandas_ms,
+        )
+        add_span_tags(
+            provider=Path(self._arrow_file_name).name,
+            num_vectors=len(vector_names),
+            num_realizations=len(realizations) if realizations is not None else "all",
+            bytes=int(df.memory_usage(index=False).sum()),
+        )
+
         LOGGER.debug(
             f"get_vectors_df() took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
@@ -418,6 +446,7 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
 
         return df
 
+    @traced("summary.get_vectors_for_date_df")
     def get_vectors_for_date_df(
         self,
         date: datetime.datetime,
@@ -451,6 +480,18 @@ class ProviderImplArrowPresampled(EnsembleSummaryProvider):
         # del table  # not necessary, but a good practice
         et_to_pandas_ms = timer.lap_ms()
 
+        record_phases(
+            read=et_read_ms,
+            filter=et_filter_ms,
+            to_pandas=et_to_pandas_ms,
+        )
+        add_span_tags(
+            provider=Path(self._arrow_file_name).name,
+            num_vectors=len(vector_names),
+            num_realizations=len(realizations) if realizations else "all",
+            bytes=int(df.memory_usage(index=False).sum()),
+        )
+
         LOGGER.debug(
             f"get_vectors_for_date_df() took: {timer.elapsed_ms()}ms ("
             f"read={et_read_ms}ms, "
@@ -10,6 +10,7 @@ from webviz_config.webviz_instance_info import WebvizRunMode
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ..provider_build_executor import ProviderBuildExecutor
 from ._arrow_unsmry_import import load_per_realization_arrow_unsmry_files
 from ._csv_import import (
     load_ensemble_summary_csv_file,
@@ -88,38 +89,46 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load summary provider (CSV) for {csv_file}")
 
-        LOGGER.info(f"Importing/saving CSV summary data for: {csv_file}")
-
-        timer.lap_s()
-        ensemble_df = load_ensemble_summary_csv_file(csv_file, ensemble_filter)
-        et_import_csv_s = timer.lap_s()
-
-        if len(ensemble_df) == 0:
-            raise ValueError("Import resulted in empty DataFrame")
-        if "DATE" not in ensemble_df.columns:
-            raise ValueError("No DATE column present in input data")
-        if "REAL" not in ensemble_df.columns:
-            raise ValueError("No REAL column present in input data")
-
-        ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
-            self._storage_dir, storage_key, ensemble_df
-        )
-        et_write_s = timer.lap_s()
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir,
+            storage_key,
+            ProviderImplArrowPresampled.from_backing_store,
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
+
+            LOGGER.info(f"Importing/saving CSV summary data for: {csv_file}")
+
+            timer.lap_s()
+            ensemble_df = load_ensemble_summary_csv_file(csv_file, ensemble_filter)
+            et_import_csv_s = timer.lap_s()
+
+            if len(ensemble_df) == 0:
+                raise ValueError("Import resulted in empty DataFrame")
+            if "DATE" not in ensemble_df.columns:
+                raise ValueError("No DATE column present in input data")
+            if "REAL" not in ensemble_df.columns:
+                raise ValueError("No REAL column present in input data")
+
+            ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
+                self._storage_dir, storage_key, ensemble_df
+            )
+            et_write_s = timer.lap_s()
 
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create provider for {csv_file}")
+            provider = ProviderImplArrowPresampled.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create provider for {csv_file}")
 
-        LOGGER.info(
-            f"Saved summary provider (CSV) to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_csv={et_import_csv_s:.2f}s, "
-            f"write={et_write_s:.2f}s, "
-            f"csv_file={csv_file})"
-        )
+            LOGGER.info(
+                f"Saved summary provider (CSV) to backing store in {timer.elapsed_s():.2f}s ("
+                f"import_csv={et_import_csv_s:.2f}s, "
+                f"write={et_write_s:.2f}s, "
+                f"csv_file={csv_file})"
+            )
 
-        return provider
+            return provider
 
     def create_from_per_realization_csv_file(
         self, ens_path: str, csv_file_rel_path: str
@@ -151,34 +160,43 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
                 f"Failed to load summary provider (per real CSV) for {ens_path}"
             )
 
-        LOGGER.info(f"Importing/saving per real CSV summary data for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir,
+            storage_key,
+            ProviderImplArrowPresampled.from_backing_store,
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
+            LOGGER.info(f"Importing/saving per real CSV summary data for: {ens_path}")
 
-        ensemble_df = load_per_real_csv_file_using_fmu(ens_path, csv_file_rel_path)
-        et_import_csv_s = timer.lap_s()
+            timer.lap_s()
 
-        ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
-            self._storage_dir, storage_key, ensemble_df
-        )
-        et_write_s = timer.lap_s()
+            ensemble_df = load_per_real_csv_file_using_fmu(ens_path, csv_file_rel_path)
+            et_import_csv_s = timer.lap_s()
 
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
+            ProviderImplArrowPresampled.write_backing_store_from_ensemble_dataframe(
+                self._storage_dir, storage_key, ensemble_df
+            )
+            et_write_s = timer.lap_s()
 
-        if not provider:
-            raise ValueError(
-                f"Failed to load/create provider (per real CSV) for {ens_path}"
+            provider = ProviderImplArrowPresampled.from_backing_store(
+                self._storage_dir, storage_key
             )
 
-        LOGGER.info(
-            f"Saved summary provider (per real CSV) to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_csv={et_import_csv_s:.2f}s, write={et_write_s:.2f}s, "
-            f"ens_path={ens_path}, csv_file_rel_path={csv_file_rel_path})"
-        )
+            if not provider:
+                raise ValueError(
+                    f"Failed to load/create provider (per real CSV) for {ens_path}"
+                )
+
+            LOGGER.info(
+                f"Saved summary provider (per real CSV) to backing store in "
+                f"{timer.elapsed_s():.2f}s ("
+                f"import_csv={et_import_csv_s:.2f}s, write={et_write_s:.2f}s, "
+                f"ens_path={ens_path}, csv_file_rel_path={csv_file_rel_path})"
+            )
 
-        return provider
+            return provider
 
     def create_from_arrow_unsmry_lazy(
         self, ens_path: str, rel_file_pattern: str
@@ -212,39 +230,48 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load lazy summary provider for {ens_path}")
 
-        LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir, storage_key, ProviderImplArrowLazy.from_backing_store
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
-        per_real_tables = load_per_realization_arrow_unsmry_files(
-            ens_path, rel_file_pattern
-        )
-        if not per_real_tables:
-            raise ValueError(
-                f"Could not find any .arrow unsmry files for ens_path={ens_path}"
-            )
-        et_import_smry_s = timer.lap_s()
+            LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
 
-        try:
-            ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
-                self._storage_dir, storage_key, per_real_tables
+            timer.lap_s()
+            per_real_tables = load_per_realization_arrow_unsmry_files(
+                ens_path, rel_file_pattern
             )
-        except ValueError as exc:
-            raise ValueError(f"Failed to write backing store for: {ens_path}") from exc
+            if not per_real_tables:
+                raise ValueError(
+                    f"Could not find any .arrow unsmry files for ens_path={ens_path}"
+                )
+            et_import_smry_s = timer.lap_s()
 
-        et_write_s = timer.lap_s()
+            try:
+                ProviderImplArrowLazy.write_backing_store_from_per_realization_tables(
+                    self._storage_dir, storage_key, per_real_tables
+                )
+            except ValueError as exc:
+                raise ValueError(
+                    f"Failed to write backing store for: {ens_path}"
+                ) from exc
 
-        provider = ProviderImplArrowLazy.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create lazy provider for {ens_path}")
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved lazy summary provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_smry={et_import_smry_s:.2f}s, write={et_write_s:.2f}s, ens_path={ens_path})"
-        )
+            provider = ProviderImplArrowLazy.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create lazy provider for {ens_path}")
+
+            LOGGER.info(
+                f"Saved lazy summary provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"import_smry={et_import_smry_s:.2f}s, write={et_write_s:.2f}s, "
+                f"ens_path={ens_path})"
+            )
 
-        return provider
+            return provider
 
     def create_from_arrow_unsmry_presampled(
         self,
@@ -288,45 +315,53 @@ class EnsembleSummaryProviderFactory(WebvizFactory):
                 f"Failed to load presampled summary provider for {ens_path}"
             )
 
-        LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir,
+            storage_key,
+            ProviderImplArrowPresampled.from_backing_store,
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
-        per_real_tables = load_per_realization_arrow_unsmry_files(
-            ens_path, rel_file_pattern
-        )
-        if not per_real_tables:
-            raise ValueError(
-                f"Could not find any .arrow unsmry files for ens_path={ens_path}"
-            )
-        et_import_smry_s = timer.lap_s()
+            LOGGER.info(f"Importing/saving arrow summary data for: {ens_path}")
 
-        if sampling_frequency is not None:
-            for real_num, table in per_real_tables.items():
-                per_real_tables[real_num] = resample_single_real_table(
-                    table, sampling_frequency
+            timer.lap_s()
+            per_real_tables = load_per_realization_arrow_unsmry_files(
+                ens_path, rel_file_pattern
+            )
+            if not per_real_tables:
+                raise ValueError(
+                    f"Could not find any .arrow unsmry files for ens_path={ens_path}"
                 )
-        et_resample_s = timer.lap_s()
+            et_import_smry_s = timer.lap_s()
 
-        ProviderImplArrowPresampled.write_backing_store_from_per_realization_tables(
-            self._storage_dir, storage_key, per_real_tables
-        )
-        et_write_s = timer.lap_s()
+            if sampling_frequency is not None:
+                for real_num, table in per_real_tables.items():
+                    per_real_tables[real_num] = resample_single_real_table(
+                        table, sampling_frequency
+                    )
+            et_resample_s = timer.lap_s()
 
-        provider = ProviderImplArrowPresampled.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create provider for {ens_path}")
+            ProviderImplArrowPresampled.write_backing_store_from_per_realization_tables(
+                self._storage_dir, storage_key, per_real_tables
+            )
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved presampled summary provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_smry={et_import_smry_s:.2f}s, "
-            f"resample={et_resample_s:.2f}s, "
-            f"write={et_write_s:.2f}s, "
-            f"ens_path={ens_path})"
-        )
+            provider = ProviderImplArrowPresampled.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create provider for {ens_path}")
+
+            LOGGER.info(
+                f"Saved presampled summary provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"import_smry={et_import_smry_s:.2f}s, "
+                f"resample={et_resample_s:.2f}s, "
+                f"write={et_write_s:.2f}s, "
+                f"ens_path={ens_path})"
+            )
 
-        return provider
+            return provider
 
 
 def _make_hash_string(string_to_hash: str) -> str:
@@ -1,3 +1,4 @@
+from ._surface_to_tiles import TilePyramidMeta
 from .ensemble_surface_provider import (
     EnsembleSurfaceProvider,
     ObservedSurfaceAddress,
@@ -6,6 +7,7 @@ from .ensemble_surface_provider import (
     SurfaceAddress,
 )
 from .ensemble_surface_provider_factory import EnsembleSurfaceProviderFactory
+from .surface_diff import compute_diff_surface
 from .surface_server import (
     QualifiedDiffSurfaceAddress,
     QualifiedSurfaceAddress,
@@ -9,6 +9,11 @@ import numpy as np
 import pandas as pd
 import xtgeo
 
+from webviz_subsurface._utils.perf_telemetry import (
+    add_span_tags,
+    record_phases,
+    traced,
+)
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._stat_surf_cache import StatSurfCache
@@ -218,6 +223,13 @@ class ProviderImplFile(EnsembleSurfaceProvider):
         # Sort and strip out any entries with real == -1
         return sorted([r for r in unique_reals if r >= 0])
 
+    @traced(
+        "surface.get_surface",
+        tags=lambda self, address: {
+            "provider": self.provider_id(),
+            "address_type": type(address).__name__,
+        },
+    )
     def get_surface(
         self,
         address: SurfaceAddress,
@@ -240,6 +252,7 @@ class ProviderImplFile(EnsembleSurfaceProvider):
 
         surf = self._stat_surf_cache.fetch(address)
         if surf:
+            add_span_tags(stat_cache_hit=True)
             LOGGER.debug(
                 f"Fetched statistical surface from cache in: {timer.elapsed_s():.2f}s"
             )
@@ -251,6 +264,9 @@ class ProviderImplFile(EnsembleSurfaceProvider):
         self._stat_surf_cache.store(address, surf)
         et_write_cache_s = timer.lap_s()
 
+        add_span_tags(stat_cache_hit=False)
+        record_phases(create=1000 * et_create_s, store=1000 * et_write_cache_s)
+
         LOGGER.debug(
             f"Created and wrote statistical surface to cache in: {timer.elapsed_s():.2f}s ("
             f"create={et_create_s:.2f}s, store={et_write_cache_s:.2f}s), "
@@ -309,6 +325,9 @@ class ProviderImplFile(EnsembleSurfaceProvider):
             stat_surface = _calc_statistic_across_surfaces(address.statistic, surfaces)
         et_calc_s = timer.lap_s()
 
+        add_span_tags(num_surfaces=surf_count)
+        record_phases(load=1000 * et_load_s, calc=1000 * et_calc_s)
+
         LOGGER.debug(
             f"Created statistical surface in: {timer.elapsed_s():.2f}s ("
             f"load={et_load_s:.2f}s, calc={et_calc_s:.2f}s), "
@@ -82,7 +82,6 @@ def surface_to_png_bytes(surface: xtgeo.RegularSurface) -> bytes:
     return ret_bytes
 
 
-# pylint: disable=too-many-locals
 def surface_to_png_bytes_optimized(surface: xtgeo.RegularSurface) -> bytes:
 
     timer = PerfTimer()
@@ -92,25 +91,40 @@ def surface_to_png_bytes_optimized(surface: xtgeo.RegularSurface) -> bytes:
     surf_values_ma = np.flip(surf_values_ma.transpose(), axis=0)  # type: ignore
     LOGGER.debug(f"flip/transpose: {timer.lap_s():.2f}s")
 
+    ret_bytes = image_values_to_png_bytes(surf_values_ma)
+
+    LOGGER.debug(f"Total time: {timer.elapsed_s():.2f}s")
+
+    return ret_bytes
+
+
+def image_values_to_png_bytes(values_ma: np.ma.MaskedArray) -> bytes:
+    """Encodes a 2d masked array of values, in image orientation (row 0 at the top),
+    as a RGBA PNG. The values are scaled to 24 bits (RGB) between the min and max
+    value of the array, and undefined values are transparent (alpha 0)."""
+
+    timer = PerfTimer()
+
     # This will be a flat bool array with true for all valid entries
-    valid_arr = np.invert(np.ma.getmaskarray(surf_values_ma).flatten())
+    valid_arr = np.invert(np.ma.getmaskarray(values_ma).flatten())
     LOGGER.debug(f"get valid_arr: {timer.lap_s():.2f}s")
 
-    shape = surf_values_ma.shape
-    min_val = surf_values_ma.min()
-    max_val = surf_values_ma.max()
+    shape = values_ma.shape
+    min_val = values_ma.min()
+    max_val = values_ma.max()
     LOGGER.debug(f"minmax: {timer.lap_s():.2f}s")
 
-    if min_val == 0.0 and max_val == 0.0:
+    if min_val is np.ma.masked or min_val == max_val:
         scale_factor = 1.0
+        min_val = 0.0 if min_val is np.ma.masked else min_val
     else:
         scale_factor = (256 * 256 * 256 - 1) / (max_val - min_val)
 
     # Scale the values into the wanted range
-    scaled_values_ma = (surf_values_ma - min_val) * scale_factor
+    scaled_values_ma = (values_ma - min_val) * scale_factor
 
     # Get a NON-masked array with all undefined entries filled with 0
-    scaled_values = scaled_values_ma.filled(0)
+    scaled_values = np.ma.filled(scaled_values_ma, 0)
 
     LOGGER.debug(f"scale and fill: {timer.lap_s():.2f}s")
 
@@ -140,6 +154,4 @@ def surface_to_png_bytes_optimized(surface: xtgeo.RegularSurface) -> bytes:
     ret_bytes = byte_io.read()
     LOGGER.debug(f"read bytes: {timer.lap_s():.2f}s")
 
-    LOGGER.debug(f"Total time: {timer.elapsed_s():.2f}s")
-
     return ret_bytes
@@ -0,0 +1,116 @@
+import logging
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+from ._surface_to_image import image_values_to_png_bytes
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SurfaceTile:
+    """A PNG encoded tile, with the value range its values are scaled to"""
+
+    png_bytes: bytes
+    val_min: float
+    val_max: float
+
+
+@dataclass(frozen=True)
+class TilePyramidMeta:
+    """Layout of a tile pyramid. Level 0 is the whole surface downsampled to fit
+    in one tile, and each following level doubles the resolution, up to the full
+    resolution of the surface at level `num_levels - 1`. Tile (x, y) of a level
+    covers image columns x*tile_size to (x+1)*tile_size and rows y*tile_size to
+    (y+1)*tile_size, counted from the upper left corner."""
+
+    tile_size: int
+    num_levels: int
+    # Size of the full resolution image, in pixels
+    width: int
+    height: int
+    # Number of tiles (columns, rows) per level
+    level_num_tiles: List[Tuple[int, int]]
+
+
+def surface_to_tile_pyramid(
+    surface: xtgeo.RegularSurface, tile_size: int = 256
+) -> Tuple[TilePyramidMeta, Dict[Tuple[int, int, int], SurfaceTile]]:
+    """Returns the layout and the tiles, by (z, x, y), of a tile pyramid of the
+    surface.
+
+    The values of each tile are scaled to 24 bits between the min and max value
+    within the tile, giving a finer quantization than when scaling the whole
+    surface. Coarser levels hold the mean of each 2x2 block of defined values of
+    the next level. Edge tiles are padded with undefined (transparent) values,
+    and tiles without any defined values are left out.
+    """
+    timer = PerfTimer()
+
+    # Image orientation, as in surface_to_png_bytes_optimized()
+    values_ma: np.ma.MaskedArray = np.flip(surface.values.transpose(), axis=0)
+    height, width = values_ma.shape
+    num_levels = 1 + max(0, math.ceil(math.log2(max(width, height) / tile_size)))
+
+    tiles: Dict[Tuple[int, int, int], SurfaceTile] = {}
+    level_num_tiles: List[Tuple[int, int]] = []
+    for zoom in reversed(range(num_levels)):
+        level_num_tiles.append(
+            (-(-values_ma.shape[1] // tile_size), -(-values_ma.shape[0] // tile_size))
+        )
+        for x_idx, y_idx, tile_values in _split_in_tiles(values_ma, tile_size):
+            if np.ma.getmaskarray(tile_values).all():
+                continue
+            tiles[(zoom, x_idx, y_idx)] = SurfaceTile(
+                png_bytes=image_values_to_png_bytes(tile_values),
+                val_min=float(tile_values.min()),
+                val_max=float(tile_values.max()),
+            )
+        if zoom > 0:
+            values_ma = _downsample(values_ma)
+    level_num_tiles.reverse()
+
+    LOGGER.debug(
+        f"Created tile pyramid with {num_levels} levels and {len(tiles)} tiles "
+        f"in {timer.elapsed_s():.2f}s"
+    )
+    meta = TilePyramidMeta(
+        tile_size=tile_size,
+        num_levels=num_levels,
+        width=width,
+        height=height,
+        level_num_tiles=level_num_tiles,
+    )
+    return meta, tiles
+
+
+def _split_in_tiles(
+    values_ma: np.ma.MaskedArray, tile_size: int
+) -> Iterator[Tuple[int, int, np.ma.MaskedArray]]:
+    height, width = values_ma.shape
+    for y_idx, row in enumerate(range(0, height, tile_size)):
+        for x_idx, col in enumerate(range(0, width, tile_size)):
+            tile_values = _undefined((tile_size, tile_size))
+            block = values_ma[row : row + tile_size, col : col + tile_size]
+            tile_values[: block.shape[0], : block.shape[1]] = block
+            yield x_idx, y_idx, tile_values
+
+
+def _downsample(values_ma: np.ma.MaskedArray) -> np.ma.MaskedArray:
+    """Halves the resolution, by the mean of each 2x2 block of defined values"""
+    height, width = values_ma.shape
+    padded = _undefined((height + height % 2, width + width % 2))
+    padded[:height, :width] = values_ma
+    blocks = padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2)
+    return blocks.mean(axis=(1, 3))
+
+
+def _undefined(shape: Tuple[int, int]) -> np.ma.MaskedArray:
+    # Zero filled, as the values below the mask are scaled when encoding
+    return np.ma.array(np.zeros(shape), mask=True)
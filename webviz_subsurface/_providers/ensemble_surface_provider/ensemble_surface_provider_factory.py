@@ -10,6 +10,7 @@ from webviz_config.webviz_instance_info import WebvizRunMode
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ..provider_build_executor import ProviderBuildExecutor
 from ._provider_impl_file import ProviderImplFile
 from ._surface_discovery import (
     discover_observed_surface_files,
@@ -88,36 +89,48 @@ class EnsembleSurfaceProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load surface provider for {ens_path}")
 
-        LOGGER.info(f"Importing/copying surface data for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir, storage_key, ProviderImplFile.from_backing_store
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
-        sim_surface_files = discover_per_realization_surface_files(
-            ens_path, rel_surface_folder, attribute_filter
-        )
-        obs_surface_files = discover_observed_surface_files(ens_path, attribute_filter)
-        et_discover_s = timer.lap_s()
-
-        # As an optimization, avoid copying the surfaces into the backing store,
-        # typically when  we're running in non-portable mode
-        ProviderImplFile.write_backing_store(
-            self._storage_dir,
-            storage_key,
-            sim_surfaces=sim_surface_files,
-            obs_surfaces=obs_surface_files,
-            avoid_copying_surfaces=self._avoid_copying_surfaces,
-        )
-        et_write_s = timer.lap_s()
+            LOGGER.info(f"Importing/copying surface data for: {ens_path}")
 
-        provider = ProviderImplFile.from_backing_store(self._storage_dir, storage_key)
-        if not provider:
-            raise ValueError(f"Failed to load/create surface provider for {ens_path}")
+            timer.lap_s()
+            sim_surface_files = discover_per_realization_surface_files(
+                ens_path, rel_surface_folder, attribute_filter
+            )
+            obs_surface_files = discover_observed_surface_files(
+                ens_path, attribute_filter
+            )
+            et_discover_s = timer.lap_s()
+
+            # As an optimization, avoid copying the surfaces into the backing store,
+            # typically when  we're running in non-portable mode
+            ProviderImplFile.write_backing_store(
+                self._storage_dir,
+                storage_key,
+                sim_surfaces=sim_surface_files,
+                obs_surfaces=obs_surface_files,
+                avoid_copying_surfaces=self._avoid_copying_surfaces,
+            )
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved surface provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"discover={et_discover_s:.2f}s, write={et_write_s:.2f}s, ens_path={ens_path})"
-        )
+            provider = ProviderImplFile.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(
+                    f"Failed to load/create surface provider for {ens_path}"
+                )
+
+            LOGGER.info(
+                f"Saved surface provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"discover={et_discover_s:.2f}s, write={et_write_s:.2f}s, ens_path={ens_path})"
+            )
 
-        return provider
+            return provider
 
 
 def _make_hash_string(string_to_hash: str) -> str:
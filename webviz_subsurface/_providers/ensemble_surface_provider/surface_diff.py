@@ -0,0 +1,148 @@
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SurfaceGeometry:
+    ncol: int
+    nrow: int
+    xori: float
+    yori: float
+    xinc: float
+    yinc: float
+    rotation: float
+    yflip: int
+
+    @staticmethod
+    def from_surface(surface: xtgeo.RegularSurface) -> "SurfaceGeometry":
+        return SurfaceGeometry(
+            ncol=surface.ncol,
+            nrow=surface.nrow,
+            xori=surface.xori,
+            yori=surface.yori,
+            xinc=surface.xinc,
+            yinc=surface.yinc,
+            rotation=surface.rotation,
+            yflip=surface.yflip,
+        )
+
+    def node_coordinates(self) -> np.ndarray:
+        """Returns the (ncol*nrow, 2) x and y coordinates of the nodes, in the
+        order of the flattened values"""
+        i_idx, j_idx = np.meshgrid(
+            np.arange(self.ncol), np.arange(self.nrow), indexing="ij"
+        )
+        local_x = i_idx.ravel() * self.xinc
+        local_y = j_idx.ravel() * self.yinc * self.yflip
+        angle = np.radians(self.rotation)
+        return np.column_stack(
+            [
+                self.xori + local_x * np.cos(angle) - local_y * np.sin(angle),
+                self.yori + local_x * np.sin(angle) + local_y * np.cos(angle),
+            ]
+        )
+
+
+@dataclass(frozen=True)
+class ResamplingOperator:
+    """Bilinear resampling from the nodes of a source geometry to the nodes of a
+    target geometry, as the indices of the (flattened) source nodes surrounding
+    each target node and their weights. Target nodes outside the source are
+    undefined, as are nodes with any undefined surrounding source node."""
+
+    target_shape: tuple
+    # Shape (number of target nodes, 4)
+    source_indices: np.ndarray
+    weights: np.ndarray
+    inside: np.ndarray
+
+    def apply(self, source_values: np.ma.MaskedArray) -> np.ma.MaskedArray:
+        values = np.ma.filled(source_values, np.nan).ravel()
+        resampled = np.einsum(
+            "ij,ij->i", values[self.source_indices], self.weights
+        ).reshape(self.target_shape)
+        undefined = np.isnan(resampled) | ~self.inside.reshape(self.target_shape)
+        return np.ma.array(np.where(undefined, 0.0, resampled), mask=undefined)
+
+
+@fingerprint_memoize(maxsize=16, copy_result=False)
+def get_resampling_operator(
+    target: SurfaceGeometry, source: SurfaceGeometry
+) -> ResamplingOperator:
+    """Returns the operator resampling surfaces on the source geometry onto the
+    target geometry. Operators are cached, and can be applied to any surface on
+    the source geometry."""
+    timer = PerfTimer()
+    coords = target.node_coordinates()
+    angle = np.radians(source.rotation)
+    delta_x = coords[:, 0] - source.xori
+    delta_y = coords[:, 1] - source.yori
+    col = (delta_x * np.cos(angle) + delta_y * np.sin(angle)) / source.xinc
+    row = (-delta_x * np.sin(angle) + delta_y * np.cos(angle)) / (
+        source.yinc * source.yflip
+    )
+
+    inside = (
+        (col >= 0) & (col <= source.ncol - 1) & (row >= 0) & (row <= source.nrow - 1)
+    )
+    # Nodes on the last column/row use the cell before it
+    col0 = np.clip(np.floor(col), 0, max(source.ncol - 2, 0)).astype(np.int64)
+    row0 = np.clip(np.floor(row), 0, max(source.nrow - 2, 0)).astype(np.int64)
+    col1 = np.minimum(col0 + 1, source.ncol - 1)
+    row1 = np.minimum(row0 + 1, source.nrow - 1)
+    frac_col = np.clip(col - col0, 0, 1)
+    frac_row = np.clip(row - row0, 0, 1)
+
+    source_indices = np.column_stack(
+        [
+            col0 * source.nrow + row0,
+            col1 * source.nrow + row0,
+            col0 * source.nrow + row1,
+            col1 * source.nrow + row1,
+        ]
+    )
+    weights = np.column_stack(
+        [
+            (1 - frac_col) * (1 - frac_row),
+            frac_col * (1 - frac_row),
+            (1 - frac_col) * frac_row,
+            frac_col * frac_row,
+        ]
+    )
+    LOGGER.debug(
+        f"Created resampling operator for {target.ncol}x{target.nrow} nodes "
+        f"in {timer.elapsed_ms()}ms"
+    )
+    return ResamplingOperator(
+        target_shape=(target.ncol, target.nrow),
+        source_indices=source_indices,
+        weights=weights,
+        inside=inside,
+    )
+
+
+def compute_diff_surface(
+    surface_a: xtgeo.RegularSurface, surface_b: xtgeo.RegularSurface
+) -> xtgeo.RegularSurface:
+    """Returns surface_a - surface_b on the geometry of surface_a. If the surfaces
+    have different geometries, surface_b is resampled bilinearly onto the
+    geometry of surface_a using a cached resampling operator."""
+    geometry_a = SurfaceGeometry.from_surface(surface_a)
+    geometry_b = SurfaceGeometry.from_surface(surface_b)
+    if geometry_a == geometry_b:
+        values_b = surface_b.values
+    else:
+        values_b = get_resampling_operator(geometry_a, geometry_b).apply(
+            surface_b.values
+        )
+    diff_surface = surface_a.copy()
+    diff_surface.values = surface_a.values - values_b
+    return diff_surface
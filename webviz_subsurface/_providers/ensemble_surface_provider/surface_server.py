@@ -14,9 +14,16 @@ import xtgeo
 from dash import Dash
 from webviz_config.webviz_instance_info import WEBVIZ_INSTANCE_INFO
 
+from webviz_subsurface._utils.perf_telemetry import (
+    add_span_tags,
+    record_phases,
+    register_telemetry_route,
+    traced,
+)
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from ._surface_to_image import surface_to_png_bytes_optimized
+from ._surface_to_tiles import SurfaceTile, TilePyramidMeta, surface_to_tile_pyramid
 from .ensemble_surface_provider import (
     ObservedSurfaceAddress,
     SimulatedSurfaceAddress,
@@ -55,6 +62,8 @@ class SurfaceMeta:
     val_max: float
     deckgl_bounds: List[float]
     deckgl_rot_deg: float  # Around upper left corner
+    # Layout of the tile pyramid, if published with tiles
+    tile_pyramid: Optional[TilePyramidMeta] = None
 
 
 class SurfaceServer:
@@ -72,7 +81,20 @@ class SurfaceServer:
         )
         self._image_cache.init_app(app.server)
 
+        # Tiles are kept apart from the images and SurfaceMeta, and the cache is
+        # unbounded, such that the many tiles of a surface never evict those
+        self._tile_cache = flask_caching.Cache(
+            config={
+                "CACHE_TYPE": "FileSystemCache",
+                "CACHE_DIR": cache_dir / "tiles",
+                "CACHE_DEFAULT_TIMEOUT": 0,
+                "CACHE_THRESHOLD": 0,
+            }
+        )
+        self._tile_cache.init_app(app.server)
+
         self._setup_url_rule(app)
+        register_telemetry_route(app)
 
     @staticmethod
     def instance(app: Dash) -> "SurfaceServer":
@@ -84,11 +106,22 @@ class SurfaceServer:
 
         return _SURFACE_SERVER_INSTANCE
 
+    @traced(
+        "surface_server.publish_surface",
+        tags=lambda self, qualified_address, surface, tile_size=None: {
+            "num_cells": surface.ncol * surface.nrow,
+            "tile_size": tile_size,
+        },
+    )
     def publish_surface(
         self,
         qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
         surface: xtgeo.RegularSurface,
+        tile_size: Optional[int] = None,
     ) -> None:
+        """Publish the surface as one image. If `tile_size` is given, a pyramid of
+        tiles of tile_size x tile_size pixels is published as well, served on the
+        URL given by `encode_partial_tile_url()`."""
         timer = PerfTimer()
 
         if isinstance(qualified_address, QualifiedSurfaceAddress):
@@ -108,7 +141,7 @@ class SurfaceServer:
             f"[base_cache_key={base_cache_key}]"
         )
 
-        self._create_and_store_image_in_cache(base_cache_key, surface)
+        self._create_and_store_image_in_cache(base_cache_key, surface, tile_size)
 
         LOGGER.debug(f"Surface published in: {timer.elapsed_s():.2f}s")
 
@@ -160,8 +193,18 @@ class SurfaceServer:
         url_path: str = f"{_ROOT_URL_PATH}/{quote(address_str)}"
         return url_path
 
+    @staticmethod
+    def encode_partial_tile_url(
+        qualified_address: Union[QualifiedSurfaceAddress, QualifiedDiffSurfaceAddress],
+    ) -> str:
+        """URL template of the tiles of a surface, with {z}, {x} and {y}
+        placeholders for the level and the tile column and row"""
+        url_path = SurfaceServer.encode_partial_url(qualified_address)
+        return url_path + "/tiles/{z}/{x}/{y}"
+
     def _setup_url_rule(self, app: Dash) -> None:
         @app.server.route(_ROOT_URL_PATH + "/<full_surf_address_str>")
+        @traced("surface_server.request")
         def _handle_surface_request(full_surf_address_str: str) -> flask.Response:
             LOGGER.debug(
                 f"Handling surface_request: "
@@ -183,15 +226,37 @@ class SurfaceServer:
             response = flask.send_file(
                 io.BytesIO(cached_img_bytes), mimetype="image/png"
             )
+            add_span_tags(bytes=len(cached_img_bytes))
             LOGGER.debug(
                 f"Request handled from image cache in: {timer.elapsed_s():.2f}s"
             )
             return response
 
+        @app.server.route(
+            _ROOT_URL_PATH + "/<full_surf_address_str>/tiles/<int:z>/<int:x>/<int:y>"
+        )
+        @traced("surface_server.tile_request")
+        def _handle_tile_request(
+            full_surf_address_str: str, z: int, x: int, y: int
+        ) -> flask.Response:
+            tile_cache_key = _tile_cache_key(full_surf_address_str, z, x, y)
+            tile: Optional[SurfaceTile] = self._tile_cache.get(tile_cache_key)
+            if not tile:
+                # Tiles without any defined values are not stored
+                LOGGER.debug(f"No tile for key: {tile_cache_key}")
+                flask.abort(404)
+
+            response = flask.send_file(io.BytesIO(tile.png_bytes), mimetype="image/png")
+            response.headers["X-Value-Min"] = repr(tile.val_min)
+            response.headers["X-Value-Max"] = repr(tile.val_max)
+            add_span_tags(bytes=len(tile.png_bytes), zoom=z)
+            return response
+
     def _create_and_store_image_in_cache(
         self,
         base_cache_key: str,
         surface: xtgeo.RegularSurface,
+        tile_size: Optional[int] = None,
     ) -> None:
 
         timer = PerfTimer()
@@ -210,6 +275,19 @@ class SurfaceServer:
         # unrot_surf.unrotate()
         # unrot_surf.quickplot("/home/sigurdp/gitRoot/hk-webviz-subsurface/quickplot.png")
 
+        tile_pyramid: Optional[TilePyramidMeta] = None
+        if tile_size is not None:
+            tile_pyramid, tiles = surface_to_tile_pyramid(surface, tile_size)
+            for (zoom, x_idx, y_idx), tile in tiles.items():
+                self._tile_cache.add(
+                    _tile_cache_key(base_cache_key, zoom, x_idx, y_idx), tile
+                )
+            add_span_tags(
+                num_tiles=len(tiles),
+                tile_bytes=sum(len(tile.png_bytes) for tile in tiles.values()),
+            )
+        et_to_tiles_s = timer.lap_s()
+
         deckgl_bounds, deckgl_rot = _calc_map_component_bounds_and_rot(surface)
 
         meta = SurfaceMeta(
@@ -221,17 +299,30 @@ class SurfaceServer:
             val_max=surface.values.max(),
             deckgl_bounds=deckgl_bounds,
             deckgl_rot_deg=deckgl_rot,
+            tile_pyramid=tile_pyramid,
         )
         self._image_cache.add(meta_cache_key, meta)
         et_write_cache_s = timer.lap_s()
 
+        add_span_tags(bytes=len(png_bytes))
+        record_phases(
+            to_image=1000 * et_to_image_s,
+            to_tiles=1000 * et_to_tiles_s,
+            write_cache=1000 * et_write_cache_s,
+        )
+
         LOGGER.debug(
             f"Created image and wrote to cache in in: {timer.elapsed_s():.2f}s ("
-            f"to_image={et_to_image_s:.2f}s, write_cache={et_write_cache_s:.2f}s), "
+            f"to_image={et_to_image_s:.2f}s, to_tiles={et_to_tiles_s:.2f}s, "
+            f"write_cache={et_write_cache_s:.2f}s), "
             f"[base_cache_key={base_cache_key}]"
         )
 
 
+def _tile_cache_key(base_cache_key: str, zoom: int, x_idx: int, y_idx: int) -> str:
+    return f"TILE:{base_cache_key}/{zoom}/{x_idx}/{y_idx}"
+
+
 def _address_to_str(
     provider_id: str,
     address: SurfaceAddress,
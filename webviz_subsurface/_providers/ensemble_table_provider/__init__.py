@@ -1,3 +1,8 @@
-from .ensemble_table_provider import ColumnMetadata, EnsembleTableProvider
+from ._table_compaction import CompactStorageOptions
+from .ensemble_table_provider import (
+    ColumnFilter,
+    ColumnMetadata,
+    EnsembleTableProvider,
+)
 from .ensemble_table_provider_factory import EnsembleTableProviderFactory
 from .ensemble_table_provider_impl_arrow import EnsembleTableProviderImplArrow
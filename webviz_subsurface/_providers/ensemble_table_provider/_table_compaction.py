@@ -0,0 +1,95 @@
+import logging
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Since PyArrow's actual compute functions are not seen by pylint
+# pylint: disable=no-member
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Integer types tried, in order, when downcasting integer columns
+_INT_TYPES = [pa.int8(), pa.int16(), pa.int32()]
+
+
+@dataclass(frozen=True)
+class CompactStorageOptions:
+    """Options for the compact storage of table providers.
+
+    * Float64 columns are stored as float32 if the relative error of all values
+      is within `float_rel_tolerance`.
+    * Int64 columns are stored using the smallest integer type holding all values.
+    * String columns are dictionary encoded (and returned as pandas categoricals)
+      if the number of unique values is at most `max_dictionary_ratio` times
+      the number of rows.
+    """
+
+    float_rel_tolerance: float = 1e-6
+    max_dictionary_ratio: float = 0.5
+
+    def storage_key_suffix(self) -> str:
+        return f"__compact_f{self.float_rel_tolerance:g}_d{self.max_dictionary_ratio:g}"
+
+
+def compact_table(table: pa.Table, options: CompactStorageOptions) -> pa.Table:
+    """Returns a copy of the table with compacted column types.
+    The REAL column and the field metadata are kept as is."""
+    fields: List[pa.Field] = []
+    columns: List[pa.ChunkedArray] = []
+    for field, column in zip(table.schema, table.columns):
+        if field.name != "REAL":
+            column = _compact_column(column, options)
+        fields.append(pa.field(field.name, column.type, field.nullable, field.metadata))
+        columns.append(column)
+
+    return pa.Table.from_arrays(
+        columns, schema=pa.schema(fields, metadata=table.schema.metadata)
+    )
+
+
+def _compact_column(
+    column: pa.ChunkedArray, options: CompactStorageOptions
+) -> pa.ChunkedArray:
+    if pa.types.is_float64(column.type):
+        return _downcast_float(column, options.float_rel_tolerance)
+    if pa.types.is_int64(column.type):
+        return _downcast_int(column)
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        num_rows = len(column)
+        num_unique = len(pc.unique(column))
+        if num_rows > 0 and num_unique <= options.max_dictionary_ratio * num_rows:
+            return pc.dictionary_encode(column)
+    return column
+
+
+def _downcast_float(column: pa.ChunkedArray, rel_tolerance: float) -> pa.ChunkedArray:
+    values = column.to_numpy()
+    with np.errstate(over="ignore", invalid="ignore"):
+        values_f32 = values.astype(np.float32)
+        abs_error = np.abs(values_f32.astype(np.float64) - values)
+    # NaN and inf are exact in float32, while overflow to inf gives an infinite
+    # error and is therefore never accepted
+    finite = np.isfinite(values)
+    if np.all(
+        (abs_error[finite] <= rel_tolerance * np.abs(values[finite]))
+        & np.isfinite(values_f32[finite])
+    ):
+        return pc.cast(column, pa.float32(), safe=False)
+    return column
+
+
+def _downcast_int(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    if len(column) == column.null_count:
+        return column
+    min_max = pc.min_max(column)
+    min_val = min_max["min"].as_py()
+    max_val = min_max["max"].as_py()
+    for int_type in _INT_TYPES:
+        info = np.iinfo(int_type.to_pandas_dtype())
+        if info.min <= min_val and max_val <= info.max:
+            return pc.cast(column, int_type)
+    return column
@@ -1,6 +1,6 @@
 import abc
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import Any, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
@@ -10,6 +10,25 @@ class ColumnMetadata:
     unit: Optional[str]
 
 
+@dataclass(frozen=True)
+class ColumnFilter:
+    """Row filter on the values of a column, for use with get_column_data().
+
+    Rows are kept if the value of the column is one of `values` (if given),
+    and is within [`min_value`, `max_value`] (if given).
+    """
+
+    column_name: str
+    values: Optional[Tuple[Any, ...]] = None
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        # Keep the filter hashable when given a list of values
+        if self.values is not None:
+            object.__setattr__(self, "values", tuple(self.values))
+
+
 class EnsembleTableProvider(abc.ABC):
     @abc.abstractmethod
     def column_names(self) -> List[str]:
@@ -21,9 +40,15 @@ class EnsembleTableProvider(abc.ABC):
 
     @abc.abstractmethod
     def get_column_data(
-        self, column_names: Sequence[str], realizations: Optional[Sequence[int]] = None
+        self,
+        column_names: Sequence[str],
+        realizations: Optional[Sequence[int]] = None,
+        column_filters: Optional[Sequence[ColumnFilter]] = None,
     ) -> pd.DataFrame:
-        ...
+        """Returns the REAL column and the requested columns, for the rows matching
+        the realizations (if given) and all the column filters (if given).
+        The filtered columns do not have to be among the requested columns.
+        """
 
     @abc.abstractmethod
     def column_metadata(self, column_name: str) -> Optional[ColumnMetadata]:
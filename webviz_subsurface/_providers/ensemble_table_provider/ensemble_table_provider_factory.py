@@ -1,9 +1,10 @@
+import functools
 import hashlib
 import json
 import logging
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 import pandas as pd
 from webviz_config.webviz_factory import WebvizFactory
@@ -28,6 +29,8 @@ from ..ensemble_summary_provider._arrow_unsmry_import import (
     load_per_realization_arrow_unsmry_files,
 )
 from ..ensemble_summary_provider._csv_import import load_per_real_csv_file_using_fmu
+from ..provider_build_executor import ProviderBuildExecutor
+from ._table_compaction import CompactStorageOptions
 from .ensemble_table_provider import EnsembleTableProvider
 from .ensemble_table_provider_impl_arrow import EnsembleTableProviderImplArrow
 
@@ -66,17 +69,21 @@ class EnsembleTableProviderFactory(WebvizFactory):
     def create_from_ensemble_csv_file(
         self,
         csv_file: Path,
+        compact_storage: Optional[CompactStorageOptions] = None,
     ) -> EnsembleTableProvider:
         """Create EnsembleTableProvider from aggregated CSV file.
         The CSV file is assumed to contain data for a single ensemble and must contain
         a REAL column.
         If the CSV file contains an `ENSEMBLE` column it will be ignored, but an exception
         will be thrown if it is present and it contains multiple ensemble names.
+        If `compact_storage` is given, the data is stored with compacted column types,
+        see CompactStorageOptions.
         """
 
         timer = PerfTimer()
 
         storage_key = f"ens_csv__{_make_hash_string(str(csv_file))}"
+        storage_key += _compact_storage_key_suffix(compact_storage)
 
         provider = EnsembleTableProviderImplArrow.from_backing_store(
             self._storage_dir, storage_key
@@ -92,54 +99,70 @@ class EnsembleTableProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load table provider (CSV) for {csv_file}")
 
-        LOGGER.info(f"Importing/saving CSV data for: {csv_file}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir,
+            storage_key,
+            EnsembleTableProviderImplArrow.from_backing_store,
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
-        ensemble_df = pd.read_csv(csv_file)
+            LOGGER.info(f"Importing/saving CSV data for: {csv_file}")
 
-        if "ENSEMBLE" in ensemble_df.columns:
-            if ensemble_df["ENSEMBLE"].nunique() > 1:
-                raise KeyError("Input data contains more than one unique ensemble name")
+            timer.lap_s()
+            ensemble_df = pd.read_csv(csv_file)
 
-        et_import_csv_s = timer.lap_s()
+            if "ENSEMBLE" in ensemble_df.columns:
+                if ensemble_df["ENSEMBLE"].nunique() > 1:
+                    raise KeyError(
+                        "Input data contains more than one unique ensemble name"
+                    )
 
-        if ensemble_df.empty:
-            raise ValueError("Import resulted in empty DataFrame")
-        if "REAL" not in ensemble_df.columns:
-            raise ValueError("No REAL column present in input data")
+            et_import_csv_s = timer.lap_s()
 
-        EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
-            self._storage_dir, storage_key, ensemble_df
-        )
-        et_write_s = timer.lap_s()
+            if ensemble_df.empty:
+                raise ValueError("Import resulted in empty DataFrame")
+            if "REAL" not in ensemble_df.columns:
+                raise ValueError("No REAL column present in input data")
 
-        provider = EnsembleTableProviderImplArrow.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create provider for {csv_file}")
+            EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
+                self._storage_dir, storage_key, ensemble_df, compact_storage
+            )
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved table provider (CSV) to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_csv={et_import_csv_s:.2f}s, "
-            f"write={et_write_s:.2f}s, "
-            f"csv_file={csv_file})"
-        )
+            provider = EnsembleTableProviderImplArrow.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create provider for {csv_file}")
+
+            LOGGER.info(
+                f"Saved table provider (CSV) to backing store in {timer.elapsed_s():.2f}s ("
+                f"import_csv={et_import_csv_s:.2f}s, "
+                f"write={et_write_s:.2f}s, "
+                f"csv_file={csv_file})"
+            )
 
-        return provider
+            return provider
 
     def create_from_per_realization_csv_file(
-        self, ens_path: str, csv_file_rel_path: str
+        self,
+        ens_path: str,
+        csv_file_rel_path: str,
+        compact_storage: Optional[CompactStorageOptions] = None,
     ) -> EnsembleTableProvider:
         """Create EnsembleTableProvider from per realization CSV files.
 
         Note that the returned table provider will not be able to return vector
         metadata.
+        If `compact_storage` is given, the data is stored with compacted column types,
+        see CompactStorageOptions.
         """
 
         timer = PerfTimer()
 
         storage_key = f"per_real_csv__{_make_hash_string(ens_path + csv_file_rel_path)}"
+        storage_key += _compact_storage_key_suffix(compact_storage)
         provider = EnsembleTableProviderImplArrow.from_backing_store(
             self._storage_dir, storage_key
         )
@@ -158,43 +181,57 @@ class EnsembleTableProviderFactory(WebvizFactory):
                 f"Failed to load table provider (per real CSV) for {ens_path}"
             )
 
-        LOGGER.info(f"Importing/saving per real CSV data for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir,
+            storage_key,
+            EnsembleTableProviderImplArrow.from_backing_store,
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
+            LOGGER.info(f"Importing/saving per real CSV data for: {ens_path}")
 
-        ensemble_df = load_per_real_csv_file_using_fmu(ens_path, csv_file_rel_path)
-        et_import_csv_s = timer.lap_s()
+            timer.lap_s()
 
-        EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
-            self._storage_dir, storage_key, ensemble_df
-        )
-        et_write_s = timer.lap_s()
+            ensemble_df = load_per_real_csv_file_using_fmu(ens_path, csv_file_rel_path)
+            et_import_csv_s = timer.lap_s()
 
-        provider = EnsembleTableProviderImplArrow.from_backing_store(
-            self._storage_dir, storage_key
-        )
+            EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
+                self._storage_dir, storage_key, ensemble_df, compact_storage
+            )
+            et_write_s = timer.lap_s()
 
-        if not provider:
-            raise ValueError(
-                f"Failed to load/create provider (per real CSV) for {ens_path}"
+            provider = EnsembleTableProviderImplArrow.from_backing_store(
+                self._storage_dir, storage_key
             )
 
-        LOGGER.info(
-            f"Saved table provider (per real CSV) to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_csv={et_import_csv_s:.2f}s, write={et_write_s:.2f}s, "
-            f"ens_path={ens_path}, csv_file_rel_path={csv_file_rel_path})"
-        )
+            if not provider:
+                raise ValueError(
+                    f"Failed to load/create provider (per real CSV) for {ens_path}"
+                )
+
+            LOGGER.info(
+                f"Saved table provider (per real CSV) to backing store in "
+                f"{timer.elapsed_s():.2f}s ("
+                f"import_csv={et_import_csv_s:.2f}s, write={et_write_s:.2f}s, "
+                f"ens_path={ens_path}, csv_file_rel_path={csv_file_rel_path})"
+            )
 
-        return provider
+            return provider
 
     def create_from_per_realization_arrow_file(
-        self, ens_path: str, rel_file_pattern: str
+        self,
+        ens_path: str,
+        rel_file_pattern: str,
+        compact_storage: Optional[CompactStorageOptions] = None,
     ) -> EnsembleTableProvider:
         """Create EnsembleTableProvider from per realization data in .arrow format.
 
         The `rel_file_pattern` parameter must specify a relative (per realization) file pattern
         that will be used to find the wanted .arrow files within each realization. The file
         pattern is realtive to each realizations's `runpath`.
+        If `compact_storage` is given, the data is stored with compacted column types,
+        see CompactStorageOptions.
         """
 
         timer = PerfTimer()
@@ -202,6 +239,7 @@ class EnsembleTableProviderFactory(WebvizFactory):
         storage_key = (
             f"per_real_arrow__{_make_hash_string(ens_path + rel_file_pattern)}"
         )
+        storage_key += _compact_storage_key_suffix(compact_storage)
         provider = EnsembleTableProviderImplArrow.from_backing_store(
             self._storage_dir, storage_key
         )
@@ -216,44 +254,59 @@ class EnsembleTableProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load table provider for {ens_path}")
 
-        LOGGER.info(f"Importing/saving arrow table data for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir,
+            storage_key,
+            EnsembleTableProviderImplArrow.from_backing_store,
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
-        per_real_tables = load_per_realization_arrow_unsmry_files(
-            ens_path, rel_file_pattern
-        )
-        if not per_real_tables:
-            raise ValueError(f"Could not find any .arrow files for ens_path={ens_path}")
-        et_import_smry_s = timer.lap_s()
+            LOGGER.info(f"Importing/saving arrow table data for: {ens_path}")
 
-        try:
-            EnsembleTableProviderImplArrow.write_backing_store_from_per_realization_tables(
-                self._storage_dir, storage_key, per_real_tables
+            timer.lap_s()
+            per_real_tables = load_per_realization_arrow_unsmry_files(
+                ens_path, rel_file_pattern
             )
-        except ValueError as exc:
-            raise ValueError(f"Failed to write backing store for: {ens_path}") from exc
+            if not per_real_tables:
+                raise ValueError(
+                    f"Could not find any .arrow files for ens_path={ens_path}"
+                )
+            et_import_smry_s = timer.lap_s()
 
-        et_write_s = timer.lap_s()
+            try:
+                EnsembleTableProviderImplArrow.write_backing_store_from_per_realization_tables(
+                    self._storage_dir, storage_key, per_real_tables, compact_storage
+                )
+            except ValueError as exc:
+                raise ValueError(
+                    f"Failed to write backing store for: {ens_path}"
+                ) from exc
 
-        provider = EnsembleTableProviderImplArrow.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/create table provider for {ens_path}")
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved table provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"import_smry={et_import_smry_s:.2f}s, write={et_write_s:.2f}s, ens_path={ens_path})"
-        )
+            provider = EnsembleTableProviderImplArrow.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/create table provider for {ens_path}")
 
-        return provider
+            LOGGER.info(
+                f"Saved table provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"import_smry={et_import_smry_s:.2f}s, write={et_write_s:.2f}s, "
+                f"ens_path={ens_path})"
+            )
+
+            return provider
 
     def create_from_per_realization_parameter_file(
-        self, ens_path: str
+        self, ens_path: str, compact_storage: Optional[CompactStorageOptions] = None
     ) -> EnsembleTableProvider:
         """Create EnsembleTableProvider from parameter files.
 
         Note that the returned table provider will not be able to return metadata.
+        If `compact_storage` is given, the data is stored with compacted column types,
+        see CompactStorageOptions.
         """
 
         LOGGER.info("create_provider_from_per_realization_parameter_file() ...")
@@ -261,6 +314,7 @@ class EnsembleTableProviderFactory(WebvizFactory):
         timer = PerfTimer()
 
         storage_key = f"parameters_{_make_hash_string(ens_path + '_parameters')}"
+        storage_key += _compact_storage_key_suffix(compact_storage)
 
         provider = EnsembleTableProviderImplArrow.from_backing_store(
             self._storage_dir, storage_key
@@ -277,89 +331,103 @@ class EnsembleTableProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load table provider for {ens_path}")
 
-        LOGGER.info(f"Importing parameters for: {ens_path}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir,
+            storage_key,
+            EnsembleTableProviderImplArrow.from_backing_store,
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
+            LOGGER.info(f"Importing parameters for: {ens_path}")
 
-        scratch_ensemble = ScratchEnsemble("ens_name_tmp", ens_path).filter("OK")
-        ensemble_df = scratch_ensemble.parameters
-        del scratch_ensemble
-        elapsed_load_parameters_s = timer.lap_s()
+            timer.lap_s()
 
-        try:
-            EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
-                self._storage_dir, storage_key, ensemble_df
-            )
-        except ValueError as exc:
-            raise ValueError(f"Failed to write backing store for: {ens_path}") from exc
+            scratch_ensemble = ScratchEnsemble("ens_name_tmp", ens_path).filter("OK")
+            ensemble_df = scratch_ensemble.parameters
+            del scratch_ensemble
+            elapsed_load_parameters_s = timer.lap_s()
 
-        et_write_s = timer.lap_s()
+            try:
+                EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
+                    self._storage_dir, storage_key, ensemble_df, compact_storage
+                )
+            except ValueError as exc:
+                raise ValueError(
+                    f"Failed to write backing store for: {ens_path}"
+                ) from exc
 
-        provider = EnsembleTableProviderImplArrow.from_backing_store(
-            self._storage_dir, storage_key
-        )
-        if not provider:
-            raise ValueError(f"Failed to load/crate table provider for {ens_path}")
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved table provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"load_parameters={elapsed_load_parameters_s:.2f}s, "
-            f"write={et_write_s:.2f}s, ens_path={ens_path})"
-        )
+            provider = EnsembleTableProviderImplArrow.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(f"Failed to load/crate table provider for {ens_path}")
 
-        return provider
+            LOGGER.info(
+                f"Saved table provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"load_parameters={elapsed_load_parameters_s:.2f}s, "
+                f"write={et_write_s:.2f}s, ens_path={ens_path})"
+            )
+
+            return provider
 
     def create_provider_set_from_aggregated_csv_file(
         self,
         aggr_csv_file: Path,
+        compact_storage: Optional[CompactStorageOptions] = None,
     ) -> Dict[str, EnsembleTableProvider]:
         """Creates a dictionary of table providers from an aggregated CSV file with
         ENSEMBLE column. The CSV file can have multiple ensembles in the ENSEMBLE column.
         (This is not accepted by the create_from_ensemble_csv_file function)
 
         Aggregated csv-files per ensemble is the preferred method.
+        If `compact_storage` is given, the data is stored with compacted column types,
+        see CompactStorageOptions.
         """
         LOGGER.info(f"create_provider_set_from_aggregated_csv_file() - {aggr_csv_file}")
 
         hashval = _make_hash_string(str(aggr_csv_file))
         main_storage_key = f"aggr_csv__{hashval}"
+        main_storage_key += _compact_storage_key_suffix(compact_storage)
+
+        executor = ProviderBuildExecutor.instance()
 
-        storage_keys_to_load: Dict[str, str] = {}
         json_fn = self._storage_dir / (f"{main_storage_key}.json")
-        try:
-            with open(json_fn, "r") as file:
-                storage_keys_to_load = json.load(file)
-        except FileNotFoundError:
+        storage_keys_to_load = _read_storage_keys(json_fn)
+        if storage_keys_to_load is None:
             # We can only recover from this if we're allowed to write to storage
             if not self._allow_storage_writes:
-                raise
-
-        if not storage_keys_to_load and self._allow_storage_writes:
-            aggregated_df = pd.read_csv(aggr_csv_file)
-            ensemble_names = aggregated_df["ENSEMBLE"].unique()
-
-            LOGGER.info(
-                f"Saving {len(ensemble_names)} table providers from aggregated CSV to backing store"
-            )
-
-            for ens_name in ensemble_names:
-                storage_key = f"{main_storage_key}__{ens_name}"
-                ensemble_df = aggregated_df[aggregated_df["ENSEMBLE"] == ens_name]
-                EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe(
-                    self._storage_dir, storage_key, ensemble_df
+                raise FileNotFoundError(f"Backing store not found: {json_fn}")
+
+            with executor.import_slot(
+                self._storage_dir,
+                main_storage_key,
+                lambda _storage_dir, _storage_key: _read_storage_keys(json_fn),
+            ) as storage_keys_to_load:
+                if storage_keys_to_load is None:
+                    storage_keys_to_load = self._write_aggregated_csv_backing_stores(
+                        aggr_csv_file, main_storage_key, compact_storage
+                    )
+                    with open(json_fn, "w") as file:
+                        json.dump(storage_keys_to_load, file)
+
+        loaded_providers = executor.build_all(
+            {
+                ens_name: functools.partial(
+                    EnsembleTableProviderImplArrow.from_backing_store,
+                    self._storage_dir,
+                    storage_key,
                 )
-                storage_keys_to_load[ens_name] = storage_key
-
-            with open(json_fn, "w") as file:
-                json.dump(storage_keys_to_load, file)
-
-        created_providers: Dict[str, EnsembleTableProvider] = {}
-        for ens_name, storage_key in storage_keys_to_load.items():
-            provider = EnsembleTableProviderImplArrow.from_backing_store(
-                self._storage_dir, storage_key
-            )
-            if provider:
-                created_providers[ens_name] = provider
+                for ens_name, storage_key in storage_keys_to_load.items()
+            }
+        )
+        created_providers: Dict[str, EnsembleTableProvider] = {
+            ens_name: provider
+            for ens_name, provider in loaded_providers.items()
+            if provider
+        }
 
         num_missing_models = len(storage_keys_to_load) - len(created_providers)
         if num_missing_models > 0:
@@ -369,6 +437,53 @@ class EnsembleTableProviderFactory(WebvizFactory):
 
         return created_providers
 
+    def _write_aggregated_csv_backing_stores(
+        self,
+        aggr_csv_file: Path,
+        main_storage_key: str,
+        compact_storage: Optional[CompactStorageOptions],
+    ) -> Dict[str, str]:
+        """Write one backing store per ensemble in the aggregated CSV file,
+        concurrently, and return the storage key per ensemble name"""
+        aggregated_df = pd.read_csv(aggr_csv_file)
+        ensemble_names = aggregated_df["ENSEMBLE"].unique()
+
+        LOGGER.info(
+            f"Saving {len(ensemble_names)} table providers from aggregated CSV to backing store"
+        )
+
+        storage_keys = {
+            ens_name: f"{main_storage_key}__{ens_name}" for ens_name in ensemble_names
+        }
+        ProviderBuildExecutor.instance().build_all(
+            {
+                ens_name: functools.partial(
+                    EnsembleTableProviderImplArrow.write_backing_store_from_ensemble_dataframe,
+                    self._storage_dir,
+                    storage_key,
+                    aggregated_df[aggregated_df["ENSEMBLE"] == ens_name],
+                    compact_storage,
+                )
+                for ens_name, storage_key in storage_keys.items()
+            }
+        )
+        return storage_keys
+
+
+def _read_storage_keys(json_fn: Path) -> Optional[Dict[str, str]]:
+    try:
+        with open(json_fn, "r") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def _compact_storage_key_suffix(
+    compact_storage: Optional[CompactStorageOptions],
+) -> str:
+    # Compact data is stored separately from the full precision data
+    return compact_storage.storage_key_suffix() if compact_storage else ""
+
 
 def _make_hash_string(string_to_hash: str) -> str:
     # There is no security risk here and chances of collision should be very slim
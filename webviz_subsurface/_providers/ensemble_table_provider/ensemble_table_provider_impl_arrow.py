@@ -1,20 +1,26 @@
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
 import pyarrow.compute as pc
 
+from ..._utils.perf_telemetry import add_span_tags, record_phases, traced
 from ..._utils.perf_timer import PerfTimer
 from ..ensemble_summary_provider._table_utils import (
     add_per_vector_min_max_to_table_schema_metadata,
     find_min_max_for_numeric_table_columns,
 )
 from ._field_metadata import create_column_metadata_from_field_meta
-from .ensemble_table_provider import ColumnMetadata, EnsembleTableProvider
+from ._table_compaction import CompactStorageOptions, compact_table
+from .ensemble_table_provider import (
+    ColumnFilter,
+    ColumnMetadata,
+    EnsembleTableProvider,
+)
 
 # Since PyArrow's actual compute functions are not seen by pylint
 # pylint: disable=no-member
@@ -29,6 +35,51 @@ def _sort_table_on_real(table: pa.Table) -> pa.Table:
     return sorted_table
 
 
+def _contiguous_realization_slices(table: pa.Table) -> Optional[List[Tuple[int, int]]]:
+    """Returns the (offset, length) of the rows of each realization, or None if
+    the rows of the realizations are not contiguous"""
+    if "REAL" not in table.schema.names or table.num_rows == 0:
+        return None
+    if table["REAL"].null_count > 0:
+        return None
+    reals = table["REAL"].to_numpy()
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(reals)) + 1))
+    if len(starts) != len(np.unique(reals)):
+        return None
+    lengths = np.diff(np.append(starts, len(reals)))
+    return list(zip(starts.tolist(), lengths.tolist()))
+
+
+def _write_table(arrow_file_name: Path, table: pa.Table) -> None:
+    """Write the table to an arrow file, with separate record batches for each
+    realization if possible, such that reads can skip unwanted realizations"""
+    slices = _contiguous_realization_slices(table)
+    with pa.OSFile(str(arrow_file_name), "wb") as sink:
+        with pa.RecordBatchFileWriter(sink, table.schema) as writer:
+            if slices is None:
+                writer.write_table(table)
+            else:
+                for offset, length in slices:
+                    writer.write_table(table.slice(offset, length))
+
+
+def _column_filter_mask(column: pa.Array, column_filter: ColumnFilter) -> pa.Array:
+    mask = pa.array(np.ones(len(column), dtype=bool))
+    if column_filter.values is not None:
+        value_type = (
+            column.type.value_type
+            if pa.types.is_dictionary(column.type)
+            else column.type
+        )
+        value_set = pa.array(column_filter.values, type=value_type)
+        mask = pc.and_(mask, pc.is_in(column, value_set=value_set))
+    if column_filter.min_value is not None:
+        mask = pc.and_(mask, pc.greater_equal(column, column_filter.min_value))
+    if column_filter.max_value is not None:
+        mask = pc.and_(mask, pc.less_equal(column, column_filter.max_value))
+    return mask
+
+
 class EnsembleTableProviderImplArrow(EnsembleTableProvider):
     """This class implements a EnsembleTableProvider"""
 
@@ -54,10 +105,16 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
         ]
         et_find_col_names_ms = timer.lap_ms()
 
-        unique_realizations_on_file = (
-            self._cached_reader.read_all().column("REAL").unique()
-        )
-        self._realizations: List[int] = unique_realizations_on_file.to_pylist()
+        # The realizations in each record batch, used for skipping batches on read
+        self._batch_realizations: List[Set[int]] = []
+        unique_realizations: Dict[int, None] = {}
+        for batch_idx in range(self._cached_reader.num_record_batches):
+            batch_reals = pc.unique(
+                self._cached_reader.get_batch(batch_idx).column("REAL")
+            ).to_pylist()
+            self._batch_realizations.append(set(batch_reals))
+            unique_realizations.update(dict.fromkeys(batch_reals))
+        self._realizations: List[int] = list(unique_realizations)
         et_find_real_ms = timer.lap_ms()
 
         LOGGER.debug(
@@ -65,12 +122,16 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
             f"(open={et_open_ms}ms, create_reader={et_create_reader_ms}ms, "
             f"find_col_names={et_find_col_names_ms}ms, find_real={et_find_real_ms}ms), "
             f"#column_names={len(self._column_names)}, "
-            f"#realization={len(self._realizations)}"
+            f"#realization={len(self._realizations)}, "
+            f"#record_batches={len(self._batch_realizations)}"
         )
 
     @staticmethod
     def write_backing_store_from_per_realization_tables(
-        storage_dir: Path, storage_key: str, per_real_tables: Dict[int, pa.Table]
+        storage_dir: Path,
+        storage_key: str,
+        per_real_tables: Dict[int, pa.Table],
+        compact_storage: Optional[CompactStorageOptions] = None,
     ) -> None:
         # pylint: disable=too-many-locals
         @dataclass
@@ -79,6 +140,7 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
             build_add_real_col_s: float = -1
             sorting_s: float = -1
             find_and_store_min_max_s: float = -1
+            compact_s: float = -1
             write_s: float = -1
 
         elapsed = Elapsed()
@@ -125,10 +187,11 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
         )
         elapsed.find_and_store_min_max_s = timer.lap_s()
 
-        # feather.write_feather(full_table, dest=arrow_file_name)
-        with pa.OSFile(str(arrow_file_name), "wb") as sink:
-            with pa.RecordBatchFileWriter(sink, full_table.schema) as writer:
-                writer.write_table(full_table)
+        if compact_storage:
+            full_table = compact_table(full_table, compact_storage)
+        elapsed.compact_s = timer.lap_s()
+
+        _write_table(arrow_file_name, full_table)
         elapsed.write_s = timer.lap_s()
 
         LOGGER.debug(
@@ -137,12 +200,16 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
             f"build_add_real_col={elapsed.build_add_real_col_s:.2f}s, "
             f"sorting={elapsed.sorting_s:.2f}s, "
             f"find_and_store_min_max={elapsed.find_and_store_min_max_s:.2f}s, "
+            f"compact={elapsed.compact_s:.2f}s, "
             f"write={elapsed.write_s:.2f}s)"
         )
 
     @staticmethod
     def write_backing_store_from_ensemble_dataframe(
-        storage_dir: Path, storage_key: str, ensemble_df: pd.DataFrame
+        storage_dir: Path,
+        storage_key: str,
+        ensemble_df: pd.DataFrame,
+        compact_storage: Optional[CompactStorageOptions] = None,
     ) -> None:
 
         table = pa.Table.from_pandas(ensemble_df, preserve_index=False)
@@ -154,11 +221,13 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
                 raise KeyError("Input data contains more than one unique ensemble name")
             table = table.drop(["ENSEMBLE"])
 
+        # Downcast numeric columns and dictionary encode string columns
+        if compact_storage:
+            table = compact_table(table, compact_storage)
+
         # Write to arrow format
         arrow_file_name: Path = storage_dir / (storage_key + ".arrow")
-        with pa.OSFile(str(arrow_file_name), "wb") as sink:
-            with pa.RecordBatchFileWriter(sink, table.schema) as writer:
-                writer.write_table(table)
+        _write_table(arrow_file_name, table)
 
     @staticmethod
     def from_backing_store(
@@ -184,9 +253,14 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
     def realizations(self) -> List[int]:
         return self._realizations
 
+    @traced("table.get_column_data")
     def get_column_data(
-        self, column_names: Sequence[str], realizations: Optional[Sequence[int]] = None
+        self,
+        column_names: Sequence[str],
+        realizations: Optional[Sequence[int]] = None,
+        column_filters: Optional[Sequence[ColumnFilter]] = None,
     ) -> pd.DataFrame:
+        # pylint: disable=too-many-locals
 
         timer = PerfTimer()
 
@@ -203,22 +277,67 @@ class EnsembleTableProviderImplArrow(EnsembleTableProvider):
             ["REAL", *column_names] if "REAL" not in column_names else column_names
         )
 
-        table = self._cached_reader.read_all().select(columns_to_get)
-        et_read_ms = timer.lap_ms()
+        column_filters = column_filters or []
+        columns_to_read = list(
+            dict.fromkeys(
+                [*columns_to_get, *(filt.column_name for filt in column_filters)]
+            )
+        )
+        schema = self._cached_reader.schema
+        missing_columns = [name for name in columns_to_read if name not in schema.names]
+        if missing_columns:
+            raise KeyError(f"Columns not found in table: {missing_columns}")
+
+        # The filters are evaluated per record batch, and batches without any of
+        # the wanted realizations are skipped, such that only the matching rows
+        # of the requested columns are materialized
+        wanted_reals = set(realizations) if realizations else None
+        batches: List[pa.RecordBatch] = []
+        for batch_idx, batch_reals in enumerate(self._batch_realizations):
+            if wanted_reals is not None and wanted_reals.isdisjoint(batch_reals):
+                continue
+
+            batch = self._cached_reader.get_batch(batch_idx).select(columns_to_read)
+            masks = [
+                _column_filter_mask(batch.column(filt.column_name), filt)
+                for filt in column_filters
+            ]
+            if wanted_reals is not None and not batch_reals.issubset(wanted_reals):
+                masks.append(
+                    pc.is_in(batch.column("REAL"), value_set=pa.array(realizations))
+                )
+            if masks:
+                mask = masks[0]
+                for other_mask in masks[1:]:
+                    mask = pc.and_(mask, other_mask)
+                batch = batch.filter(mask)
+
+            batches.append(batch.select(columns_to_get))
+        et_read_and_filter_ms = timer.lap_ms()
 
-        if realizations:
-            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(mask)
-        et_filter_ms = timer.lap_ms()
+        table = pa.Table.from_batches(
+            batches, schema=pa.schema([schema.field(name) for name in columns_to_get])
+        )
 
         df = table.to_pandas(ignore_metadata=True)
         et_to_pandas_ms = timer.lap_ms()
 
+        record_phases(read_and_filter=et_read_and_filter_ms, to_pandas=et_to_pandas_ms)
+        add_span_tags(
+            provider=Path(self._arrow_file_name).name,
+            num_columns=len(column_names),
+            num_realizations=len(realizations) if realizations else "all",
+            num_column_filters=len(column_filters),
+            num_record_batches=len(batches),
+            bytes=int(df.memory_usage(index=False).sum()),
+        )
+
         LOGGER.debug(
             f"get_column_data() took: {timer.elapsed_ms()}ms "
-            f"(read={et_read_ms}ms, filter={et_filter_ms}ms, to_pandas={et_to_pandas_ms}ms), "
+            f"(read_and_filter={et_read_and_filter_ms}ms, to_pandas={et_to_pandas_ms}ms), "
             f"#cols={len(column_names)}, "
             f"#real={len(realizations) if realizations else 'all'}, "
+            f"#filters={len(column_filters)}, "
             f"df.shape={df.shape}, file={Path(self._arrow_file_name).name}"
         )
 
@@ -0,0 +1,133 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+# File locking is used to coordinate between processes (e.g. multiple app
+# workers) sharing the same storage folder. fcntl is not available on Windows,
+# where we only coordinate between threads within the process.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENT_IMPORTS = min(4, os.cpu_count() or 1)
+
+
+class ProviderBuildExecutor:
+    """Shared service for building providers concurrently.
+
+    `build_all()` runs a set of provider build functions (typically one per
+    ensemble) concurrently in a thread pool. Factories wrap the expensive part
+    of creating a provider, i.e. importing data and writing the backing store,
+    in `import_slot()`, which limits the number of concurrent imports across
+    all factories and holds a lock per storage key. The lock is a file lock
+    in the storage folder, so that two app workers will never import the same
+    backing store twice. Since another worker may have written the backing
+    store while waiting for the lock, `import_slot()` loads the backing store
+    again after acquiring the lock, and callers only import if that fails.
+
+    The executor is shared by all provider factories in the process, and does
+    not depend on the factory registry so that it can also be used when
+    factories are created directly (e.g. in dev scripts and tests).
+    """
+
+    _instance: Optional["ProviderBuildExecutor"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(
+        self, max_concurrent_imports: int = DEFAULT_MAX_CONCURRENT_IMPORTS
+    ) -> None:
+        if max_concurrent_imports < 1:
+            raise ValueError("max_concurrent_imports must be at least 1")
+
+        self._max_workers = max_concurrent_imports
+        self._import_semaphore = threading.BoundedSemaphore(max_concurrent_imports)
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+
+    @staticmethod
+    def instance() -> "ProviderBuildExecutor":
+        """Static method to access the singleton instance of the executor."""
+
+        with ProviderBuildExecutor._instance_lock:
+            if ProviderBuildExecutor._instance is None:
+                ProviderBuildExecutor._instance = ProviderBuildExecutor()
+            return ProviderBuildExecutor._instance
+
+    @property
+    def max_concurrent_imports(self) -> int:
+        return self._max_workers
+
+    def build_all(self, build_funcs: Dict[str, Callable[[], T]]) -> Dict[str, T]:
+        """Run the build functions concurrently, and return the results with the
+        same keys and in the same order as the input. If any of the functions
+        raises, the first exception (in input order) is re-raised after all
+        functions have completed.
+        """
+        if len(build_funcs) <= 1:
+            return {name: func() for name, func in build_funcs.items()}
+
+        max_workers = min(self._max_workers, len(build_funcs))
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="provider_build"
+        ) as executor:
+            futures = {
+                name: executor.submit(func) for name, func in build_funcs.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    @contextmanager
+    def import_slot(
+        self,
+        storage_dir: Path,
+        storage_key: str,
+        from_backing_store: Optional[Callable[[Path, str], Optional[T]]] = None,
+    ) -> Iterator[Optional[T]]:
+        """Context manager to be held while importing data and writing the
+        backing store for `storage_key`.
+
+        The per key lock is acquired before the global import slot, so that
+        threads waiting for a key being imported by someone else do not occupy
+        any of the import slots.
+
+        If `from_backing_store` is given, it is called with the storage folder
+        and key once the lock is acquired, and its result is returned by the
+        context manager. A backing store written by another worker while
+        waiting for the lock is then returned, instead of being imported again.
+        """
+        lock_file = Path(storage_dir) / f"{storage_key}.lock"
+        with self._key_lock(lock_file), _file_lock(lock_file):
+            existing = (
+                from_backing_store(storage_dir, storage_key)
+                if from_backing_store is not None
+                else None
+            )
+            if existing is not None:
+                yield existing
+                return
+            with self._import_semaphore:
+                yield None
+
+    def _key_lock(self, lock_file: Path) -> threading.Lock:
+        with self._key_locks_guard:
+            return self._key_locks.setdefault(str(lock_file), threading.Lock())
+
+
+@contextmanager
+def _file_lock(lock_file: Path) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+
+    lock_fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        os.close(lock_fd)
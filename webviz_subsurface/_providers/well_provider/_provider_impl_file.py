@@ -3,8 +3,16 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
+import pyarrow as pa
 import xtgeo
+from pyarrow import feather
 
+from webviz_subsurface._utils.perf_telemetry import (
+    add_span_tags,
+    provider_tags,
+    traced,
+)
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 from .well_provider import WellPath, WellProvider
@@ -14,15 +22,27 @@ LOGGER = logging.getLogger(__name__)
 
 INV_KEY_REL_PATH = "rel_path"
 INV_KEY_MD_LOGNAME = "md_logname"
+INV_KEY_PATH_OFFSET = "path_offset"
+INV_KEY_PATH_LENGTH = "path_length"
+
+# The well paths of all wells, concatenated, with the offset and length of each
+# well given in the inventory
+WELL_PATHS_FILE_NAME = "well_paths.arrow"
+_PATH_COLUMNS = ["X_UTME", "Y_UTMN", "Z_TVDSS", "MD"]
 
 
 class ProviderImplFile(WellProvider):
     def __init__(
-        self, provider_id: str, provider_dir: Path, inventory: Dict[str, dict]
+        self,
+        provider_id: str,
+        provider_dir: Path,
+        inventory: Dict[str, dict],
+        path_arrays: Optional[Dict[str, np.ndarray]] = None,
     ) -> None:
         self._provider_id = provider_id
         self._provider_dir = provider_dir
         self._inventory = inventory
+        self._path_arrays = path_arrays
 
     @staticmethod
     def write_backing_store(
@@ -41,6 +61,8 @@ class ProviderImplFile(WellProvider):
         provider_dir.mkdir(parents=True, exist_ok=True)
 
         inventory_dict: Dict[str, dict] = {}
+        path_tables: List[pa.Table] = []
+        path_offset = 0
 
         LOGGER.debug(f"Writing {len(well_file_names)} wells into backing store...")
 
@@ -66,20 +88,47 @@ class ProviderImplFile(WellProvider):
             well.to_file(wfile=dst_file, fformat="rmswell")
             # well.to_hdf(wfile=dst_file)
 
+            df = well.dataframe
+            path_tables.append(
+                pa.table(
+                    {
+                        "X_UTME": df["X_UTME"].to_numpy(dtype=np.float64),
+                        "Y_UTMN": df["Y_UTMN"].to_numpy(dtype=np.float64),
+                        "Z_TVDSS": df["Z_TVDSS"].to_numpy(dtype=np.float64),
+                        "MD": df[well.mdlogname].to_numpy(dtype=np.float64),
+                    }
+                )
+            )
+
             inventory_dict[well_name] = {
                 INV_KEY_REL_PATH: rel_path,
                 INV_KEY_MD_LOGNAME: well.mdlogname,
+                INV_KEY_PATH_OFFSET: path_offset,
+                INV_KEY_PATH_LENGTH: len(df),
             }
+            path_offset += len(df)
 
         et_copy_s = timer.lap_s()
 
+        path_table = (
+            pa.concat_tables(path_tables).combine_chunks()
+            if path_tables
+            else pa.table({col: pa.array([], pa.float64()) for col in _PATH_COLUMNS})
+        )
+        feather.write_feather(
+            path_table,
+            dest=provider_dir / WELL_PATHS_FILE_NAME,
+            compression="uncompressed",
+        )
+        et_write_paths_s = timer.lap_s()
+
         json_fn = provider_dir / "inventory.json"
         with open(json_fn, "w") as file:
             json.dump(inventory_dict, file)
 
         LOGGER.debug(
             f"Wrote well backing store in: {timer.elapsed_s():.2f}s ("
-            f"copy={et_copy_s:.2f}s)"
+            f"copy={et_copy_s:.2f}s, write_paths={et_write_paths_s:.2f}s)"
         )
 
     @staticmethod
@@ -97,7 +146,12 @@ class ProviderImplFile(WellProvider):
         except FileNotFoundError:
             return None
 
-        return ProviderImplFile(storage_key, provider_dir, inventory)
+        return ProviderImplFile(
+            storage_key,
+            provider_dir,
+            inventory,
+            _read_path_arrays(provider_dir / WELL_PATHS_FILE_NAME),
+        )
 
     def provider_id(self) -> str:
         return self._provider_id
@@ -105,7 +159,17 @@ class ProviderImplFile(WellProvider):
     def well_names(self) -> List[str]:
         return sorted(list(self._inventory.keys()))
 
+    @traced("well.get_well_path", tags=provider_tags)
     def get_well_path(self, well_name: str) -> WellPath:
+        well_entry = self._inventory.get(well_name)
+        if (
+            well_entry
+            and self._path_arrays is not None
+            and INV_KEY_PATH_OFFSET in well_entry
+        ):
+            return self._sliced_well_path(well_entry)
+
+        # Backing stores written before the well paths file was added
         well = self.get_well_xtgeo_obj(well_name)
         df = well.dataframe
         md_logname = well.mdlogname
@@ -117,6 +181,12 @@ class ProviderImplFile(WellProvider):
 
         return WellPath(x_arr=x_arr, y_arr=y_arr, z_arr=z_arr, md_arr=md_arr)
 
+    @traced("well.get_well_paths", tags=provider_tags)
+    def get_well_paths(self, well_names: List[str]) -> Dict[str, WellPath]:
+        add_span_tags(num_wells=len(well_names))
+        return {well_name: self.get_well_path(well_name) for well_name in well_names}
+
+    @traced("well.get_well_xtgeo_obj", tags=provider_tags)
     def get_well_xtgeo_obj(self, well_name: str) -> xtgeo.Well:
         well_entry = self._inventory.get(well_name)
         if not well_entry:
@@ -131,3 +201,30 @@ class ProviderImplFile(WellProvider):
         )
 
         return well
+
+    def _sliced_well_path(self, well_entry: dict) -> WellPath:
+        assert self._path_arrays is not None
+        start = well_entry[INV_KEY_PATH_OFFSET]
+        stop = start + well_entry[INV_KEY_PATH_LENGTH]
+        return WellPath(
+            x_arr=self._path_arrays["X_UTME"][start:stop],
+            y_arr=self._path_arrays["Y_UTMN"][start:stop],
+            z_arr=self._path_arrays["Z_TVDSS"][start:stop],
+            md_arr=self._path_arrays["MD"][start:stop],
+        )
+
+
+def _read_path_arrays(file_name: Path) -> Optional[Dict[str, np.ndarray]]:
+    """Memory maps the well paths file, returning None if it does not exist"""
+    if not file_name.exists():
+        return None
+    source = pa.memory_map(str(file_name), "r")
+    table = pa.ipc.RecordBatchFileReader(source).read_all().combine_chunks()
+    return {
+        col: (
+            table.column(col).chunk(0).to_numpy()
+            if table.column(col).num_chunks > 0
+            else np.array([], dtype=np.float64)
+        )
+        for col in _PATH_COLUMNS
+    }
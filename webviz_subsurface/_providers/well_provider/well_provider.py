@@ -1,6 +1,6 @@
 import abc
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
 import numpy as np
 import xtgeo
@@ -28,6 +28,10 @@ class WellProvider(abc.ABC):
     def get_well_path(self, well_name: str) -> WellPath:
         """Returns the coordinates for the well path along with MD for the well."""
 
+    def get_well_paths(self, well_names: List[str]) -> Dict[str, WellPath]:
+        """Returns the well paths of the wells, by well name."""
+        return {well_name: self.get_well_path(well_name) for well_name in well_names}
+
     @abc.abstractmethod
     def get_well_xtgeo_obj(self, well_name: str) -> xtgeo.Well:
         ...
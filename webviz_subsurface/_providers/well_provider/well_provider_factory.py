@@ -10,6 +10,7 @@ from webviz_config.webviz_instance_info import WebvizRunMode
 
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
+from ..provider_build_executor import ProviderBuildExecutor
 from ._provider_impl_file import ProviderImplFile
 from .well_provider import WellProvider
 
@@ -63,32 +64,46 @@ class WellProviderFactory(WebvizFactory):
         if not self._allow_storage_writes:
             raise ValueError(f"Failed to load well provider for {file_pattern}")
 
-        LOGGER.info(f"Importing/writing well data for: {file_pattern}")
+        with ProviderBuildExecutor.instance().import_slot(
+            self._storage_dir, storage_key, ProviderImplFile.from_backing_store
+        ) as existing_provider:
+            if existing_provider:
+                return existing_provider
 
-        timer.lap_s()
-        src_file_names = sorted(
-            [str(filename) for filename in Path(well_folder).glob(f"*{well_suffix}")]
-        )
-        et_discover_s = timer.lap_s()
+            LOGGER.info(f"Importing/writing well data for: {file_pattern}")
 
-        ProviderImplFile.write_backing_store(
-            self._storage_dir,
-            storage_key,
-            well_file_names=src_file_names,
-            md_logname=md_logname,
-        )
-        et_write_s = timer.lap_s()
+            timer.lap_s()
+            src_file_names = sorted(
+                [
+                    str(filename)
+                    for filename in Path(well_folder).glob(f"*{well_suffix}")
+                ]
+            )
+            et_discover_s = timer.lap_s()
 
-        provider = ProviderImplFile.from_backing_store(self._storage_dir, storage_key)
-        if not provider:
-            raise ValueError(f"Failed to load/create well provider for {file_pattern}")
+            ProviderImplFile.write_backing_store(
+                self._storage_dir,
+                storage_key,
+                well_file_names=src_file_names,
+                md_logname=md_logname,
+            )
+            et_write_s = timer.lap_s()
 
-        LOGGER.info(
-            f"Saved well provider to backing store in {timer.elapsed_s():.2f}s ("
-            f"discover={et_discover_s:.2f}s, write={et_write_s:.2f}s, file_pattern={file_pattern})"
-        )
+            provider = ProviderImplFile.from_backing_store(
+                self._storage_dir, storage_key
+            )
+            if not provider:
+                raise ValueError(
+                    f"Failed to load/create well provider for {file_pattern}"
+                )
 
-        return provider
+            LOGGER.info(
+                f"Saved well provider to backing store in {timer.elapsed_s():.2f}s ("
+                f"discover={et_discover_s:.2f}s, write={et_write_s:.2f}s, "
+                f"file_pattern={file_pattern})"
+            )
+
+            return provider
 
 
 def _make_hash_string(string_to_hash: str) -> str:
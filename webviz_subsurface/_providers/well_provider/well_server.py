@@ -1,5 +1,7 @@
 import logging
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 import flask
@@ -7,6 +9,11 @@ import geojson
 from dash import Dash
 
 from webviz_subsurface._providers.well_provider.well_provider import WellProvider
+from webviz_subsurface._utils.perf_telemetry import (
+    add_span_tags,
+    register_telemetry_route,
+    traced,
+)
 from webviz_subsurface._utils.perf_timer import PerfTimer
 
 LOGGER = logging.getLogger(__name__)
@@ -15,11 +22,17 @@ _ROOT_URL_PATH = "/WellServer"
 
 _WELL_SERVER_INSTANCE: Optional["WellServer"] = None
 
+# Maximum number of GeoJSON responses to keep, by provider and set of wells
+_GEOJSON_CACHE_MAXSIZE = 64
+
 
 class WellServer:
     def __init__(self, app: Dash) -> None:
         self._setup_url_rule(app)
+        register_telemetry_route(app)
         self._id_to_provider_dict: Dict[str, WellProvider] = {}
+        self._geojson_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._geojson_cache_lock = threading.Lock()
 
     @staticmethod
     def instance(app: Dash) -> "WellServer":
@@ -69,6 +82,7 @@ class WellServer:
 
     def _setup_url_rule(self, app: Dash) -> None:
         @app.server.route(_ROOT_URL_PATH + "/<provider_id>/<well_names_str>")
+        @traced("well_server.request")
         def _handle_wells_request(
             provider_id: str, well_names_str: str
         ) -> flask.Response:
@@ -88,28 +102,48 @@ class WellServer:
                 LOGGER.error("Error decoding wells address")
                 flask.abort(404)
 
-            validate_geometry = True
-            feature_arr = []
-            for wname in well_names_arr:
-                well_path = provider.get_well_path(wname)
+            cache_key = (provider_id, well_names_str)
+            with self._geojson_cache_lock:
+                geojson_str = self._geojson_cache.get(cache_key)
+                if geojson_str is not None:
+                    self._geojson_cache.move_to_end(cache_key)
+
+            if geojson_str is None:
+                geojson_str = _well_paths_to_geojson(provider, well_names_arr)
+                with self._geojson_cache_lock:
+                    self._geojson_cache[cache_key] = geojson_str
+                    while len(self._geojson_cache) > _GEOJSON_CACHE_MAXSIZE:
+                        self._geojson_cache.popitem(last=False)
+                add_span_tags(cache_hit=False)
+            else:
+                add_span_tags(cache_hit=True)
+
+            response = flask.Response(geojson_str, mimetype="application/geo+json")
+            add_span_tags(
+                provider=provider_id,
+                num_wells=len(well_names_arr),
+                bytes=response.content_length,
+            )
 
-                coords = list(zip(well_path.x_arr, well_path.y_arr, well_path.z_arr))
-                # coords = coords[0::20]
-                point = geojson.Point(
-                    coordinates=[coords[0][0], coords[0][1]], validate=validate_geometry
-                )
+            LOGGER.debug(f"Request handled in: {timer.elapsed_s():.2f}s")
+            return response
 
-                geocoll = geojson.GeometryCollection(geometries=[point])
 
-                feature = geojson.Feature(
-                    id=wname, geometry=geocoll, properties={"name": wname}
-                )
-                feature_arr.append(feature)
+def _well_paths_to_geojson(provider: WellProvider, well_names: List[str]) -> str:
+    validate_geometry = True
+    feature_arr = []
+    for wname, well_path in provider.get_well_paths(well_names).items():
+        point = geojson.Point(
+            coordinates=[float(well_path.x_arr[0]), float(well_path.y_arr[0])],
+            validate=validate_geometry,
+        )
 
-            featurecoll = geojson.FeatureCollection(features=feature_arr)
-            response = flask.Response(
-                geojson.dumps(featurecoll), mimetype="application/geo+json"
-            )
+        geocoll = geojson.GeometryCollection(geometries=[point])
 
-            LOGGER.debug(f"Request handled in: {timer.elapsed_s():.2f}s")
-            return response
+        feature = geojson.Feature(
+            id=wname, geometry=geocoll, properties={"name": wname}
+        )
+        feature_arr.append(feature)
+
+    featurecoll = geojson.FeatureCollection(features=feature_arr)
+    return geojson.dumps(featurecoll)
@@ -105,6 +105,50 @@ def correlate_response_with_dataframe(
     return corrdf.reindex(corrdf.abs().sort_values().index)
 
 
+def correlation_matrix(
+    dframe1: pd.DataFrame, dframe2: pd.DataFrame, method: str = "pearson"
+) -> pd.DataFrame:
+    """Returns the correlations between all columns in `dframe1` (index) and all
+    columns in `dframe2` (columns), computed with matrix products.
+
+    The rows of the two dataframes must correspond to each other. As in
+    `pd.DataFrame.corrwith`, missing values are excluded pairwise, and constant
+    columns give NaN. Supported methods are `pearson` and `spearman`, where the
+    latter ranks each column over its non-missing values.
+    """
+    if method == "spearman":
+        dframe1, dframe2 = dframe1.rank(), dframe2.rank()
+    elif method != "pearson":
+        raise ValueError(f"Unknown correlation method: {method}")
+
+    xval = dframe1.to_numpy(dtype=np.float64)
+    yval = dframe2.to_numpy(dtype=np.float64)
+    xmask = ~np.isnan(xval)
+    ymask = ~np.isnan(yval)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Center columns first to avoid loss of precision in the moments below
+        xval = np.where(xmask, xval - dframe1.mean().to_numpy(), 0.0)
+        yval = np.where(ymask, yval - dframe2.mean().to_numpy(), 0.0)
+        xmask_f, ymask_f = xmask.astype(np.float64), ymask.astype(np.float64)
+
+        count = xmask_f.T @ ymask_f
+        sum_x = xval.T @ ymask_f
+        sum_y = xmask_f.T @ yval
+        cov = xval.T @ yval - sum_x * sum_y / count
+        var_x = (xval**2).T @ ymask_f - sum_x**2 / count
+        var_y = xmask_f.T @ (yval**2) - sum_y**2 / count
+        corr = np.clip(cov / np.sqrt(var_x * var_y), -1, 1)
+
+    corr[count < 2] = np.nan
+    corr[_is_constant(dframe1), :] = np.nan
+    corr[:, _is_constant(dframe2)] = np.nan
+    return pd.DataFrame(corr, index=dframe1.columns, columns=dframe2.columns)
+
+
+def _is_constant(dframe: pd.DataFrame) -> np.ndarray:
+    return (dframe.nunique() <= 1).to_numpy()
+
+
 def merge_dataframes_on_realization(
     dframe1: pd.DataFrame, dframe2: pd.DataFrame
 ) -> pd.DataFrame:
@@ -1,10 +1,12 @@
+import functools
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict
 
 from webviz_subsurface._providers import (
     EnsembleSummaryProvider,
     EnsembleSummaryProviderFactory,
     Frequency,
+    ProviderBuildExecutor,
 )
 
 from .ensemble_summary_provider_set import EnsembleSummaryProviderSet
@@ -26,11 +28,16 @@ def create_lazy_ensemble_summary_provider_set_from_paths(
     Provider set with ensemble summary providers with lazy (on-demand) resampling/interpolation
     """
     provider_factory = EnsembleSummaryProviderFactory.instance()
-    provider_dict: Dict[str, EnsembleSummaryProvider] = {}
-    for name, path in name_path_dict.items():
-        provider_dict[name] = provider_factory.create_from_arrow_unsmry_lazy(
-            str(path), rel_file_pattern
+    # The providers for the different ensembles are built concurrently
+    build_funcs: Dict[str, Callable[[], EnsembleSummaryProvider]] = {
+        name: functools.partial(
+            provider_factory.create_from_arrow_unsmry_lazy,
+            str(path),
+            rel_file_pattern,
         )
+        for name, path in name_path_dict.items()
+    }
+    provider_dict = ProviderBuildExecutor.instance().build_all(build_funcs)
     return EnsembleSummaryProviderSet(provider_dict)
 
 
@@ -55,9 +62,15 @@ def create_presampled_ensemble_summary_provider_set_from_paths(
     """
     # TODO: Make presampling_frequency: Optional[Frequency] when allowing raw data for plugin
     provider_factory = EnsembleSummaryProviderFactory.instance()
-    provider_dict: Dict[str, EnsembleSummaryProvider] = {}
-    for name, path in name_path_dict.items():
-        provider_dict[name] = provider_factory.create_from_arrow_unsmry_presampled(
-            str(path), rel_file_pattern, presampling_frequency
+    # The providers for the different ensembles are built concurrently
+    build_funcs: Dict[str, Callable[[], EnsembleSummaryProvider]] = {
+        name: functools.partial(
+            provider_factory.create_from_arrow_unsmry_presampled,
+            str(path),
+            rel_file_pattern,
+            presampling_frequency,
         )
+        for name, path in name_path_dict.items()
+    }
+    provider_dict = ProviderBuildExecutor.instance().build_all(build_funcs)
     return EnsembleSummaryProviderSet(provider_dict)
@@ -0,0 +1,268 @@
+import copy
+import datetime
+import enum
+import functools
+import hashlib
+import itertools
+import logging
+import os
+import pathlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar, cast
+
+import numpy as np
+import pandas as pd
+
+LOGGER = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_PRIMITIVE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    bool,
+    complex,
+    type(None),
+    enum.Enum,
+    datetime.date,
+    datetime.datetime,
+    datetime.timedelta,
+)
+
+# Identity tokens for objects without a content fingerprint, e.g. models and
+# providers. Weak references are used to never give a new object the token of
+# an object that has been garbage collected.
+_TOKENS: "weakref.WeakKeyDictionary[Any, int]" = weakref.WeakKeyDictionary()
+_TOKEN_COUNTER = itertools.count()
+_TOKENS_LOCK = threading.Lock()
+
+
+@dataclass
+class MemoizeStats:
+    hits: int = 0
+    misses: int = 0
+    key_compute_s: float = 0.0
+
+    @property
+    def calls(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.calls if self.calls else 0.0
+
+    @property
+    def mean_key_compute_ms(self) -> float:
+        return 1000 * self.key_compute_s / self.calls if self.calls else 0.0
+
+
+_STATS: Dict[str, MemoizeStats] = {}
+
+
+def fingerprint(obj: Any) -> Hashable:
+    """Returns a cheap and stable hashable fingerprint of the object.
+
+    * DataFrames, Series and numpy arrays are fingerprinted by type, shape,
+      columns/dtype and a hash of all the values.
+    * xtgeo surfaces, cubes and wells are fingerprinted by their geometry and
+      the fingerprint of their values/dataframe.
+    * Paths are fingerprinted by the path and the modification time of the file.
+    * Lists, tuples, sets and dicts are fingerprinted recursively.
+    * Other objects with value based hashing are used as is, while objects with
+      identity based hashing (e.g. models and providers) get a unique token.
+    """
+    # pylint: disable=too-many-return-statements
+    if isinstance(obj, _PRIMITIVE_TYPES):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return (type(obj).__name__, tuple(fingerprint(item) for item in obj))
+    if isinstance(obj, dict):
+        return (
+            "dict",
+            tuple((fingerprint(key), fingerprint(value)) for key, value in obj.items()),
+        )
+    if isinstance(obj, (set, frozenset)):
+        return ("set", tuple(sorted((fingerprint(item) for item in obj), key=repr)))
+    if isinstance(obj, pd.DataFrame):
+        return (
+            "DataFrame",
+            obj.shape,
+            tuple(obj.columns),
+            tuple(str(dtype) for dtype in obj.dtypes),
+            _frame_digest(obj),
+        )
+    if isinstance(obj, pd.Series):
+        return ("Series", obj.shape, obj.name, str(obj.dtype), _frame_digest(obj))
+    if isinstance(obj, np.ndarray):
+        return ("ndarray", obj.shape, str(obj.dtype), _array_digest(obj))
+    if isinstance(obj, pathlib.PurePath):
+        try:
+            return ("Path", str(obj), os.stat(obj).st_mtime_ns)
+        except OSError:
+            return ("Path", str(obj), None)
+    if type(obj).__module__.split(".")[0] == "xtgeo":
+        return _xtgeo_fingerprint(obj)
+    if type(obj).__hash__ is not object.__hash__ and type(obj).__hash__ is not None:
+        return (type(obj).__qualname__, obj)
+    return (type(obj).__qualname__, "token", _identity_token(obj))
+
+
+def fingerprint_memoize(
+    maxsize: int = 64, copy_result: bool = True
+) -> Callable[[F], F]:
+    """In-process memoization keyed by the fingerprints of the arguments.
+
+    Intended for functions taking large objects such as DataFrames, xtgeo
+    objects or models as arguments, where building a cache key from the string
+    representation of the full object (as done by e.g. CACHE.memoize) is
+    expensive. Values are hashed with numpy/pandas hashing instead.
+
+    The least recently used results are discarded when more than `maxsize`
+    results are stored. Unless `copy_result` is False, a copy of the result is
+    returned, such that callers can modify the returned object without
+    affecting the stored one.
+
+    Hit rate and the time spent computing keys are available through
+    `memoize_stats()`, and `cache_info()`/`cache_clear()` on the decorated function.
+    """
+
+    def decorator(func: F) -> F:
+        cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        lock = threading.Lock()
+        stats = MemoizeStats()
+        _STATS[f"{func.__module__}.{func.__qualname__}"] = stats
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            key = (fingerprint(args), fingerprint(tuple(sorted(kwargs.items()))))
+            elapsed_s = time.perf_counter() - start
+
+            with lock:
+                stats.key_compute_s += elapsed_s
+                found = key in cache
+                if found:
+                    stats.hits += 1
+                    cache.move_to_end(key)
+                    result = cache[key]
+                else:
+                    stats.misses += 1
+
+            if not found:
+                result = func(*args, **kwargs)
+                with lock:
+                    cache[key] = result
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+
+            return _copy(result) if copy_result else result
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_info = lambda: stats  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def memoize_stats() -> Dict[str, MemoizeStats]:
+    """Statistics per memoized function, by fully qualified function name"""
+    return dict(_STATS)
+
+
+def log_memoize_stats(level: int = logging.INFO) -> None:
+    for name, stats in sorted(memoize_stats().items()):
+        if stats.calls:
+            LOGGER.log(
+                level,
+                f"{name}: calls={stats.calls}, hit_rate={stats.hit_rate:.2f}, "
+                f"mean_key_compute={stats.mean_key_compute_ms:.3f}ms",
+            )
+
+
+def _copy(result: Any) -> Any:
+    if isinstance(result, (pd.DataFrame, pd.Series, np.ndarray)):
+        return result.copy()
+    if isinstance(result, _PRIMITIVE_TYPES):
+        return result
+    return copy.deepcopy(result)
+
+
+def _frame_digest(obj: Any) -> str:
+    try:
+        hashed = pd.util.hash_pandas_object(obj, index=True).to_numpy()
+        return hashlib.md5(hashed.tobytes()).hexdigest()  # nosec
+    except TypeError:
+        # Unhashable values, e.g. lists
+        return hashlib.md5(repr(obj.to_dict("list")).encode()).hexdigest()  # nosec
+
+
+def _array_digest(arr: np.ndarray) -> str:
+    if arr.dtype == object:
+        return hashlib.md5(repr(arr.tolist()).encode()).hexdigest()  # nosec
+    digest = hashlib.md5(np.ascontiguousarray(arr).tobytes())  # nosec
+    if isinstance(arr, np.ma.MaskedArray):
+        digest.update(np.packbits(np.ma.getmaskarray(arr)).tobytes())
+    return digest.hexdigest()
+
+
+def _xtgeo_fingerprint(obj: Any) -> Tuple:
+    geometry = tuple(
+        _non_callable_attr(obj, attr)
+        for attr in (
+            "name",
+            "ncol",
+            "nrow",
+            "nlay",
+            "xori",
+            "yori",
+            "zori",
+            "xinc",
+            "yinc",
+            "zinc",
+            "rotation",
+            "yflip",
+        )
+    )
+    # The attributes are checked for their type, as e.g. RegularSurface has a
+    # dataframe() method, and callables must never be part of the fingerprint
+    content: Hashable
+    values = getattr(obj, "values", None)
+    if isinstance(values, np.ndarray):
+        # E.g. xtgeo.RegularSurface, xtgeo.Cube and xtgeo.GridProperty
+        content = fingerprint(values)
+    else:
+        dataframe = getattr(obj, "dataframe", None)
+        if isinstance(dataframe, (pd.DataFrame, pd.Series)):
+            # E.g. xtgeo.Well and xtgeo.Polygons
+            content = fingerprint(dataframe)
+        else:
+            content = _identity_token(obj)
+    return (type(obj).__qualname__, geometry, content)
+
+
+def _non_callable_attr(obj: Any, attr: str) -> Any:
+    value = getattr(obj, attr, None)
+    return None if callable(value) else value
+
+
+def _identity_token(obj: Any) -> int:
+    with _TOKENS_LOCK:
+        try:
+            token = _TOKENS.get(obj)
+            if token is None:
+                token = next(_TOKEN_COUNTER)
+                _TOKENS[obj] = token
+            return token
+        except TypeError:
+            # Not possible to make a weak reference to the object
+            return id(obj)
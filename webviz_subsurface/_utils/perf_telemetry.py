@@ -0,0 +1,263 @@
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, TypeVar, cast
+
+import flask
+import numpy as np
+from dash import Dash
+
+from .perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Setting this environment variable to 1 enables the telemetry route.
+# Setting the dump variable to a file name enables a periodic JSON dump.
+TELEMETRY_ENV_VAR = "WEBVIZ_SUBSURFACE_PERF_TELEMETRY"
+TELEMETRY_DUMP_ENV_VAR = "WEBVIZ_SUBSURFACE_PERF_TELEMETRY_DUMP"
+TELEMETRY_DUMP_INTERVAL_ENV_VAR = "WEBVIZ_SUBSURFACE_PERF_TELEMETRY_DUMP_INTERVAL_S"
+
+TELEMETRY_URL_PATH = "/WebvizSubsurface/perf-telemetry"
+
+_CURRENT_SPAN: "contextvars.ContextVar[Optional[TelemetrySpan]]" = (
+    contextvars.ContextVar("current_telemetry_span", default=None)
+)
+
+
+@dataclass
+class TelemetrySpan:
+    """A timed operation, with tags (e.g. provider id, number of vectors,
+    number of bytes) and the durations of its phases"""
+
+    operation: str
+    tags: Dict[str, Any] = field(default_factory=dict)
+    phases_ms: Dict[str, float] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.time)
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "operation": self.operation,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "tags": self.tags,
+            "phases_ms": self.phases_ms,
+        }
+
+
+class _Histogram:
+    """Duration statistics for one operation. The percentiles are calculated
+    from the most recent `max_samples` samples."""
+
+    def __init__(self, max_samples: int) -> None:
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        self._samples.append(duration_ms)
+        self._count += 1
+        self._total_ms += duration_ms
+        self._max_ms = max(self._max_ms, duration_ms)
+
+    def summary(self) -> Dict[str, float]:
+        p50, p95, p99 = np.percentile(np.fromiter(self._samples, float), [50, 95, 99])
+        return {
+            "count": self._count,
+            "mean_ms": self._total_ms / self._count,
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": self._max_ms,
+        }
+
+
+class PerfTelemetry:
+    """In-process collection of telemetry spans.
+
+    Spans are recorded with `traced()` or `telemetry_span()`, and keep the
+    durations of each operation (and of each phase of an operation, as
+    `<operation>.<phase>`) in histograms. The most recent spans are kept with
+    their tags.
+
+    The statistics are exposed on a Flask route by `register_telemetry_route()`
+    and written to a JSON file by `start_periodic_dump()`, both opt-in through
+    environment variables.
+    """
+
+    _instance: Optional["PerfTelemetry"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_samples: int = 2048, max_recent_spans: int = 256) -> None:
+        self._max_samples = max_samples
+        self._histograms: Dict[str, _Histogram] = {}
+        self._recent_spans: Deque[TelemetrySpan] = deque(maxlen=max_recent_spans)
+        self._lock = threading.Lock()
+        self._dump_thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def instance() -> "PerfTelemetry":
+        """Static method to access the singleton instance of the telemetry."""
+
+        with PerfTelemetry._instance_lock:
+            if PerfTelemetry._instance is None:
+                PerfTelemetry._instance = PerfTelemetry()
+            return PerfTelemetry._instance
+
+    def record(self, span: TelemetrySpan) -> None:
+        with self._lock:
+            self._add_sample(span.operation, span.duration_ms)
+            for phase, duration_ms in span.phases_ms.items():
+                self._add_sample(f"{span.operation}.{phase}", duration_ms)
+            self._recent_spans.append(span)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Histogram summaries per operation and the most recent spans"""
+        with self._lock:
+            return {
+                "operations": {
+                    operation: histogram.summary()
+                    for operation, histogram in sorted(self._histograms.items())
+                },
+                "recent_spans": [span.to_dict() for span in self._recent_spans],
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._recent_spans.clear()
+
+    def dump_json(self, file_name: Path) -> None:
+        """Write the snapshot to a JSON file. The file is replaced atomically"""
+        file_name = Path(file_name)
+        tmp_file_name = file_name.with_name(f".{file_name.name}.tmp")
+        with open(tmp_file_name, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, indent=2, default=str)
+        os.replace(tmp_file_name, file_name)
+
+    def start_periodic_dump(self, file_name: Path, interval_s: float = 60) -> None:
+        """Write the snapshot to a JSON file every `interval_s` seconds in a
+        background thread. Only one periodic dump is started per process."""
+        with self._lock:
+            if self._dump_thread is not None:
+                return
+
+            def _dump_loop() -> None:
+                while True:
+                    time.sleep(interval_s)
+                    try:
+                        self.dump_json(file_name)
+                    except OSError as exc:
+                        LOGGER.warning(
+                            f"Could not write telemetry to {file_name}: {exc}"
+                        )
+
+            self._dump_thread = threading.Thread(
+                target=_dump_loop, name="perf_telemetry_dump", daemon=True
+            )
+            self._dump_thread.start()
+        LOGGER.info(f"Writing performance telemetry to {file_name} every {interval_s}s")
+
+    def _add_sample(self, operation: str, duration_ms: float) -> None:
+        histogram = self._histograms.get(operation)
+        if histogram is None:
+            histogram = self._histograms[operation] = _Histogram(self._max_samples)
+        histogram.add(duration_ms)
+
+
+@contextmanager
+def telemetry_span(operation: str, **tags: Any) -> Iterator[TelemetrySpan]:
+    """Context manager recording the duration of the enclosed block as a span"""
+    span = TelemetrySpan(operation=operation, tags=tags)
+    timer = PerfTimer()
+    token = _CURRENT_SPAN.set(span)
+    try:
+        yield span
+    except Exception:
+        span.tags["error"] = True
+        raise
+    finally:
+        _CURRENT_SPAN.reset(token)
+        span.duration_ms = 1000 * timer.elapsed_s()
+        PerfTelemetry.instance().record(span)
+
+
+def traced(
+    operation: str, tags: Optional[Callable[..., Dict[str, Any]]] = None
+) -> Callable[[F], F]:
+    """Decorator recording each call of the function as a span. If given, `tags`
+    is called with the arguments of the function and returns the span tags."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with telemetry_span(operation, **(tags(*args, **kwargs) if tags else {})):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def provider_tags(provider: Any, *_args: Any, **_kwargs: Any) -> Dict[str, Any]:
+    """Span tags for provider methods, for use with `traced()`"""
+    return {"provider": provider.provider_id()}
+
+
+def add_span_tags(**tags: Any) -> None:
+    """Add tags to the current span, e.g. sizes that are known at the end of
+    the operation. Does nothing outside a span."""
+    span = _CURRENT_SPAN.get()
+    if span is not None:
+        span.tags.update(tags)
+
+
+def record_phases(**phases_ms: float) -> None:
+    """Add the durations (in milliseconds) of the phases of the current span,
+    typically the laps of a PerfTimer. Does nothing outside a span."""
+    span = _CURRENT_SPAN.get()
+    if span is not None:
+        span.phases_ms.update(phases_ms)
+
+
+def telemetry_enabled() -> bool:
+    return os.environ.get(TELEMETRY_ENV_VAR, "").lower() in ("1", "true", "yes")
+
+
+def register_telemetry_route(app: Dash) -> None:
+    """Register the telemetry route on the app, and start the periodic JSON dump,
+    if enabled through the environment variables. Safe to call several times."""
+    telemetry = PerfTelemetry.instance()
+
+    dump_file_name = os.environ.get(TELEMETRY_DUMP_ENV_VAR)
+    if dump_file_name:
+        telemetry.start_periodic_dump(
+            Path(dump_file_name),
+            float(os.environ.get(TELEMETRY_DUMP_INTERVAL_ENV_VAR, 60)),
+        )
+
+    if (
+        not telemetry_enabled()
+        or "_handle_telemetry_request" in app.server.view_functions
+    ):
+        return
+
+    @app.server.route(TELEMETRY_URL_PATH)
+    def _handle_telemetry_request() -> flask.Response:
+        return flask.Response(
+            json.dumps(telemetry.snapshot(), default=str),
+            mimetype="application/json",
+        )
+
+    LOGGER.info(f"Performance telemetry available at {TELEMETRY_URL_PATH}")
@@ -0,0 +1,222 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .._abbreviations.reservoir_simulation import (
+    simulation_region_vector_breakdown,
+    simulation_region_vector_recompose,
+)
+
+
+class RegionAggregator:
+    """Aggregation of region vectors (e.g. ROIP:1, ROIP:2, ...) of one FIP array
+    (e.g. FIPNUM) over groups of regions.
+
+    The mapping from regions to the subgroups of each group in the fipfile
+    (e.g. the zones of ZONE) is precomputed as a sparse (region x subgroup)
+    membership matrix. A filter combination is combined into one sparse
+    (region x aggregated vector) matrix, and the aggregated vectors are then
+    calculated as a single matrix product with the (row x region) array of
+    the selected vector. The region arrays are extracted from the summary data
+    on first use per vector.
+
+    If there is no fipfile definition of the FIP array, the regions are filtered
+    on region number, using the filter name `regions`.
+    """
+
+    INDEX_COLUMNS = ["ENSEMBLE", "REAL", "DATE"]
+
+    def __init__(
+        self,
+        smry: pd.DataFrame,
+        smry_cols: List[str],
+        fip: str,
+        fipdesc: Optional[pd.DataFrame] = None,
+    ) -> None:
+        self._smry = smry
+        self._fip = fip
+
+        # Summary column per region, for each vector base
+        self._columns: Dict[str, Dict[int, str]] = {}
+        for col in smry_cols:
+            vector_base, fiparray, node = simulation_region_vector_breakdown(col)
+            if fiparray == fip and node is not None and node.isdigit():
+                self._columns.setdefault(vector_base, {})[int(node)] = col
+
+        fipdesc = (
+            None
+            if fipdesc is None or fip not in fipdesc["FIP"].values
+            else fipdesc[fipdesc["FIP"] == fip]
+        )
+        nodes = {node for cols in self._columns.values() for node in cols}
+        if fipdesc is not None:
+            nodes.update(int(node) for node in fipdesc["NODE"])
+        self._nodes = np.array(sorted(nodes), dtype=int)
+        self._node_index = {node: idx for idx, node in enumerate(self._nodes)}
+
+        self._memberships: Dict[str, Tuple[List[str], sparse.csr_matrix]] = {}
+        if fipdesc is not None:
+            for group, group_df in fipdesc.groupby("GROUP", sort=False):
+                subgroups = list(group_df["SUBGROUP"].unique())
+                subgroup_index = {
+                    subgroup: idx for idx, subgroup in enumerate(subgroups)
+                }
+                matrix = sparse.csr_matrix(
+                    (
+                        np.ones(len(group_df)),
+                        (
+                            [self._node_index[int(node)] for node in group_df["NODE"]],
+                            [subgroup_index[sub] for sub in group_df["SUBGROUP"]],
+                        ),
+                    ),
+                    shape=(len(self._nodes), len(subgroups)),
+                )
+                self._memberships[str(group)] = (subgroups, matrix)
+
+        self._region_arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def nodes(self) -> List[int]:
+        return self._nodes.tolist()
+
+    def aggregation_matrix(
+        self, groupby: str, filters: Dict[str, list]
+    ) -> Tuple[List[str], sparse.csr_matrix]:
+        """Returns the names of the aggregated vectors, together with a sparse
+        (region x aggregated vector) matrix with ones for the regions that are
+        summed in each aggregated vector"""
+        if not self._memberships:
+            return self._region_number_aggregation_matrix(groupby, filters)
+
+        num_nodes = len(self._nodes)
+        # A region is included if all its subgroups in each group are selected
+        included = np.ones(num_nodes, dtype=bool)
+        for group, subgroups in filters.items():
+            if group not in self._memberships:
+                included[:] = False
+                break
+            names, membership = self._memberships[group]
+            num_total = np.asarray(membership.sum(axis=1)).ravel()
+            num_selected = membership @ np.isin(names, subgroups).astype(float)
+            included &= (num_total > 0) & (num_selected == num_total)
+
+        if groupby == "ENSEMBLE":
+            if not included.any():
+                return [], sparse.csr_matrix((num_nodes, 0))
+            return ["ENSEMBLE"], sparse.csr_matrix(included.astype(float)[:, None])
+
+        names, membership = self._memberships[groupby]
+        matrix = sparse.diags(included.astype(float)) @ membership
+        matrix.eliminate_zeros()
+        if (matrix.getnnz(axis=1) > 1).any():
+            node = self._nodes[np.flatnonzero(matrix.getnnz(axis=1) > 1)[0]]
+            raise ValueError(
+                f"This should not occur, likely to be a bug. Vector nr {node} matched several"
+                f"{groupby} that your tried to group by."
+                "Please report this at https://github.com/equinor/webviz-subsurface/issues"
+            )
+
+        # Order the aggregated vectors by their first region, and drop empty ones
+        matrix = matrix.tocsc()
+        first_node = {
+            col: matrix.indices[matrix.indptr[col] : matrix.indptr[col + 1]].min()
+            for col in range(matrix.shape[1])
+            if matrix.indptr[col + 1] > matrix.indptr[col]
+        }
+        order = sorted(first_node, key=first_node.__getitem__)
+        return [names[col] for col in order], matrix[:, order].tocsr()
+
+    def aggregate(
+        self, ensembles: list, groupby: str, vector: str, filters: Dict[str, list]
+    ) -> Tuple[pd.DataFrame, str]:
+        """Sum the region vectors of the vector base `vector` for each group of
+        regions matching the filters. Returns a DataFrame with ENSEMBLE, REAL and
+        DATE, and the aggregated vectors as `AGG_<vector>_filtered_on_<name>`,
+        together with the name of one of the summed vectors to be used for
+        metadata.
+        Raises KeyError if the vector is missing for any of the filtered regions.
+        """
+        if groupby != "ENSEMBLE" and len(ensembles) > 1:  # This should never happen
+            raise ValueError(
+                "Cannot have multiple ensembles unless you group by ensemble"
+            )
+        names, matrix = self.aggregation_matrix(groupby, filters)
+
+        included = self._nodes[np.flatnonzero(matrix.getnnz(axis=1))]
+        node_cols = self._columns.get(vector, {})
+        missing = [
+            simulation_region_vector_recompose(vector, self._fip, str(node))
+            for node in included
+            if node not in node_cols
+        ]
+        if missing:
+            raise KeyError(f"{missing} not in index")
+
+        # Storing a full vector name that exists in the dataset to be used for metadata
+        ref_vector = ""
+        first_nodes = matrix[:, 0].nonzero()[0] if names else []
+        if len(first_nodes) > 0:
+            ref_vector = node_cols[self._nodes[first_nodes.min()]]
+
+        rows = self._smry["ENSEMBLE"].isin(ensembles).to_numpy()
+        df = self._smry.loc[rows, RegionAggregator.INDEX_COLUMNS]
+        if names:
+            nodes_idx, values = self._region_array(vector)
+            aggregated = np.asarray(matrix[nodes_idx].T @ values[rows].T).T
+            df = pd.concat(
+                [
+                    df,
+                    pd.DataFrame(
+                        aggregated,
+                        index=df.index,
+                        columns=[f"AGG_{vector}_filtered_on_{name}" for name in names],
+                    ),
+                ],
+                axis=1,
+            )
+        return df, ref_vector
+
+    def _region_number_aggregation_matrix(
+        self, groupby: str, filters: Dict[str, list]
+    ) -> Tuple[List[str], sparse.csr_matrix]:
+        nodes = [int(node) for node in filters.get("regions", [])]
+        unknown = [node for node in nodes if node not in self._node_index]
+        if unknown:
+            raise KeyError(f"Regions {unknown} not found for {self._fip}")
+        rows = [self._node_index[node] for node in nodes]
+        if groupby == "ENSEMBLE":
+            names = ["regions"]
+            cols = [0] * len(rows)
+        else:
+            names = [str(node) for node in nodes]
+            cols = list(range(len(rows)))
+        return names, sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(self._nodes), len(names))
+        )
+
+    def _region_array(self, vector: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Region indices and the (row x region) array of the vector base, with
+        missing values as zero (as for a pandas sum)"""
+        if vector not in self._region_arrays:
+            node_cols = self._columns[vector]
+            nodes_idx = np.array([self._node_index[node] for node in node_cols])
+            values = self._smry[list(node_cols.values())].to_numpy(
+                dtype=np.float64, copy=True
+            )
+            values[np.isnan(values)] = 0.0
+            self._region_arrays[vector] = (nodes_idx, values)
+        return self._region_arrays[vector]
+
+
+def calc_recovery(df: pd.DataFrame, agg_vectors: List[str]) -> np.ndarray:
+    """Recovery of aggregated inplace vectors relative to the first date of each
+    realization: (initial - now) / initial"""
+    first = (
+        df.groupby(["ENSEMBLE", "REAL"], sort=False)[agg_vectors]
+        .transform("first")
+        .to_numpy()
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (first - df[agg_vectors].to_numpy()) / first
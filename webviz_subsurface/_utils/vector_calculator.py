@@ -1,5 +1,14 @@
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple, TypedDict, Union
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 from uuid import uuid4
 
 import numpy as np
@@ -13,13 +22,16 @@ from webviz_subsurface_components import (
     VectorDefinition,
 )
 
-from webviz_subsurface._providers import EnsembleSummaryProvider, Frequency
-
 from .vector_selector import (
     add_vector_to_vector_selector_data,
     is_vector_name_in_vector_selector_data,
 )
 
+if TYPE_CHECKING:
+    # Only used for type hints, avoids importing all providers (and e.g. xtgeo)
+    # when the package is imported
+    from webviz_subsurface._providers import EnsembleSummaryProvider, Frequency
+
 # JSON Schema for predefined expressions configuration
 # Used as schema input for json_schema.validate()
 PREDEFINED_EXPRESSIONS_JSON_SCHEMA = {
@@ -276,9 +288,9 @@ def get_calculated_vector_df(
 
 def create_calculated_vector_df(
     expression: ExpressionInfo,
-    provider: EnsembleSummaryProvider,
+    provider: "EnsembleSummaryProvider",
     realizations: Optional[Sequence[int]],
-    resampling_frequency: Optional[Frequency],
+    resampling_frequency: Optional["Frequency"],
 ) -> pd.DataFrame:
     """Create dataframe with calculated vector from expression
 
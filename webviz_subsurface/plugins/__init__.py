@@ -20,52 +20,123 @@ pages:
 ```
 """
 
-from ._assisted_history_matching_analysis import AssistedHistoryMatchingAnalysis
-from ._bhp_qc import BhpQc
-from ._co2_leakage import CO2Leakage
-from ._disk_usage import DiskUsage
-from ._grid_viewer_fmu import EXPERIMENTALGridViewerFMU
-from ._group_tree import GroupTree
-from ._history_match import HistoryMatch
-from ._horizon_uncertainty_viewer import HorizonUncertaintyViewer
-from ._inplace_volumes import InplaceVolumes
-from ._inplace_volumes_onebyone import InplaceVolumesOneByOne
-from ._line_plotter_fmu.line_plotter_fmu import LinePlotterFMU
-from ._map_viewer_fmu import MapViewerFMU
-from ._morris_plot import MorrisPlot
-from ._parameter_analysis import ParameterAnalysis
-from ._parameter_correlation import ParameterCorrelation
-from ._parameter_distribution import ParameterDistribution
-from ._parameter_parallel_coordinates import ParameterParallelCoordinates
-from ._parameter_response_correlation import ParameterResponseCorrelation
-from ._prod_misfit import ProdMisfit
-from ._property_statistics import PropertyStatistics
-from ._pvt_plot import PvtPlot
-from ._relative_permeability import RelativePermeability
-from ._reservoir_simulation_timeseries import ReservoirSimulationTimeSeries
-from ._reservoir_simulation_timeseries_onebyone import (
-    ReservoirSimulationTimeSeriesOneByOne,
-)
-from ._reservoir_simulation_timeseries_regional import (
-    ReservoirSimulationTimeSeriesRegional,
-)
-from ._rft_plotter import RftPlotter
-from ._running_time_analysis_fmu import RunningTimeAnalysisFMU
-from ._segy_viewer import SegyViewer
-from ._seismic_misfit import SeismicMisfit
-from ._simulation_time_series import SimulationTimeSeries
-from ._structural_uncertainty import StructuralUncertainty
-from ._subsurface_map import SubsurfaceMap
-from ._surface_viewer_fmu import SurfaceViewerFMU
-from ._surface_with_grid_cross_section import SurfaceWithGridCrossSection
-from ._surface_with_seismic_cross_section import SurfaceWithSeismicCrossSection
-from ._swatinit_qc import SwatinitQC
-from ._tornado_plotter_fmu import TornadoPlotterFMU
-from ._vfp_analysis import VfpAnalysis
-from ._volumetric_analysis import VolumetricAnalysis
-from ._well_analysis import WellAnalysis
-from ._well_completion import WellCompletion
-from ._well_completions import WellCompletions
-from ._well_cross_section import WellCrossSection
-from ._well_cross_section_fmu import WellCrossSectionFMU
-from ._well_log_viewer import WellLogViewer
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# The plugins are imported on first access, through the module level
+# `__getattr__` below. This is also how the `webviz_config_plugins` entry points
+# are resolved, such that an app only pays the import cost (e.g. of vtk, xtgeo,
+# ecl2df and opm) of the plugins it uses.
+_PLUGIN_MODULES: Dict[str, str] = {
+    "AssistedHistoryMatchingAnalysis": "._assisted_history_matching_analysis",
+    "BhpQc": "._bhp_qc",
+    "CO2Leakage": "._co2_leakage",
+    "DiskUsage": "._disk_usage",
+    "EXPERIMENTALGridViewerFMU": "._grid_viewer_fmu",
+    "GroupTree": "._group_tree",
+    "HistoryMatch": "._history_match",
+    "HorizonUncertaintyViewer": "._horizon_uncertainty_viewer",
+    "InplaceVolumes": "._inplace_volumes",
+    "InplaceVolumesOneByOne": "._inplace_volumes_onebyone",
+    "LinePlotterFMU": "._line_plotter_fmu.line_plotter_fmu",
+    "MapViewerFMU": "._map_viewer_fmu",
+    "MorrisPlot": "._morris_plot",
+    "ParameterAnalysis": "._parameter_analysis",
+    "ParameterCorrelation": "._parameter_correlation",
+    "ParameterDistribution": "._parameter_distribution",
+    "ParameterParallelCoordinates": "._parameter_parallel_coordinates",
+    "ParameterResponseCorrelation": "._parameter_response_correlation",
+    "ProdMisfit": "._prod_misfit",
+    "PropertyStatistics": "._property_statistics",
+    "PvtPlot": "._pvt_plot",
+    "RelativePermeability": "._relative_permeability",
+    "ReservoirSimulationTimeSeries": "._reservoir_simulation_timeseries",
+    "ReservoirSimulationTimeSeriesOneByOne": "._reservoir_simulation_timeseries_onebyone",
+    "ReservoirSimulationTimeSeriesRegional": "._reservoir_simulation_timeseries_regional",
+    "RftPlotter": "._rft_plotter",
+    "RunningTimeAnalysisFMU": "._running_time_analysis_fmu",
+    "SegyViewer": "._segy_viewer",
+    "SeismicMisfit": "._seismic_misfit",
+    "SimulationTimeSeries": "._simulation_time_series",
+    "StructuralUncertainty": "._structural_uncertainty",
+    "SubsurfaceMap": "._subsurface_map",
+    "SurfaceViewerFMU": "._surface_viewer_fmu",
+    "SurfaceWithGridCrossSection": "._surface_with_grid_cross_section",
+    "SurfaceWithSeismicCrossSection": "._surface_with_seismic_cross_section",
+    "SwatinitQC": "._swatinit_qc",
+    "TornadoPlotterFMU": "._tornado_plotter_fmu",
+    "VfpAnalysis": "._vfp_analysis",
+    "VolumetricAnalysis": "._volumetric_analysis",
+    "WellAnalysis": "._well_analysis",
+    "WellCompletion": "._well_completion",
+    "WellCompletions": "._well_completions",
+    "WellCrossSection": "._well_cross_section",
+    "WellCrossSectionFMU": "._well_cross_section_fmu",
+    "WellLogViewer": "._well_log_viewer",
+}
+
+__all__ = list(_PLUGIN_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PLUGIN_MODULES:
+        plugin = getattr(importlib.import_module(_PLUGIN_MODULES[name], __name__), name)
+        globals()[name] = plugin
+        return plugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from ._assisted_history_matching_analysis import AssistedHistoryMatchingAnalysis
+    from ._bhp_qc import BhpQc
+    from ._co2_leakage import CO2Leakage
+    from ._disk_usage import DiskUsage
+    from ._grid_viewer_fmu import EXPERIMENTALGridViewerFMU
+    from ._group_tree import GroupTree
+    from ._history_match import HistoryMatch
+    from ._horizon_uncertainty_viewer import HorizonUncertaintyViewer
+    from ._inplace_volumes import InplaceVolumes
+    from ._inplace_volumes_onebyone import InplaceVolumesOneByOne
+    from ._line_plotter_fmu.line_plotter_fmu import LinePlotterFMU
+    from ._map_viewer_fmu import MapViewerFMU
+    from ._morris_plot import MorrisPlot
+    from ._parameter_analysis import ParameterAnalysis
+    from ._parameter_correlation import ParameterCorrelation
+    from ._parameter_distribution import ParameterDistribution
+    from ._parameter_parallel_coordinates import ParameterParallelCoordinates
+    from ._parameter_response_correlation import ParameterResponseCorrelation
+    from ._prod_misfit import ProdMisfit
+    from ._property_statistics import PropertyStatistics
+    from ._pvt_plot import PvtPlot
+    from ._relative_permeability import RelativePermeability
+    from ._reservoir_simulation_timeseries import ReservoirSimulationTimeSeries
+    from ._reservoir_simulation_timeseries_onebyone import (
+        ReservoirSimulationTimeSeriesOneByOne,
+    )
+    from ._reservoir_simulation_timeseries_regional import (
+        ReservoirSimulationTimeSeriesRegional,
+    )
+    from ._rft_plotter import RftPlotter
+    from ._running_time_analysis_fmu import RunningTimeAnalysisFMU
+    from ._segy_viewer import SegyViewer
+    from ._seismic_misfit import SeismicMisfit
+    from ._simulation_time_series import SimulationTimeSeries
+    from ._structural_uncertainty import StructuralUncertainty
+    from ._subsurface_map import SubsurfaceMap
+    from ._surface_viewer_fmu import SurfaceViewerFMU
+    from ._surface_with_grid_cross_section import SurfaceWithGridCrossSection
+    from ._surface_with_seismic_cross_section import SurfaceWithSeismicCrossSection
+    from ._swatinit_qc import SwatinitQC
+    from ._tornado_plotter_fmu import TornadoPlotterFMU
+    from ._vfp_analysis import VfpAnalysis
+    from ._volumetric_analysis import VolumetricAnalysis
+    from ._well_analysis import WellAnalysis
+    from ._well_completion import WellCompletion
+    from ._well_completions import WellCompletions
+    from ._well_cross_section import WellCrossSection
+    from ._well_cross_section_fmu import WellCrossSectionFMU
+    from ._well_log_viewer import WellLogViewer
@@ -2,7 +2,6 @@ from typing import Dict, List
 
 import numpy as np
 import pandas as pd
-from webviz_config.common_cache import CACHE
 
 from ...._utils.fanchart_plotting import (
     FanchartData,
@@ -11,9 +10,10 @@ from ...._utils.fanchart_plotting import (
     MinMaxData,
     get_fanchart_traces,
 )
+from ...._utils.fingerprint_memoize import fingerprint_memoize
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def filter_df(df: pd.DataFrame, ensemble: str, wells: List[str]) -> pd.DataFrame:
     """Filter dataframe for current ensembles and wells.
     Replacing zeroes (well not open) with np.NaN to not be accounted for
@@ -144,22 +144,11 @@ def get_plume_polygon(
         or threshold <= 0
     ):
         return None
-    surfaces = [
-        surface_provider.get_surface(
-            SimulatedSurfaceAddress(
-                attribute=surface_attribute,
-                name=surface_name,
-                datestr=datestr,
-                realization=r,
-            )
-        )
-        for r in realizations
-    ]
-    surfaces = [s for s in surfaces if s is not None]
-    if len(surfaces) == 0:
-        return None
-    return plume_extent.plume_polygons(
-        surfaces,
+    return plume_extent.get_plume_extent_engine(surface_provider).plume_polygons(
+        surface_name,
+        surface_attribute,
+        realizations,
+        datestr,
         threshold,
         smoothing=smoothing,
         simplify_factor=0.12 * smoothing,  # Experimental
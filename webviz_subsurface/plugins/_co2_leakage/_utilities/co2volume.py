@@ -1,6 +1,8 @@
 import itertools
+import warnings
+from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 import pandas
@@ -8,6 +10,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 
 from webviz_subsurface._providers import EnsembleTableProvider
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
 
 
 class _Columns(Enum):
@@ -17,55 +20,110 @@ class _Columns(Enum):
     VOLUME_OUTSIDE = "volume_outside"
 
 
-def _read_dataframe(
-    table_provider: EnsembleTableProvider, realization: int
-) -> pandas.DataFrame:
-    return table_provider.get_column_data(
-        ["date", "co2_inside", "co2_outside"], [realization]
-    )
+@dataclass(frozen=True)
+class ContainmentData:
+    """CO2 containment of the realizations of an ensemble, as one (realization x
+    date x containment category) array, with ensemble statistics per date and
+    category. The categories are inside, outside and their total. Volumes are NaN
+    for dates that are missing in a realization."""
+
+    realizations: np.ndarray
+    # Dates as in the table (e.g. 20250101), sorted
+    dates: np.ndarray
+    categories: Tuple[str, ...]
+    volumes: np.ndarray
+    # Index of the last date with data, per realization
+    terminal_date_idx: np.ndarray
+    # Ensemble statistics per (date, category), over the realizations with data
+    mean: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+
+    @staticmethod
+    def from_table_provider(table_provider: EnsembleTableProvider) -> "ContainmentData":
+        table_categories = ["inside", "outside"]
+        df = table_provider.get_column_data(
+            ["date"] + [f"co2_{category}" for category in table_categories]
+        )
+        realizations = np.array(sorted(df["REAL"].unique()))
+        dates, date_idx = np.unique(df["date"].to_numpy(), return_inverse=True)
+        real_idx = np.searchsorted(realizations, df["REAL"].to_numpy())
+
+        categories = tuple(table_categories) + ("total",)
+        volumes = np.full((len(realizations), len(dates), len(categories)), np.nan)
+        volumes[real_idx, date_idx, :-1] = df[
+            [f"co2_{category}" for category in table_categories]
+        ].to_numpy(dtype=np.float64)
+        volumes[:, :, -1] = volumes[:, :, :-1].sum(axis=2)
+
+        has_data = ~np.isnan(volumes).all(axis=2)
+        terminal_date_idx = len(dates) - 1 - np.argmax(has_data[:, ::-1], axis=1)
+        with warnings.catch_warnings():
+            # Dates without data in any realization give all-NaN slices
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            return ContainmentData(
+                realizations=realizations,
+                dates=dates,
+                categories=categories,
+                volumes=volumes,
+                terminal_date_idx=terminal_date_idx,
+                mean=np.nanmean(volumes, axis=0),
+                minimum=np.nanmin(volumes, axis=0),
+                maximum=np.nanmax(volumes, axis=0),
+            )
+
+    def realization_indices(self, realizations: List[int]) -> np.ndarray:
+        """Indices of the realizations that have data, in the given order"""
+        if len(self.realizations) == 0:
+            return np.array([], dtype=np.int64)
+        indices = np.searchsorted(self.realizations, realizations)
+        indices = np.minimum(indices, len(self.realizations) - 1)
+        return indices[self.realizations[indices] == realizations]
 
+    def category_volumes(self, category: str) -> np.ndarray:
+        """Volumes of the category, per (realization, date)"""
+        return self.volumes[:, :, self.categories.index(category)]
 
-def _read_terminal_co2_volumes(
-    table_provider: EnsembleTableProvider, realizations: List[int]
+
+@fingerprint_memoize(maxsize=16, copy_result=False)
+def get_containment_data(table_provider: EnsembleTableProvider) -> ContainmentData:
+    return ContainmentData.from_table_provider(table_provider)
+
+
+def _terminal_co2_volumes(
+    data: ContainmentData, realizations: List[int]
 ) -> pandas.DataFrame:
-    records = []
-    for real in realizations:
-        df = _read_dataframe(table_provider, real)
-        last = df.iloc[np.argmax(df["date"])]
-        label = str(real)
-        records += [
-            (label, last["co2_inside"], "inside", 0.0),
-            (label, last["co2_outside"], "outside", last["co2_outside"]),
-        ]
-    df = pandas.DataFrame.from_records(
-        records,
-        columns=[
-            _Columns.REALIZATION.value,
-            _Columns.VOLUME.value,
-            _Columns.CONTAINMENT.value,
-            _Columns.VOLUME_OUTSIDE.value,
-        ],
+    real_indices = data.realization_indices(realizations)
+    terminal = data.volumes[real_indices, data.terminal_date_idx[real_indices]]
+    inside = terminal[:, data.categories.index("inside")]
+    outside = terminal[:, data.categories.index("outside")]
+    labels = data.realizations[real_indices].astype(str)
+    df = pandas.DataFrame(
+        {
+            _Columns.REALIZATION.value: np.repeat(labels, 2),
+            _Columns.VOLUME.value: np.column_stack([inside, outside]).ravel(),
+            _Columns.CONTAINMENT.value: np.tile(["inside", "outside"], len(labels)),
+            _Columns.VOLUME_OUTSIDE.value: np.column_stack(
+                [np.zeros_like(outside), outside]
+            ).ravel(),
+        }
     )
     df.sort_values(_Columns.VOLUME_OUTSIDE.value, inplace=True, ascending=True)
     return df
 
 
-def _read_co2_volumes(
-    table_provider: EnsembleTableProvider, realizations: List[int]
-) -> pandas.DataFrame:
-    return pandas.concat(
-        [
-            _read_dataframe(table_provider, real).assign(realization=real)
-            for real in realizations
-        ]
-    )
+def _date_labels(dates: np.ndarray) -> np.ndarray:
+    dates_str = pandas.Series(dates).astype(str)
+    return (
+        dates_str.str[:4] + "-" + dates_str.str[4:6] + "-" + dates_str.str[6:]
+    ).to_numpy()
 
 
 def generate_co2_volume_figure(
     table_provider: EnsembleTableProvider,
     realizations: List[int],
 ) -> go.Figure:
-    df = _read_terminal_co2_volumes(table_provider, realizations)
+    df = _terminal_co2_volumes(get_containment_data(table_provider), realizations)
     fig = px.bar(
         df,
         y=_Columns.REALIZATION.value,
@@ -94,12 +152,10 @@ def generate_co2_time_containment_figure(
     table_provider: EnsembleTableProvider,
     realizations: List[int],
 ) -> go.Figure:
-    df = _read_co2_volumes(table_provider, realizations)
-    df.sort_values(by="date", inplace=True)
-    df["date"] = df["date"].astype(str)
-    dates = df["date"].str[:4] + "-" + df["date"].str[4:6] + "-" + df["date"].str[6:]
-    df["dt"] = dates
-    df["co2_total"] = df["co2_inside"] + df["co2_outside"]
+    data = get_containment_data(table_provider)
+    date_labels = _date_labels(data.dates)
+    outside = data.category_volumes("outside")
+    total = data.category_volumes("total")
     fig = go.Figure()
     colors = px.colors.qualitative.Plotly
     # Generate dummy scatters for legend entries
@@ -109,16 +165,21 @@ def generate_co2_time_containment_figure(
     fig.add_scatter(y=[0.0], **dummy_args, **outside_args)
     fig.add_scatter(y=[0.0], **dummy_args, **total_args)
     for rlz, color in zip(realizations, itertools.cycle(colors)):
-        sub_df = df[df["realization"] == rlz]
+        real_indices = data.realization_indices([rlz])
+        if len(real_indices) == 0:
+            continue
+        has_data = ~np.isnan(total[real_indices[0]])
         common_args = dict(
-            x=sub_df["dt"],
+            x=date_labels[has_data],
             hovertemplate="%{x}: %{y}<br>Realization: %{meta[0]}",
             meta=[rlz],
             marker_color=color,
             showlegend=False,
         )
-        fig.add_scatter(y=sub_df["co2_outside"], **outside_args, **common_args)
-        fig.add_scatter(y=sub_df["co2_total"], **total_args, **common_args)
+        fig.add_scatter(
+            y=outside[real_indices[0], has_data], **outside_args, **common_args
+        )
+        fig.add_scatter(y=total[real_indices[0], has_data], **total_args, **common_args)
     fig.layout.legend.orientation = "h"
     fig.layout.legend.title.text = ""
     fig.layout.legend.yanchor = "bottom"
@@ -132,5 +193,13 @@ def generate_co2_time_containment_figure(
     fig.layout.margin.t = 60
     fig.layout.margin.l = 10
     fig.layout.margin.r = 10
-    fig.layout.yaxis.range = (0, 1.05 * df["co2_total"].max())
+    if set(realizations) >= set(data.realizations):
+        max_total = np.nanmax(
+            data.maximum[:, data.categories.index("total")], initial=0.0
+        )
+    else:
+        max_total = np.nanmax(
+            total[data.realization_indices(realizations)], initial=0.0
+        )
+    fig.layout.yaxis.range = (0, 1.05 * max_total)
     return fig
@@ -1,3 +1,4 @@
+import functools
 from typing import Dict, List, Optional
 
 from webviz_config import WebvizSettings
@@ -7,6 +8,7 @@ from webviz_subsurface._providers import (
     EnsembleSurfaceProviderFactory,
     EnsembleTableProvider,
     EnsembleTableProviderFactory,
+    ProviderBuildExecutor,
 )
 from webviz_subsurface._utils.webvizstore_functions import read_csv
 from webviz_subsurface.plugins._co2_leakage._utilities.generic import MapAttribute
@@ -33,12 +35,15 @@ def init_surface_providers(
     ensembles: List[str],
 ) -> Dict[str, EnsembleSurfaceProvider]:
     surface_provider_factory = EnsembleSurfaceProviderFactory.instance()
-    return {
-        ens: surface_provider_factory.create_from_ensemble_surface_files(
-            webviz_settings.shared_settings["scratch_ensembles"][ens],
-        )
-        for ens in ensembles
-    }
+    return ProviderBuildExecutor.instance().build_all(
+        {
+            ens: functools.partial(
+                surface_provider_factory.create_from_ensemble_surface_files,
+                webviz_settings.shared_settings["scratch_ensembles"][ens],
+            )
+            for ens in ensembles
+        }
+    )
 
 
 def init_well_pick_provider(
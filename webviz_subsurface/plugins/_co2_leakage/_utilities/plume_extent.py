@@ -1,10 +1,32 @@
-from typing import Iterable, List
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import geojson
 import numpy as np
 import scipy.ndimage
 import xtgeo
 
+from webviz_subsurface._providers import (
+    EnsembleSurfaceProvider,
+    SimulatedSurfaceAddress,
+)
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
 MISSING_DEPENDENCIES = False
 try:
     import shapely.geometry
@@ -17,6 +39,10 @@ try:
 except ImportError:
     MISSING_DEPENDENCIES = True
 
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 def plume_polygons(
     surfaces: List[xtgeo.RegularSurface],
@@ -27,13 +53,257 @@ def plume_polygons(
     if MISSING_DEPENDENCIES:
         return geojson.FeatureCollection(features=[])
     plume_count = truncate_surfaces(surfaces, threshold, smoothing)
+    return _plume_count_to_polygons(
+        plume_count, len(surfaces), surfaces[0], simplify_factor
+    )
+
+
+def truncate_surfaces(
+    surfaces: List[xtgeo.RegularSurface], threshold: float, smoothing: float
+) -> np.ndarray:
+    stack = np.stack([_defined_values(s) for s in surfaces])
+    return _smoothed_exceedance_counts(stack[np.newaxis], threshold, smoothing)[0]
+
+
+@dataclass
+class _SurfaceStack:
+    dates: List[Optional[str]]
+    # Values per (date, realization, column, row), with undefined values and
+    # missing surfaces as 0
+    values: np.ndarray
+    # Number of realizations with a surface, per date
+    num_surfaces: np.ndarray
+    template: xtgeo.RegularSurface
+
+
+class PlumeExtentEngine:
+    """Plume extents of a set of realizations, for all dates at once.
+
+    The surfaces of all realizations and dates of an attribute are read once and
+    stacked into one (date x realization x column x row) array. The smoothed
+    number of realizations exceeding a threshold is then computed for all dates
+    in one vectorized pass, and the plume polygons are cached per date,
+    threshold and smoothing, such that stepping through the dates only extracts
+    the contours of dates not seen before.
+
+    The caches hold futures, and the stacks, counts and polygons are computed
+    outside the lock, such that loading the surfaces of one attribute does not
+    block requests that are served from the caches. Concurrent requests for the
+    same entry wait for the same computation.
+    """
+
+    def __init__(
+        self,
+        surface_provider: EnsembleSurfaceProvider,
+        max_cached_stacks: int = 2,
+        max_cached_counts: int = 8,
+        max_cached_polygons: int = 256,
+    ) -> None:
+        self._provider = surface_provider
+        self._caches: Dict[str, "OrderedDict[Hashable, Future]"] = {
+            "stacks": OrderedDict(),
+            "counts": OrderedDict(),
+            "polygons": OrderedDict(),
+        }
+        self._max_cached = {
+            "stacks": max_cached_stacks,
+            "counts": max_cached_counts,
+            "polygons": max_cached_polygons,
+        }
+        self._lock = threading.Lock()
+
+    # pylint: disable=too-many-arguments
+    def plume_count(
+        self,
+        surface_name: str,
+        attribute: str,
+        realizations: List[int],
+        datestr: Optional[str],
+        threshold: float,
+        smoothing: float,
+    ) -> Optional[Tuple[np.ndarray, int, xtgeo.RegularSurface]]:
+        """Returns the smoothed number of realizations exceeding the threshold at
+        the date, the number of realizations with a surface at the date, and a
+        surface with the geometry of the plume count. None if there are no
+        surfaces at the date."""
+        stack_key = (surface_name, attribute, tuple(realizations))
+        stack: Optional[_SurfaceStack] = self._get_or_compute(
+            "stacks", stack_key, lambda: self._load_stack(*stack_key)
+        )
+        if stack is None or datestr not in stack.dates:
+            return None
+        date_idx = stack.dates.index(datestr)
+        if stack.num_surfaces[date_idx] == 0:
+            return None
+        counts: np.ndarray = self._get_or_compute(
+            "counts",
+            (stack_key, threshold, smoothing),
+            lambda: _smoothed_exceedance_counts(stack.values, threshold, smoothing),
+        )
+        return counts[date_idx], int(stack.num_surfaces[date_idx]), stack.template
+
+    # pylint: disable=too-many-arguments
+    def plume_polygons(
+        self,
+        surface_name: str,
+        attribute: str,
+        realizations: List[int],
+        datestr: Optional[str],
+        threshold: float,
+        smoothing: float = 10.0,
+        simplify_factor: float = 1.2,
+    ) -> Optional[geojson.FeatureCollection]:
+        """Plume polygons at the date, as in `plume_polygons()`. None if there are
+        no surfaces at the date."""
+        if MISSING_DEPENDENCIES:
+            return geojson.FeatureCollection(features=[])
+        key = (
+            surface_name,
+            attribute,
+            tuple(realizations),
+            datestr,
+            threshold,
+            smoothing,
+            simplify_factor,
+        )
+        return self._get_or_compute(
+            "polygons",
+            key,
+            lambda: self._create_polygons(
+                surface_name,
+                attribute,
+                realizations,
+                datestr,
+                threshold,
+                smoothing,
+                simplify_factor,
+            ),
+        )
+
+    # pylint: disable=too-many-arguments
+    def _create_polygons(
+        self,
+        surface_name: str,
+        attribute: str,
+        realizations: List[int],
+        datestr: Optional[str],
+        threshold: float,
+        smoothing: float,
+        simplify_factor: float,
+    ) -> Optional[geojson.FeatureCollection]:
+        plume_count = self.plume_count(
+            surface_name, attribute, realizations, datestr, threshold, smoothing
+        )
+        if plume_count is None:
+            return None
+        count, num_surfaces, template = plume_count
+        return _plume_count_to_polygons(count, num_surfaces, template, simplify_factor)
+
+    def _get_or_compute(
+        self, cache_name: str, key: Hashable, compute: Callable[[], Any]
+    ) -> Any:
+        """Returns the cached value, computing it if it is not cached. Only the
+        cache bookkeeping is done while holding the lock."""
+        cache = self._caches[cache_name]
+        with self._lock:
+            future = cache.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                _lru_put(cache, key, future, self._max_cached[cache_name])
+            else:
+                cache.move_to_end(key)
+
+        if is_owner:
+            try:
+                future.set_result(compute())
+            except BaseException as exc:
+                # Not cached, such that the next request tries again
+                with self._lock:
+                    if cache.get(key) is future:
+                        del cache[key]
+                future.set_exception(exc)
+                raise
+        return future.result()
+
+    def _load_stack(
+        self, surface_name: str, attribute: str, realizations: Tuple[int, ...]
+    ) -> Optional[_SurfaceStack]:
+        timer = PerfTimer()
+        dates: List[Optional[str]] = list(
+            self._provider.surface_dates_for_attribute(attribute) or [None]
+        )
+        values: Optional[np.ndarray] = None
+        template: Optional[xtgeo.RegularSurface] = None
+        num_surfaces = np.zeros(len(dates), dtype=np.int64)
+        for date_idx, datestr in enumerate(dates):
+            for real_idx, real in enumerate(realizations):
+                surface = self._provider.get_surface(
+                    SimulatedSurfaceAddress(
+                        attribute=attribute,
+                        name=surface_name,
+                        datestr=datestr,
+                        realization=real,
+                    )
+                )
+                if surface is None:
+                    continue
+                if values is None:
+                    values = np.zeros(
+                        (len(dates), len(realizations), surface.ncol, surface.nrow),
+                        dtype=np.float32,
+                    )
+                    template = surface.copy()
+                values[date_idx, real_idx] = _defined_values(surface)
+                num_surfaces[date_idx] += 1
+        if values is None or template is None:
+            return None
+        LOGGER.debug(
+            f"Loaded {int(num_surfaces.sum())} surfaces of {surface_name}/{attribute} "
+            f"for {len(dates)} dates in {timer.elapsed_s():.2f}s"
+        )
+        return _SurfaceStack(dates, values, num_surfaces, template)
+
+
+@fingerprint_memoize(maxsize=16, copy_result=False)
+def get_plume_extent_engine(
+    surface_provider: EnsembleSurfaceProvider,
+) -> PlumeExtentEngine:
+    return PlumeExtentEngine(surface_provider)
+
+
+def _defined_values(surface: xtgeo.RegularSurface) -> np.ndarray:
+    return np.where(
+        np.isnan(surface.values) | np.ma.getmaskarray(surface.values),
+        0.0,
+        surface.values,
+    )
+
+
+def _smoothed_exceedance_counts(
+    values: np.ndarray, threshold: float, smoothing: float
+) -> np.ndarray:
+    """Smoothed number of realizations exceeding the threshold, per (date,
+    column, row), for values per (date, realization, column, row)"""
+    count = (values > threshold).sum(axis=1).astype(float)
+    return scipy.ndimage.gaussian_filter(
+        count, sigma=(0, smoothing, smoothing), mode="nearest"
+    )
+
+
+def _plume_count_to_polygons(
+    plume_count: np.ndarray,
+    num_surfaces: int,
+    ref_surface: xtgeo.RegularSurface,
+    simplify_factor: float,
+) -> geojson.FeatureCollection:
     p_levels = [0.1]
-    if len(surfaces) > 2:
+    if num_surfaces > 2:
         p_levels.append(0.5)
-    if len(surfaces) > 1:
+    if num_surfaces > 1:
         p_levels.append(0.9)
-    levels = [lvl * len(surfaces) for lvl in p_levels]
-    contours = _extract_contours(plume_count, surfaces[0], simplify_factor, levels)
+    levels = [lvl * num_surfaces for lvl in p_levels]
+    contours = _extract_contours(plume_count, ref_surface, simplify_factor, levels)
     return geojson.FeatureCollection(
         features=[
             geojson.Feature(
@@ -46,17 +316,13 @@ def plume_polygons(
     )
 
 
-def truncate_surfaces(
-    surfaces: List[xtgeo.RegularSurface], threshold: float, smoothing: float
-) -> np.ndarray:
-    binary = [
-        (
-            np.where(np.isnan(s.values) | s.values.mask, 0.0, s.values) > threshold
-        ).astype(float)
-        for s in surfaces
-    ]
-    count = sum(binary)
-    return scipy.ndimage.gaussian_filter(count, sigma=smoothing, mode="nearest")
+def _lru_put(
+    cache: "OrderedDict[Hashable, T]", key: Hashable, value: T, maxsize: int
+) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
 
 
 def _extract_contours(
@@ -6,7 +6,6 @@ import xtgeo
 from webviz_subsurface._providers import (
     EnsembleSurfaceProvider,
     QualifiedSurfaceAddress,
-    SimulatedSurfaceAddress,
     StatisticalSurfaceAddress,
     SurfaceAddress,
     SurfaceMeta,
@@ -16,7 +15,7 @@ from webviz_subsurface._providers.ensemble_surface_provider.ensemble_surface_pro
     SurfaceStatistic,
 )
 from webviz_subsurface.plugins._co2_leakage._utilities.plume_extent import (
-    truncate_surfaces,
+    get_plume_extent_engine,
 )
 
 
@@ -87,22 +86,18 @@ def _generate_surface(
     provider: EnsembleSurfaceProvider,
     address: TruncatedSurfaceAddress,
 ) -> Optional[xtgeo.RegularSurface]:
-    surfaces = [
-        provider.get_surface(
-            SimulatedSurfaceAddress(
-                attribute=address.basis_attribute,
-                name=address.name,
-                datestr=address.datestr,
-                realization=r,
-            )
-        )
-        for r in address.realizations
-    ]
-    surfaces = [s for s in surfaces if s is not None]
-    if len(surfaces) == 0:
+    plume_count = get_plume_extent_engine(provider).plume_count(
+        address.name,
+        address.basis_attribute,
+        address.realizations,
+        address.datestr,
+        address.threshold,
+        address.smoothing,
+    )
+    if plume_count is None:
         return None
-    plume_count = truncate_surfaces(surfaces, address.threshold, address.smoothing)
-    template: xtgeo.RegularSurface = surfaces[0].copy()  # type: ignore
-    template.values = plume_count
-    template.values.mask = plume_count < 1e-4  # type: ignore
-    return template
+    count, _, template = plume_count
+    surface: xtgeo.RegularSurface = template.copy()  # type: ignore
+    surface.values = count
+    surface.values.mask = count < 1e-4  # type: ignore
+    return surface
@@ -14,6 +14,7 @@ from webviz_config.webviz_store import webvizstore
 from .._abbreviations.number_formatting import table_statistics_base
 from .._abbreviations.volume_terminology import volume_description, volume_unit
 from .._datainput.inplace_volumes import extract_volumes
+from .._utils.fingerprint_memoize import fingerprint_memoize
 
 
 @deprecated_plugin(
@@ -507,7 +508,7 @@ but the following responses are given more descriptive names automatically:
                 return False, selectors[0], 1
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def plot_data(
     plot_type: str, dframe: pd.DataFrame, response: str, name: str
 ) -> Union[dict, None]:
@@ -528,7 +529,7 @@ def plot_data(
     return output
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def plot_table(dframe: pd.DataFrame, response: str, name: str) -> Union[dict, None]:
     values = dframe[response]
 
@@ -589,7 +590,7 @@ def plot_layout(plot_type: str, response: str, theme: dict) -> dict:
     return layout
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def filter_dataframe(
     dframe: pd.DataFrame,
     columns: Union[str, List[str]],
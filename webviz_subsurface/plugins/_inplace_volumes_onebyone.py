@@ -19,6 +19,7 @@ from .._abbreviations.number_formatting import table_statistics_base
 from .._abbreviations.volume_terminology import volume_description, volume_unit
 from .._datainput.fmu_input import find_sens_type, get_realizations
 from .._datainput.inplace_volumes import extract_volumes
+from .._utils.fingerprint_memoize import fingerprint_memoize
 
 
 @deprecated_plugin(
@@ -715,7 +716,7 @@ def calculate_table(df: pd.DataFrame, response: str) -> Tuple[List[dict], List[d
     return table, columns
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def filter_dataframe(
     dframe: pd.DataFrame,
     columns: Union[str, List[str]],
@@ -4,10 +4,10 @@ import numpy as np
 import pandas as pd
 from dash import Dash, Input, Output, State, no_update
 from dash.exceptions import PreventUpdate
-from webviz_config.common_cache import CACHE
 
 from webviz_subsurface._models import ObservationModel
 from webviz_subsurface._providers import EnsembleTableProvider
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
 
 from ..figures.plotly_line_plot import PlotlyLinePlot
 
@@ -238,7 +238,7 @@ def build_figure(
         )
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def calc_series_statistics(
     df: pd.DataFrame, vectors: list, refaxis: str = "DATE"
 ) -> pd.DataFrame:
@@ -272,7 +272,7 @@ def calc_series_statistics(
     return stat_df
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def get_table_data(
     tableproviders: Dict[str, EnsembleTableProvider],
     ensemble_names: List,
@@ -0,0 +1,136 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from typing import List, Sequence, Tuple, TypeVar
+
+from webviz_subsurface._providers import (
+    EnsembleSurfaceProvider,
+    QualifiedSurfaceAddress,
+    SimulatedSurfaceAddress,
+    StatisticalSurfaceAddress,
+    SurfaceAddress,
+    SurfaceServer,
+)
+from webviz_subsurface._providers.ensemble_surface_provider.ensemble_surface_provider import (
+    SurfaceStatistic,
+)
+from webviz_subsurface._utils.perf_timer import PerfTimer
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SurfacePrefetcher:
+    """Publishes surfaces to the SurfaceServer in background threads, such that
+    surfaces the user is likely to select next are served from the cache.
+
+    Each call to `prefetch()` replaces the queued surfaces: surfaces that have
+    not been started on are cancelled, and at most `max_queued` new surfaces
+    are queued. Surfaces that are already being published are completed, as
+    they are likely to be requested soon anyway.
+    """
+
+    def __init__(
+        self, surface_server: SurfaceServer, max_workers: int = 2, max_queued: int = 8
+    ) -> None:
+        self._surface_server = surface_server
+        self._max_queued = max_queued
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="surface_prefetch"
+        )
+        self._futures: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prefetch(
+        self, requests: Sequence[Tuple[EnsembleSurfaceProvider, SurfaceAddress]]
+    ) -> None:
+        """Queue the surfaces for publishing, most likely first"""
+        with self._lock:
+            for key, future in list(self._futures.items()):
+                if future.cancel() or future.done():
+                    del self._futures[key]
+
+            num_queued = 0
+            for provider, address in requests:
+                if num_queued >= self._max_queued:
+                    break
+                qualified_address = QualifiedSurfaceAddress(
+                    provider.provider_id(), address
+                )
+                key = self._surface_server.encode_partial_url(qualified_address)
+                if key in self._futures:
+                    continue
+                self._futures[key] = self._executor.submit(
+                    self._publish, provider, qualified_address
+                )
+                num_queued += 1
+
+    def wait_for(self, qualified_address: QualifiedSurfaceAddress) -> None:
+        """Wait for the surface if it is being published in the background, or
+        cancel it if it is queued, such that the caller can publish the surface
+        without publishing it twice"""
+        key = self._surface_server.encode_partial_url(qualified_address)
+        with self._lock:
+            future = self._futures.pop(key, None)
+        if future is not None and not future.cancel():
+            future.result()
+
+    def _publish(
+        self,
+        provider: EnsembleSurfaceProvider,
+        qualified_address: QualifiedSurfaceAddress,
+    ) -> None:
+        # Prefetching is speculative, so failures are logged and otherwise ignored
+        # pylint: disable=broad-except
+        try:
+            if self._surface_server.get_surface_metadata(qualified_address):
+                return
+            timer = PerfTimer()
+            surface = provider.get_surface(address=qualified_address.address)
+            if surface is None:
+                return
+            self._surface_server.publish_surface(qualified_address, surface)
+            LOGGER.debug(
+                f"Prefetched surface in {timer.elapsed_s():.2f}s "
+                f"[{qualified_address.address}]"
+            )
+        except Exception as exc:
+            LOGGER.warning(f"Could not prefetch {qualified_address.address}: {exc}")
+
+
+def neighbor_surface_addresses(
+    provider: EnsembleSurfaceProvider, address: SurfaceAddress
+) -> List[SurfaceAddress]:
+    """Returns the surfaces the user is likely to step to from the surface: the
+    next and previous realization (for simulated surfaces) or statistic (for
+    statistical surfaces), and the next and previous date"""
+    neighbors: List[SurfaceAddress] = []
+    if isinstance(address, SimulatedSurfaceAddress):
+        neighbors.extend(
+            replace(address, realization=real)
+            for real in _adjacent(sorted(provider.realizations()), address.realization)
+        )
+    if isinstance(address, StatisticalSurfaceAddress):
+        neighbors.extend(
+            replace(address, statistic=statistic)
+            for statistic in _adjacent(
+                list(SurfaceStatistic), SurfaceStatistic(address.statistic)
+            )
+        )
+    if address.datestr is not None:
+        dates = sorted(provider.surface_dates_for_attribute(address.attribute) or [])
+        neighbors.extend(
+            replace(address, datestr=date) for date in _adjacent(dates, address.datestr)
+        )
+    return neighbors
+
+
+def _adjacent(values: List[T], value: T) -> List[T]:
+    """The next and the previous value in the list, if any"""
+    if value not in values:
+        return []
+    idx = values.index(value)
+    return [values[i] for i in (idx + 1, idx - 1) if 0 <= i < len(values)]
@@ -24,9 +24,11 @@ from webviz_subsurface._providers import (
     StatisticalSurfaceAddress,
     SurfaceAddress,
     SurfaceServer,
+    compute_diff_surface,
 )
 
 from ._layer_model import DeckGLMapLayersModel
+from ._surface_prefetcher import SurfacePrefetcher, neighbor_surface_addresses
 from ._tmp_well_pick_provider import WellPickProvider
 from ._types import SurfaceMode
 from .layout import (
@@ -44,6 +46,7 @@ def plugin_callbacks(
     get_uuid: Callable,
     ensemble_surface_providers: Dict[str, EnsembleSurfaceProvider],
     surface_server: SurfaceServer,
+    surface_prefetcher: Optional[SurfacePrefetcher],
     ensemble_fault_polygons_providers: Dict[str, EnsembleFaultPolygonsProvider],
     fault_polygons_server: FaultPolygonsServer,
     map_surface_names_to_fault_polygons: Dict[str, str],
@@ -433,6 +436,10 @@ def plugin_callbacks(
                         )
                     },
                 )
+
+        if surface_prefetcher is not None:
+            surface_prefetcher.prefetch(get_neighbor_surfaces(surface_elements))
+
         return (
             layer_model.layers,
             viewport_bounds if surface_elements else no_update,
@@ -785,6 +792,8 @@ def plugin_callbacks(
     ) -> Tuple:
         provider_id: str = surface_provider.provider_id()
         qualified_address = QualifiedSurfaceAddress(provider_id, surface_address)
+        if surface_prefetcher is not None:
+            surface_prefetcher.wait_for(qualified_address)
         surf_meta = surface_server.get_surface_metadata(qualified_address)
         if not surf_meta:
             # This means we need to compute the surface
@@ -814,12 +823,33 @@ def plugin_callbacks(
         if not surf_meta:
             surface_a = surface_provider.get_surface(address=surface_address)
             surface_b = sub_surface_provider.get_surface(address=sub_surface_address)
-            if surface_a is not None and surface_b is not None:
-                surface = surface_a - surface_b
+            if surface_a is None or surface_b is None:
+                raise ValueError(
+                    f"Could not get surfaces for addresses: {surface_address}, "
+                    f"{sub_surface_address}"
+                )
+            surface = compute_diff_surface(surface_a, surface_b)
             surface_server.publish_surface(qualified_address, surface)
             surf_meta = surface_server.get_surface_metadata(qualified_address)
         return surf_meta, surface_server.encode_partial_url(qualified_address)
 
+    def get_neighbor_surfaces(
+        surface_elements: List[dict],
+    ) -> List[Tuple[EnsembleSurfaceProvider, SurfaceAddress]]:
+        """Surfaces the user is likely to step to from the shown surfaces"""
+        neighbors = []
+        for data in surface_elements:
+            if data.get("surf_type") == "diff":
+                continue
+            provider = ensemble_surface_providers[data["ensemble"][0]]
+            neighbors.extend(
+                (provider, address)
+                for address in neighbor_surface_addresses(
+                    provider, get_surface_address_from_data(data)
+                )
+            )
+        return neighbors
+
     def get_surface_id_from_data(data: dict) -> str:
         """Retrieve surfaceid used for the colorstore"""
         surfaceid = data["attribute"][0] + data["name"][0]
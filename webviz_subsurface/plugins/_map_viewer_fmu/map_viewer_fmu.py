@@ -1,3 +1,4 @@
+import functools
 import json
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
@@ -8,6 +9,7 @@ from webviz_config import WebvizPluginABC, WebvizSettings
 from webviz_subsurface._providers import (
     EnsembleFaultPolygonsProviderFactory,
     EnsembleSurfaceProviderFactory,
+    ProviderBuildExecutor,
 )
 from webviz_subsurface._providers.ensemble_fault_polygons_provider.fault_polygons_server import (
     FaultPolygonsServer,
@@ -17,6 +19,7 @@ from webviz_subsurface._providers.ensemble_surface_provider.surface_server impor
 )
 from webviz_subsurface._utils.webvizstore_functions import read_csv
 
+from ._surface_prefetcher import SurfacePrefetcher
 from ._tmp_well_pick_provider import WellPickProvider
 from .callbacks import plugin_callbacks
 from .color_tables import default_color_tables
@@ -42,6 +45,9 @@ A dashboard to covisualize arbitrary surfaces generated by FMU.
     to the relevant fault polygon set name
 * **`color_tables`:** Color tables for the map layers
 * **`hillshading_enabled`:** Flag to set initial hillshading on or off
+* **`prefetch_surfaces`:** Flag to publish the surfaces next to the shown ones (next and \
+    previous realization, statistic and date) in the background, such that stepping \
+    through them is faster
 
 ---
 The available maps are gathered from the `share/results/maps/` folder
@@ -93,6 +99,7 @@ color-tables.json for color_tables format.
         rel_surface_folder: str = "share/results/maps",
         color_tables: Path = None,
         hillshading_enabled: bool = True,
+        prefetch_surfaces: bool = True,
     ):
 
         super().__init__()
@@ -102,15 +109,21 @@ color-tables.json for color_tables format.
             EnsembleFaultPolygonsProviderFactory.instance()
         )
 
-        self._ensemble_surface_providers = {
-            ens: surface_provider_factory.create_from_ensemble_surface_files(
-                webviz_settings.shared_settings["scratch_ensembles"][ens],
-                attribute_filter=attributes,
-                rel_surface_folder=rel_surface_folder,
-            )
-            for ens in ensembles
-        }
+        self._ensemble_surface_providers = ProviderBuildExecutor.instance().build_all(
+            {
+                ens: functools.partial(
+                    surface_provider_factory.create_from_ensemble_surface_files,
+                    webviz_settings.shared_settings["scratch_ensembles"][ens],
+                    attribute_filter=attributes,
+                    rel_surface_folder=rel_surface_folder,
+                )
+                for ens in ensembles
+            }
+        )
         self._surface_server = SurfaceServer.instance(app)
+        self._surface_prefetcher = (
+            SurfacePrefetcher(self._surface_server) if prefetch_surfaces else None
+        )
 
         self.well_pick_provider = None
         self.well_pick_file = well_pick_file
@@ -124,12 +137,15 @@ color-tables.json for color_tables format.
                 self.well_pick_provider.well_names(), "TopVolantis"
             )
 
-        self._ensemble_fault_polygons_providers = {
-            ens: fault_polygons_provider_factory.create_from_ensemble_fault_polygons_files(
-                webviz_settings.shared_settings["scratch_ensembles"][ens]
-            )
-            for ens in ensembles
-        }
+        self._ensemble_fault_polygons_providers = ProviderBuildExecutor.instance().build_all(
+            {
+                ens: functools.partial(
+                    fault_polygons_provider_factory.create_from_ensemble_fault_polygons_files,
+                    webviz_settings.shared_settings["scratch_ensembles"][ens],
+                )
+                for ens in ensembles
+            }
+        )
         all_fault_polygon_attributes = self._ensemble_fault_polygons_providers[
             ensembles[0]
         ].attributes()
@@ -182,6 +198,7 @@ color-tables.json for color_tables format.
             get_uuid=self.uuid,
             ensemble_surface_providers=self._ensemble_surface_providers,
             surface_server=self._surface_server,
+            surface_prefetcher=self._surface_prefetcher,
             ensemble_fault_polygons_providers=self._ensemble_fault_polygons_providers,
             fault_polygon_attribute=self.fault_polygon_attribute,
             fault_polygons_server=self._fault_polygons_server,
@@ -7,16 +7,14 @@ from dash.exceptions import PreventUpdate
 
 from webviz_subsurface._figures import BarChart, ScatterPlot, TimeSeriesFigure
 from webviz_subsurface._utils.colors import hex_to_rgba_str, rgba_to_hex
-from webviz_subsurface._utils.dataframe_utils import (
-    correlate_response_with_dataframe,
-    merge_dataframes_on_realization,
-)
+from webviz_subsurface._utils.dataframe_utils import merge_dataframes_on_realization
 
 from .._utils import datetime_utils
 from ..models import (
     ParametersModel,
     ProviderTimeSeriesDataModel,
     SimulationTimeSeriesModel,
+    VectorParameterCorrelations,
 )
 
 
@@ -27,6 +25,8 @@ def parameter_response_controller(
     vectormodel: Union[SimulationTimeSeriesModel, ProviderTimeSeriesDataModel],
     parametermodel: ParametersModel,
 ):
+    correlations = VectorParameterCorrelations()
+
     @app.callback(
         Output(get_uuid("vector-vs-time-graph"), "figure"),
         Output(get_uuid("vector-vs-param-scatter"), "figure"),
@@ -87,13 +87,20 @@ def parameter_response_controller(
             return [empty_figure("Selected vector does not exist for ensemble")] * 4
 
         param_df = parametermodel.get_parameter_df_for_ensemble(ensemble, realizations)
-        merged_df = merge_dataframes_on_realization(
-            dframe1=vector_df[vector_df["DATE"] == date], dframe2=param_df
+        corr_args = dict(
+            ensemble=ensemble,
+            date=date,
+            parameters=parametermodel.parameters,
+            vector_df=vector_df,
+            param_df=param_df,
+            method="spearman" if options.get("rank_corr") else "pearson",
         )
+
         # Make correlation figure for vector
         if options["autocompute_corr"]:
             corr_v_fig = make_correlation_figure(
-                merged_df, response=vector, corrwith=parametermodel.parameters
+                correlations.vector_correlations(vector=vector, **corr_args),
+                response=vector,
             ).figure
 
         # Get clicked parameter correlation bar or largest bar initially
@@ -113,11 +120,18 @@ def parameter_response_controller(
             # Make correlation figure for parameter
             if options["autocompute_corr"]:
                 corr_p_fig = make_correlation_figure(
-                    merged_df, response=parameter, corrwith=vectors
+                    correlations.parameter_correlations(
+                        parameter=parameter, vectors=vectors, **corr_args
+                    ),
+                    response=parameter,
                 ).figure
 
             corr_p_fig = color_corr_bars(corr_p_fig, vector, color, options["opacity"])
 
+        merged_df = merge_dataframes_on_realization(
+            dframe1=vector_df[vector_df["DATE"] == date], dframe2=param_df
+        )
+
         # Create scatter plot of vector vs parameter
         scatter_fig = ScatterPlot(
             merged_df,
@@ -224,6 +238,7 @@ def parameter_response_controller(
         return dict(
             show_dateline="DateLine" in checkbox_options,
             autocompute_corr="AutoCompute" in checkbox_options,
+            rank_corr="RankCorr" in checkbox_options,
             color=None if color_clickdata is None else color,
             opacity=opacity,
             ctx=ctx,
@@ -291,9 +306,8 @@ def parameter_response_controller(
         raise PreventUpdate
 
 
-def make_correlation_figure(df: pd.DataFrame, response: str, corrwith: list):
+def make_correlation_figure(corrseries: pd.Series, response: str):
     """Create a bar plot with correlations for chosen response"""
-    corrseries = correlate_response_with_dataframe(df, response, corrwith)
     return BarChart(
         corrseries, n_rows=15, title=f"Correlations with {response}", orientation="h"
     )
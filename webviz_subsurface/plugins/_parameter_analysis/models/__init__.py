@@ -1,3 +1,4 @@
 from .ensemble_timeseries_datamodel import ProviderTimeSeriesDataModel
 from .parameters_model import ParametersModel
 from .simulation_timeseries_model import SimulationTimeSeriesModel
+from .vector_parameter_correlations import VectorParameterCorrelations
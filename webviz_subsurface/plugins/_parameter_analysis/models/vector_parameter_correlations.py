@@ -0,0 +1,185 @@
+import datetime
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from webviz_subsurface._utils.dataframe_utils import correlation_matrix
+
+
+@dataclass
+class _DateCorrelations:
+    # Correlations between the non-constant vectors (index) and parameters (columns)
+    corr: Optional[pd.DataFrame] = None
+    # All vectors that have been correlated, including the constant ones
+    vectors: Set[str] = field(default_factory=set)
+    nbytes: int = 0
+    # Held while computing correlations for the entry
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class VectorParameterCorrelations:
+    """Correlations between vectors and parameters per ensemble and date.
+
+    The correlations of all requested vectors with all parameters at a date are
+    computed as one matrix product (see `correlation_matrix`), and cached per
+    ensemble, realization selection, date and correlation method. Vectors that
+    are not already correlated at a date are added to the cached matrix when
+    requested, such that changing date, vector or parameter is served from the
+    cache.
+
+    The cache is shared by all sessions, and is bounded both by the number of
+    dates and by the total size of the matrices. Correlations are computed
+    while holding a lock for the date only, such that computing a date does not
+    block requests for other dates.
+
+    As with `correlate_response_with_dataframe`, constant vectors and parameters
+    are left out of the correlations.
+    """
+
+    def __init__(
+        self, max_cached_dates: int = 32, max_cached_bytes: int = 64 * 2**20
+    ) -> None:
+        self._max_cached_dates = max_cached_dates
+        self._max_cached_bytes = max_cached_bytes
+        self._cache: "OrderedDict[Tuple, _DateCorrelations]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    # pylint: disable=too-many-arguments
+    def get_correlations(
+        self,
+        ensemble: str,
+        date: datetime.datetime,
+        vectors: List[str],
+        parameters: List[str],
+        vector_df: pd.DataFrame,
+        param_df: pd.DataFrame,
+        method: str = "pearson",
+    ) -> pd.DataFrame:
+        """Returns the correlations between the non-constant vectors (index) and
+        the non-constant parameters (columns) at the date.
+
+        `vector_df` has DATE, REAL and the vectors, and `param_df` has REAL and
+        the parameters, for the selected realizations of the ensemble.
+        """
+        realizations = tuple(sorted(vector_df["REAL"].unique()))
+        key = (ensemble, realizations, date, method, tuple(sorted(parameters)))
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                entry = self._cache[key] = _DateCorrelations()
+            self._cache.move_to_end(key)
+            self._prune(keep_key=key)
+
+        with entry.lock:
+            missing_vectors = [vec for vec in vectors if vec not in entry.vectors]
+            if missing_vectors:
+                corr = _correlate_at_date(
+                    date, missing_vectors, parameters, vector_df, param_df, method
+                )
+                entry.corr = (
+                    corr if entry.corr is None else pd.concat([entry.corr, corr])
+                )
+                entry.vectors.update(missing_vectors)
+                self._update_size(key, entry)
+
+            if entry.corr is None:
+                return pd.DataFrame()
+            return entry.corr.loc[[vec for vec in vectors if vec in entry.corr.index]]
+
+    def _update_size(self, key: Tuple, entry: _DateCorrelations) -> None:
+        nbytes = 0 if entry.corr is None else int(entry.corr.memory_usage().sum())
+        with self._lock:
+            if self._cache.get(key) is entry:
+                self._cached_bytes += nbytes - entry.nbytes
+            entry.nbytes = nbytes
+            self._prune(keep_key=key)
+
+    def _prune(self, keep_key: Tuple) -> None:
+        """Discards the least recently used entries while the cache is too large.
+        The entry being requested is kept, even if it is too large on its own.
+        Must be called while holding the lock."""
+        while len(self._cache) > 1 and (
+            len(self._cache) > self._max_cached_dates
+            or self._cached_bytes > self._max_cached_bytes
+        ):
+            oldest_key = next(key for key in self._cache if key != keep_key)
+            self._cached_bytes -= self._cache.pop(oldest_key).nbytes
+
+    # pylint: disable=too-many-arguments
+    def vector_correlations(
+        self,
+        ensemble: str,
+        date: datetime.datetime,
+        vector: str,
+        parameters: List[str],
+        vector_df: pd.DataFrame,
+        param_df: pd.DataFrame,
+        method: str = "pearson",
+    ) -> pd.Series:
+        """Correlations of a vector with the parameters, sorted on absolute value"""
+        corr = self.get_correlations(
+            ensemble, date, [vector], parameters, vector_df, param_df, method
+        )
+        series = (
+            corr.loc[vector]
+            if vector in corr.index
+            else pd.Series(np.nan, index=corr.columns, name=vector)
+        )
+        return _sort_on_abs(series)
+
+    # pylint: disable=too-many-arguments
+    def parameter_correlations(
+        self,
+        ensemble: str,
+        date: datetime.datetime,
+        parameter: str,
+        vectors: List[str],
+        parameters: List[str],
+        vector_df: pd.DataFrame,
+        param_df: pd.DataFrame,
+        method: str = "pearson",
+    ) -> pd.Series:
+        """Correlations of a parameter with the vectors, sorted on absolute value"""
+        corr = self.get_correlations(
+            ensemble, date, vectors, parameters, vector_df, param_df, method
+        )
+        series = (
+            corr[parameter]
+            if parameter in corr.columns
+            else pd.Series(np.nan, index=corr.index, name=parameter)
+        )
+        return _sort_on_abs(series)
+
+
+def _correlate_at_date(
+    date: datetime.datetime,
+    vectors: List[str],
+    parameters: List[str],
+    vector_df: pd.DataFrame,
+    param_df: pd.DataFrame,
+    method: str,
+) -> pd.DataFrame:
+    vectors = [vec for vec in vectors if vec in vector_df.columns]
+    parameters = [param for param in parameters if param in param_df.columns]
+    merged_df = (
+        vector_df.loc[vector_df["DATE"] == date, ["REAL"] + vectors]
+        .set_index("REAL")
+        .join(param_df[["REAL"] + parameters].set_index("REAL"))
+    )
+    vector_values = merged_df[vectors]
+    param_values = merged_df[parameters]
+    return correlation_matrix(
+        vector_values.loc[:, vector_values.nunique() > 1],
+        param_values.loc[:, param_values.nunique() > 1],
+        method=method,
+    )
+
+
+def _sort_on_abs(series: pd.Series) -> pd.Series:
+    return series.reindex(series.abs().sort_values().index)
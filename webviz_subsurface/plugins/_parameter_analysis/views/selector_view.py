@@ -88,6 +88,7 @@ def plot_options(get_uuid: Callable, tab: str) -> html.Div:
                 options=[
                     {"label": "Dateline visible", "value": "DateLine"},
                     {"label": "Auto compute correlations", "value": "AutoCompute"},
+                    {"label": "Rank (Spearman) correlations", "value": "RankCorr"},
                 ],
                 value=["DateLine", "AutoCompute"],
             ),
@@ -45,6 +45,7 @@ from .._utils.fanchart_plotting import (
     MinMaxData,
     get_fanchart_traces,
 )
+from .._utils.fingerprint_memoize import fingerprint_memoize
 from .._utils.simulation_timeseries import (
     add_statistics_traces,
     calc_series_statistics,
@@ -1284,7 +1285,7 @@ folder, to avoid risk of not extracting the right data.
 
 
 # pylint: disable = too-many-arguments
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def calculate_vector_dataframes(
     smry: pd.DataFrame,
     smry_meta: Union[pd.DataFrame, None],
@@ -1314,7 +1315,7 @@ def calculate_vector_dataframes(
 
 
 # pylint: disable = too-many-arguments
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def calculate_vector_dataframe(
     smry: pd.DataFrame,
     smry_meta: Union[pd.DataFrame, None],
@@ -1410,7 +1411,7 @@ def calculate_delta(df: pd.DataFrame, base_ens: str, delta_ens: str) -> pd.DataF
     return dframe.dropna(axis=0, how="any")
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def add_histogram_traces(
     dframe: pd.DataFrame,
     vector: str,
@@ -1461,7 +1462,7 @@ def add_observation_trace(obs: dict) -> List[dict]:
     ]
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def add_realization_traces(
     dframe: pd.DataFrame, vector: str, colors: dict, line_shape: str, interval: str
 ) -> List[dict]:
@@ -1502,7 +1503,7 @@ def add_history_trace(dframe: pd.DataFrame, vector: str, line_shape: str) -> dic
     }
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def _get_fanchart_traces(
     stat_df: pd.DataFrame, vector: str, colors: dict, line_shape: str, interval: str
 ) -> list:
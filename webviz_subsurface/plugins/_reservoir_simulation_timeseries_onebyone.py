@@ -26,6 +26,7 @@ from .._abbreviations.reservoir_simulation import (
     simulation_vector_description,
 )
 from .._datainput.fmu_input import find_sens_type, get_realizations
+from .._utils.fingerprint_memoize import fingerprint_memoize
 from .._utils.simulation_timeseries import (
     get_simulation_line_shape,
     set_simulation_line_shape_fallback,
@@ -621,7 +622,7 @@ folder, to avoid risk of not extracting the right data.
             return figure
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def calculate_table(df: pd.DataFrame, vector: str) -> Tuple[List[dict], List[dict]]:
     table = []
     for (sensname, senscase), dframe in df.groupby(["SENSNAME", "SENSCASE"]):
@@ -670,6 +671,6 @@ def read_csv(csv_file: Path) -> pd.DataFrame:
     return pd.read_csv(csv_file, index_col=None)
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def get_unit(smry_meta: Union[pd.DataFrame, None], vec: str) -> Union[str, None]:
     return None if smry_meta is None else simulation_unit_reformat(smry_meta.unit[vec])
@@ -23,7 +23,6 @@ from dash import (
 )
 from dash.exceptions import PreventUpdate
 from webviz_config import WebvizConfigTheme, WebvizPluginABC, WebvizSettings
-from webviz_config.common_cache import CACHE
 from webviz_config.webviz_store import webvizstore
 
 from webviz_subsurface._models import (
@@ -35,7 +34,6 @@ from .._abbreviations.number_formatting import table_statistics_base
 from .._abbreviations.reservoir_simulation import (
     historical_vector,
     simulation_region_vector_breakdown,
-    simulation_region_vector_recompose,
     simulation_unit_reformat,
     simulation_vector_base,
     simulation_vector_description,
@@ -47,6 +45,8 @@ from .._utils.fanchart_plotting import (
     MinMaxData,
     get_fanchart_traces,
 )
+from .._utils.fingerprint_memoize import fingerprint_memoize
+from .._utils.region_aggregation import RegionAggregator, calc_recovery
 from .._utils.simulation_timeseries import (
     get_simulation_line_shape,
     set_simulation_line_shape_fallback,
@@ -240,6 +240,10 @@ folder, to avoid risk of not extracting the right data.
         self.fip_arrays = list(
             {simulation_region_vector_breakdown(col)[1] for col in self.smry_cols}
         )
+        self.region_aggregators = {
+            fip: RegionAggregator(self.smry, self.smry_cols, fip, self.fipdesc)
+            for fip in self.fip_arrays
+        }
         self.set_callbacks(app)
 
     @property
@@ -662,14 +666,11 @@ folder, to avoid risk of not extracting the right data.
                 mode = "agg"
                 vector_base = vector
             try:
-                df, ref_vector = filter_and_aggregate_vectors(
-                    smry=self.smry,
+                df, ref_vector = self.region_aggregators[fip_array].aggregate(
                     ensembles=ensembles,
                     groupby=groupby,
                     vector=vector_base,
                     filters=filters,
-                    fipdesc=self.fipdesc,
-                    fip=fip_array,
                 )
             except KeyError as exception:
                 return [
@@ -837,7 +838,7 @@ folder, to avoid risk of not extracting the right data.
             return title
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def make_title(smry_meta: pd.DataFrame, ref_vector: str, vector: str, mode: str) -> str:
     return (
         f"{simulation_vector_description(vector).split(')')[0]})"
@@ -1062,114 +1063,8 @@ def render_table(
     )
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
-def filter_and_aggregate_vectors(
-    smry: pd.DataFrame,
-    ensembles: list,
-    groupby: str,
-    vector: str,
-    filters: dict,
-    fipdesc: pd.DataFrame,
-    fip: str,
-) -> Tuple[pd.DataFrame, str]:
-    """Aggregate inplace vectors based on filters
-    Note: ensemble is only in the list of inputs to reduce risk with caching
-          See: https://github.com/equinor/webviz-config/issues/211
-    Creating Eclipse format summary vectors from selection
-    """
-    if groupby != "ENSEMBLE" and len(ensembles) > 1:  # This should never happen
-        raise ValueError("Cannot have multiple ensembles unless you group by ensemble")
-    df = smry[smry["ENSEMBLE"].isin(ensembles)]
-    if fipdesc is None or fip not in fipdesc["FIP"].values:
-        if groupby == "ENSEMBLE":
-            nodes = filters
-        else:
-            nodes = {str(node): [node] for node in filters["regions"]}
-    else:
-        nodes = get_nodes(
-            groupby=groupby,
-            fipdesc=fipdesc,
-            fip=fip,
-            filters=filters,
-        )
-    subgroup_vectors = {
-        subgroup: [
-            simulation_region_vector_recompose(
-                vector_base_name=vector, fiparray=fip, node=node
-            )
-            for node in values
-        ]
-        for subgroup, values in nodes.items()
-    }
-    # Storing a full vector name that exists in the dataset to be used for metadata
-    ref_vector = ""
-    for _, vector_list in subgroup_vectors.items():
-        for vec in vector_list:
-            if vec in smry.columns:
-                ref_vector = vec
-                break
-        else:
-            continue
-        break
-
-    # Aggregate, concatenate and return.
-    return (
-        pd.concat(
-            [df[["ENSEMBLE", "REAL", "DATE"]]]
-            + [
-                df[vectors].sum(axis=1).to_frame(f"AGG_{vector}_filtered_on_{subgroup}")
-                for subgroup, vectors in subgroup_vectors.items()
-            ],
-            axis=1,
-        ),
-        ref_vector,
-    )
-
-
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
-def get_nodes(groupby: str, fipdesc: pd.DataFrame, fip: str, filters: dict) -> dict:
-    df = fipdesc[fipdesc["FIP"] == fip]
-    nodes: dict = {}
-    for node, dfn in df.groupby("NODE"):
-        node_inc = True
-        node_subgroups = []
-        for group, subgroups in filters.items():
-            if dfn[dfn["GROUP"] == group].empty or not all(
-                dfn[dfn["GROUP"] == group]["SUBGROUP"].isin(subgroups)
-            ):
-                node_inc = False
-                break
-            if group == groupby and groupby != "ENSEMBLE":
-                node_subgroups.extend(dfn[dfn["GROUP"] == group]["SUBGROUP"])
-        if node_inc:
-            if groupby == "ENSEMBLE":
-                if "ENSEMBLE" in nodes:
-                    nodes["ENSEMBLE"].append(node)
-                else:
-                    nodes["ENSEMBLE"] = [node]
-            elif len(node_subgroups) == 1:
-                if node_subgroups[0] in nodes:
-                    nodes[node_subgroups[0]].append(node)
-                else:
-                    nodes[node_subgroups[0]] = [node]
-            elif len(node_subgroups) > 1:
-                raise ValueError(
-                    f"This should not occur, likely to be a bug. Vector nr {node} matched several"
-                    f"{groupby} that your tried to group by."
-                    "Please report this at https://github.com/equinor/webviz-subsurface/issues"
-                )
-    return nodes
-
-
-# TODO(Sigurd) What is the correct return type of this function? numpy.ndarray?
-def calc_real_recovery(df: pd.DataFrame, agg_vectors: List[str]):  # type: ignore
-    first = df[agg_vectors].values[0]
-    with np.errstate(invalid="ignore"):
-        return (first - df[agg_vectors].values) / first
-
-
 # pylint: disable=too-many-arguments, too-many-locals, unused-argument
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def per_real_calculations(
     df: pd.DataFrame,
     ensembles: list,
@@ -1185,65 +1080,62 @@ def per_real_calculations(
     """All calls that are per realization are called here to avoid multiple loops:
     That includes calculation of recovery and making traces per realization.
     This method assumes that the DataFrame 'df' has already been processed with
-    the 'filter_and_aggregate_vectors' method.
+    the 'RegionAggregator.aggregate' method.
     """
     if groupby != "ENSEMBLE" and len(ensembles) > 1:  # This should never happen
         raise ValueError("Cannot have multiple ensembles unless you group by ensemble")
-    traces = []
-    ens_dfs = []
+    traces: List[dict] = []
     # Find aggregated vectors
     agg_vectors = df.columns[df.columns.str.contains("AGG_.*")]
     # Subgroups from aggregated vector names to be used for e.g. legend.
     groupby_names = [
         agg_vector.split("_filtered_on_")[-1] for agg_vector in agg_vectors
     ]
-    # Make recovery vector names if relevant
+    # Calculate recovery for all realizations at once, and store it for
+    # statistical graphs and tables
+    plot_vectors = list(agg_vectors)
     if mode == "rec":
         rec_vectors = ["REC" + vec[3:] for vec in agg_vectors]
+        rec_df = df[df["ENSEMBLE"].isin(rec_ensembles)]
+        if not rec_df.empty:
+            df = pd.concat(
+                [
+                    rec_df,
+                    pd.DataFrame(
+                        calc_recovery(rec_df, list(agg_vectors)),
+                        index=rec_df.index,
+                        columns=rec_vectors,
+                    ),
+                ],
+                axis=1,
+            )
+            df = df.sort_values("ENSEMBLE", kind="stable").reset_index(drop=True)
+        plot_vectors = rec_vectors
+    if visualization != "realizations":
+        return (traces, df)
+
     # Iterate over ensembles and realizations
     for ens, ens_df in df.groupby("ENSEMBLE"):
-        ens_rec = []
         if mode == "rec" and ens not in rec_ensembles:
             continue
         for real_no, (real, real_df) in enumerate(ens_df.groupby("REAL")):
-            if mode == "rec":
-                rec = calc_real_recovery(real_df, agg_vectors)
-                ens_rec.extend(rec)
-
-            if visualization == "realizations":
-                for i, vec in enumerate(agg_vectors):
-                    name = ens if groupby == "ENSEMBLE" else groupby_names[i]
-                    traces.append(
-                        {
-                            "x": real_df["DATE"],
-                            "y": rec[:, i] if mode == "rec" else real_df[vec],
-                            "hovertext": (
-                                f"{groupby.lower().capitalize()}: {name} "
-                                + f"Realization: {real}"
-                            ),
-                            "name": name,
-                            "legendgroup": name,
-                            "marker": {"color": groupby_colors[groupby][name]},
-                            "showlegend": real_no == 0,
-                            "line": {"shape": line_shape},
-                        }
-                    )
-        if mode == "rec":
-            # We want to store calculated recovery for statistical graphs and tables
-            ens_dfs.append(
-                pd.concat(
-                    [
-                        ens_df.reset_index(drop=True),
-                        pd.DataFrame(ens_rec, columns=rec_vectors).reset_index(
-                            drop=True
+            for i, vec in enumerate(plot_vectors):
+                name = ens if groupby == "ENSEMBLE" else groupby_names[i]
+                traces.append(
+                    {
+                        "x": real_df["DATE"],
+                        "y": real_df[vec],
+                        "hovertext": (
+                            f"{groupby.lower().capitalize()}: {name} "
+                            + f"Realization: {real}"
                         ),
-                    ],
-                    axis=1,
+                        "name": name,
+                        "legendgroup": name,
+                        "marker": {"color": groupby_colors[groupby][name]},
+                        "showlegend": real_no == 0,
+                        "line": {"shape": line_shape},
+                    }
                 )
-            )
-    # Concat ensemble dfs with calculated recovery
-    if ens_dfs:
-        df = pd.concat(ens_dfs, ignore_index=True)
     return (traces, df)
 
 
@@ -1398,7 +1290,7 @@ def get_fipdesc(fipfile: Path, column_keys: list) -> pd.DataFrame:
     return pd.concat(dfs).sort_index()
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def get_unit(smry_meta: pd.DataFrame, vec: str) -> Union[str, None]:
     return (
         None
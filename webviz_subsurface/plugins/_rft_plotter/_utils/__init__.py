@@ -1,7 +1,6 @@
 from ._formation_figure import FormationFigure
 from ._rft_plotter_data_model import (
     RftPlotterDataModel,
-    correlate,
     filter_frame,
     interpolate_depth,
 )
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
@@ -12,9 +13,50 @@ from webviz_subsurface._models import (
     caching_ensemble_set_model_factory,
 )
 from webviz_subsurface._models.parameter_model import ParametersModel
+from webviz_subsurface._utils.dataframe_utils import correlation_matrix
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
 from webviz_subsurface._utils.unique_theming import unique_colors
 
 
+@dataclass
+class RftParameterMatrices:
+    """Simulated RFT values and parameter values of an ensemble, as dense
+    matrices with one row per realization. Multiple observations with the
+    same well/date/zone are averaged into one RFT column."""
+
+    rfts: pd.DataFrame
+    parameters: pd.DataFrame
+    observations: pd.DataFrame
+
+    @classmethod
+    def from_dataframes(
+        cls, ertdatadf: pd.DataFrame, paramdf: pd.DataFrame, selectors: List[str]
+    ) -> "RftParameterMatrices":
+        rft_df = ertdatadf.assign(
+            RFT_KEY=ertdatadf["WELL"]
+            + " "
+            + ertdatadf["DATE"]
+            + " "
+            + ertdatadf["ZONE"]
+        )
+        rfts = rft_df.pivot_table(
+            index="REAL", columns="RFT_KEY", values="SIMULATED", aggfunc="mean"
+        )
+        parameters = paramdf.set_index("REAL")[
+            [col for col in paramdf.columns if col not in selectors]
+        ]
+        reals = rfts.index.intersection(parameters.index).sort_values()
+        return cls(
+            rfts=rfts.loc[reals],
+            parameters=parameters.loc[reals],
+            observations=rft_df.groupby("RFT_KEY")[["OBSERVED", "OBSERVED_ERR"]].mean(),
+        )
+
+    def select_reals(self, reals: List[int]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        mask = self.rfts.index.isin(reals)
+        return self.rfts.loc[mask], self.parameters.loc[mask]
+
+
 class RftPlotterDataModel:
     """Class keeping the data needed in the RFT vizualisations and various
     data providing methods.
@@ -131,6 +173,11 @@ class RftPlotterDataModel:
             ["WELL", "DATE", "ZONE", "ENSEMBLE", "TVD"]
         )["SIMULATED"].transform("std")
 
+        self._rft_param_matrices: Dict[str, RftParameterMatrices] = {}
+        self._rft_param_correlations: Dict[
+            Tuple[str, str, Tuple[int, ...]], pd.DataFrame
+        ] = {}
+
     @property
     def well_names(self) -> List[str]:
         return sorted(list(self.ertdatadf["WELL"].unique()))
@@ -204,73 +251,89 @@ class RftPlotterDataModel:
             )
         return df.reset_index(drop=True)
 
-    def create_rft_and_param_pivot_table(
-        self,
-        ensemble: str,
-        well: str,
-        date: str,
-        zone: str,
-        reals: List[int],
-        keep_all_rfts: bool,
-    ) -> Tuple[Optional[pd.DataFrame], float, float, List[str], List[str],]:
-        """This method merges rft observations and parameters.
-
-        The RFT observations are converted from long form (all simulated values
-        in one column: SIMULATED) to wide form (on column for each well/date/zone).
-        This is needed for calculating correlations between RFTs. It is an option
-        whether to keep one or all RFT columns. If there are multiple observations
-        with the same well/date/zone, they are averaged (depth could be added as a
-        fourth parameter here, f.ex optional).
-
-        This RFT wide form table is then merged on REAL with the ensemble parameters.
+    def get_rft_and_param_df(
+        self, ensemble: str, reals: List[int], rft_key: str
+    ) -> Tuple[Optional[pd.DataFrame], float, float, List[str]]:
+        """Returns the simulated values of an RFT (well/date/zone) merged on REAL
+        with the ensemble parameters, for the given realizations.
+
+        If there are multiple observations with the same well/date/zone, they
+        are averaged (depth could be added as a fourth parameter here, f.ex
+        optional).
 
         Returns:
-        * merged dataframe with RFTs and parameters
+        * merged dataframe with the RFT and parameters
         * observation for well/date/zone
         * observation error
         * list with ensemble parameters
-        * list with rft names
         """
-        # pylint: disable = too-many-locals
-        rft_filter = {"ENSEMBLE": ensemble, "REAL": reals}
-        if not keep_all_rfts:
-            rft_filter.update({"WELL": well, "DATE": date, "ZONE": zone})
-
-        rft_df = filter_frame(self.ertdatadf, rft_filter)[
-            ["REAL", "DATE", "WELL", "ZONE", "SIMULATED", "OBSERVED", "OBSERVED_ERR"]
-        ]
-
-        if rft_df.empty:
-            return None, 0, 0, [], []
-
-        rft_df["RFT_KEY"] = rft_df["WELL"] + " " + rft_df["DATE"] + " " + rft_df["ZONE"]
-
-        # Get observation and error
-        # In case there are multiple observations in the same well/date/zone
-        # they are averaged (as in the pivot table)
-        df_current_obs = rft_df[rft_df["RFT_KEY"] == f"{well} {date} {zone}"]
-        obs = df_current_obs["OBSERVED"].mean()
-        obs_err = df_current_obs["OBSERVED_ERR"].mean()
-
-        pivot_df = rft_df.pivot_table(
-            index="REAL", columns="RFT_KEY", values="SIMULATED", aggfunc="mean"
-        ).reset_index()
+        matrices = self.get_rft_param_matrices(ensemble)
+        rfts, params = matrices.select_reals(reals)
+        if rfts.empty or rft_key not in rfts.columns:
+            return None, 0, 0, []
+
+        # Removes parameters not used in this ensemble
+        params = params.dropna(axis=1)
+        obs, obs_err = matrices.observations.loc[rft_key]
+        dframe = pd.concat([rfts[[rft_key]], params], axis=1).reset_index()
+        return dframe, obs, obs_err, list(params.columns)
+
+    def get_rft_param_matrices(self, ensemble: str) -> "RftParameterMatrices":
+        """Dense realization x RFT and realization x parameter matrices for an
+        ensemble, built once per ensemble"""
+        if ensemble not in self._rft_param_matrices:
+            self._rft_param_matrices[ensemble] = RftParameterMatrices.from_dataframes(
+                self.ertdatadf.loc[self.ertdatadf["ENSEMBLE"] == ensemble],
+                self.param_model.dataframe.loc[
+                    self.param_model.dataframe["ENSEMBLE"] == ensemble
+                ],
+                self.param_model.POSSIBLE_SELECTORS,
+            )
+        return self._rft_param_matrices[ensemble]
 
-        param_df = (
-            filter_frame(
-                self.param_model.dataframe, {"ENSEMBLE": ensemble, "REAL": reals}
+    def get_rft_param_correlations(
+        self, ensemble: str, reals: List[int], method: str = "pearson"
+    ) -> pd.DataFrame:
+        """Correlations between all RFTs (index) and all parameters (columns) of
+        an ensemble for the given realizations. The result is cached, so that
+        callbacks with the same realization selection only index into it."""
+        key = (ensemble, method, tuple(sorted(reals)))
+        if key not in self._rft_param_correlations:
+            rfts, params = self.get_rft_param_matrices(ensemble).select_reals(reals)
+            if len(self._rft_param_correlations) >= 32:
+                self._rft_param_correlations.clear()
+            self._rft_param_correlations[key] = correlation_matrix(
+                rfts, params.dropna(axis=1), method=method
             )
-            .drop("ENSEMBLE", axis=1)
-            .dropna(axis=1)  # Removes parameters not used in this ensemble
+        return self._rft_param_correlations[key]
+
+    def correlate_rft_with_parameters(
+        self, ensemble: str, reals: List[int], rft_key: str, method: str = "pearson"
+    ) -> pd.Series:
+        """Correlations between an RFT and the non-constant parameters,
+        sorted by absolute value"""
+        corrdf = self.get_rft_param_correlations(ensemble, reals, method)
+        rfts, params = self.get_rft_param_matrices(ensemble).select_reals(reals)
+        corrseries = (
+            corrdf.loc[rft_key]
+            if rft_key in corrdf.index
+            else pd.Series(np.nan, index=corrdf.columns)
         )
-        ens_params = [
-            param
-            for param in param_df.columns
-            if param not in self.param_model.POSSIBLE_SELECTORS
-        ]
-        ens_rfts = [rft for rft in pivot_df.columns if rft != "REAL"]
-
-        return pivot_df.merge(param_df, on="REAL"), obs, obs_err, ens_params, ens_rfts
+        return _sort_correlations(corrseries, params[corrdf.columns])
+
+    def correlate_parameter_with_rfts(
+        self, ensemble: str, reals: List[int], parameter: str, method: str = "pearson"
+    ) -> pd.Series:
+        """Correlations between a parameter and the non-constant RFTs,
+        sorted by absolute value"""
+        corrdf = self.get_rft_param_correlations(ensemble, reals, method)
+        rfts, _ = self.get_rft_param_matrices(ensemble).select_reals(reals)
+        corrseries = (
+            corrdf[parameter]
+            if parameter in corrdf.columns
+            else pd.Series(np.nan, index=corrdf.index)
+        )
+        return _sort_correlations(corrseries, rfts)
 
     @property
     def webviz_store(self) -> List[Tuple[Callable, List[Dict[str, Any]]]]:
@@ -310,7 +373,7 @@ def interpolate_depth(df: pd.DataFrame) -> pd.DataFrame:
     return df.to_frame().rename(columns={0: "PRESSURE"}).reset_index()
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def filter_frame(
     dframe: pd.DataFrame, column_values: Dict[str, Union[List[str], str]]
 ) -> pd.DataFrame:
@@ -324,16 +387,9 @@ def filter_frame(
     return df
 
 
-def correlate(df: pd.DataFrame, response: str) -> pd.Series:
-    """Returns the correlation matrix for a dataframe
-
-    This function is the same as in ParameterAnalysis and could be generalized
-    """
-    df = df[df.columns[df.nunique() > 1]].copy()
-    if response not in df.columns:
-        df[response] = np.nan
-    series = df[response]
-    df = df.drop(columns=[response])
-    corrdf = df.corrwith(series)
-    corrdf.fillna(0, inplace=True)
-    return corrdf.reindex(corrdf.abs().sort_values().index)
+def _sort_correlations(corrseries: pd.Series, dframe: pd.DataFrame) -> pd.Series:
+    """Drops correlations with constant columns in `dframe`, and sorts the rest
+    by absolute value. Undefined correlations are set to 0"""
+    corrseries = corrseries[(dframe.nunique() > 1).reindex(corrseries.index)]
+    corrseries = corrseries.fillna(0)
+    return corrseries.reindex(corrseries.abs().sort_values().index)
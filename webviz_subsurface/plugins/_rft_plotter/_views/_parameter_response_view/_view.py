@@ -9,7 +9,7 @@ from webviz_config.webviz_plugin_subclasses import ViewABC
 from ....._figures import BarChart, ScatterPlot
 from ..._reusable_view_element import GeneralViewElement
 from ..._types import CorrType, DepthType, LineType
-from ..._utils import FormationFigure, RftPlotterDataModel, correlate
+from ..._utils import FormationFigure, RftPlotterDataModel
 from ._settings import Options, ParameterFilterSettings, Selections
 
 
@@ -193,21 +193,12 @@ class ParameterResponseView(ViewABC):
             * response vs param scatter plot
             * formations chart RFT pressure vs depth, colored by parameter value
             """
-            (
-                df,
-                obs,
-                obs_err,
-                ens_params,
-                ens_rfts,
-            ) = self._datamodel.create_rft_and_param_pivot_table(
+            current_key = f"{well} {date} {zone}"
+            df, obs, obs_err, ens_params = self._datamodel.get_rft_and_param_df(
                 ensemble=ensemble,
-                well=well,
-                date=date,
-                zone=zone,
                 reals=real_filter[ensemble],
-                keep_all_rfts=(corrtype == CorrType.PARAM_VS_SIM),
+                rft_key=current_key,
             )
-            current_key = f"{well} {date} {zone}"
 
             if df is None:
                 # This happens if the filtering criterias returns no data
@@ -223,13 +214,17 @@ class ParameterResponseView(ViewABC):
                 return ["The selected ensemble has no non-constant parameters."] * 3
 
             if corrtype == CorrType.SIM_VS_PARAM or param is None:
-                corrseries = correlate(df[ens_params + [current_key]], current_key)
+                corrseries = self._datamodel.correlate_rft_with_parameters(
+                    ensemble, real_filter[ensemble], current_key
+                )
                 param = param if param is not None else corrseries.abs().idxmax()
                 corr_title = f"{current_key} vs parameters"
                 scatter_x, scatter_y, highlight_bar = param, current_key, param
 
             if corrtype == CorrType.PARAM_VS_SIM:
-                corrseries = correlate(df[ens_rfts + [param]], param)
+                corrseries = self._datamodel.correlate_parameter_with_rfts(
+                    ensemble, real_filter[ensemble], param
+                )
                 corr_title = f"{param} vs simulated RFTs"
                 scatter_x, scatter_y, highlight_bar = param, current_key, current_key
 
@@ -1,15 +1,18 @@
-import json
-from typing import Callable, List, Optional, Tuple, Union
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
-import numpy as np
 import pandas as pd
 import webviz_core_components as wcc
-from dash import Dash, Input, Output, html
+from dash import Dash, Input, Output, State, callback_context, dcc, html
+from dash.exceptions import PreventUpdate
 from webviz_config import WebvizPluginABC, WebvizSettings
 from webviz_config.common_cache import CACHE
+from webviz_config.webviz_instance_info import WEBVIZ_INSTANCE_INFO, WebvizRunMode
 from webviz_config.webviz_store import webvizstore
 
-from .._datainput.fmu_input import load_ensemble_set, load_parameters
+from .._datainput.fmu_input import load_parameters
+from .._datainput.status_json import StatusFileIndex
+from .._utils.fingerprint_memoize import fingerprint_memoize
 
 
 class RunningTimeAnalysisFMU(WebvizPluginABC):
@@ -35,6 +38,9 @@ Visualizations:
     (default: `status.json`).
 * **`visual_parameters`:** List of default visualized parameteres in parallel coordinates plot \
     (default: all parameters).
+* **`refresh_interval`:** Check for new and modified status files every X seconds, \
+    and update the visualization accordingly. Only status files that have changed are read \
+    again. Not used in portable apps (default: no refresh).
 
 ---
 
@@ -66,6 +72,7 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
         filter_shorter: Union[int, float] = 10,
         status_file: str = "status.json",
         visual_parameters: Optional[list] = None,
+        refresh_interval: Optional[int] = None,
     ):
         super().__init__()
         self.filter_shorter = filter_shorter
@@ -81,9 +88,29 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
             ensemble_set_name="EnsembleSet",
             filter_file=None,
         )
-        all_data_df = make_status_df(
-            self.ens_paths, self.status_file
-        )  # Has to be stored in one df due to webvizstore, see issue #206 in webviz-config
+        self.refresh_interval = (
+            refresh_interval
+            if WEBVIZ_INSTANCE_INFO.run_mode != WebvizRunMode.PORTABLE
+            else None
+        )
+        self.status_index: Optional[StatusFileIndex] = None
+        # Guards the status dataframes and their versions, which are replaced
+        # together on refresh. Refreshes are serialized by a separate lock, such
+        # that figures can be rendered while refreshing.
+        self._status_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._status_versions: Dict[str, int] = {ens: 0 for ens in ensembles}
+        if self.refresh_interval:
+            self.status_index = StatusFileIndex(self.ens_paths, self.status_file)
+            self.status_index.refresh()
+            all_data_df = combine_status_dfs(self.status_index, self.ens_paths)
+            self._status_versions = {
+                ens: self.status_index.version(ens) for ens in ensembles
+            }
+        else:
+            all_data_df = make_status_df(
+                self.ens_paths, self.status_file
+            )  # Has to be stored in one df due to webvizstore, see issue #206 in webviz-config
         self.job_status_df = all_data_df.loc["job"]
         self.real_status_df = all_data_df.loc["real"]
         self.visual_parameters = (
@@ -137,7 +164,18 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
                 # figure instead of the figure div getting padded by whitespace down to height of
                 # outer div.
                 html.Div(style={"width": "100%"}),
-            ],
+            ]
+            + (
+                [
+                    dcc.Interval(
+                        id=self.uuid("refresh"), interval=self.refresh_interval * 1000
+                    ),
+                    # Ensemble and status version of the figure shown in this session
+                    dcc.Store(id=self.uuid("shown_version")),
+                ]
+                if self.refresh_interval
+                else []
+            ),
         )
 
     @property
@@ -276,7 +314,12 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
 
     def set_callbacks(self, app: Dash) -> None:
         @app.callback(
-            Output(self.uuid("fig"), "figure"),
+            [Output(self.uuid("fig"), "figure")]
+            + (
+                [Output(self.uuid("shown_version"), "data")]
+                if self.refresh_interval
+                else []
+            ),
             [
                 Input(self.uuid("ensemble"), "value"),
                 Input(self.uuid("mode"), "value"),
@@ -284,8 +327,17 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
                 Input(self.uuid("relative_real"), "value"),
                 Input(self.uuid("parameters"), "value"),
                 Input(self.uuid("filter_short"), "value"),
-            ],
+            ]
+            + (
+                [Input(self.uuid("refresh"), "n_intervals")]
+                if self.refresh_interval
+                else []
+            ),
+            [State(self.uuid("shown_version"), "data")]
+            if self.refresh_interval
+            else [],
         )
+        # pylint: disable=too-many-arguments
         def _update_fig(
             ens: str,
             mode: str,
@@ -293,56 +345,38 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
             rel_real: str,
             params: Union[str, List[str]],
             filter_short: List[str],
-        ) -> dict:
+            *refresh_args: Union[int, Optional[dict]],
+        ) -> Union[dict, Tuple[dict, dict]]:
             """Update main figure
             Dependent on `mode` it will call rendering of the chosen form of visualization
             """
-            if mode == "running_time_matrix" and "filter_short" in filter_short:
-                return render_matrix(
-                    self.job_status_df[
-                        (self.job_status_df["ENSEMBLE"] == ens)
-                        & (self.job_status_df["JOB_MAX_RUNTIME"] >= self.filter_shorter)
-                    ],
-                    rel_runtime,
-                    self.plotly_theme,
-                )
-            if mode == "running_time_matrix":
-                return render_matrix(
-                    self.job_status_df[(self.job_status_df["ENSEMBLE"] == ens)],
-                    rel_runtime,
-                    self.plotly_theme,
-                )
-
-            # Otherwise: parallel coordinates
-            # Ensure selected parameters is a list
-            params = params if isinstance(params, list) else [params]
-            # Color by success or runtime, for runtime drop unsuccesful
-            colormap_labels: Union[List[str], None]
-            if rel_real == "Successful/failed realization":
-                plot_df = self.real_status_df[self.real_status_df["ENSEMBLE"] == ens]
-                colormap = make_colormap(
-                    self.plotly_theme["layout"]["colorway"], discrete=2
-                )
-                color_by_col = "STATUS_BOOL"
-                colormap_labels = ["Failed", "Success"]
-            else:
-                plot_df = self.real_status_df[
-                    (self.real_status_df["ENSEMBLE"] == ens)
-                    & (self.real_status_df["STATUS_BOOL"] == 1)
-                ]
-                colormap = self.plotly_theme["layout"]["colorscale"]["sequential"]
-                color_by_col = "RUNTIME"
-                colormap_labels = None
-
-            # Call rendering of parallel coordinate plot
-            return render_parcoord(
-                plot_df,
+            refresh_triggered = (
+                callback_context.triggered
+                and callback_context.triggered[0]["prop_id"]
+                == f"{self.uuid('refresh')}.n_intervals"
+            )
+            if refresh_triggered:
+                self.refresh_status()
+            with self._status_lock:
+                job_status_df = self.job_status_df
+                real_status_df = self.real_status_df
+                version = {"ensemble": ens, "version": self._status_versions[ens]}
+
+            # Each session compares with the version it shows, such that all
+            # sessions are updated when the ensemble changes
+            if refresh_triggered and refresh_args[-1] == version:
+                raise PreventUpdate
+            figure = self._render_fig(
+                job_status_df,
+                real_status_df,
+                ens,
+                mode,
+                rel_runtime,
+                rel_real,
                 params,
-                self.plotly_theme,
-                colormap,
-                color_by_col,
-                colormap_labels,
+                filter_short,
             )
+            return (figure, version) if self.refresh_interval else figure
 
         @app.callback(
             [
@@ -371,6 +405,83 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
                 )
             return style
 
+    # pylint: disable=too-many-arguments
+    def _render_fig(
+        self,
+        job_status_df: pd.DataFrame,
+        real_status_df: pd.DataFrame,
+        ens: str,
+        mode: str,
+        rel_runtime: str,
+        rel_real: str,
+        params: Union[str, List[str]],
+        filter_short: List[str],
+    ) -> dict:
+        if mode == "running_time_matrix" and "filter_short" in filter_short:
+            return render_matrix(
+                job_status_df[
+                    (job_status_df["ENSEMBLE"] == ens)
+                    & (job_status_df["JOB_MAX_RUNTIME"] >= self.filter_shorter)
+                ],
+                rel_runtime,
+                self.plotly_theme,
+            )
+        if mode == "running_time_matrix":
+            return render_matrix(
+                job_status_df[(job_status_df["ENSEMBLE"] == ens)],
+                rel_runtime,
+                self.plotly_theme,
+            )
+
+        # Otherwise: parallel coordinates
+        # Ensure selected parameters is a list
+        params = params if isinstance(params, list) else [params]
+        # Color by success or runtime, for runtime drop unsuccesful
+        colormap_labels: Union[List[str], None]
+        if rel_real == "Successful/failed realization":
+            plot_df = real_status_df[real_status_df["ENSEMBLE"] == ens]
+            colormap = make_colormap(
+                self.plotly_theme["layout"]["colorway"], discrete=2
+            )
+            color_by_col = "STATUS_BOOL"
+            colormap_labels = ["Failed", "Success"]
+        else:
+            plot_df = real_status_df[
+                (real_status_df["ENSEMBLE"] == ens)
+                & (real_status_df["STATUS_BOOL"] == 1)
+            ]
+            colormap = self.plotly_theme["layout"]["colorscale"]["sequential"]
+            color_by_col = "RUNTIME"
+            colormap_labels = None
+
+        # Call rendering of parallel coordinate plot
+        return render_parcoord(
+            plot_df,
+            params,
+            self.plotly_theme,
+            colormap,
+            color_by_col,
+            colormap_labels,
+        )
+
+    def refresh_status(self) -> List[str]:
+        """Read new and modified status files, and replace the job and realization
+        status of the changed ensembles. Returns the changed ensembles."""
+        if self.status_index is None:
+            return []
+        with self._refresh_lock:
+            changed = self.status_index.refresh()
+            if changed:
+                all_data_df = combine_status_dfs(self.status_index, self.ens_paths)
+                versions = {
+                    ens: self.status_index.version(ens) for ens in self.ensembles
+                }
+                with self._status_lock:
+                    self.job_status_df = all_data_df.loc["job"]
+                    self.real_status_df = all_data_df.loc["real"]
+                    self._status_versions = versions
+        return changed
+
     def add_webvizstore(self) -> List[Tuple[Callable, list]]:
         return [
             (
@@ -394,7 +505,7 @@ blob/master/reek_history_match/realization-0/iter-0/status.json).
         ]
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def render_matrix(status_df: pd.DataFrame, rel: str, theme: dict) -> dict:
     """Render matrix
     Returns figure object as heatmap for the chosen ensemble and scaling method.
@@ -465,7 +576,7 @@ def render_matrix(status_df: pd.DataFrame, rel: str, theme: dict) -> dict:
     return {"data": [data], "layout": layout}
 
 
-@CACHE.memoize(timeout=CACHE.TIMEOUT)
+@fingerprint_memoize()
 def render_parcoord(
     plot_df: pd.DataFrame,
     params: List[str],
@@ -529,8 +640,6 @@ def render_parcoord(
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
 @webvizstore
-# pylint: disable=too-many-locals
-# pylint: disable=too-many-statements
 def make_status_df(
     ens_paths: dict,
     status_file: str,
@@ -538,153 +647,34 @@ def make_status_df(
     """Return DataFrame of information from status.json files.
     *Finds status.json filepaths.
     For jobs:
-    *Loads data into pandas DataFrames.
+    *Loads data into pandas DataFrames, reading the files concurrently.
     *Calculates runtimes and normalized runtimes.
     *Creates hoverinfo column to be used in visualization.
     For realizations:
     *Creates DataFrame of success/failure and total running time.
     """
+    status_index = StatusFileIndex(ens_paths, status_file)
+    status_index.refresh()
+    return combine_status_dfs(status_index, ens_paths)
+
 
+def combine_status_dfs(status_index: StatusFileIndex, ens_paths: dict) -> pd.DataFrame:
+    """Combine job and realization status from the index. Realization status is
+    merged with realization parameters for parameter parallel coordinates"""
     parameter_df = load_parameters(
         ensemble_paths=ens_paths,
         ensemble_set_name="EnsembleSet",
         filter_file=None,
     )
-    # sub-method to process ensemble data when all realizations in ensemble have been processed
-    def ensemble_post_processing() -> list:
-        # add missing realizations to get whitespace in heatmap matrix
-        if len(set(range(min(reals), max(reals) + 1))) > len(set(reals)):
-            missing_df = ens_dfs[0].copy()
-            missing_df["STATUS"] = "Realization not started"
-            missing_df["RUNTIME"] = np.NaN
-            missing_df["JOB_SCALED_RUNTIME"] = np.NaN
-            missing_df["ENS_SCALED_RUNTIME"] = np.NaN
-            for missing_real in set(range(min(reals), max(reals) + 1)).difference(
-                set(reals)
-            ):
-                ens_dfs.append(missing_df.copy())
-                ens_dfs[-1]["REAL"] = missing_real
-                ens_dfs[-1]["ENSEMBLE"] = ens
-        # Concatenate realization DataFrames to an Ensemble DataFrame and store in list
-        job_status_dfs.append(pd.concat(ens_dfs))
-        # Find max running time of job in ensemble and create scaled columns
-        job_status_dfs[-1]["JOB_MAX_RUNTIME"] = pd.concat(
-            [ens_max_job_runtime] * (len(ens_dfs))
-        )
-        job_status_dfs[-1]["JOB_SCALED_RUNTIME"] = (
-            job_status_dfs[-1]["RUNTIME"] / job_status_dfs[-1]["JOB_MAX_RUNTIME"]
-        )
-        job_status_dfs[-1]["ENS_SCALED_RUNTIME"] = job_status_dfs[-1][
-            "RUNTIME"
-        ] / np.amax(ens_max_job_runtime)
-        # Return ensemble DataFrame list updated with the latest ensemble
-        return job_status_dfs
-
-    # find status filepaths
-    ens_set = load_ensemble_set(ens_paths, filter_file=None)
-    df = pd.concat(
-        [
-            ens_set[ens].find_files(status_file).assign(ENSEMBLE=ens)
-            for ens in ens_set.ensemblenames
-        ]
-    )
-    # Initial values for local variables
-    job_status_dfs: list = []
-    ens_dfs: list = []
-    real_status: list = []
-    ens_max_job_runtime = 1
-    ens = ""
-    reals: list = []
-
-    # Loop through identified filepaths and get realization data
-    for row in df.itertuples(index=False):
-        # Load each json-file to a DataFrame for the realization
-        with open(row.FULLPATH) as fjson:
-            status_dict = json.load(fjson)
-        real_df = pd.DataFrame(status_dict["jobs"])
-
-        # If new ensemble, calculate ensemble scaled runtimes
-        # for previous ensemble and reset temporary ensemble data
-        if ens != row.ENSEMBLE:
-            if ens == "":  # First ensemble
-                ens = row.ENSEMBLE
-            else:  # Store last ensemble and reset temporary ensemble data
-                job_status_dfs = ensemble_post_processing()
-                ens_max_job_runtime = 1
-                ens_dfs = []
-                ens = row.ENSEMBLE
-                reals = []
-
-        # Additional realization data into realization DataFrame
-        real_df["RUNTIME"] = real_df["end_time"] - real_df["start_time"]
-        real_df["REAL"] = row.REAL
-        real_df["ENSEMBLE"] = row.ENSEMBLE
-        real_df["REAL_SCALED_RUNTIME"] = real_df["RUNTIME"] / max(
-            real_df["RUNTIME"].dropna()
-        )
-        real_df = real_df[
-            ["ENSEMBLE", "REAL", "RUNTIME", "REAL_SCALED_RUNTIME", "name", "status"]
-        ].rename(columns={"name": "JOB", "status": "STATUS"})
-        # Status DataFrame to be used with parallel coordinates
-        if all(real_df["STATUS"] == "Success"):
-            real_status.append(
-                {
-                    "ENSEMBLE": row.ENSEMBLE,
-                    "REAL": row.REAL,
-                    "STATUS": "Success",
-                    "STATUS_BOOL": 1,
-                    "RUNTIME": status_dict["end_time"] - status_dict["start_time"],
-                }
-            )
-        else:
-            real_status.append(
-                {
-                    "ENSEMBLE": row.ENSEMBLE,
-                    "REAL": row.REAL,
-                    "STATUS": "Failure",
-                    "STATUS_BOOL": 0,
-                    "RUNTIME": None,
-                }
-            )
-
-        # Need unique job ids names to separate jobs in same realization with same name in json file
-        real_df["JOB_ID"] = range(0, len(real_df["JOB"]))
-
-        # Update max runtime for jobs in ensemble
-        ens_max_job_runtime = np.fmax(real_df["RUNTIME"], ens_max_job_runtime)
-
-        # Append realization to ensemble data
-        reals.append(row.REAL)
-        ens_dfs.append(real_df)
-
-    # Add last ensemble
-    job_status_dfs = ensemble_post_processing()
-    job_status_df = pd.concat(job_status_dfs, sort=False)
-
-    # Create hoverinfo
-    job_status_df["HOVERINFO"] = (
-        "Real: "
-        + job_status_df["REAL"].astype(str)
-        + "<br>"
-        + "Job: #"
-        + job_status_df["JOB_ID"].astype(str)
-        + "<br>"
-        + job_status_df["JOB"].astype(str)
-        + "<br>"
-        + "Running time: "
-        + job_status_df["RUNTIME"].astype(str)
-        + " s"
-        + "<br>"
-        + "Status: "
-        + job_status_df["STATUS"]
-    )
-    # Create dataframe of realization status and merge with realization parameters for parameter
-    # parallel coordinates
-    real_status_df = pd.DataFrame(real_status).merge(
+    real_status_df = status_index.real_status_df().merge(
         parameter_df, on=["ENSEMBLE", "REAL"]
     )
     # Has to be stored in one df due to webvizstore, see issue #206 in webviz-config
-    return pd.concat([job_status_df, real_status_df], keys=["job", "real"], sort=False)
+    return pd.concat(
+        [status_index.job_status_df(), real_status_df],
+        keys=["job", "real"],
+        sort=False,
+    )
 
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
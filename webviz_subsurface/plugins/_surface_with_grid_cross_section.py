@@ -1,4 +1,3 @@
-import warnings
 from pathlib import Path
 from typing import List
 from uuid import uuid4
@@ -15,7 +14,7 @@ from webviz_subsurface_components import LeafletMap
 
 from webviz_subsurface._models import SurfaceLeafletModel
 
-from .._datainput.grid import load_grid, load_grid_parameter
+from .._datainput.grid_fence import GridFenceSampler
 from .._datainput.surface import get_surface_fence
 
 
@@ -24,7 +23,8 @@ class SurfaceWithGridCrossSection(WebvizPluginABC):
 The cross section is defined by a polyline interactively edited in the map view.
 
 !> This is an experimental plugin exploring how we can visualize 3D grid data in Webviz. \
-The performance is currently slow for large grids.
+The grid is kept in memory, and the first cross section through the grid is slower than \
+the following ones.
 
 ---
 
@@ -316,9 +316,10 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             if surface_type == "attribute":
                 min_val = color_values[0] if color_values else None
                 max_val = color_values[1] if color_values else None
-                grid = load_grid(get_path(self.gridfile))
-                gridparameter = load_grid_parameter(grid, get_path(gridparameter))
-                surface.slice_grid3d(grid, gridparameter)
+                sampler = GridFenceSampler.for_grid_file(get_path(self.gridfile))
+                surface.slice_grid3d(
+                    sampler.grid, sampler.get_property(get_path(gridparameter))
+                )
 
             return [
                 SurfaceLeafletModel(
@@ -343,40 +344,24 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
         def _render_fence(coords, gridparameter, surfacepath, color_values, colorscale):
             if not coords:
                 raise PreventUpdate
-            grid = load_grid(get_path(self.gridfile))
-            if (
-                grid.subgrids is not None
-                and sum([len(subgrid) for subgrid in grid.subgrids.values()])
-                != grid.nlay
-            ):
-                warnings.warn(
-                    (
-                        f"Subgrid information in {self.gridfile} does not correspond "
-                        "with number of grid layers. Subgrid information will be removed. "
-                        "This is a bug in xtgeo==2.15.2 for grids exported from RMS using Xtgeo. "
-                        "Export the grid with xtgeo>2.15.2 to remove this warning. "
-                    ),
-                    FutureWarning,
-                )
-                grid.subgrids = None
-            gridparameter = load_grid_parameter(grid, get_path(gridparameter))
+            sampler = GridFenceSampler.for_grid_file(get_path(self.gridfile))
             fence = get_fencespec(coords)
-            hmin, hmax, vmin, vmax, values = grid.get_randomline(
-                fence, gridparameter, zincrement=0.5
+            fence_sample = sampler.sample_fence(
+                get_path(gridparameter), fence, zincrement=0.5
             )
 
             surface = xtgeo.surface_from_file(get_path(surfacepath))
             s_arr = get_surface_fence(fence, surface)
             return make_heatmap(
-                values,
+                fence_sample.values,
                 s_arr=s_arr,
                 theme=self.plotly_theme,
                 s_name=self.surfacenames[self.surfacefiles.index(surfacepath)],
                 colorscale=colorscale,
-                xmin=hmin,
-                xmax=hmax,
-                ymin=vmin,
-                ymax=vmax,
+                xmin=fence_sample.hmin,
+                xmax=fence_sample.hmax,
+                ymin=fence_sample.vmin,
+                ymax=fence_sample.vmax,
                 zmin=color_values[0],
                 zmax=color_values[1],
                 xaxis_title="Distance along polyline",
@@ -394,8 +379,8 @@ e.g. [xtgeo](https://xtgeo.readthedocs.io/en/latest/).
             [State(self.ids("gridparameter"), "value")],
         )
         def _update_color_slider(_clicks, gridparameter):
-            grid = load_grid(get_path(self.gridfile))
-            gridparameter = load_grid_parameter(grid, get_path(gridparameter))
+            sampler = GridFenceSampler.for_grid_file(get_path(self.gridfile))
+            gridparameter = sampler.get_property(get_path(gridparameter))
 
             minv = float(f"{gridparameter.values.min():2f}")
             maxv = float(f"{gridparameter.values.max():2f}")
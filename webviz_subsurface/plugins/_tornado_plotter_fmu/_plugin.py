@@ -8,7 +8,7 @@ from webviz_config import WebvizPluginABC, WebvizSettings
 from webviz_config.utils import StrEnum, callback_typecheck
 
 from webviz_subsurface._datainput.fmu_input import find_sens_type
-from webviz_subsurface._providers import EnsembleTableProviderFactory
+from webviz_subsurface._providers import ColumnFilter, EnsembleTableProviderFactory
 
 from ._error import error
 from .shared_settings import Filters, Selectors, ViewSettings
@@ -266,21 +266,26 @@ class TornadoPlotterFMU(WebvizPluginABC):
         ) -> str:
             """Returns a json dump for the tornado data with the response values per realization"""
 
-            data = self._table_provider.get_column_data(
-                [response] + self._single_filters + self._multi_filters
-            )
-
-            # Filter data
+            # The filters are evaluated by the table provider when reading the data
+            column_filters = []
             if single_filters is not None:
                 for value, input_dict in zip(
                     single_filters, callback_context.inputs_list[1]
                 ):
-                    data = data.loc[data[input_dict["id"]["name"]] == value]
+                    column_filters.append(
+                        ColumnFilter(input_dict["id"]["name"], values=(value,))
+                    )
             if multi_filters is not None:
                 for value, input_dict in zip(
                     multi_filters, callback_context.inputs_list[2]
                 ):
-                    data = data.loc[data[input_dict["id"]["name"]].isin(value)]
+                    column_filters.append(
+                        ColumnFilter(input_dict["id"]["name"], values=tuple(value))
+                    )
+
+            data = self._table_provider.get_column_data(
+                [response], column_filters=column_filters
+            )
 
             return json.dumps(
                 {
@@ -9,7 +9,7 @@ from dash.exceptions import PreventUpdate
 from webviz_config.utils import StrEnum, callback_typecheck
 from webviz_config.webviz_plugin_subclasses import ViewABC
 
-from webviz_subsurface._components.tornado._tornado_data import TornadoData
+from webviz_subsurface._components.tornado._tornado_batch_data import TornadoBatchData
 from webviz_subsurface._components.tornado._tornado_table import TornadoTable
 
 from ...shared_settings import FilterOption, Scale
@@ -88,18 +88,14 @@ class TornadoTableView(ViewABC):
             ]
 
             design_and_responses = pd.merge(values, realizations, on="REAL")
-            if sens_filter is not None:
-                if reference not in sens_filter:
-                    sens_filter.append(reference)
-                design_and_responses = design_and_responses.loc[
-                    design_and_responses["SENSNAME"].isin(sens_filter)
-                ]
-            tornado_data = TornadoData(
-                dframe=design_and_responses,
+            tornado_data = TornadoBatchData(
+                dframe=design_and_responses, responses=["VALUE"], reference=reference
+            ).tornado_data(
+                response="VALUE",
                 response_name=data.get("response_name"),
-                reference=reference,
                 scale="Percentage" if scale == Scale.REL_VALUE_PERC else "Absolute",
                 cutbyref=FilterOption.REMOVE_SENS_WITH_NO_IMPACT in filter_options,
+                sensitivities=sens_filter,
             )
             tornado_table = TornadoTable(tornado_data=tornado_data)
             return (
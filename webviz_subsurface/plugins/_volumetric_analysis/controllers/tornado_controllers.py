@@ -8,6 +8,7 @@ from dash.exceptions import PreventUpdate
 from webviz_config import WebvizConfigTheme
 
 from webviz_subsurface._components.tornado._tornado_bar_chart import TornadoBarChart
+from webviz_subsurface._components.tornado._tornado_batch_data import TornadoBatchData
 from webviz_subsurface._components.tornado._tornado_data import TornadoData
 from webviz_subsurface._components.tornado._tornado_table import TornadoTable
 from webviz_subsurface._figures import create_figure
@@ -48,8 +49,6 @@ def tornado_controllers(
         if subplots and selections["Subplots"] not in groups:
             groups.append(selections["Subplots"])
 
-        filters = selections["filters"].copy()
-
         figures = []
         tables = []
         responses = (
@@ -57,52 +56,64 @@ def tornado_controllers(
             if page_selected == "torn_bulk_inplace"
             else [selections["Response"]]
         )
+        if selections["Reference"] not in selections["Sensitivities"]:
+            selections["Sensitivities"].append(selections["Reference"])
+
+        # The tornado calculations for all responses are done in one pass per
+        # subplot group, the sensitivity selection is applied afterwards
+        dframe = volumemodel.get_df(filters=selections["filters"], groups=groups)
+        df_groups = (
+            dframe.groupby(selections["Subplots"]) if subplots else [(None, dframe)]
+        )
+        tornado_batches = (
+            {
+                group: TornadoBatchData(
+                    dframe=df,
+                    responses=list(dict.fromkeys(responses)),
+                    reference=selections["Reference"],
+                )
+                for group, df in df_groups
+                if selections["Reference"] in df["SENSNAME"].unique()
+            }
+            if not dframe.empty
+            else {}
+        )
+
         for response in responses:
-            if not (response == "BULK" and page_selected == "torn_bulk_inplace"):
-                if selections["Reference"] not in selections["Sensitivities"]:
-                    selections["Sensitivities"].append(selections["Reference"])
-                filters.update(SENSNAME=selections["Sensitivities"])
-
-            dframe = volumemodel.get_df(filters=filters, groups=groups)
-
-            if not dframe.empty:
-                dframe.rename(columns={response: "VALUE"}, inplace=True)
-                df_groups = (
-                    dframe.groupby(selections["Subplots"])
-                    if subplots
-                    else [(None, dframe)]
+            sensitivities = (
+                None
+                if response == "BULK" and page_selected == "torn_bulk_inplace"
+                else selections["Sensitivities"]
+            )
+            for group, tornado_batch in tornado_batches.items():
+                tornado_data = tornado_batch.tornado_data(
+                    response=response,
+                    scale=selections["Scale"],
+                    cutbyref=bool(selections["Remove no impact"]),
+                    sensitivities=sensitivities,
                 )
-                for group, df in df_groups:
-                    if selections["Reference"] in df["SENSNAME"].unique():
-                        tornado_data = TornadoData(
-                            dframe=df,
-                            reference=selections["Reference"],
-                            response_name=response,
-                            scale=selections["Scale"],
-                            cutbyref=bool(selections["Remove no impact"]),
-                        )
-                        figure, table_data, columns = tornado_figure_and_table(
-                            tornado_data=tornado_data,
-                            response=response,
-                            selections=selections,
-                            theme=theme,
-                            sensitivity_colors=sens_colors(),
-                            font_size=max((20 - (0.4 * len(df_groups))), 10),
-                            group=group,
-                            use_si_format=response in volumemodel.volume_columns,
-                        )
-                        figures.append(figure)
-                        tables.append(table_data)
-
-                        if (
-                            response == selections["Response"]
-                            and selections["bottom_viz"] == "realplot"
-                            and not subplots
-                        ):
-                            realplot = create_realplot(
-                                df=tornado_data.real_df,
-                                sensitivity_colors=sens_colors(),
-                            )
+                figure, table_data, columns = tornado_figure_and_table(
+                    tornado_data=tornado_data,
+                    response=response,
+                    selections=selections,
+                    theme=theme,
+                    sensitivity_colors=sens_colors(),
+                    font_size=max((20 - (0.4 * len(df_groups))), 10),
+                    group=group,
+                    use_si_format=response in volumemodel.volume_columns,
+                )
+                figures.append(figure)
+                tables.append(table_data)
+
+                if (
+                    response == selections["Response"]
+                    and selections["bottom_viz"] == "realplot"
+                    and not subplots
+                ):
+                    realplot = create_realplot(
+                        df=tornado_data.real_df,
+                        sensitivity_colors=sens_colors(),
+                    )
 
         if selections["Shared axis"] and selections["Scale"] != "True":
             update_tornado_figures_xaxis(figures)
@@ -3,7 +3,6 @@ from pathlib import Path
 from typing import Dict, List
 
 import pandas as pd
-from fmu.tools.fipmapper import fipmapper
 
 
 class VolumeValidatorAndCombinator:
@@ -46,9 +45,7 @@ class VolumeValidatorAndCombinator:
             "dynamic": [],
             "unknown": [],
         }
-        self.disjoint_set_df = (
-            fipmapper.FipMapper(yamlfile=fipfile).disjoint_sets() if fipfile else None
-        )
+        self.disjoint_set_df = _disjoint_sets(fipfile) if fipfile else None
 
         self.dframe = self.validate_and_combine_sources(
             self.drop_rows_with_totals_from_selectors(volumes_table)
@@ -227,3 +224,11 @@ class VolumeValidatorAndCombinator:
         for sel in selectors:
             dframe = dframe.loc[dframe[sel] != "Totals"]
         return dframe
+
+
+def _disjoint_sets(fipfile: Path) -> pd.DataFrame:
+    # fmu.tools imports xtgeo, hence only imported when a fipfile is given
+    # pylint: disable=import-outside-toplevel
+    from fmu.tools.fipmapper import fipmapper
+
+    return fipmapper.FipMapper(yamlfile=fipfile).disjoint_sets()
@@ -96,14 +96,18 @@ class WellCompletionDataModel:
         """Generates the wells part of the input to the WellCompletions component."""
         well_list = []
         no_real = wellcompletion_df["REAL"].nunique()
-        for well_name, well_group in wellcompletion_df.groupby("WELL"):
-            well_data = _extract_well(well_group, well_name, no_real)
-            well_data["attributes"] = (
-                self._well_attributes[well_name]
-                if well_name in self._well_attributes
-                else {}
+        for well_name, completions in _extract_completions(
+            wellcompletion_df, no_real
+        ).items():
+            well_list.append(
+                {
+                    "name": well_name,
+                    "completions": completions,
+                    "attributes": self._well_attributes[well_name]
+                    if well_name in self._well_attributes
+                    else {},
+                }
             )
-            well_list.append(well_data)
         return well_list
 
     def _extract_stratigraphy(self) -> List[Dict[str, Any]]:
@@ -171,35 +175,48 @@ def _add_colors_to_stratigraphy(
     return stratigraphy
 
 
-def _extract_well(
-    well_group: pd.DataFrame, well_name: str, no_real: int
-) -> Dict[str, Any]:
-    """Extract completion events and kh values for a single well"""
-    well_dict: Dict[str, Any] = {}
-    well_dict["name"] = well_name
-
-    completions: Dict[str, Dict[str, List[Any]]] = {}
-    for (zone, timestep), group_df in well_group.groupby(["ZONE", "TIMESTEP"]):
-        data = group_df["OP/SH"].value_counts()
-        if zone not in completions:
-            completions[zone] = {
-                "t": [],
-                "open": [],
-                "shut": [],
-                "khMean": [],
-                "khMin": [],
-                "khMax": [],
-            }
-        zonedict = completions[zone]
-        zonedict["t"].append(int(timestep))
-        zonedict["open"].append(float(data["OPEN"] / no_real if "OPEN" in data else 0))
-        zonedict["shut"].append(float(data["SHUT"] / no_real if "SHUT" in data else 0))
-        zonedict["khMean"].append(round(float(group_df["KH"].mean()), 2))
-        zonedict["khMin"].append(round(float(group_df["KH"].min()), 2))
-        zonedict["khMax"].append(round(float(group_df["KH"].max()), 2))
-
-    well_dict["completions"] = completions
-    return well_dict
+def _extract_completions(
+    wellcompletion_df: pd.DataFrame, no_real: int
+) -> Dict[str, Dict[str, Dict[str, List[Any]]]]:
+    """Extract completion events and kh values for all wells, per well and zone.
+
+    The open/shut counts and kh statistics are aggregated for all wells, zones
+    and time steps in one groupby.
+    """
+    aggregated = (
+        wellcompletion_df.assign(
+            OPEN=wellcompletion_df["OP/SH"] == "OPEN",
+            SHUT=wellcompletion_df["OP/SH"] == "SHUT",
+        )
+        .groupby(["WELL", "ZONE", "TIMESTEP"])
+        .agg(
+            OPEN=("OPEN", "sum"),
+            SHUT=("SHUT", "sum"),
+            KH_MEAN=("KH", "mean"),
+            KH_MIN=("KH", "min"),
+            KH_MAX=("KH", "max"),
+        )
+        .reset_index()
+    )
+    columns = {
+        "t": aggregated["TIMESTEP"].astype(int).tolist(),
+        "open": (aggregated["OPEN"] / no_real).astype(float).tolist(),
+        "shut": (aggregated["SHUT"] / no_real).astype(float).tolist(),
+        "khMean": [round(val, 2) for val in aggregated["KH_MEAN"].astype(float)],
+        "khMin": [round(val, 2) for val in aggregated["KH_MIN"].astype(float)],
+        "khMax": [round(val, 2) for val in aggregated["KH_MAX"].astype(float)],
+    }
+
+    completions: Dict[str, Dict[str, Dict[str, List[Any]]]] = {}
+    for idx, (well, zone) in enumerate(
+        zip(aggregated["WELL"].tolist(), aggregated["ZONE"].tolist())
+    ):
+        zonedict = completions.setdefault(well, {}).setdefault(
+            zone, {key: [] for key in columns}
+        )
+        for key, values in columns.items():
+            zonedict[key].append(values[idx])
+    return completions
 
 
 def _filter_valid_nodes(
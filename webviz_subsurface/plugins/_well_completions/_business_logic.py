@@ -209,76 +209,74 @@ def get_kh_unit(ensemble_path: str) -> Tuple[str, int]:
     return ("", 2)
 
 
-def get_time_series(df: pd.DataFrame, time_steps: list) -> tuple:
-    """Create two lists with values for each time step
-    * the first one is on the form [0,0,0,1,1,1,1,-1,-1,-1] where '0' means no event,\
-    '1' is open, '-1' is shut.
-    * the second is with sum of kh values for the open compdats in each zone
-
-    The input data frame is assumed to contain data for single well,
-    single zone and single realization.
+def get_completion_tensors(
+    df: pd.DataFrame,
+    wells: list,
+    zone_names: list,
+    time_steps: list,
+    realizations: list,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Scatters the completion data into two dense arrays with axes
+    (well, zone, realization, time step):
+    * completion events, where '0' means no event, '1' is open and '-1' is shut
+    * sum of kh values for the open compdats
+
+    At a time step with data, a zone is considered open if minimum one of its
+    compdats is OPEN. The values are forward filled to the following time steps
+    without data.
     """
-    if df.empty:
-        return [0] * len(time_steps), [0] * len(time_steps)
-
-    events, kh_values = [], []
-    event_value, kh_value = 0, 0
-    unique_dates = df.DATE.unique()
-
-    for timestep in time_steps:
-        if timestep in unique_dates:
-            df_timestep = df[df.DATE == timestep]
-            df_timestep_open = df_timestep[df_timestep["OP/SH"] == "OPEN"]
+    shape = (len(wells), len(zone_names), len(realizations), len(time_steps))
+    codes = [
+        pd.Categorical(df[col], categories=categories).codes.astype(np.int64)
+        for col, categories in [
+            ("WELL", wells),
+            ("ZONE", zone_names),
+            ("REAL", realizations),
+            ("DATE", time_steps),
+        ]
+    ]
+    valid = np.logical_and.reduce([code >= 0 for code in codes])
+    index = np.ravel_multi_index([code[valid] for code in codes], shape)
+    is_open = (df["OP/SH"].to_numpy() == "OPEN")[valid]
+    kh_open = np.where(
+        is_open, np.nan_to_num(df["KH"].to_numpy(dtype=np.float64)[valid]), 0.0
+    )
 
-            # if minimum one of the compdats for the zone is OPEN then the zone is considered open
-            event_value = 1 if not df_timestep_open.empty else -1
-            kh_value = df_timestep_open.KH.sum()
+    size = int(np.prod(shape))
+    has_event = np.bincount(index, minlength=size).reshape(shape) > 0
+    open_count = np.bincount(index, weights=is_open, minlength=size).reshape(shape)
+    kh_sum = np.bincount(index, weights=kh_open, minlength=size).reshape(shape)
 
-        events.append(event_value)
-        kh_values.append(kh_value)
+    # Forward fill from the last time step with data
+    last_event = np.maximum.accumulate(
+        np.where(has_event, np.arange(shape[3]), 0), axis=3
+    )
+    started = np.logical_or.accumulate(has_event, axis=3)
+    events = np.where(
+        started,
+        np.take_along_axis(np.where(open_count > 0, 1, -1), last_event, axis=3),
+        0,
+    ).astype(np.int8)
+    kh_values = np.where(started, np.take_along_axis(kh_sum, last_event, axis=3), 0.0)
     return events, kh_values
 
 
-def get_completion_events_and_kh(
-    df: pd.DataFrame, zone_names: list, time_steps: list
-) -> tuple:
-    """Extracts completion events ad kh values into two lists of lists of lists,
-    one with completions events and one with kh values
-    * Axis 0 is realization
-    * Axis 1 is zone
-    * Axis 2 is time step
-    """
-    compl_events, kh_values = [], []
-    for _, realdata in df.groupby("REAL"):
-        compl_events_real, kh_real = [], []
-        for zone_name in zone_names:
-            zone_data = realdata[realdata.ZONE == zone_name]
-            compl_events_real_zone, kh_real_zone = get_time_series(
-                zone_data, time_steps
-            )
-            compl_events_real.append(compl_events_real_zone)
-            kh_real.append(kh_real_zone)
-
-        compl_events.append(compl_events_real)
-        kh_values.append(kh_real)
-    return compl_events, kh_values
-
-
 def format_time_series(
-    open_frac: List[float],
-    shut_frac: List[float],
-    kh_mean: List[float],
-    kh_min: List[float],
-    kh_max: List[float],
+    open_frac: np.ndarray,
+    shut_frac: np.ndarray,
+    kh_mean: np.ndarray,
+    kh_min: np.ndarray,
+    kh_max: np.ndarray,
 ) -> Optional[Dict]:
-    """The functions takes in five lists with values per timestep
+    """The functions takes in five arrays with values per timestep
     * fractions of realizations open in this zone
     * fractions of realizations shut in this zone
     * kh mean over open realizations
     * kh min over open realizations
     * kh max over open realizations
 
-    Returns the data in compact form:
+    Returns the data in compact form, only for the time steps where the open or
+    shut fractions change:
     {
         t: [3, 5],
         open: [0.25, 1.0],
@@ -288,92 +286,39 @@ def format_time_series(
         khMean: [600, 1500]
     }
     """
-    output: Dict[str, list] = {
-        "t": [],
-        "open": [],
-        "shut": [],
-        "khMean": [],
-        "khMin": [],
-        "khMax": [],
+    changed = (np.diff(open_frac, prepend=0.0) != 0) | (
+        np.diff(shut_frac, prepend=0.0) != 0
+    )
+    return {
+        "t": np.flatnonzero(changed).tolist(),
+        "open": open_frac[changed].tolist(),
+        "shut": shut_frac[changed].tolist(),
+        "khMean": kh_mean[changed].tolist(),
+        "khMin": kh_min[changed].tolist(),
+        "khMax": kh_max[changed].tolist(),
     }
-    prev_open_val = prev_shut_val = 0.0
-
-    for i, _ in enumerate(open_frac):
-        open_val = open_frac[i]
-        shut_val = shut_frac[i]
-        if open_val != prev_open_val or shut_val != prev_shut_val:
-            output["t"].append(i)
-            output["open"].append(open_val)
-            output["shut"].append(shut_val)
-            output["khMean"].append(kh_mean[i])
-            output["khMin"].append(kh_min[i])
-            output["khMax"].append(kh_max[i])
-        prev_open_val = open_val
-        prev_shut_val = shut_val
-    return output
 
 
 def calc_over_realizations(
-    compl_events: list, kh_values: list, realizations: list
+    compl_events: np.ndarray, kh_values: np.ndarray, real_mask: np.ndarray
 ) -> tuple:
-    """Takes in two three dimensional lists where the levels are: 1. realization \
-    2. zones and 3. timesteps
+    """Takes in two arrays with axes (well, zone, realization, time step), and a
+    boolean (well, realization) array of the realizations where each well exists.
 
-    Returns two dimensional lists where calculations have been done over the \
-    realization level.
+    Returns arrays with axes (well, zone, time step) where calculations have been
+    done over the realization axis. The kh mean is over all realizations, while
+    kh min and max are over the realizations where the well exists.
     """
-    # calculate fraction of open realizations
-    open_count = np.maximum(np.asarray(compl_events), 0)  # remove -1
-    open_count_reduced = open_count.sum(axis=0)  # sum over realizations
-    open_frac = (
-        np.asarray(open_count_reduced, dtype=np.float64) / float(len(realizations))
-    ).round(decimals=3)
-
-    # calculate fraction of shut realizations
-    shut_count = (
-        np.minimum(np.asarray(compl_events), 0) * -1
-    )  # remove +1 and convert -1 to 1
-    shut_count_reduced = shut_count.sum(axis=0)  # sum over realizations
-    shut_frac = (
-        np.asarray(shut_count_reduced, dtype=np.float64) / float(len(realizations))
-    ).round(decimals=3)
-
-    # calculate khMean, khMin and khMax
-    np_kh_values = np.asarray(kh_values)
-    kh_mean = (np_kh_values.sum(axis=0) / float(len(realizations))).round(decimals=2)
-    kh_min = np_kh_values.min(axis=0).round(decimals=2)
-    kh_max = np_kh_values.max(axis=0).round(decimals=2)
+    no_real = float(compl_events.shape[2])
+    open_frac = ((compl_events == 1).sum(axis=2) / no_real).round(decimals=3)
+    shut_frac = ((compl_events == -1).sum(axis=2) / no_real).round(decimals=3)
 
-    return open_frac, shut_frac, kh_mean, kh_min, kh_max
+    mask = real_mask[:, np.newaxis, :, np.newaxis]
+    kh_mean = (kh_values.sum(axis=2) / no_real).round(decimals=2)
+    kh_min = np.where(mask, kh_values, np.inf).min(axis=2).round(decimals=2)
+    kh_max = np.where(mask, kh_values, -np.inf).max(axis=2).round(decimals=2)
 
-
-def extract_well(
-    df: pd.DataFrame, well: str, zone_names: list, time_steps: list, realizations: list
-) -> Dict[str, Any]:
-    # pylint: disable=too-many-locals
-    """Extract completion events and kh values for a single well"""
-    well_dict: Dict[str, Any] = {}
-    well_dict["name"] = well
-
-    compl_events, kh_values = get_completion_events_and_kh(df, zone_names, time_steps)
-    open_frac, shut_frac, kh_mean, kh_min, kh_max = calc_over_realizations(
-        compl_events, kh_values, realizations
-    )
-    result = {}
-    for (
-        zone_name,
-        open_frac_zone,
-        shut_frac_zone,
-        kh_mean_zone,
-        kh_min_zone,
-        kh_max_zone,
-    ) in zip(zone_names, open_frac, shut_frac, kh_mean, kh_min, kh_max):
-        if sum(open_frac_zone) != 0.0 or sum(shut_frac_zone) != 0.0:
-            result[zone_name] = format_time_series(
-                open_frac_zone, shut_frac_zone, kh_mean_zone, kh_min_zone, kh_max_zone
-            )
-    well_dict["completions"] = result
-    return well_dict
+    return open_frac, shut_frac, kh_mean, kh_min, kh_max
 
 
 def extract_wells(
@@ -382,19 +327,62 @@ def extract_wells(
     time_steps: list,
     realizations: list,
     well_attributes: Optional[dict],
+    max_tensor_size: int = 2**25,
 ) -> List[Dict]:
-    """Generates the wells part of the input dictionary to the WellCompletions component"""
+    """Generates the wells part of the input dictionary to the WellCompletions component.
+
+    The wells are processed in blocks, so that the size of the dense
+    (well, zone, realization, time step) arrays is limited by `max_tensor_size`.
+    """
+    # pylint: disable=too-many-locals
+    wells = sorted(df["WELL"].unique())
+    real_mask = (
+        pd.crosstab(df["WELL"], df["REAL"])
+        .reindex(index=wells, columns=realizations, fill_value=0)
+        .to_numpy()
+        > 0
+    )
+    block_size = max(
+        1,
+        max_tensor_size
+        // max(1, len(zone_names) * len(realizations) * len(time_steps)),
+    )
+
     well_list = []
-    for well_name, well_group in df.groupby("WELL"):
-        well_data = extract_well(
-            well_group, well_name, zone_names, time_steps, realizations
+    for start in range(0, len(wells), block_size):
+        block_wells = wells[start : start + block_size]
+        compl_events, kh_values = get_completion_tensors(
+            df[df["WELL"].isin(block_wells)],
+            block_wells,
+            zone_names,
+            time_steps,
+            realizations,
         )
-        well_data["attributes"] = (
-            well_attributes[well_name]
-            if (well_attributes is not None and well_name in well_attributes)
-            else {}
+        open_frac, shut_frac, kh_mean, kh_min, kh_max = calc_over_realizations(
+            compl_events, kh_values, real_mask[start : start + block_size]
         )
-        well_list.append(well_data)
+        has_data = (open_frac != 0).any(axis=2) | (shut_frac != 0).any(axis=2)
+
+        for widx, well_name in enumerate(block_wells):
+            well_list.append(
+                {
+                    "name": well_name,
+                    "completions": {
+                        zone_name: format_time_series(
+                            open_frac[widx, zidx],
+                            shut_frac[widx, zidx],
+                            kh_mean[widx, zidx],
+                            kh_min[widx, zidx],
+                            kh_max[widx, zidx],
+                        )
+                        for zidx, zone_name in enumerate(zone_names)
+                        if has_data[widx, zidx]
+                    },
+                    "attributes": well_attributes[well_name]
+                    if (well_attributes is not None and well_name in well_attributes)
+                    else {},
+                }
+            )
     return well_list
 
 
@@ -21,6 +21,7 @@ from webviz_subsurface._models import SurfaceLeafletModel
 
 from .._datainput.fmu_input import get_realizations
 from .._datainput.seismic import load_cube_data
+from .._datainput.surface import surfaces_from_binary, surfaces_to_binary_stream
 from .._datainput.well import load_well
 from .._datainput.xsection import XSectionFigure
 
@@ -654,17 +655,15 @@ def calculate_surface_statistics(
         for real_path in list(realdf[realdf["ENSEMBLE"] == ensemble]["RUNPATH"])
     ]
     surfaces = get_surfaces(fns)
-    return io.BytesIO(
-        json.dumps(
-            {
-                "mean": surface_to_json(surfaces.apply(np.nanmean, axis=0)),
-                "maximum": surface_to_json(surfaces.apply(np.nanmax, axis=0)),
-                "minimum": surface_to_json(surfaces.apply(np.nanmin, axis=0)),
-                "p10": surface_to_json(surfaces.apply(np.nanpercentile, 10, axis=0)),
-                "p90": surface_to_json(surfaces.apply(np.nanpercentile, 90, axis=0)),
-                "stddev": surface_to_json(surfaces.apply(np.nanstd, axis=0)),
-            }
-        ).encode()
+    return surfaces_to_binary_stream(
+        {
+            "mean": surfaces.apply(np.nanmean, axis=0),
+            "maximum": surfaces.apply(np.nanmax, axis=0),
+            "minimum": surfaces.apply(np.nanmin, axis=0),
+            "p10": surfaces.apply(np.nanpercentile, 10, axis=0),
+            "p90": surfaces.apply(np.nanpercentile, 90, axis=0),
+            "stddev": surfaces.apply(np.nanstd, axis=0),
+        }
     )
 
 
@@ -672,35 +671,9 @@ def calculate_surface_statistics(
 def get_surface_statistics(
     realdf_dict: list, ensemble: str, surfacefile: str, surfacefolder: Path
 ) -> Dict[str, xtgeo.RegularSurface]:
-    surfaces = json.load(
+    return surfaces_from_binary(
         calculate_surface_statistics(realdf_dict, ensemble, surfacefile, surfacefolder)
     )
-    return {
-        statistic: surface_from_json(surface) for statistic, surface in surfaces.items()
-    }
-
-
-def surface_to_json(surface: xtgeo.RegularSurface) -> str:
-    return json.dumps(
-        {
-            "ncol": surface.ncol,
-            "nrow": surface.nrow,
-            "xori": surface.xori,
-            "yori": surface.yori,
-            "rotation": surface.rotation,
-            "xinc": surface.xinc,
-            "yinc": surface.yinc,
-            "values": surface.values.copy().filled(np.nan).tolist(),
-        }
-    )
-
-
-def surface_from_json(surfaceobj: Union[str, bytes]) -> xtgeo.RegularSurface:
-    # See https://github.com/equinor/xtgeo/issues/405
-    data = json.loads(surfaceobj)
-    surface = xtgeo.RegularSurface(**data)
-    surface.values = np.array(data["values"])
-    return surface
 
 
 @CACHE.memoize(timeout=CACHE.TIMEOUT)
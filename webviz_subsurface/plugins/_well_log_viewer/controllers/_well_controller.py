@@ -1,10 +1,10 @@
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-from dash import Dash, Input, Output
+from dash import Dash, Input, Output, State
 
 from webviz_subsurface._models.well_set_model import WellSetModel
 
-from ..utils.xtgeo_well_log_to_json import xtgeo_well_logs_to_json_format
+from ..utils.well_log_pyramid import get_well_log_pyramid, template_curve_names
 
 
 def well_controller(
@@ -13,12 +13,35 @@ def well_controller(
     log_templates: Dict,
     get_uuid: Callable,
 ) -> None:
+    @app.callback(
+        Output(get_uuid("depth-window"), "min"),
+        Output(get_uuid("depth-window"), "max"),
+        Output(get_uuid("depth-window"), "value"),
+        Input(get_uuid("well"), "value"),
+    )
+    def _update_depth_window(well_name: str) -> Tuple[float, float, List[float]]:
+        pyramid = get_well_log_pyramid(well_set_model.get_well(well_name))
+        md_min, md_max = pyramid.md_range
+        return md_min, md_max, [md_min, md_max]
+
     @app.callback(
         Output(get_uuid("well-log-viewer"), "welllog"),
         Output(get_uuid("well-log-viewer"), "template"),
-        Input(get_uuid("well"), "value"),
+        Output(get_uuid("well-log-viewer"), "domain"),
+        Input(get_uuid("depth-window"), "value"),
         Input(get_uuid("template"), "value"),
+        State(get_uuid("well"), "value"),
     )
-    def _update_log_data(well_name: str, template: str) -> Tuple[Any, Any]:
-        well = well_set_model.get_well(well_name)
-        return xtgeo_well_logs_to_json_format(well), log_templates.get(template)
+    def _update_log_data(
+        depth_window: List[float], template: str, well_name: str
+    ) -> Tuple[Any, Any, List[float]]:
+        # Only the logs in the template and the depth window are sent, decimated
+        # to a level with a limited number of samples
+        pyramid = get_well_log_pyramid(well_set_model.get_well(well_name))
+        log_template = log_templates.get(template)
+        md_window = (depth_window[0], depth_window[1])
+        return (
+            pyramid.welllog(template_curve_names(log_template), md_window),
+            log_template,
+            list(md_window),
+        )
@@ -0,0 +1,154 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import xtgeo
+
+from webviz_subsurface._utils.fingerprint_memoize import fingerprint_memoize
+
+from .xtgeo_well_log_to_json import generate_curve, generate_header
+
+# Logs added by xtgeo when calculating well geometrics
+GEOMETRIC_LOGS = ["Q_MDEPTH", "Q_AZI", "Q_INCL", "R_HLEN"]
+
+
+class WellLogPyramid:
+    """Min/max preserving decimation levels of the logs of a well.
+
+    The finest level holds all samples. For each coarser level the samples are
+    grouped in bins `bin_factor` times larger than in the previous level, and
+    the samples with the minimum and maximum value of each log within each bin
+    are kept. Peaks and thin layers are therefore kept at all levels.
+
+    A request for a set of logs within an MD window returns the samples of the
+    finest level with at most `max_points` samples in the window.
+    """
+
+    def __init__(
+        self, well: xtgeo.Well, max_points: int = 2000, bin_factor: int = 4
+    ) -> None:
+        # Calculate well geometrics if MD log is not provided
+        if well.mdlogname is None:
+            well.geometrics()
+
+        self._well_name = well.name
+        self._max_points = max_points
+        lognames = [
+            logname for logname in well.lognames if logname not in GEOMETRIC_LOGS
+        ]
+        self._curve_names = ["MD", "TVD"] + [logname.upper() for logname in lognames]
+        data = well.dataframe[[well.mdlogname, "Z_TVDSS"] + lognames].to_numpy(
+            dtype=np.float64
+        )
+        self._data = data[np.argsort(data[:, 0], kind="stable")]
+
+        # Per level, the sample indices of the min and max of each curve per bin,
+        # as a (curve x sample) array. The finest level is not stored.
+        self._levels: List[np.ndarray] = []
+        num_samples = len(self._data)
+        bin_size = bin_factor
+        while bin_size < num_samples:
+            self._levels.append(_min_max_indices(self._data, bin_size))
+            bin_size *= bin_factor
+
+    @property
+    def curve_names(self) -> List[str]:
+        return self._curve_names
+
+    @property
+    def md_range(self) -> Tuple[float, float]:
+        if len(self._data) == 0:
+            return (0.0, 0.0)
+        return (float(self._data[0, 0]), float(self._data[-1, 0]))
+
+    def sample_indices(
+        self,
+        curve_names: Optional[Sequence[str]] = None,
+        md_window: Optional[Tuple[float, float]] = None,
+    ) -> np.ndarray:
+        """Returns the indices of the samples to show for the curves (all if None)
+        within the MD window (all samples if None)"""
+        start, stop = 0, len(self._data)
+        if md_window is not None:
+            start, stop = np.searchsorted(
+                self._data[:, 0], [md_window[0], md_window[1]], side="left"
+            )
+            stop = min(stop + 1, len(self._data))
+        if stop - start <= self._max_points or not self._levels:
+            return np.arange(start, stop)
+
+        curve_idx = self._curve_indices(curve_names)
+        for level in self._levels:
+            indices = level[curve_idx].ravel()
+            indices = np.unique(indices[(indices >= start) & (indices < stop)])
+            if len(indices) <= self._max_points:
+                break
+        return indices
+
+    def welllog(
+        self,
+        curve_names: Optional[Sequence[str]] = None,
+        md_window: Optional[Tuple[float, float]] = None,
+    ) -> Dict[str, Any]:
+        """Returns the logs in the JSON Well Log Format, with the MD and TVD curves,
+        the given curves (all if None) and the samples within the MD window"""
+        curve_idx = self._curve_indices(curve_names)
+        indices = self.sample_indices(curve_names, md_window)
+        curves = [
+            generate_curve(log_name="MD", description="Measured depth"),
+            generate_curve(log_name="TVD", description="True vertical depth (SS)"),
+        ] + [generate_curve(log_name=self._curve_names[idx]) for idx in curve_idx[2:]]
+        return {
+            "header": generate_header(well_name=self._well_name),
+            "curves": curves,
+            "data": self._data[np.ix_(indices, curve_idx)].tolist(),
+        }
+
+    def _curve_indices(self, curve_names: Optional[Sequence[str]]) -> np.ndarray:
+        """Indices of MD, TVD and the given curves (all if None)"""
+        if curve_names is None:
+            return np.arange(len(self._curve_names))
+        wanted = {name.upper() for name in curve_names}
+        return np.array(
+            [0, 1]
+            + [
+                idx
+                for idx, name in enumerate(self._curve_names[2:], start=2)
+                if name in wanted
+            ]
+        )
+
+
+def _min_max_indices(data: np.ndarray, bin_size: int) -> np.ndarray:
+    """Returns a (curve x 2*bins) array with the indices of the min and max value
+    of each curve within each bin of `bin_size` samples. Undefined values are
+    ignored, unless all values of a bin are undefined."""
+    num_samples, num_curves = data.shape
+    num_bins = -(-num_samples // bin_size)
+    padded = np.full((num_bins * bin_size, num_curves), np.nan)
+    padded[:num_samples] = data
+    binned = padded.reshape(num_bins, bin_size, num_curves)
+
+    offsets = np.arange(num_bins)[:, None] * bin_size
+    undefined = np.isnan(binned)
+    min_idx = np.where(undefined, np.inf, binned).argmin(axis=1) + offsets
+    max_idx = np.where(undefined, -np.inf, binned).argmax(axis=1) + offsets
+    indices = np.concatenate([min_idx, max_idx]).T
+    return np.minimum(indices, num_samples - 1)
+
+
+@fingerprint_memoize(maxsize=32, copy_result=False)
+def get_well_log_pyramid(well: xtgeo.Well) -> WellLogPyramid:
+    return WellLogPyramid(well)
+
+
+def template_curve_names(template: Optional[Dict]) -> Optional[List[str]]:
+    """Returns the names of the logs plotted in a log template, including the
+    second log of differential plots, or None if there are no plots in the template"""
+    names = [
+        plot[key]
+        for track in (template or {}).get("tracks", [])
+        for plot in track.get("plots", [])
+        for key in ("name", "name2")
+        if key in plot
+    ]
+    return names if names else None
@@ -13,7 +13,7 @@ from webviz_subsurface._utils.webvizstore_functions import find_files, get_path
 from ._validate_log_templates import load_and_validate_log_templates
 from .controllers import well_controller
 from .utils.default_color_tables import default_color_tables
-from .utils.xtgeo_well_log_to_json import xtgeo_well_logs_to_json_format
+from .utils.well_log_pyramid import get_well_log_pyramid, template_curve_names
 
 
 class WellLogViewer(WebvizPluginABC):
@@ -130,6 +130,11 @@ Format of the `initial_settings` argument:
 
     @property
     def layout(self) -> html.Div:
+        initial_pyramid = get_well_log_pyramid(
+            self._well_set_model.get_well(self.initial_well_name)
+        )
+        md_min, md_max = initial_pyramid.md_range
+        initial_template = self._log_templates.get(self.initial_log_template)
         return wcc.FlexBox(
             [
                 wcc.Frame(
@@ -155,6 +160,15 @@ Format of the `initial_settings` argument:
                             value=self.initial_log_template,
                             clearable=False,
                         ),
+                        wcc.RangeSlider(
+                            label="Depth window (MD)",
+                            id=self.uuid("depth-window"),
+                            min=md_min,
+                            max=md_max,
+                            value=[md_min, md_max],
+                            tooltip={"placement": "bottom", "always_visible": False},
+                            marks=None,
+                        ),
                     ],
                 ),
                 wcc.Frame(
@@ -162,11 +176,9 @@ Format of the `initial_settings` argument:
                     children=[
                         WellLogViewerComponent(
                             id=self.uuid("well-log-viewer"),
-                            template=self._log_templates.get(self.initial_log_template),
-                            welllog=xtgeo_well_logs_to_json_format(
-                                well=self._well_set_model.get_well(
-                                    self.initial_well_name
-                                )
+                            template=initial_template,
+                            welllog=initial_pyramid.welllog(
+                                template_curve_names(initial_template)
                             ),
                             colorTables=self.colortables,
                         )
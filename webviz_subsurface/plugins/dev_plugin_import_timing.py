@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from . import __all__ as ALL_PLUGINS
+
+HEAVY_MODULES = [
+    "ecl2df",
+    "matplotlib",
+    "opm",
+    "pyscal",
+    "scipy",
+    "shapely",
+    "vtk",
+    "vtkmodules",
+    "xtgeo",
+]
+
+
+def _measure_in_subprocess(plugin_name: str) -> Tuple[float, List[str]]:
+    """Import the plugin in a fresh python process, and return the time spent
+    (in addition to importing webviz_subsurface.plugins) together with the
+    heavy modules that were imported by it"""
+    code = f"""
+import sys
+import time
+import webviz_subsurface.plugins as plugins
+before = set(sys.modules)
+start = time.perf_counter()
+getattr(plugins, "{plugin_name}")
+print(time.perf_counter() - start)
+print(",".join(m for m in {HEAVY_MODULES!r} if m in set(sys.modules) - before))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    elapsed, heavy_modules = result.stdout.splitlines()[-2:]
+    return float(elapsed), [mod for mod in heavy_modules.split(",") if mod]
+
+
+def _measure_package_import() -> float:
+    code = """
+import time
+start = time.perf_counter()
+import webviz_subsurface.plugins
+print(time.perf_counter() - start)
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    plugin_names = sys.argv[1:] if len(sys.argv) > 1 else ALL_PLUGINS
+
+    print(f"## import webviz_subsurface.plugins (s): {_measure_package_import():.3f}")
+    print("## Measuring import time per plugin, each in a separate process...")
+
+    timings: Dict[str, Tuple[float, List[str]]] = {}
+    for plugin_name in plugin_names:
+        try:
+            timings[plugin_name] = _measure_in_subprocess(plugin_name)
+        except subprocess.CalledProcessError as exc:
+            print(f"## {plugin_name} failed to import:\n{exc.stderr}")
+
+    print()
+    print(f"{'Plugin':<45}{'Import time (s)':>16}   Heavy modules")
+    for plugin_name, (elapsed, heavy_modules) in sorted(
+        timings.items(), key=lambda item: item[1][0], reverse=True
+    ):
+        print(f"{plugin_name:<45}{elapsed:>16.3f}   {', '.join(heavy_modules)}")
+
+
+# Running:
+#   python -m webviz_subsurface.plugins.dev_plugin_import_timing [PluginName ...]
+# -------------------------------------------------------------------------
+if __name__ == "__main__":
+    main()